@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Cost benchmark for create_market and place_bet.
+For markets of increasing option count, simulates market creation and one bet
+and reports the opcode budget each call consumes, plus the box bytes the market
+occupies (which set its minimum-balance cost) and the fee creation needs once
+OpUp budget calls are padded in. Because option pools are packed 8-byte slots
+updated in place, the bet cost should be identical for every market size.
+"""
+
+import base64
+import logging
+
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.transaction import PaymentTxn
+from algosdk.v2client.models import SimulateRequest
+
+from sample_usage import bet_deposit, create_and_fund_account, deploy_prediction_market, setup_clients
+from smart_contracts.prediction_market.helpers import (
+    BOX_BYTE_MBR,
+    BOX_FLAT_MBR,
+    bet_boxes,
+    market_boxes,
+    market_deposit,
+    padded_fee_params,
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OPTION_COUNTS = [2, 3, 10, 32, 50]
+
+
+def app_budget_consumed(atc: AtomicTransactionComposer, algod_client) -> int:
+    """Simulate the group and return the opcode budget consumed by its app call."""
+    result = atc.simulate(algod_client, SimulateRequest(txn_groups=[]))
+    txn_results = result.simulate_response["txn-groups"][0]["txn-results"]
+    return next(
+        txn_result["app-budget-consumed"]
+        for txn_result in txn_results
+        if "app-budget-consumed" in txn_result
+    )
+
+
+def market_args(app_client, option_count: int) -> dict:
+    """create_market arguments, deposit payment included, for a benchmark market with option_count options."""
+    title = f"Benchmark {option_count}"
+    options = [f"Option {i}" for i in range(option_count)]
+    odds = [200] * option_count
+    return {
+        "title": title,
+        "options": options,
+        "odds": odds,
+        "duration_hours": 1,
+        "payment_txn": PaymentTxn(
+            sender=app_client.sender,
+            receiver=app_client.app_address,
+            amt=market_deposit(title, options, odds),
+            sp=app_client.algod_client.suggested_params(),
+        ),
+    }
+
+
+def simulate_create_cost(app_client, algod_client, option_count: int) -> tuple[int, int]:
+    """Simulate creating a market and return the opcode budget it consumes and the fee it needs."""
+    next_market_id = app_client.get_global_state().get("market_counter", 0) + 1
+    boxes = market_boxes(next_market_id)
+    sp = padded_fee_params(app_client, "create_market", {"boxes": boxes}, **market_args(app_client, option_count))
+    atc = AtomicTransactionComposer()
+    app_client.compose_call(
+        atc,
+        "create_market",
+        transaction_parameters={"boxes": boxes, "suggested_params": sp},
+        **market_args(app_client, option_count),
+    )
+    return app_budget_consumed(atc, algod_client), sp.fee
+
+
+def simulate_bet_cost(app_client, algod_client, bettor, market_id: int, option_index: int) -> int:
+    """Simulate a 1 ALGO bet and return the opcode budget consumed by the app call."""
+    payment_txn = PaymentTxn(
+        sender=bettor.address,
+        receiver=app_client.app_address,
+        amt=1_000_000 + bet_deposit(app_client, market_id, bettor.address),
+        sp=algod_client.suggested_params(),
+    )
+
+    atc = AtomicTransactionComposer()
+    app_client.compose_call(
+        atc,
+        "place_bet",
+        transaction_parameters={"boxes": bet_boxes(market_id, bettor.address), "signer": bettor.signer},
+        market_id=market_id,
+        option_index=option_index,
+        payment_txn=payment_txn,
+    )
+    return app_budget_consumed(atc, algod_client)
+
+
+def market_box_bytes(app_client, algod_client, market_id: int) -> tuple[int, int]:
+    """Return the key plus value bytes of a market's boxes and the minimum balance they lock."""
+    total_bytes = 0
+    min_balance = 0
+    for _app, name in market_boxes(market_id):
+        box = algod_client.application_box_by_name(app_client.app_id, name)
+        size = len(name) + len(base64.b64decode(box["value"]))
+        total_bytes += size
+        min_balance += BOX_FLAT_MBR + BOX_BYTE_MBR * size
+    return total_bytes, min_balance
+
+
+def main():
+    """Create one market per option count and report what creating it and betting on it costs."""
+    algod_client, indexer_client = setup_clients()
+    deployer = create_and_fund_account(algod_client, "Deployer", 50_000_000)
+    bettor = create_and_fund_account(algod_client, "Bettor", 10_000_000)
+    app_client = deploy_prediction_market(algod_client, indexer_client, deployer)
+
+    logger.info(f"{'options':>8} {'create':>8} {'fee':>8} {'bet':>8} {'bytes':>8} {'mbr':>8}")
+    for option_count in OPTION_COUNTS:
+        create_cost, create_fee = simulate_create_cost(app_client, algod_client, option_count)
+
+        next_market_id = app_client.get_global_state().get("market_counter", 0) + 1
+        boxes = market_boxes(next_market_id)
+        sp = padded_fee_params(app_client, "create_market", {"boxes": boxes}, **market_args(app_client, option_count))
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": boxes, "suggested_params": sp},
+            **market_args(app_client, option_count),
+        ).return_value
+
+        bet_cost = simulate_bet_cost(app_client, algod_client, bettor, market_id, option_count - 1)
+        box_bytes, min_balance = market_box_bytes(app_client, algod_client, market_id)
+        logger.info(
+            f"{option_count:>8} {create_cost:>8} {create_fee:>8} {bet_cost:>8} {box_bytes:>8} {min_balance:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
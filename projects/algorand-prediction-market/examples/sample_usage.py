@@ -5,19 +5,87 @@ Demonstrates how to deploy, create markets, place bets, and claim winnings.
 """
 
 import logging
+import sys
+from pathlib import Path
 
 import algokit_utils
 from algokit_utils import ApplicationClient, Account
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.error import AlgodHTTPError
 from algosdk.transaction import PaymentTxn
+from algosdk.v2client.models import SimulateRequest
+
+# Run as a script from examples/, so make the project root importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from smart_contracts.prediction_market.deploy_config import legacy_app_spec, template_params  # noqa: E402
+from smart_contracts.prediction_market.helpers import (  # noqa: E402
+    BOX_BYTE_MBR,
+    BOX_FLAT_MBR,
+    advance_time,
+    bet_boxes,
+    market_boxes,
+    market_deposit,
+    padded_fee_params,
+    portfolio_box,
+    position_box,
+)
+
+# Most summaries one get_markets_page call returns (MAX_PAGE_SIZE in the contract)
+MARKETS_PAGE_SIZE = 23
+
+# Most entries one get_user_portfolio call returns (MAX_PORTFOLIO_PAGE_SIZE in the contract)
+PORTFOLIO_PAGE_SIZE = 37
+
+# Most transactions in one group
+MAX_GROUP_SIZE = 16
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def bet_deposit(app_client: ApplicationClient, market_id: int, address: str) -> int:
+    """Box deposit the next bet by ``address`` on ``market_id`` pays on top of its stake.
+
+    A first bet in a market pays the minimum balance of the position box it
+    creates, of the bettor's portfolio index entry (the whole box for their
+    first market) and of their slot in the market's bettor index (the whole
+    page for the first bettor on it); close_positions refunds it. Later bets
+    in the same market pay none.
+    """
+
+    def box_exists(box: tuple[int, bytes]) -> bool:
+        try:
+            app_client.algod_client.application_box_by_name(app_client.app_id, box[1])
+        except AlgodHTTPError:
+            return False
+        return True
+
+    if box_exists(position_box(market_id, address)):
+        return 0
+
+    summary = app_client.call(
+        "get_market_summary",
+        transaction_parameters={"boxes": market_boxes(market_id)},
+        market_id=market_id,
+    ).return_value
+    bettor_count, option_pools = summary[6], summary[8]
+
+    deposit = BOX_FLAT_MBR + BOX_BYTE_MBR * (41 + 10 + 8 * len(option_pools))
+    if box_exists(portfolio_box(address)):
+        deposit += BOX_BYTE_MBR * 8
+    else:
+        deposit += BOX_FLAT_MBR + BOX_BYTE_MBR * (33 + 8)
+    if bettor_count % 32:
+        deposit += BOX_BYTE_MBR * 32
+    else:
+        deposit += BOX_FLAT_MBR + BOX_BYTE_MBR * (17 + 32)
+    return deposit
+
+
 def setup_clients() -> tuple[AlgodClient, IndexerClient]:
     """Set up Algorand clients for local development."""
     # For AlgoKit LocalNet
@@ -61,43 +129,10 @@ def deploy_prediction_market(
 ) -> ApplicationClient:
     """Deploy the prediction market smart contract."""
     
-    # Create application specification
-    app_spec = algokit_utils.ApplicationSpecification.from_json({
-        "hints": {},
-        "source": {
-            "approval": "",
-            "clear": ""
-        },
-        "state": {
-            "global": {
-                "num_byte_slices": 32,
-                "num_uints": 64
-            },
-            "local": {
-                "num_byte_slices": 8,
-                "num_uints": 16
-            }
-        },
-        "schema": {
-            "global": {
-                "declared": {},
-                "reserved": {}
-            },
-            "local": {
-                "declared": {},
-                "reserved": {}
-            }
-        },
-        "contract": {
-            "name": "PredictionMarket",
-            "methods": []
-        }
-    })
-    
     # Create application client
     app_client = ApplicationClient(
         algod_client=algod_client,
-        app_spec=app_spec,
+        app_spec=legacy_app_spec(),
         creator=deployer,
         indexer_client=indexer_client,
     )
@@ -106,6 +141,7 @@ def deploy_prediction_market(
     
     # Deploy the application
     app_client.deploy(
+        template_values=template_params(),
         on_schema_break=algokit_utils.OnSchemaBreak.ReplaceApp,
         on_update=algokit_utils.OnUpdate.UpdateApp,
     )
@@ -134,15 +170,30 @@ def create_sample_market(app_client: ApplicationClient) -> int:
     title = "Premier League: Manchester City vs Arsenal"
     options = ["Manchester City", "Draw", "Arsenal"]
     odds = [180, 320, 220]  # 1.80, 3.20, 2.20 (scaled by 100)
-    duration_hours = 48  # 48 hours betting window
+    duration_hours = 1  # 1 hour betting window; the demo moves LocalNet's clock past it
     
-    # Create the market
+    # Create the market (its record lives in the box of the next market id),
+    # paying the minimum balance of its boxes
+    next_market_id = app_client.get_global_state().get("market_counter", 0) + 1
+    payment_txn = PaymentTxn(
+        sender=app_client.sender,
+        receiver=app_client.app_address,
+        amt=market_deposit(title, options, odds),
+        sp=app_client.algod_client.suggested_params(),
+    )
+    market_args = {
+        "title": title,
+        "options": options,
+        "odds": odds,
+        "duration_hours": duration_hours,
+        "payment_txn": payment_txn,
+    }
+    boxes = market_boxes(next_market_id)
+    sp = padded_fee_params(app_client, "create_market", {"boxes": boxes}, **market_args)
     result = app_client.call(
         "create_market",
-        title=title,
-        options=options,
-        odds=odds,
-        duration_hours=duration_hours,
+        transaction_parameters={"boxes": boxes, "suggested_params": sp},
+        **market_args,
     )
     
     market_id = result.return_value
@@ -163,12 +214,8 @@ def demonstrate_betting(
     """Demonstrate betting functionality with multiple users."""
     logger.info("Demonstrating betting functionality...")
     
-    # Opt all bettors into the application
-    for i, bettor in enumerate(bettors):
-        logger.info(f"Opting bettor {i+1} into the application...")
-        app_client.opt_in(signer=bettor)
-    
-    # Betting scenarios
+    # Betting scenarios (no opt-in needed: each bettor's position box is
+    # created by their first bet)
     bets = [
         (bettors[0], 0, 3_000_000, "Manchester City"),  # Bettor 1: 3 ALGO on City
         (bettors[1], 2, 2_000_000, "Arsenal"),         # Bettor 2: 2 ALGO on Arsenal
@@ -179,31 +226,30 @@ def demonstrate_betting(
     for bettor, option_index, amount, option_name in bets:
         logger.info(f"Placing bet: {amount/1_000_000} ALGO on {option_name}")
         
-        # Create payment transaction
+        # Create payment transaction; a first bet also pays for the boxes it creates
         payment_txn = PaymentTxn(
             sender=bettor.address,
             receiver=app_client.app_address,
-            amt=amount,
+            amt=amount + bet_deposit(app_client, market_id, bettor.address),
             sp=algod_client.suggested_params(),
         )
         
-        # Place the bet
-        app_client.call(
+        # Place the bet; the call returns the market and position after the bet
+        result = app_client.call(
             "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor.address)},
             market_id=market_id,
             option_index=option_index,
             payment_txn=payment_txn,
             signer=bettor,
         )
+        total_pool, option_pools, _position_stakes, position_total = result.return_value
         
-        logger.info("✅ Bet placed successfully")
+        logger.info(f"✅ Bet placed successfully (your total: {position_total / 1_000_000} ALGO)")
     
-    # Check market state after betting
-    market_info = app_client.call("get_market_info", market_id=market_id)
-    market_data = market_info.return_value
-    
-    total_pool = market_data[4] / 1_000_000  # Convert to ALGOs
-    option_pools = [pool.native / 1_000_000 for pool in market_data[3]]  # Convert to ALGOs
+    # Market state after the last bet, straight from its result
+    total_pool = total_pool / 1_000_000  # Convert to ALGOs
+    option_pools = [pool / 1_000_000 for pool in option_pools]  # Convert to ALGOs
     
     logger.info("📊 Market state after betting:")
     logger.info(f"   Total pool: {total_pool} ALGO")
@@ -223,6 +269,7 @@ def check_user_positions(
     for i, bettor in enumerate(bettors):
         position = app_client.call(
             "get_user_position",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor.address)},
             market_id=market_id,
             user=bettor.address,
         )
@@ -246,28 +293,28 @@ def simulate_market_settlement(
     """Simulate market settlement (in production, this would be done by an oracle)."""
     logger.info(f"Settling market with winning option: {winning_option}")
     
-    # In a real scenario, you'd wait for the market to end
-    # For demo purposes, we'll assume the market creator can settle
+    # A market can only be settled after its end time. In a real scenario the
+    # oracle waits for the match to end; on LocalNet the demo moves the clock
+    # past the 1 hour betting window instead
+    advance_time(app_client.algod_client, 2 * 3600)
     
     try:
-        app_client.call(
+        result = app_client.call(
             "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
             market_id=market_id,
             winning_option=winning_option,
         )
         
         logger.info("✅ Market settled successfully")
         
-        # Check updated market info
-        market_info = app_client.call("get_market_info", market_id=market_id)
-        market_data = market_info.return_value
-        
-        status = market_data[6]  # Status
-        winning_opt = market_data[7]  # Winning option
+        # The settlement result carries the updated market state
+        status, winning_opt, _winning_pool, payout_ratio = result.return_value
         
         option_names = ["Manchester City", "Draw", "Arsenal"]
         logger.info(f"   Status: {status} (2 = settled)")
         logger.info(f"   Winning option: {option_names[winning_opt]} (index {winning_opt})")
+        logger.info(f"   Payout per ALGO staked on the winner: {payout_ratio / 1_000_000_000:.4f} ALGO")
         
     except Exception as e:
         logger.error(f"Failed to settle market: {e}")
@@ -290,6 +337,7 @@ def demonstrate_claiming(
             # Check if user has winning bets
             position = app_client.call(
                 "get_user_position",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor.address)},
                 market_id=market_id,
                 user=bettor.address,
             )
@@ -299,14 +347,21 @@ def demonstrate_claiming(
             if len(user_bets) > winning_option and user_bets[winning_option].native > 0:
                 logger.info(f"👤 Bettor {i+1} has winning bets, attempting to claim...")
                 
-                # Attempt to claim winnings
+                # Attempt to claim winnings, paying the fee of the inner payout payment too
+                sp = app_client.algod_client.suggested_params()
+                sp.flat_fee = True
+                sp.fee = 2 * sp.min_fee
                 result = app_client.call(
                     "claim_winnings",
+                    transaction_parameters={
+                        "boxes": bet_boxes(market_id, bettor.address),
+                        "suggested_params": sp,
+                    },
                     market_id=market_id,
                     signer=bettor,
                 )
                 
-                payout = result.return_value / 1_000_000  # Convert to ALGOs
+                payout = result.return_value[0] / 1_000_000  # Convert to ALGOs
                 logger.info(f"✅ Claimed {payout} ALGO in winnings")
                 
             else:
@@ -316,6 +371,59 @@ def demonstrate_claiming(
             logger.info(f"👤 Bettor {i+1} claim failed: {e}")
 
 
+def list_markets(app_client: ApplicationClient, start: int, count: int) -> list:
+    """Fetch up to ``count`` market summaries from ``start`` in a single simulate request.
+
+    Groups one get_markets_page call per page (up to 16 pages, i.e. 368 markets)
+    and lets simulate resolve the market boxes and lift the opcode budget.
+    """
+    atc = AtomicTransactionComposer()
+    for page_start in range(start, start + count, MARKETS_PAGE_SIZE):
+        app_client.compose_call(
+            atc,
+            "get_markets_page",
+            start=page_start,
+            count=min(MARKETS_PAGE_SIZE, start + count - page_start),
+        )
+
+    result = atc.simulate(
+        app_client.algod_client,
+        SimulateRequest(
+            txn_groups=[],
+            allow_unnamed_resources=True,
+            extra_opcode_budget=20_000 * atc.get_tx_count(),
+        ),
+    )
+    return [summary for page in result.abi_results for summary in page.return_value]
+
+
+def list_portfolio(app_client: ApplicationClient, address: str) -> list:
+    """Fetch every position of ``address`` from its portfolio index in a single simulate request.
+
+    Groups a full group of get_user_portfolio pages (up to 592 positions);
+    pages past the end of the index come back empty.
+    """
+    atc = AtomicTransactionComposer()
+    for page in range(MAX_GROUP_SIZE):
+        app_client.compose_call(
+            atc,
+            "get_user_portfolio",
+            user=address,
+            start=page * PORTFOLIO_PAGE_SIZE,
+            count=PORTFOLIO_PAGE_SIZE,
+        )
+
+    result = atc.simulate(
+        app_client.algod_client,
+        SimulateRequest(
+            txn_groups=[],
+            allow_unnamed_resources=True,
+            extra_opcode_budget=20_000 * atc.get_tx_count(),
+        ),
+    )
+    return [entry for page in result.abi_results for entry in page.return_value]
+
+
 def main():
     """Main demonstration function."""
     logger.info("🚀 Starting Algorand Prediction Market Demo")
@@ -351,6 +459,19 @@ def main():
         
         # Demonstrate claiming
         demonstrate_claiming(app_client, market_id, bettors, winning_option)
+
+        # List every market in one request
+        summaries = list_markets(app_client, start=1, count=200)
+        logger.info(f"📋 Listed {len(summaries)} market(s) in one simulate request")
+
+        # Load a bettor's whole portfolio in one request
+        portfolio = list_portfolio(app_client, bettors[0].address)
+        logger.info(f"💼 Bettor 1 has {len(portfolio)} position(s):")
+        for position_market_id, status, _winner, claimed, total_stake, claimable in portfolio:
+            logger.info(
+                f"   Market {position_market_id}: staked {total_stake / 1_000_000} ALGO, "
+                f"status {status}, claimed {claimed}, claimable {claimable / 1_000_000} ALGO"
+            )
         
         logger.info("=" * 50)
         logger.info("✅ Demo completed successfully!")
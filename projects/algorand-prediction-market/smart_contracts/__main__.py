@@ -1,20 +1,27 @@
+import ast
+import ctypes
 import dataclasses
+import errno
+import hashlib
 import importlib
+import importlib.metadata
+import io
+import json
 import logging
+import os
+import re
 import subprocess
 import sys
+import tempfile
+import time
+import uuid
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from pathlib import Path
 from shutil import rmtree
 
-from algokit_utils.config import config
 from dotenv import load_dotenv
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
 # Set up logging and load environment variables.
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
@@ -34,6 +41,7 @@ class SmartContract:
     path: Path
     name: str
     deploy: Callable[[], None] | None = None
+    template_params: Callable[[], dict[str, int]] | None = None
 
 
 def import_contract(folder: Path) -> Path:
@@ -55,6 +63,18 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def import_template_params_if_exists(
+    folder: Path,
+) -> Callable[[], dict[str, int]] | None:
+    """Imports the template_params function from a folder's deploy config if it exists."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
+        deploy_module = importlib.import_module(module_name)
+        return getattr(deploy_module, "template_params", None)
+    except ImportError:
+        return None
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
@@ -67,6 +87,7 @@ contracts: list[SmartContract] = [
         path=import_contract(folder),
         name=folder.name,
         deploy=import_deploy_if_exists(folder),
+        template_params=import_template_params_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -86,17 +107,119 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+BUILD_CACHE_FILE = ".build_cache"
+
+
+def _local_imports(source_path: Path) -> list[Path]:
+    """Returns the modules under root_path that a source file imports."""
+    tree = ast.parse(source_path.read_text(), filename=str(source_path))
+    modules: list[Path] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = source_path.parent
+                for _ in range(node.level - 1):
+                    base = base.parent
+                parts = node.module.split(".") if node.module else []
+            elif node.module and node.module.split(".")[0] == root_path.name:
+                base = root_path.parent
+                parts = node.module.split(".")
+            else:
+                continue
+            candidates = [base.joinpath(*parts)]
+            candidates += [base.joinpath(*parts, alias.name) for alias in node.names]
+        elif isinstance(node, ast.Import):
+            candidates = [
+                root_path.parent.joinpath(*alias.name.split("."))
+                for alias in node.names
+                if alias.name.split(".")[0] == root_path.name
+            ]
+        else:
+            continue
+        for candidate in candidates:
+            for module_path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                if module_path.is_file():
+                    modules.append(module_path.resolve())
+    return modules
+
+
+def contract_sources(contract_path: Path) -> list[Path]:
+    """Returns the contract file and every local module it imports, transitively."""
+    pending = [contract_path.resolve()]
+    sources: list[Path] = []
+    while pending:
+        source = pending.pop()
+        if source in sources:
+            continue
+        sources.append(source)
+        pending.extend(_local_imports(source))
+    return sorted(sources)
+
+
+def _package_version(name: str) -> str:
+    """Returns the installed version of a package, or an empty string if it is missing."""
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def build_cache_key(contract_path: Path, compile_args: list[str]) -> str:
     """
-    Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    Hashes everything that determines a contract's artifacts: the contract source and
+    its local imports, the compiler and client generator versions, and the compile flags.
     """
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+    digest = hashlib.sha256()
+    for source in contract_sources(contract_path):
+        digest.update(os.path.relpath(source, root_path.parent).encode())
+        digest.update(hashlib.sha256(source.read_bytes()).digest())
+    for package in ("puyapy", "algokit-client-generator"):
+        digest.update(f"{package}=={_package_version(package)}".encode())
+    digest.update(json.dumps(compile_args).encode())
+    return digest.hexdigest()
+
+
+def _cached_build(output_dir: Path, cache_key: str) -> Path | None:
+    """Returns the result of a previous build if its cache key matches and its artifacts exist."""
+    try:
+        cache = json.loads((output_dir / BUILD_CACHE_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if cache.get("key") != cache_key:
+        return None
+    if not all((output_dir / name).is_file() for name in cache.get("artifacts", [])):
+        return None
+    return output_dir / cache["result"] if cache.get("result") else output_dir
+
+
+BUILD_BACKENDS = ("subprocess", "inprocess")
 
+
+def build_backend() -> str:
+    """
+    The build backend, from BUILD_BACKEND. "subprocess" (the default) runs the algokit
+    CLI for each step; "inprocess" calls the puyapy compiler and the client generator
+    as libraries, so a long-lived process pays their start-up cost only once.
+    """
+    backend = os.environ.get("BUILD_BACKEND", "subprocess")
+    if backend not in BUILD_BACKENDS:
+        raise Exception(
+            f"Unknown build backend {backend!r}, expected one of {', '.join(BUILD_BACKENDS)}"
+        )
+    return backend
+
+
+def _snake_case(name: str) -> str:
+    """Converts an app spec name to the snake_case algokit uses for client file names."""
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
+    return re.sub(r"[-\s]+", "_", name).lower()
+
+
+def _compile_with_algokit(
+    contract_path: Path, output_dir: Path, compile_args: list[str]
+) -> None:
+    """Compiles the contract into output_dir by running `algokit compile python`."""
     build_result = subprocess.run(
         [
             "algokit",
@@ -105,9 +228,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "python",
             str(contract_path.resolve()),
             f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
+            *compile_args,
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -116,9 +237,162 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
+
+def _generate_client_with_algokit(app_spec_path: Path, output_dir: Path) -> None:
+    """Generates the typed client for an app spec by running `algokit generate client`."""
+    generate_result = subprocess.run(
+        [
+            "algokit",
+            "generate",
+            "client",
+            str(app_spec_path),
+            "--output",
+            str(_get_output_path(output_dir, deployment_extension)),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if generate_result.returncode:
+        if "No such command" in generate_result.stdout:
+            raise Exception(
+                "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+            )
+        else:
+            raise Exception(
+                f"Could not generate typed client:\n{generate_result.stdout}"
+            )
+
+
+def _compile_in_process(
+    contract_path: Path, output_dir: Path, template_params: dict[str, int] | None
+) -> None:
+    """Compiles the contract into output_dir with the puyapy compiler in this process."""
+    import structlog
+    from puya.log import LogLevel, configure_logging
+    from puyapy.compile import compile_to_teal
+    from puyapy.options import PuyaPyOptions
+    from puyapy.template import parse_template_key_value
+
+    # puya picks its colours when logging is configured, so NO_COLOR only needs to be
+    # set for that call; it matches the subprocess backend's --no-color.
+    no_color = os.environ.get("NO_COLOR")
+    os.environ["NO_COLOR"] = "1"
+    try:
+        configure_logging(
+            min_log_level=LogLevel.info, cache_logger=False, reconfigure_stdio=False
+        )
+    finally:
+        if no_color is None:
+            del os.environ["NO_COLOR"]
+        else:
+            os.environ["NO_COLOR"] = no_color
+    # Collect the compiler's output, as the subprocess backend does, to report on failure.
+    compiler_output = io.StringIO()
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(file=compiler_output))
+    options = PuyaPyOptions(
+        paths=[contract_path.resolve()],
+        out_dir=output_dir,
+        output_teal=True,
+        output_source_map=True,
+        output_arc56=True,
+        output_arc32=False,
+        cli_template_definitions=dict(
+            parse_template_key_value(f"{name}={value}")
+            for name, value in (template_params or {}).items()
+        ),
+    )
+    try:
+        compile_to_teal(options)
+    except (Exception, SystemExit):
+        # Compile errors raise PuyaExitError in puyapy 5 and exit in earlier versions;
+        # either way the compiler has already logged them.
+        raise Exception(
+            f"Could not build contract:\n{compiler_output.getvalue()}"
+        ) from None
+
+
+def _generate_client_in_process(app_spec_path: Path, output_dir: Path) -> None:
+    """Generates the typed client for an app spec with the client generator in this process."""
+    from algokit_client_generator import generate_client
+
+    contract_name = _snake_case(json.loads(app_spec_path.read_text())["name"])
+    output_path = str(_get_output_path(output_dir, deployment_extension))
+    generate_client(
+        app_spec_path, Path(output_path.format(contract_name=contract_name))
+    )
+
+
+# renameat2() arguments for atomically exchanging two paths on Linux.
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+def _exchange_directories(first: Path, second: Path) -> bool:
+    """
+    Atomically swaps two directories with renameat2(RENAME_EXCHANGE). Returns False
+    where that is unsupported (not Linux, an old libc or a filesystem without it).
+    """
+    if sys.platform != "linux":
+        return False
+    renameat2 = getattr(ctypes.CDLL(None, use_errno=True), "renameat2", None)
+    if renameat2 is None:
+        return False
+    if (
+        renameat2(
+            _AT_FDCWD,
+            os.fsencode(first),
+            _AT_FDCWD,
+            os.fsencode(second),
+            _RENAME_EXCHANGE,
+        )
+        == 0
+    ):
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL):
+        return False
+    raise OSError(error, os.strerror(error), str(first), None, str(second))
+
+
+def publish_artifacts(staging_dir: Path, output_dir: Path) -> None:
+    """
+    Replaces output_dir with the completed build in staging_dir, a sibling directory.
+    A first build is a single rename. A rebuild exchanges the two directories in one
+    step where the platform supports it, so readers see either the old artifacts or
+    the new ones and never a missing or partial directory. Elsewhere the old
+    directory is renamed aside first, which leaves a brief window without it.
+    """
+    if not output_dir.exists():
+        staging_dir.rename(output_dir)
+        return
+    if _exchange_directories(staging_dir, output_dir):
+        # staging_dir now holds the previous artifacts
+        rmtree(staging_dir, ignore_errors=True)
+        return
+    previous_dir = output_dir.with_name(f".{output_dir.name}.old-{uuid.uuid4().hex[:8]}")
+    output_dir.rename(previous_dir)
+    staging_dir.rename(output_dir)
+    rmtree(previous_dir, ignore_errors=True)
+
+
+def _build_into(
+    build_dir: Path,
+    contract_path: Path,
+    template_params: dict[str, int] | None,
+    backend: str,
+    compile_args: list[str],
+    cache_key: str,
+) -> str | None:
+    """Compiles the contract and generates its clients in build_dir, returning the app spec name."""
+    if backend == "inprocess":
+        _compile_in_process(contract_path, build_dir, template_params)
+    else:
+        _compile_with_algokit(contract_path, build_dir, compile_args)
+
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
+        file.name for file in build_dir.glob("*.arc56.json")
     ]
 
     client_file: str | None = None
@@ -129,37 +403,350 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     else:
         for file_name in app_spec_file_names:
             client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
+            logger.info(f"Generating typed client from {file_name}")
+            if backend == "inprocess":
+                _generate_client_in_process(build_dir / file_name, build_dir)
+            else:
+                _generate_client_with_algokit(build_dir / file_name, build_dir)
+    # Record the cache key alongside the artifacts it describes.
+    (build_dir / BUILD_CACHE_FILE).write_text(
+        json.dumps(
+            {
+                "key": cache_key,
+                "result": client_file,
+                "artifacts": sorted(
+                    file.name for file in build_dir.iterdir() if file.is_file()
+                ),
+            },
+            indent=2,
+        )
+    )
+    return client_file
+
+
+def _compile_args(template_params: dict[str, int] | None) -> list[str]:
+    """The compiler flags for a build, which are also part of its cache key."""
+    return [
+        "--no-output-arc32",
+        "--output-arc56",
+        "--output-source-map",
+        *(
+            f"--template-var={name}={value}"
+            for name, value in (template_params or {}).items()
+        ),
+    ]
+
+
+def _log_reused(contract_path: Path, output_dir: Path) -> None:
+    """Logs that a contract's build was skipped in favour of its cached artifacts."""
+    logger.info(f"{contract_path} is unchanged, reusing artifacts in {output_dir}")
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    template_params: dict[str, int] | None = None,
+    backend: str | None = None,
+) -> Path:
+    """
+    Builds the contract by exporting (compiling) its source and generating a client,
+    with the given backend or the one selected by BUILD_BACKEND. Any template_params
+    are substituted for the matching TMPL_ variables and recorded in the arc56 spec.
+    If the contract, its imports, the toolchain and the flags are unchanged since the
+    last build, the existing artifacts are reused. Otherwise the build is written to a
+    sibling staging directory and only published over output_dir once it succeeds,
+    so a failed build leaves the previous artifacts in place.
+    """
+    backend = backend or build_backend()
+    output_dir = output_dir.resolve()
+    compile_args = _compile_args(template_params)
+    cache_key = build_cache_key(contract_path, compile_args)
+    cached = _cached_build(output_dir, cache_key)
+    if cached is not None:
+        _log_reused(contract_path, output_dir)
+        return cached
+
+    staging_dir = output_dir.with_name(f".{output_dir.name}.build-{uuid.uuid4().hex[:8]}")
+    staging_dir.mkdir(parents=True)
+    logger.info(f"Exporting {contract_path} to {output_dir}")
+    try:
+        client_file = _build_into(
+            staging_dir, contract_path, template_params, backend, compile_args, cache_key
+        )
+        publish_artifacts(staging_dir, output_dir)
+    except BaseException:
+        rmtree(staging_dir, ignore_errors=True)
+        raise
+
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+class _LogCollector(logging.Handler):
+    """Keeps log records in memory so a worker's output can be replayed by the parent."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message and traceback now, so the record pickles without its args.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _build_in_worker(
+    output_dir: Path,
+    contract_path: Path,
+    template_params: dict[str, int] | None,
+) -> tuple[list[logging.LogRecord], Path | None, str | None]:
+    """Runs build() with its logs captured, returning the logs, the result and any error."""
+    collector = _LogCollector()
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    root_logger.handlers = [collector]
+    try:
+        return collector.records, build(output_dir, contract_path, template_params), None
+    except Exception as e:
+        return collector.records, None, str(e)
+    finally:
+        root_logger.handlers = handlers
+
+
+def build_workers() -> int:
+    """Number of contracts to build at once, from BUILD_WORKERS or the CPU count."""
+    return max(1, int(os.environ.get("BUILD_WORKERS", 0)) or os.cpu_count() or 1)
+
+
+def build_all(artifact_path: Path, to_build: list[SmartContract]) -> list[Path]:
+    """
+    Builds the contracts concurrently on a bounded process pool. Contracts whose build
+    cache is current are resolved here and never reach the pool. Each contract's logs
+    are replayed as one block, in contract order, as soon as it and the contracts
+    before it have finished. The first failure cancels the builds not yet started
+    and is raised once the logs up to it have been replayed.
+    """
+    jobs = [
+        (
+            (artifact_path / contract.name).resolve(),
+            contract.path,
+            contract.template_params() if contract.template_params else None,
+        )
+        for contract in to_build
+    ]
+    cached = [
+        _cached_build(output_dir, build_cache_key(contract_path, _compile_args(template_params)))
+        for output_dir, contract_path, template_params in jobs
+    ]
+    stale = sum(result is None for result in cached)
+    workers = min(build_workers(), stale)
+    results: list[Path] = []
+    if workers <= 1:
+        for contract, job, result in zip(to_build, jobs, cached):
+            logger.info(f"Building app at {contract.path}")
+            if result is None:
+                results.append(build(*job))
+            else:
+                _log_reused(contract.path, job[0])
+                results.append(result)
+        return results
+
+    logger.info(f"Building {stale} apps with {workers} workers")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: list[Future] = []
+        for job, result in zip(jobs, cached):
+            if result is None:
+                futures.append(executor.submit(_build_in_worker, *job))
+            else:
+                reused: Future = Future()
+                reused.set_result(([], result, None))
+                futures.append(reused)
+        pending: set[Future] = {future for future in futures if not future.done()}
+        while len(results) < len(futures):
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            failed = any(not future.cancelled() and future.result()[2] for future in done)
+            if failed:
+                for future in pending:
+                    future.cancel()
+            # Replay the finished prefix, stopping at the first build still running.
+            for index in range(len(results), len(futures)):
+                contract, future = to_build[index], futures[index]
+                if not future.done() or future.cancelled():
+                    break
+                logger.info(f"Building app at {contract.path}")
+                if cached[index] is not None:
+                    _log_reused(contract.path, jobs[index][0])
+                records, result, error = future.result()
+                for record in records:
+                    logger.handle(record)
+                if error:
+                    executor.shutdown(cancel_futures=True)
+                    raise Exception(f"Could not build {contract.name}: {error}")
+                results.append(result)  # type: ignore[arg-type]
+    return results
+
+
+WATCH_POLL_SECONDS = 0.5
+WATCH_DEBOUNCE_SECONDS = 1.0
+
+
+def _source_mtimes(
+    sources: dict[str, list[Path]],
+) -> dict[str, dict[Path, int | None]]:
+    """Modification times of each contract's sources, with None for a missing file."""
+    mtimes: dict[str, dict[Path, int | None]] = {}
+    for name, paths in sources.items():
+        mtimes[name] = {}
+        for path in paths:
+            try:
+                mtimes[name][path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtimes[name][path] = None
+    return mtimes
+
+
+def _published_build_key(output_dir: Path) -> str | None:
+    """The cache key of the artifacts currently published in output_dir, if any."""
+    try:
+        return json.loads((output_dir / BUILD_CACHE_FILE).read_text()).get("key")
+    except (OSError, ValueError):
+        return None
+
+
+def _rebuild(
+    artifact_path: Path, to_build: list[SmartContract], deploy: bool
+) -> None:
+    """Builds the contracts and, if deploy is set, deploys those whose artifacts changed."""
+    previous_keys = {
+        contract.name: _published_build_key(artifact_path / contract.name)
+        for contract in to_build
+    }
+    try:
+        build_all(artifact_path, to_build)
+    except Exception as e:
+        logger.error(f"Build failed: {e}")
+        return
+    if not deploy:
+        return
+    for contract in to_build:
+        if not contract.deploy:
+            continue
+        if _published_build_key(artifact_path / contract.name) == previous_keys[contract.name]:
+            continue
+        # deploy() imports the generated client, so drop the copy imported before this build.
+        client_package = f"{root_path.name}.artifacts.{contract.name}"
+        for module_name in list(sys.modules):
+            if module_name == client_package or module_name.startswith(f"{client_package}."):
+                del sys.modules[module_name]
+        importlib.invalidate_caches()
+        logger.info(f"Deploying {contract.name}")
+        try:
+            contract.deploy()
+        except Exception as e:
+            logger.error(f"Could not deploy {contract.name}: {e}")
+
+
+def watch(artifact_path: Path, to_watch: list[SmartContract], deploy: bool = False) -> None:
+    """
+    Rebuilds contracts when their contract.py or a local module it imports changes,
+    by polling modification times. Changes are collected until the sources have been
+    quiet for WATCH_DEBOUNCE_SECONDS, so a burst of saves triggers one rebuild, and
+    only the affected contracts are rebuilt. Rebuilds go through the build cache, so
+    a save that leaves the content unchanged costs nothing. If deploy is set, each
+    contract whose artifacts changed is redeployed to the network configured in .env.
+    """
+    sources = {contract.name: contract_sources(contract.path) for contract in to_watch}
+    _rebuild(artifact_path, to_watch, deploy=False)
+    mtimes = _source_mtimes(sources)
+    logger.info(
+        f"Watching {', '.join(sources)} for changes, press Ctrl+C to stop"
+    )
+    try:
+        while True:
+            time.sleep(WATCH_POLL_SECONDS)
+            snapshot = _source_mtimes(sources)
+            if snapshot == mtimes:
+                continue
+            # Wait for the burst of saves to settle before rebuilding.
+            while True:
+                time.sleep(WATCH_DEBOUNCE_SECONDS)
+                settled = _source_mtimes(sources)
+                if settled == snapshot:
+                    break
+                snapshot = settled
+
+            changed = [
+                contract
+                for contract in to_watch
+                if snapshot[contract.name] != mtimes[contract.name]
+            ]
+            # The change may have added or removed imports, so resolve them again.
+            for contract in changed:
+                try:
+                    sources[contract.name] = contract_sources(contract.path)
+                except (OSError, SyntaxError):
+                    pass  # the build reports the error; keep watching the old sources
+            mtimes = _source_mtimes(sources)
+
+            logger.info(f"Changes detected in {', '.join(c.name for c in changed)}")
+            _rebuild(artifact_path, changed, deploy)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+
+
+BENCHMARK_RUNS = 5
+
+
+def benchmark(artifact_path: Path, to_benchmark: list[SmartContract]) -> None:
+    """
+    Times full builds of each contract with every backend, into scratch directories so
+    the build cache never applies. The in-process backend's first run includes
+    importing the compiler; later runs show its cost in a long-lived process.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for contract in to_benchmark:
+            template_params = (
+                contract.template_params() if contract.template_params else None
+            )
+            for backend in BUILD_BACKENDS:
+                timings = []
+                for run in range(BENCHMARK_RUNS):
+                    output_dir = Path(scratch) / f"{contract.name}_{backend}_{run}"
+                    started = time.perf_counter()
+                    build(output_dir, contract.path, template_params, backend)
+                    timings.append(time.perf_counter() - started)
+                rows.append((contract.name, backend, timings))
+
+    logger.info(f"{'contract':>20} {'backend':>12} {'first':>8} {'mean':>8} {'min':>8}")
+    for name, backend, timings in rows:
+        rest = timings[1:] or timings
+        logger.info(
+            f"{name:>20} {backend:>12} {timings[0]:>8.2f} {sum(rest) / len(rest):>8.2f} {min(timings):>8.2f}"
+        )
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
+def configure_debugging() -> None:
+    """
+    Configures algokit_utils for deployments. Only the actions that deploy import it,
+    so a build whose artifacts are current does not pay for loading it.
+    """
+    from algokit_utils.config import config
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+
 def main(action: str, contract_name: str | None = None) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
@@ -172,10 +759,9 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, filtered_contracts)
         case "deploy":
+            configure_debugging()
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
                 app_spec_file_name = next(
@@ -192,12 +778,21 @@ def main(action: str, contract_name: str | None = None) -> None:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
         case "all":
+            configure_debugging()
+            build_all(artifact_path, filtered_contracts)
             for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
+        case "watch":
+            configure_debugging()
+            watch(
+                artifact_path,
+                filtered_contracts,
+                deploy=os.environ.get("WATCH_DEPLOY", "").lower() in ("1", "true"),
+            )
+        case "benchmark":
+            benchmark(artifact_path, filtered_contracts)
         case _:
             logger.error(f"Unknown action: {action}")
 
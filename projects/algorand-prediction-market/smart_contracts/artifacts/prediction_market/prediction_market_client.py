@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "string[]", "name": "options"}, {"type": "uint64[]", "name": "odds"}, {"type": "uint64", "name": "duration_hours"}], "name": "create_market", "returns": {"type": "uint64"}, "desc": "Create a new prediction market.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "option_index"}, {"type": "pay", "name": "payment_txn"}], "name": "place_bet", "returns": {"type": "void"}, "desc": "Place a bet on a market option.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}], "name": "settle_market", "returns": {"type": "void"}, "desc": "Settle a market by determining the winning option.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "claim_winnings", "returns": {"type": "uint64"}, "desc": "Claim winnings from a settled market.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "get_market_info", "returns": {"type": "(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)"}, "desc": "Get comprehensive market information.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "user"}], "name": "get_user_position", "returns": {"type": "(uint64[],uint64,bool)"}, "desc": "Get user's betting position for a market.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_market_count", "returns": {"type": "uint64"}, "desc": "Get total market count.", "events": [], "readonly": true, "recommendations": {}}], "name": "PredictionMarket", "state": {"keys": {"box": {}, "global": {"market_counter": {"key": "bWFya2V0X2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "market_title": {"key": "bWFya2V0X3RpdGxl", "keyType": "AVMString", "valueType": "AVMString"}, "total_pool": {"key": "dG90YWxfcG9vbA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAAEIAyYGDm1hcmtldF9jb3VudGVyCnRvdGFsX3Bvb2wEFR98dQxtYXJrZXRfdGl0bGUHY3JlYXRvcggAAAAAAAAAADEYQAAPKCJnK4AAZykiZycEMQBnMRtBANCCBwTLO5wEBJwdvmcE0quKcATjXMEcBNei11UEQDFOfARyUKlANhoAjgcAfABgAE4AOwAoABIAAiJDMRkURDEYRIgCUCpMULAjQzEZFEQxGEQ2GgE2GgKIAgYqTFCwI0MxGRREMRhENhoBiAE2KkxQsCNDMRkURDEYRDYaAYgBCypMULAjQzEZFEQxGEQ2GgE2GgKIANkjQzEZFEQxGEQ2GgE2GgIxFiMJSTgQIxJEiACHI0MxGRREMRhENhoBNhoCNhoDNhoEiAARKkxQsCNDMRlA/2MxGBREI0OKBAGL/SJZRwKBAg9Ei/4iWRJEIosBiwAMQQAhi/5XAgCLAUlOAiQLJFiACAAAAAAAAABlp0QjCIwBQv/XIihlRCMIKExni/xXAgArTGcpImcnBDEAZyIoZUQWjACJigMAi/0XIihlRA5Ei/4XJQxEi/84BzIKEkSL/zgISYHAhD0PRIv/OAAxABJEIillRAgpTGeJigIAMQAiJwRlRBJEi/4XIihlRA5Ei/8XJQxEiYoBAYv/FyIoZUQORCIpZUSBWguBZAoWiYoBAYv/FyIoZUQORCIrZURJFRZXBgJMUCIpZUQWMgeBgKMFCBZLAhWBKAhJFlcGAoACAChMUEyBJghJFlcGAk8CTFBMgRoIFlcGAlBPAlBMUCcFUCcFUExQgCYAAwAGABAAGgAIT3B0aW9uIDEACE9wdGlvbiAyAAhPcHRpb24gM1CAGgADAAAAAAAAAMgAAAAAAAABLAAAAAAAAACWUIAaAAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQiYoCAYv+FyIoZUQORIAlAAsAAAAAAAAAAAAAAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIkiKGVEFok=", "clear": "CoEBQw=="}, "desc": "A comprehensive prediction market smart contract for sports betting.", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzCiAgICBieXRlY2Jsb2NrICJtYXJrZXRfY291bnRlciIgInRvdGFsX3Bvb2wiIDB4MTUxZjdjNzUgIm1hcmtldF90aXRsZSIgImNyZWF0b3IiIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgtOQogICAgLy8gIyBHbG9iYWwgc3RhdGUKICAgIC8vIHNlbGYubWFya2V0X2NvdW50ZXIgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAKICAgIC8vIHNlbGYubWFya2V0X3RpdGxlID0gU3RyaW5nKCIiKQogICAgYnl0ZWNfMyAvLyAibWFya2V0X3RpdGxlIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExCiAgICAvLyBzZWxmLnRvdGFsX3Bvb2wgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3Bvb2wiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMgogICAgLy8gc2VsZi5jcmVhdG9yID0gVHhuLnNlbmRlcgogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTIKICAgIHB1c2hieXRlc3MgMHhjYjNiOWMwNCAweDljMWRiZTY3IDB4ZDJhYjhhNzAgMHhlMzVjYzExYyAweGQ3YTJkNzU1IDB4NDAzMTRlN2MgMHg3MjUwYTk0MCAvLyBtZXRob2QgImNyZWF0ZV9tYXJrZXQoc3RyaW5nLHN0cmluZ1tdLHVpbnQ2NFtdLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgInBsYWNlX2JldCh1aW50NjQsdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJzZXR0bGVfbWFya2V0KHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW1fd2lubmluZ3ModWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X21hcmtldF9pbmZvKHVpbnQ2NCkoc3RyaW5nLHN0cmluZ1tdLHVpbnQ2NFtdLHVpbnQ2NFtdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF91c2VyX3Bvc2l0aW9uKHVpbnQ2NCxhZGRyZXNzKSh1aW50NjRbXSx1aW50NjQsYm9vbCkiLCBtZXRob2QgImdldF9tYXJrZXRfY291bnQoKXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX21hcmtldF9yb3V0ZUA1IG1haW5fcGxhY2VfYmV0X3JvdXRlQDYgbWFpbl9zZXR0bGVfbWFya2V0X3JvdXRlQDcgbWFpbl9jbGFpbV93aW5uaW5nc19yb3V0ZUA4IG1haW5fZ2V0X21hcmtldF9pbmZvX3JvdXRlQDkgbWFpbl9nZXRfdXNlcl9wb3NpdGlvbl9yb3V0ZUAxMCBtYWluX2dldF9tYXJrZXRfY291bnRfcm91dGVAMTEKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9tYXJrZXRfY291bnRfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTQzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfbWFya2V0X2NvdW50CiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF91c2VyX3Bvc2l0aW9uX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3VzZXJfcG9zaXRpb24KICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X21hcmtldF9pbmZvX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X21hcmtldF9pbmZvCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3dpbm5pbmdzX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY2xhaW1fd2lubmluZ3MKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0dGxlX21hcmtldF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldHRsZV9tYXJrZXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcGxhY2VfYmV0X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwbGFjZV9iZXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX21hcmtldF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZV9tYXJrZXQKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuY3JlYXRlX21hcmtldCh0aXRsZTogYnl0ZXMsIG9wdGlvbnM6IGJ5dGVzLCBvZGRzOiBieXRlcywgZHVyYXRpb25faG91cnM6IGJ5dGVzKSAtPiBieXRlczoKY3JlYXRlX21hcmtldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxNC0yMQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX21hcmtldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHRpdGxlOiBhcmM0LlN0cmluZywKICAgIC8vICAgICBvcHRpb25zOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10sCiAgICAvLyAgICAgb2RkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gICAgIGR1cmF0aW9uX2hvdXJzOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjIzLTI0CiAgICAvLyAjIEJhc2ljIHZhbGlkYXRpb24KICAgIC8vIGFzc2VydCBvcHRpb25zLmxlbmd0aCA+PSAyLCAiTWFya2V0IG11c3QgaGF2ZSBhdCBsZWFzdCAyIG9wdGlvbnMiCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwbiAyCiAgICBwdXNoaW50IDIgLy8gMgogICAgPj0KICAgIGFzc2VydCAvLyBNYXJrZXQgbXVzdCBoYXZlIGF0IGxlYXN0IDIgb3B0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgb3B0aW9ucy5sZW5ndGggPT0gb2Rkcy5sZW5ndGgsICJPcHRpb25zIGFuZCBvZGRzIG11c3QgaGF2ZSBzYW1lIGxlbmd0aCIKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICA9PQogICAgYXNzZXJ0IC8vIE9wdGlvbnMgYW5kIG9kZHMgbXVzdCBoYXZlIHNhbWUgbGVuZ3RoCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjctMjgKICAgIC8vICMgVmFsaWRhdGUgb2RkcyAobWluaW11bSAxMDEgPSAxLjAxeCkKICAgIC8vIGZvciBpIGluIHVyYW5nZShvcHRpb25zLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAoKY3JlYXRlX21hcmtldF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjctMjgKICAgIC8vICMgVmFsaWRhdGUgb2RkcyAobWluaW11bSAxMDEgPSAxLjAxeCkKICAgIC8vIGZvciBpIGluIHVyYW5nZShvcHRpb25zLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGNyZWF0ZV9tYXJrZXRfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToyOQogICAgLy8gYXNzZXJ0IG9kZHNbaV0gPj0gMTAxLCAiT2RkcyBtdXN0IGJlIGF0IGxlYXN0IDEuMDEgKDEwMSkiCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDA2NQogICAgYj49CiAgICBhc3NlcnQgLy8gT2RkcyBtdXN0IGJlIGF0IGxlYXN0IDEuMDEgKDEwMSkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToyNy0yOAogICAgLy8gIyBWYWxpZGF0ZSBvZGRzIChtaW5pbXVtIDEwMSA9IDEuMDF4KQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG9wdGlvbnMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgY3JlYXRlX21hcmtldF9mb3JfaGVhZGVyQDEKCmNyZWF0ZV9tYXJrZXRfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzEtMzIKICAgIC8vICMgSW5jcmVtZW50IG1hcmtldCBjb3VudGVyIGFuZCBzdG9yZSBiYXNpYyBtYXJrZXQgaW5mbwogICAgLy8gc2VsZi5tYXJrZXRfY291bnRlciArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJtYXJrZXRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18wIC8vICJtYXJrZXRfY291bnRlciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzMKICAgIC8vIHNlbGYubWFya2V0X3RpdGxlID0gdGl0bGUubmF0aXZlCiAgICBmcmFtZV9kaWcgLTQKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlY18zIC8vICJtYXJrZXRfdGl0bGUiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM0CiAgICAvLyBzZWxmLnRvdGFsX3Bvb2wgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3Bvb2wiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNQogICAgLy8gc2VsZi5jcmVhdG9yID0gVHhuLnNlbmRlcgogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzcKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLm1hcmtldF9jb3VudGVyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgaXRvYgogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5wbGFjZV9iZXQobWFya2V0X2lkOiBieXRlcywgb3B0aW9uX2luZGV4OiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gdm9pZDoKcGxhY2VfYmV0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM5LTQ1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwbGFjZV9iZXQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBtYXJrZXRfaWQ6IGFyYzQuVUludDY0LAogICAgLy8gICAgIG9wdGlvbl9pbmRleDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGF5bWVudF90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0Ny00OAogICAgLy8gIyBCYXNpYyB2YWxpZGF0aW9uCiAgICAvLyBhc3NlcnQgbWFya2V0X2lkLm5hdGl2ZSA8PSBzZWxmLm1hcmtldF9jb3VudGVyLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgZnJhbWVfZGlnIC0zCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAibWFya2V0X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0X2NvdW50ZXIgZXhpc3RzCiAgICA8PQogICAgYXNzZXJ0IC8vIE1hcmtldCBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgb3B0aW9uX2luZGV4Lm5hdGl2ZSA8IDMsICJJbnZhbGlkIG9wdGlvbiBpbmRleCIgICMgU2ltcGxpZmllZCB0byAzIG9wdGlvbnMgbWF4CiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGludGNfMyAvLyAzCiAgICA8CiAgICBhc3NlcnQgLy8gSW52YWxpZCBvcHRpb24gaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MS01MgogICAgLy8gIyBWYWxpZGF0ZSBwYXltZW50IHRyYW5zYWN0aW9uCiAgICAvLyBhc3NlcnQgcGF5bWVudF90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBhcHBsaWNhdGlvbiIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSB0byBhcHBsaWNhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBhc3NlcnQgcGF5bWVudF90eG4uYW1vdW50ID49IDFfMDAwXzAwMCwgIk1pbmltdW0gYmV0IGlzIDEgQUxHTyIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIHB1c2hpbnQgMTAwMDAwMCAvLyAxMDAwMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIE1pbmltdW0gYmV0IGlzIDEgQUxHTwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhc3NlcnQgcGF5bWVudF90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIsICJQYXltZW50IHNlbmRlciBtdXN0IG1hdGNoIHRyYW5zYWN0aW9uIHNlbmRlciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgc2VuZGVyIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTYtNTcKICAgIC8vICMgVXBkYXRlIHRvdGFsIHBvb2wKICAgIC8vIHNlbGYudG90YWxfcG9vbCArPSBwYXltZW50X3R4bi5hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9wb29sIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3Bvb2wgZXhpc3RzCiAgICArCiAgICBieXRlY18xIC8vICJ0b3RhbF9wb29sIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LnNldHRsZV9tYXJrZXQobWFya2V0X2lkOiBieXRlcywgd2lubmluZ19vcHRpb246IGJ5dGVzKSAtPiB2b2lkOgpzZXR0bGVfbWFya2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU5LTYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXR0bGVfbWFya2V0KHNlbGYsIG1hcmtldF9pZDogYXJjNC5VSW50NjQsIHdpbm5pbmdfb3B0aW9uOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjYyLTYzCiAgICAvLyAjIE9ubHkgY3JlYXRvciBjYW4gc2V0dGxlCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IsICJPbmx5IG1hcmtldCBjcmVhdG9yIGNhbiBzZXR0bGUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IG1hcmtldCBjcmVhdG9yIGNhbiBzZXR0bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NAogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgPD0gc2VsZi5tYXJrZXRfY291bnRlciwgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NQogICAgLy8gYXNzZXJ0IHdpbm5pbmdfb3B0aW9uLm5hdGl2ZSA8IDMsICJJbnZhbGlkIHdpbm5pbmcgb3B0aW9uIgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpbnRjXzMgLy8gMwogICAgPAogICAgYXNzZXJ0IC8vIEludmFsaWQgd2lubmluZyBvcHRpb24KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmNsYWltX3dpbm5pbmdzKG1hcmtldF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpjbGFpbV93aW5uaW5nczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2Ny02OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY2xhaW1fd2lubmluZ3Moc2VsZiwgbWFya2V0X2lkOiBhcmM0LlVJbnQ2NCkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MAogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgPD0gc2VsZi5tYXJrZXRfY291bnRlciwgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3Mi03MwogICAgLy8gIyBTaW1wbGlmaWVkIHBheW91dCAtIHJldHVybiA5MCUgb2YgdG90YWwgcG9vbCB0byBjbGFpbWFudAogICAgLy8gcGF5b3V0ID0gc2VsZi50b3RhbF9wb29sICogVUludDY0KDkwKSAvLyBVSW50NjQoMTAwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3Bvb2wiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcG9vbCBleGlzdHMKICAgIHB1c2hpbnQgOTAgLy8gOTAKICAgICoKICAgIHB1c2hpbnQgMTAwIC8vIDEwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc1CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQocGF5b3V0KQogICAgaXRvYgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuZ2V0X21hcmtldF9pbmZvKG1hcmtldF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfbWFya2V0X2luZm86CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzctODcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9tYXJrZXRfaW5mbyhzZWxmLCBtYXJrZXRfaWQ6IGFyYzQuVUludDY0KSAtPiBhcmM0LlR1cGxlWwogICAgLy8gICAgIGFyYzQuU3RyaW5nLCAgIyB0aXRsZQogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSwgICMgb3B0aW9ucwogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSwgICMgb2RkcwogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSwgICMgb3B0aW9uX3Bvb2xzCiAgICAvLyAgICAgYXJjNC5VSW50NjQsICAjIHRvdGFsX3Bvb2wKICAgIC8vICAgICBhcmM0LlVJbnQ2NCwgICMgZW5kX3RpbWUKICAgIC8vICAgICBhcmM0LlVJbnQ2NCwgICMgc3RhdHVzCiAgICAvLyAgICAgYXJjNC5VSW50NjQgICAjIHdpbm5pbmdfb3B0aW9uCiAgICAvLyBdOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODkKICAgIC8vIGFzc2VydCBtYXJrZXRfaWQubmF0aXZlIDw9IHNlbGYubWFya2V0X2NvdW50ZXIsICJNYXJrZXQgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJtYXJrZXRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRfY291bnRlciBleGlzdHMKICAgIDw9CiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTExCiAgICAvLyBhcmM0LlN0cmluZyhzZWxmLm1hcmtldF90aXRsZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAibWFya2V0X3RpdGxlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF90aXRsZSBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE1CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnRvdGFsX3Bvb2wpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3Bvb2wiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcG9vbCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTYKICAgIC8vIGFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgVUludDY0KDg2NDAwKSksICAjIGVuZF90aW1lOiAyNCBob3VycyBmcm9tIG5vdwogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgcHVzaGludCA4NjQwMCAvLyA4NjQwMAogICAgKwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMC0xMTkKICAgIC8vIHJldHVybiBhcmM0LlR1cGxlKCgKICAgIC8vICAgICBhcmM0LlN0cmluZyhzZWxmLm1hcmtldF90aXRsZSksCiAgICAvLyAgICAgb3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb2Rkcy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX3Bvb2xzLmNvcHkoKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLnRvdGFsX3Bvb2wpLAogICAgLy8gICAgIGFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wICsgVUludDY0KDg2NDAwKSksICAjIGVuZF90aW1lOiAyNCBob3VycyBmcm9tIG5vdwogICAgLy8gICAgIGFyYzQuVUludDY0KDApLCAgIyBzdGF0dXM6IGFjdGl2ZQogICAgLy8gICAgIGFyYzQuVUludDY0KDApICAgIyB3aW5uaW5nX29wdGlvbjogbm90IHNldAogICAgLy8gKSkKICAgIGRpZyAyCiAgICBsZW4KICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwMjgKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgcHVzaGludCAzOCAvLyAzOAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHB1c2hpbnQgMjYgLy8gMjYKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTcKICAgIC8vIGFyYzQuVUludDY0KDApLCAgIyBzdGF0dXM6IGFjdGl2ZQogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAtMTE5CiAgICAvLyByZXR1cm4gYXJjNC5UdXBsZSgoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcoc2VsZi5tYXJrZXRfdGl0bGUpLAogICAgLy8gICAgIG9wdGlvbnMuY29weSgpLAogICAgLy8gICAgIG9kZHMuY29weSgpLAogICAgLy8gICAgIG9wdGlvbl9wb29scy5jb3B5KCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi50b3RhbF9wb29sKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIFVJbnQ2NCg4NjQwMCkpLCAgIyBlbmRfdGltZTogMjQgaG91cnMgZnJvbSBub3cKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwgICMgc3RhdHVzOiBhY3RpdmUKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSAgICMgd2lubmluZ19vcHRpb246IG5vdCBzZXQKICAgIC8vICkpCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTgKICAgIC8vIGFyYzQuVUludDY0KDApICAgIyB3aW5uaW5nX29wdGlvbjogbm90IHNldAogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAtMTE5CiAgICAvLyByZXR1cm4gYXJjNC5UdXBsZSgoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcoc2VsZi5tYXJrZXRfdGl0bGUpLAogICAgLy8gICAgIG9wdGlvbnMuY29weSgpLAogICAgLy8gICAgIG9kZHMuY29weSgpLAogICAgLy8gICAgIG9wdGlvbl9wb29scy5jb3B5KCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi50b3RhbF9wb29sKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIFVJbnQ2NCg4NjQwMCkpLCAgIyBlbmRfdGltZTogMjQgaG91cnMgZnJvbSBub3cKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwgICMgc3RhdHVzOiBhY3RpdmUKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSAgICMgd2lubmluZ19vcHRpb246IG5vdCBzZXQKICAgIC8vICkpCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkxLTk2CiAgICAvLyAjIFJldHVybiBzaW1wbGlmaWVkIG1hcmtldCBpbmZvCiAgICAvLyBvcHRpb25zID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKCJPcHRpb24gMSIpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKCJPcHRpb24gMiIpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKCJPcHRpb24gMyIpCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAzMDAwNjAwMTAwMDFhMDAwODRmNzA3NDY5NmY2ZTIwMzEwMDA4NGY3MDc0Njk2ZjZlMjAzMjAwMDg0ZjcwNzQ2OTZmNmUyMDMzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwLTExOQogICAgLy8gcmV0dXJuIGFyYzQuVHVwbGUoKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHNlbGYubWFya2V0X3RpdGxlKSwKICAgIC8vICAgICBvcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvZGRzLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25fcG9vbHMuY29weSgpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudG90YWxfcG9vbCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBVSW50NjQoODY0MDApKSwgICMgZW5kX3RpbWU6IDI0IGhvdXJzIGZyb20gbm93CiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksICAjIHN0YXR1czogYWN0aXZlCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCkgICAjIHdpbm5pbmdfb3B0aW9uOiBub3Qgc2V0CiAgICAvLyApKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTgtMTAyCiAgICAvLyBvZGRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKAogICAgLy8gICAgIGFyYzQuVUludDY0KDIwMCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMzAwKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgxNTApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAzMDAwMDAwMDAwMDAwMDBjODAwMDAwMDAwMDAwMDAxMmMwMDAwMDAwMDAwMDAwMDk2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwLTExOQogICAgLy8gcmV0dXJuIGFyYzQuVHVwbGUoKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHNlbGYubWFya2V0X3RpdGxlKSwKICAgIC8vICAgICBvcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvZGRzLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25fcG9vbHMuY29weSgpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudG90YWxfcG9vbCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBVSW50NjQoODY0MDApKSwgICMgZW5kX3RpbWU6IDI0IGhvdXJzIGZyb20gbm93CiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksICAjIHN0YXR1czogYWN0aXZlCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCkgICAjIHdpbm5pbmdfb3B0aW9uOiBub3Qgc2V0CiAgICAvLyApKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0LTEwOAogICAgLy8gb3B0aW9uX3Bvb2xzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKAogICAgLy8gICAgIGFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFyYzQuVUludDY0KDApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAzMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwLTExOQogICAgLy8gcmV0dXJuIGFyYzQuVHVwbGUoKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHNlbGYubWFya2V0X3RpdGxlKSwKICAgIC8vICAgICBvcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvZGRzLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25fcG9vbHMuY29weSgpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYudG90YWxfcG9vbCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBVSW50NjQoODY0MDApKSwgICMgZW5kX3RpbWU6IDI0IGhvdXJzIGZyb20gbm93CiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksICAjIHN0YXR1czogYWN0aXZlCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCkgICAjIHdpbm5pbmdfb3B0aW9uOiBub3Qgc2V0CiAgICAvLyApKQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5nZXRfdXNlcl9wb3NpdGlvbihtYXJrZXRfaWQ6IGJ5dGVzLCB1c2VyOiBieXRlcykgLT4gYnl0ZXM6CmdldF91c2VyX3Bvc2l0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMS0xMjYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF91c2VyX3Bvc2l0aW9uKHNlbGYsIG1hcmtldF9pZDogYXJjNC5VSW50NjQsIHVzZXI6IGFyYzQuQWRkcmVzcykgLT4gYXJjNC5UdXBsZVsKICAgIC8vICAgICBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0sICAjIHVzZXJfYmV0cyBwZXIgb3B0aW9uCiAgICAvLyAgICAgYXJjNC5VSW50NjQsICAjIHRvdGFsX2JldF9hbW91bnQKICAgIC8vICAgICBhcmM0LkJvb2wgICAgICMgaXNfY2xhaW1lZAogICAgLy8gXToKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyOAogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgPD0gc2VsZi5tYXJrZXRfY291bnRlciwgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgPD0KICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzctMTQxCiAgICAvLyByZXR1cm4gYXJjNC5UdXBsZSgoCiAgICAvLyAgICAgdXNlcl9iZXRzLmNvcHkoKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwgICAgICMgdG90YWxfYmV0X2Ftb3VudAogICAgLy8gICAgIGFyYzQuQm9vbChGYWxzZSkgICAgIyBpc19jbGFpbWVkCiAgICAvLyApKQogICAgcHVzaGJ5dGVzIDB4MDAwYjAwMDAwMDAwMDAwMDAwMDAwMDAwMDMwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmdldF9tYXJrZXRfY291bnQoKSAtPiBieXRlczoKZ2V0X21hcmtldF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxNDYKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLm1hcmtldF9jb3VudGVyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgaXRvYgogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [355], "errorMessage": "Index access is out of bounds"}, {"pc": [425], "errorMessage": "Invalid option index"}, {"pc": [488], "errorMessage": "Invalid winning option"}, {"pc": [419, 482, 501, 525, 714], "errorMessage": "Market does not exist"}, {"pc": [326], "errorMessage": "Market must have at least 2 options"}, {"pc": [444], "errorMessage": "Minimum bet is 1 ALGO"}, {"pc": [367], "errorMessage": "Odds must be at least 1.01 (101)"}, {"pc": [156, 172, 194, 213, 232, 250, 278], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [473], "errorMessage": "Only market creator can settle"}, {"pc": [332], "errorMessage": "Options and odds must have same length"}, {"pc": [433], "errorMessage": "Payment must be to application"}, {"pc": [452], "errorMessage": "Payment sender must match transaction sender"}, {"pc": [311], "errorMessage": "can only call when creating"}, {"pc": [159, 175, 197, 216, 235, 253, 281], "errorMessage": "can only call when not creating"}, {"pc": [471], "errorMessage": "check self.creator exists"}, {"pc": [378, 403, 417, 480, 499, 523, 712, 758], "errorMessage": "check self.market_counter exists"}, {"pc": [529], "errorMessage": "check self.market_title exists"}, {"pc": [456, 505, 541], "errorMessage": "check self.total_pool exists"}, {"pc": [269], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "string[]", "name": "options"}, {"type": "uint16[]", "name": "odds"}, {"type": "uint64", "name": "duration_hours"}, {"type": "pay", "name": "payment_txn"}], "name": "create_market", "returns": {"type": "uint64"}, "desc": "Create a new prediction market.\npayment_txn must pay exactly the minimum balance of the market's boxes, which archive_market returns to the creator. Markets with many options pool extra opcode budget through OpUp inner app calls, paid for by the caller's fee surplus.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "option_count"}, {"type": "uint64", "name": "end_time"}], "name": "MarketCreated", "desc": "ARC-28 event emitted by create_market."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint16[]", "name": "option_ids"}, {"type": "uint16[]", "name": "odds"}, {"type": "uint64", "name": "duration_hours"}, {"type": "pay", "name": "payment_txn"}], "name": "create_market_with_ids", "returns": {"type": "uint64"}, "desc": "Create a market whose option names are registered strings, stored as 2-byte ids.\npayment_txn pays the box deposit, as for create_market.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "option_count"}, {"type": "uint64", "name": "end_time"}], "name": "MarketCreated", "desc": "ARC-28 event emitted by create_market."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint64", "name": "option_set_id"}, {"type": "uint16[]", "name": "odds"}, {"type": "uint64", "name": "duration_hours"}, {"type": "pay", "name": "payment_txn"}], "name": "create_market_from_template", "returns": {"type": "uint64"}, "desc": "Create a market with the options of a registered option-set template.\npayment_txn pays the box deposit, as for create_market.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "option_count"}, {"type": "uint64", "name": "end_time"}], "name": "MarketCreated", "desc": "ARC-28 event emitted by create_market."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "uint64[]", "name": "boundaries"}, {"type": "uint16[]", "name": "odds"}, {"type": "uint64", "name": "duration_hours"}, {"type": "pay", "name": "payment_txn"}], "name": "create_scalar_market", "returns": {"type": "uint64"}, "desc": "Create a market on a numeric result, such as total goals, split into buckets.\nboundaries must be strictly increasing; n boundaries make n + 1 buckets, which are the market's options: bucket 0 is below the first boundary and bucket i covers [boundary i-1, boundary i). The boundaries are packed in a b\"b\" box and settle_scalar_market maps the result to its bucket. payment_txn pays the box deposit, boundaries box included, as for create_market.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "option_count"}, {"type": "uint64", "name": "end_time"}], "name": "MarketCreated", "desc": "ARC-28 event emitted by create_market."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "value"}, {"type": "pay", "name": "payment_txn"}], "name": "register_string", "returns": {"type": "uint16"}, "desc": "Intern a string, such as a team name, and return its id.\nRegistering a string that is already in the registry returns its existing id. Boxes used: b\"h\" + sha256(value) and b\"s\" + the new id. payment_txn must pay exactly the minimum balance of the two new boxes, or nothing for a string already registered; registry boxes are permanent, so the deposit is not refunded.", "events": [{"args": [{"type": "uint16", "name": "string_id"}, {"type": "string", "name": "value"}], "name": "StringRegistered", "desc": "ARC-28 event emitted when a string is added to the registry."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint16[]", "name": "string_ids"}, {"type": "pay", "name": "payment_txn"}], "name": "register_option_set", "returns": {"type": "uint64"}, "desc": "Register a reusable option-set template (e.g. Home/Draw/Away) of string ids and return its id.\npayment_txn must pay exactly the minimum balance of the template's box, which is permanent.", "events": [{"args": [{"type": "uint64", "name": "option_set_id"}, {"type": "uint16[]", "name": "string_ids"}], "name": "OptionSetRegistered", "desc": "ARC-28 event emitted when an option-set template is registered."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "option_index"}, {"type": "pay", "name": "payment_txn"}], "name": "place_bet", "returns": {"type": "(uint64,uint64[],uint64[],uint64)", "struct": "BetResult"}, "desc": "Place a bet on a market option and return the resulting pools and caller's position.\nOn the caller's first bet in a market the payment also covers the minimum balance of the boxes the bet creates (see _open_position); the rest of the payment is staked. close_positions refunds the deposit.\nThe return value (28 + 16 bytes per option) and the BetPlaced event share the 1024-byte log limit, which caps markets bet on this way at 58 options.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "option"}, {"type": "address", "name": "bettor"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "new_option_pool"}], "name": "BetPlaced", "desc": "ARC-28 event emitted for every bet, with the option pool after the bet."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "market_ids"}, {"type": "uint64[]", "name": "option_indexes"}, {"type": "uint64[]", "name": "amounts"}, {"type": "pay", "name": "payment_txn"}], "name": "place_bets", "returns": {"type": "void"}, "desc": "Place several bets (legs) in one call, all covered by a single grouped payment.\nThe payment must equal the sum of the amounts plus the minimum balance of the boxes opened by legs in markets new to the caller, which close_positions refunds. Each leg emits a BetPlaced event and a transaction may log at most 1024 bytes, so one call takes up to 15 legs; split longer slips across app calls in the same group.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "option"}, {"type": "address", "name": "bettor"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "new_option_pool"}], "name": "BetPlaced", "desc": "ARC-28 event emitted for every bet, with the option pool after the bet."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}], "name": "settle_market", "returns": {"type": "(uint64,uint64,uint64,uint64)", "struct": "SettlementResult"}, "desc": "Settle a market by determining the winning option and return its payout state.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "winning_pool"}, {"type": "uint64", "name": "payout_ratio"}], "name": "MarketSettled", "desc": "ARC-28 event emitted when a market is settled."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "result"}], "name": "settle_scalar_market", "returns": {"type": "(uint64,uint64,uint64,uint64)", "struct": "SettlementResult"}, "desc": "Settle a scalar market on its numeric result; the bucket holding it wins.\nThe bucket is found by binary search over the packed boundaries, so the cost grows with log(buckets).", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "winning_pool"}, {"type": "uint64", "name": "payout_ratio"}], "name": "MarketSettled", "desc": "ARC-28 event emitted when a market is settled."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "market_ids"}, {"type": "uint64[]", "name": "winning_options"}], "name": "settle_markets", "returns": {"type": "void"}, "desc": "Settle a batch of markets in one call; the caller must have created each of them.\nEach market emits a MarketSettled event and a transaction may log at most 1024 bytes, so one call settles up to 28 markets; split larger batches across app calls in the same group. Large batches pool opcode budget through OpUp inner app calls, paid for by the caller's fee surplus.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "winning_pool"}, {"type": "uint64", "name": "payout_ratio"}], "name": "MarketSettled", "desc": "ARC-28 event emitted when a market is settled."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "claim_winnings", "returns": {"type": "(uint64,uint64,bool)", "struct": "ClaimResult"}, "desc": "Claim winnings from a settled market.\nReturns the payout with the market's status and the position's claimed flag as they stand after the claim.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "claimant"}, {"type": "uint64", "name": "payout"}], "name": "WinningsClaimed", "desc": "ARC-28 event emitted for every claimed position."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "market_ids"}], "name": "claim_all", "returns": {"type": "uint64"}, "desc": "Claim winnings from several settled markets with a single inner payment.\nThe inner payment's fee is pooled, so the caller's transaction pays it. Each market emits a WinningsClaimed event and a transaction may log at most 1024 bytes, so one call claims up to 19 markets.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "claimant"}, {"type": "uint64", "name": "payout"}], "name": "WinningsClaimed", "desc": "ARC-28 event emitted for every claimed position."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "cursor"}, {"type": "uint64", "name": "max_bettors"}], "name": "distribute", "returns": {"type": "uint64"}, "desc": "Push payouts to the next bettors of a settled market and return the new cursor.\nVisits up to max_bettors (at most MAX_DISTRIBUTE_BATCH) entries of the bettor index from cursor, which must equal the market's stored cursor, and settles each unclaimed position as claim_winnings would, paying winners with an inner payment. Index pages are deleted once visited; their minimum balance was paid by the bettors and stays in the app until close_positions refunds it.\nA market with n bettors is distributed in ceil(n / MAX_DISTRIBUTE_BATCH) calls, each spanning DISTRIBUTE_CALL_TXNS transactions to carry its references, so five calls (50 bettors) fit in one 16-transaction group, each given the cursor the previous one returns, with their inner payments covered by fee pooling. A 1,000-bettor market takes 100 calls in 20 groups.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "claimant"}, {"type": "uint64", "name": "payout"}], "name": "WinningsClaimed", "desc": "ARC-28 event emitted for every claimed position."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "archive_market", "returns": {"type": "uint64"}, "desc": "Archive a settled market once its claim period is over and return the amount swept.\nDeletes the market's record, pools, remaining bettor index pages and (for scalar markets) boundaries boxes. The market creator gets back the deposit they paid for the record, pools and boundaries, and the app creator is swept the unclaimed remainder of the pool (rake, rounding dust and unclaimed winnings). The bettor index was paid for by the bettors, so its minimum balance stays in the app for close_positions, which removes their position boxes afterwards and refunds their deposits.\nIndex pages already visited by distribute are gone, so only the rest need box references. A market with many pages pools opcode budget through OpUp inner app calls, paid for by the caller's fee surplus.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "total_pool"}, {"type": "uint64", "name": "paid_out"}, {"type": "uint64", "name": "swept"}], "name": "MarketArchived", "desc": "ARC-28 event emitted when a market is archived: its final compact record."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "address[]", "name": "bettors"}], "name": "close_positions", "returns": {"type": "uint64"}, "desc": "Delete bettors' position boxes in an archived market, refund their deposits and return the total refunded.\nEach closed position is also removed from its bettor's portfolio index. A bettor is refunded the minimum balance of their position box, their portfolio index entry and their slot in the market's bettor index (the whole page if they opened it) with one inner payment each, so a call closes at most 16 positions, fewer when it pools opcode budget through OpUp inner app calls (paid for by the caller's fee surplus) for many positions or long portfolio indexes.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "get_market_info", "returns": {"type": "(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)"}, "desc": "Get comprehensive market information.\nOptions stored as registered string ids are returned resolved, which reads the b\"s\" box of each id.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "get_bucket_boundaries", "returns": {"type": "uint64[]"}, "desc": "Get a scalar market's bucket boundaries (empty for other markets).", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}], "name": "get_market_summary", "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])", "struct": "MarketTicker"}, "desc": "Get a market's pools, status, timing, winner, version and bet statistics, without text.\nversion increases with every bet and settlement, so pollers can skip unchanged markets.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "user"}], "name": "get_user_position", "returns": {"type": "(uint64[],uint64,bool)"}, "desc": "Get user's betting position for a market.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}, {"type": "uint64", "name": "start"}, {"type": "uint64", "name": "count"}], "name": "get_user_portfolio", "returns": {"type": "(uint64,uint8,uint8,bool,uint64,uint64)[]"}, "desc": "Get a bettor's positions from their portfolio index, starting at index entry start.\nMarkets that have been archived are skipped. At most MAX_PORTFOLIO_PAGE_SIZE entries are read per call; group several calls into one simulate request to load a whole portfolio at once.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "start"}, {"type": "uint64", "name": "count"}], "name": "get_markets_page", "returns": {"type": "(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]"}, "desc": "Get summaries of the markets with ids from start onwards, skipping ids without a market.\nAt most MAX_PAGE_SIZE markets are returned per call. To list more in one request, group several page calls into a single simulate call and raise its extra opcode budget.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_market_count", "returns": {"type": "uint64"}, "desc": "Get total market count.", "events": [], "readonly": true, "recommendations": {}}], "name": "PredictionMarket", "state": {"keys": {"box": {}, "global": {"market_counter": {"key": "bWFya2V0X2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "string_counter": {"key": "c3RyaW5nX2NvdW50ZXI=", "keyType": "AVMString", "valueType": "AVMUint64"}, "option_set_counter": {"key": "b3B0aW9uX3NldF9jb3VudGVy", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"markets": {"keyType": "uint64", "valueType": "Market", "prefix": "bQ=="}, "strings": {"keyType": "uint64", "valueType": "string", "prefix": "cw=="}, "string_ids": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "aA=="}, "option_sets": {"keyType": "uint64", "valueType": "uint16[]", "prefix": "dA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"BetResult": [{"name": "total_pool", "type": "uint64"}, {"name": "option_pools", "type": "uint64[]"}, {"name": "position_stakes", "type": "uint64[]"}, {"name": "position_total", "type": "uint64"}], "ClaimResult": [{"name": "payout", "type": "uint64"}, {"name": "status", "type": "uint64"}, {"name": "claimed", "type": "bool"}], "Market": [{"name": "creator", "type": "address"}, {"name": "end_time", "type": "uint64"}, {"name": "status", "type": "uint64"}, {"name": "winning_option", "type": "uint64"}, {"name": "option_count", "type": "uint64"}, {"name": "total_pool", "type": "uint64"}, {"name": "winning_pool", "type": "uint64"}, {"name": "payout_ratio", "type": "uint64"}, {"name": "paid_out", "type": "uint64"}, {"name": "version", "type": "uint64"}, {"name": "bet_count", "type": "uint64"}, {"name": "bettor_count", "type": "uint64"}, {"name": "max_bet", "type": "uint64"}, {"name": "distribution_cursor", "type": "uint64"}, {"name": "title", "type": "string"}, {"name": "options", "type": "string[]"}, {"name": "option_ids", "type": "uint16[]"}, {"name": "odds", "type": "uint16[]"}], "MarketTicker": [{"name": "version", "type": "uint64"}, {"name": "status", "type": "uint64"}, {"name": "end_time", "type": "uint64"}, {"name": "winning_option", "type": "uint64"}, {"name": "total_pool", "type": "uint64"}, {"name": "bet_count", "type": "uint64"}, {"name": "bettor_count", "type": "uint64"}, {"name": "max_bet", "type": "uint64"}, {"name": "option_pools", "type": "uint64[]"}], "SettlementResult": [{"name": "status", "type": "uint64"}, {"name": "winning_option", "type": "uint64"}, {"name": "winning_pool", "type": "uint64"}, {"name": "payout_ratio", "type": "uint64"}]}, "byteCode": {"approval": "CiAKAAEIIJADxBMygJTr3APAhD30AyYPBBUffHUBbQgAAAAAAAAAAAF1Dm1hcmtldF9jb3VudGVyAXACAAAIAAAAAAAAAAIOc3RyaW5nX2NvdW50ZXISb3B0aW9uX3NldF9jb3VudGVyAWIBcgEAAWkDBoEBMRhAAAwnBCJnJwgiZycJImcxG0EC74IXBLwuJxQELzQx0gTn8KEPBGjG2rsE03tKxwR5uJbBBJWEq94En7UCugQx2i+yBBxereEEA58Y/gRGWgr8BMejK28EWIDlNAQO5XrwBMAiHAUEPmw5ewQxE+EiBCzoZNcEQDFOfATU4g2zBMj2p94EclCpQDYaAI4XAiEB+wHVAa8BkgF1AVUBNgEgAQoA+ADlANIAuQCmAJAAfQBqAFcAQQAoABIAAiJDMRkURDEYRIgOgihMULAjQzEZFEQxGEQ2GgE2GgKIDXwoTFCwI0MxGRREMRhENhoBNhoCNhoDiAxNKExQsCNDMRkURDEYRDYaATYaAogL1ihMULAjQzEZFEQxGEQ2GgGIC14oTFCwI0MxGRREMRhENhoBiAsyKExQsCNDMRkURDEYRDYaAYgJ/ShMULAjQzEZFEQxGEQ2GgE2GgKICMAoTFCwI0MxGRREMRhENhoBiAeyKExQsCNDMRkURDEYRDYaATYaAjYaA4gGqShMULAjQzEZFEQxGEQ2GgGIBkMoTFCwI0MxGRREMRhENhoBiAXkKExQsCNDMRkURDEYRDYaATYaAogFiiNDMRkURDEYRDYaATYaAogFCChMULAjQzEZFEQxGEQ2GgE2GgKIBL8oTFCwI0MxGRREMRhENhoBNhoCNhoDMRYjCUk4ECMSRIgEFyNDMRkURDEYRDYaATYaAjEWIwlJOBAjEkSIA3QoTFCwI0MxGRREMRhENhoBMRYjCUk4ECMSRIgDBihMULAjQzEZFEQxGEQ2GgExFiMJSTgQIxJEiAJ3KExQsCNDMRkURDEYRDYaATYaAjYaAzYaBDEWIwlJOBAjEkSIAdMoTFCwI0MxGRREMRhENhoBNhoCNhoDNhoEMRYjCUk4ECMSRIgBcShMULAjQzEZFEQxGEQ2GgE2GgI2GgM2GgQxFiMJSTgQIxJEiAETKExQsCNDMRkURDEYRDYaATYaAjYaAzYaBDEWIwlJOBAjEkSIAMAoTFCwI0MxGUD9tDEYFEQjQ4oCAIv+gQoIiwAyDA1BACqxgQayEIEFshknDrIeJw6yH4v/jQIACwAEs0L/2zIAsgFC//UisgFC/++JigIAi/69QQAUi/8ViwBJTwIIi/5M04v+TIv/u4mL/ov/v4mKBAGL/kEAFIv9JAuBCgiL/EwkuheL/x0hB5eJi/wiJLoXiYoBAYv/vUAAAyJMiYv/vESL/xWLAAghBAshBQhMiYoBAYv/FSQKFlcGAov/UImKBQGL/CJZi/0iWRJEMgpzAUSL/heL+4v8JwaL/U8EiAtyRgOL/08CiAygFomKBQGL/CJZi/0iWUsBEkQhBg5Ei/yIDD0yCnMBRIv+F4v7JwaL/Iv9TwSICzpGA4v/TwKIDGgWiYoFAYv8FxaAAXRMUEm9RQFEvkRJIlmL/SJZEkQyCnMBRIv+F4v7JwZPBIv9TwSICv5GA4v/TwKIDCwWiYoFAYv8IllJIwiL/SJZTEsBEkQhBg5EgRkLIoj+kov8FYEKiwGLAAxBABeLAUkkCYv8TFuL/EsCWwxEJAiMAUL/4TIKcwFEi/4Xi/snBkmL/U8EiAqdRgMWJwpLAVCBAosASU4CD4ECSwJPAk2L/ExPAlK/i/9PAogLr4wAiYoCATIKcwFEi/5XAgABgAFoTFBJvUUBQAA/IicIZURJgf//AwxEIwgnCEsBZxaAAXNLAVBJvEiL/r+LAUsBv0mTgRAORFcGAoACAARQi/5QgAQJThTtTFCwi/+LAIgLTIsBvkQXFkmTgRAORFcGAowAiYoCAYv+IllJgQIPRCEGDkSL/ogK3DIKcwFEIicJZUQjCCcJSwFnFoABdExQSbxIi/6/i/9MiAsCIicJZUQWSYACAApQi/5QgASciWIxTFCwiYoDAYv/iArNMgpzAUSL/RdJiArsMgpzAURPAwmL/heL/zgITwIJSwNOAk8DiAs3FicFSwFQvkhMMQArSwJQTFC+SEwpTFC+RFdACE8CiP2+SwIVgQpLAQ+BCksCTwJNSwRMTwJSiP2mTwMiWxZPA4ACABRQSwMVgRQIFlcGAlBMUE8CUExQiYoEAIv8IllHAkSL/SJZSwESRIv+IllLARJEi/+ICi+BwAILIoj8wTIKcwFEIkmLA4sADEEAO4v8VwIAiwNJTgIkC0xLAVtJiAovi/1XAgBLA1uL/lcCAE8EW08DTwJLAk8EiAp6iwIIjAIjCIwDQv+9MgpzAUSLAQmL/zgIiwJPAggSRImKAgGL/heL/xdLAUyIC58WKUxQvkRJVygISwFXMAhLAldICE8DV1AITwNPA1BPAlBMUImKAgGL/hdJFkknCkxQSb1EJAqL/xdMIkyLBIsFDEEAI4sEiwUIgQIKSSQLiwJMJLoXiwMOQQAHIwiMBEL/2owFQv/ViwCLBIgLMSmLAVC+RElXKAhLAVcwCEsCV0gITwNXUAhPA08DUE8CUExQjACJigIAi/4iWUmL/yJZSwESRIGWAQsiiPuoIosBiwAMQQAii/5XAgCLAUlOAiQLTEsBW4v/VwIATwJbiArPIwiMAUL/1omKAQGL/xdJMQCICkxJQQAQsTEAiwGyCLIHI7IQIrIBszEAiwAWK0sBUE8CUCQjuosBFilPA1C+RFcoCE8CFycMIk8CVE4CUExQjACJigEBi/8iWUmBlgELIoj7ICJJiwKLAAxBAB6L/1cCAIsCSU4CJAtbMQCICeCLAQiMASMIjAJC/9qLAUEAELExAIsBsgiyByOyECKyAbOLARaMAImKAwEiSYAARwSL/RdJFkkpTFBHAr1FAUS+TElPAkRJVygIJweoRFeACIv+qESL/xdJgQoNQQAEgQqMC4v+F0mMAosLCEmMBIsKgXBbSYwFDUEABIsFjASLBIsCCYG+AQsiiPp5iwKLBAxBAGuLAkklCicLiwhJTgRQTBZQSYwBTCUYSYwGJQslukmMACtPAlBMUCQjuhdAAB2LB4sAiAkZSYwDQQAQsYsDsgiLALIHI7IQIrIBs4sGgR8SQAAKiwIjCIsFEkEABosBiPqRSIsCIwiMAkL/jYsEFosJSU4CvkRLAVyASwK8SE8CTL+MAImKAQEiSYAAi/8XFkkpSwFQSb1FAURJvkxJTgJOBERJVygIJweoRDIHSwElW4GAztoDCA9ESwG9REsCFQghBAshBQhPArxIJwVLA1CI+iAIJwpPA1CI+hcITEmBcFslCCMJJQpJTwKBgAFbJQpMSwEJgSgLgWQIIoj5c4sHiwYMQQAXJwuLA1CLB0lOAhZQiPndSCMIjAdC/+GxiwRJVwAgiwWyCLIHI7IQIrIBs0lXQAiMAEmBQFtLAVdYCIwBTIFYWwlJjAJBABCxMgmLArIIsgcjshAisgGziwRXMAiLAhaL/08CUIsAUIsBUEsBUIAEWmN9s0xQsIwAiYoCASJHAoAARwWL/hdHAkQiJwRlREsBD0QWSSlMUL1FARREi/8iWUmByAELIoj4wiJJiw2LCwxBAOeL/1cCAIsNJQslWEmMACuLClBMUEmMAr1FAYsMjAdBAFWBgGSMBosCgQkjuhdBABUnC4sKUCIWUBUhBAshBQiBgGQIjAaLAoj474wIJw2LAFBJjAG9TIwEQAAoIosICIsGCLFJsgiLALIHI7IQIrIBs4sMCIwHiweMDIsNIwiMDUL/dYsESSQKgRQLIoj4KSQJjAMijAWLBYsEDEEARYsBiwUkuheLCRJBAC+LA0AAEYsBSbxEFSQIIQQLIQUIQv+biwFJiwNJTgMkuksBiwVPArtM04GAGUL/gosFJAiMBUL/syJC/3WLDBaMAImKAQEiSYAARwKL/xcWKUsBUEm9RQFEvkxJTgJOA0QnBU8CUL5ITEmBiAFZSwGBigFZSU4DSwJOAlJMSYGMAVlJTwJJgY4BWUlOA0xOAlJJIllJQAB0iwWLB4sJUosFSRVLAYsKTwJSiwaI9/5LAldACEsDVyAISwRXKAhPBVcwCIsISU4GFYEoCEkWVwYCgAIAKExQTwlJTgQVTwIISRZXBgJPAkxQSwkVTwIIFlcGAlBPBVBPBFBPA1BMUE8DUExQTwJQTFCMAImLC0lXAAKMAIAAjAGLDIECC4wCFYwEgQKMA4sDiwQMQQAviwFJFYsCCBZXBgKLAExQjACLC4sDSU4CWRaAAXNMUL5ETwJMUIwBgQIIjANC/8mLAIsBUEL/OooBAYv/FxYpSwFQvUUBRCcKTFC+SIj3MImKAQGL/xcWKUsBUEm9RQFEvkQnBU8CUL5ITElXYAhLAVcoCEsCVyAISwNXMAhLBFdACEsFV2gISwZXcAhPB1d4CE8IiPbpTwhPCFBPB1BPBlBPBVBPBFBPA1BPAlCAAgBCUExQiYoCAYv+FxYpSwFQSU4CvUUBRCtMUIv/UL5AAA+LAL5EgThbJAuBCgivjAGLAUkVgQpLAQ+BCksCTwJNSwJMTwJSiPaGSwEiWxZPAiRVJwwiTwJUgAIAC08CUExQTFCMAImKAwEiRwWAAEcGJw2L/VC+SIv/F0mBJQ1BAASBJYwOi/4XSYwLiw4IJAtJjAmLDRVJjAoNQQAEiwqMCScGjAOLCyQLjAiLCIsJDEEAxIsNiwhbFkmMASlMUEmMAL1FAYsDjARBAJ6LAL5MSU4CjAJEK4sBUIv9UEmMBSQjuheMDCJJjAZMVygIJweoTIwHQQAiiwaMB4sMQAAZiwJJgTBbSwGBSFtPAoFQW4sFTgOI9XeMB4sHiwNXAgCLAkmBKFsWSZMkDkRXBwFMgTBbFkmTJA5EVwcBJwwiiwxUiwUiJLoXFk8FFosBTwVQTwRQTwNQTwJQTFBQSRWBGwoWVwYCTFCMBIsEjAOLCCQIjAhC/zSLA4wAiYoCASJHA4AASYv/F0mBFw1BAASBF4wGi/4XSYwEiwYISYwFIicEZUQjCA1BAAkiJwRlRCMIjAUnBowCiwSLBQxBAKiLBBZJjAEpTFBJjAC9RQGLAowDQQCFiwC+RIsCVwIASwFXIAhLAldACEsDgShbFkmTJA5EVwcBSwSBOFsWSZMkDkRXBwFLBYEwWxZJkyQORFcHAUsGgWhbFkmTJQ5EVwQESweBcFsWSZMlDkRXBARPCFd4CIsBTwhQTwdQTwZQTwVQTwRQTwNQTwJQTFBQSRWBKwoWVwYCTFCMA4sDjAKLBCMIjARC/1CLAowAiSInBGVEFomKBQSL/iJZRwKBAg9ESSEGDkSBHgshBAgiiPOhi/4VgQKLAosBDEEAGov+iwJJTgJZSYFlD0SBkE4ORIECCIwCQv/eIicEZUQjCCcESwFnMgeL/4GQHAsIFjEAiwBJTgQWTEsCUCpQKlBLAVAqUCpQKlAqUCpQKlAqUCpQKlCAAgCQUIv7FYGQAQhJFlcGAk8CTFCL/BVPAghJFlcGAk8CTFCL/RVPAggWVwYCUIv7UIv8UIv9UIv+UEsDFilLAVBJvEhPAr8nBUsBUE8FJAu5RDEAUExQTFCABLerQaxMULCL/Iv9i/5PBk8GTwaJigEAi/8VSYECCoEZCyKI8r6BAosBiwAMQQAZi/+LAUlOAllJRCInCGVEDkSBAgiMAUL/34mKAQCL/zgHMgoSRIv/OAAxABJEiYoCAIv+iP/ki/44CDIKcwFEi/8JEkSJigEBi/8WSSlLAVBJvUUBRL5MSU4CTgNEMQArTwNQTFBJTwKBOFskC4EKCLlAAAQijACJJw0xAFCLAElOAojyaosBgXBbSSUKJwtPA1BMFlAxAIjyVSUYQAAIiwKBCYABAbsjjACJigQAi/wWSSlLAVBJTgJJvUUBRL5ESVcoCCqoRDIHSwElWwxESYE4W4v9DUSL/iEID0SL/SQLJwVLA1BJSwIkuheL/ggWSU4FSwJMuzEAK08EUExQgQpPAghKJLoXi/4IFksCTgK7SSIkuheL/ggWIky7SYFAW4v+CBZcQEmBYFsjCBZcYEmBaFsjCBZcaEmL/0EADYsDSYFwWyMIFlxwjASLBEmMA0mBeFuL/gxMjARBAAqL/haLA0xceIwEiwSLAUm8SEy/i/0WMQCL/haLAE8DUE8CUExQiwJQgAS0TG3HTFCwiYoCAYv+FilLAVBJvUUBREm+RElXKAgnB6hEK0sDUIv/UEm9RQFESSQjuhcUREkkgAEBu0sBgTBbSwKBSFtLA4FQW4jxPUyBWFtLAQgWSwK+RExcWEsCvEhPAky/SRZPAov/UExQgARbGSvoTFCwiYoCAIv+FkkpSwFQSU4CSb1FAUS+TElOAk4DRDEASwFXACASRElXKAgqqEQyB0sBJVsPRIE4W4v/DUQnBUxQi/8kCyS6F0kiTEEAFosCgUBbSSEJHYGQTpcJIQcdiwOXjASLAicHXCiL/xZcMIsDFlxIiwQWXFBJgWBbIwgWXGCLAUm8SEsBv0lXMAhLAVdICE8CV1AIiwBPA1BPAlBMUIAEFaloWExQsIk=", "clear": "CoEBQw=="}, "desc": "A comprehensive prediction market smart contract for sports betting.", "events": [{"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "option_count"}, {"type": "uint64", "name": "end_time"}], "name": "MarketCreated", "desc": "ARC-28 event emitted by create_market."}, {"args": [{"type": "uint16", "name": "string_id"}, {"type": "string", "name": "value"}], "name": "StringRegistered", "desc": "ARC-28 event emitted when a string is added to the registry."}, {"args": [{"type": "uint64", "name": "option_set_id"}, {"type": "uint16[]", "name": "string_ids"}], "name": "OptionSetRegistered", "desc": "ARC-28 event emitted when an option-set template is registered."}, {"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "option"}, {"type": "address", "name": "bettor"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "new_option_pool"}], "name": "BetPlaced", "desc": "ARC-28 event emitted for every bet, with the option pool after the bet."}, {"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "winning_pool"}, {"type": "uint64", "name": "payout_ratio"}], "name": "MarketSettled", "desc": "ARC-28 event emitted when a market is settled."}, {"args": [{"type": "uint64", "name": "market_id"}, {"type": "address", "name": "claimant"}, {"type": "uint64", "name": "payout"}], "name": "WinningsClaimed", "desc": "ARC-28 event emitted for every claimed position."}, {"args": [{"type": "uint64", "name": "market_id"}, {"type": "uint64", "name": "winning_option"}, {"type": "uint64", "name": "total_pool"}, {"type": "uint64", "name": "paid_out"}, {"type": "uint64", "name": "swept"}], "name": "MarketArchived", "desc": "ARC-28 event emitted when a market is archived: its final compact record."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAzMiA0MDAgMjUwMCBUTVBMX01BWF9PUFRJT05TIDEwMDAwMDAwMDAgVE1QTF9NSU5fQkVUIFRNUExfUkFLRV9CUFMKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAweDZkIDB4MDAwMDAwMDAwMDAwMDAwMCAweDc1ICJtYXJrZXRfY291bnRlciIgMHg3MCAweDAwMDAgMHgwMDAwMDAwMDAwMDAwMDAyICJzdHJpbmdfY291bnRlciIgIm9wdGlvbl9zZXRfY291bnRlciIgMHg2MiAweDcyIDB4MDAgMHg2OSAweDA2ODEwMQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQzMi00MzMKICAgIC8vICMgR2xvYmFsIHN0YXRlCiAgICAvLyBzZWxmLm1hcmtldF9jb3VudGVyID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJtYXJrZXRfY291bnRlciIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQzNAogICAgLy8gc2VsZi5zdHJpbmdfY291bnRlciA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAic3RyaW5nX2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MzUKICAgIC8vIHNlbGYub3B0aW9uX3NldF9jb3VudGVyID0gVUludDY0KDApCiAgICBieXRlYyA5IC8vICJvcHRpb25fc2V0X2NvdW50ZXIiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDI4CiAgICBwdXNoYnl0ZXNzIDB4YmMyZTI3MTQgMHgyZjM0MzFkMiAweGU3ZjBhMTBmIDB4NjhjNmRhYmIgMHhkMzdiNGFjNyAweDc5Yjg5NmMxIDB4OTU4NGFiZGUgMHg5ZmI1MDJiYSAweDMxZGEyZmIyIDB4MWM1ZWFkZTEgMHgwMzlmMThmZSAweDQ2NWEwYWZjIDB4YzdhMzJiNmYgMHg1ODgwZTUzNCAweDBlZTU3YWYwIDB4YzAyMjFjMDUgMHgzZTZjMzk3YiAweDMxMTNlMTIyIDB4MmNlODY0ZDcgMHg0MDMxNGU3YyAweGQ0ZTIwZGIzIDB4YzhmNmE3ZGUgMHg3MjUwYTk0MCAvLyBtZXRob2QgImNyZWF0ZV9tYXJrZXQoc3RyaW5nLHN0cmluZ1tdLHVpbnQxNltdLHVpbnQ2NCxwYXkpdWludDY0IiwgbWV0aG9kICJjcmVhdGVfbWFya2V0X3dpdGhfaWRzKHN0cmluZyx1aW50MTZbXSx1aW50MTZbXSx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAiY3JlYXRlX21hcmtldF9mcm9tX3RlbXBsYXRlKHN0cmluZyx1aW50NjQsdWludDE2W10sdWludDY0LHBheSl1aW50NjQiLCBtZXRob2QgImNyZWF0ZV9zY2FsYXJfbWFya2V0KHN0cmluZyx1aW50NjRbXSx1aW50MTZbXSx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAicmVnaXN0ZXJfc3RyaW5nKHN0cmluZyxwYXkpdWludDE2IiwgbWV0aG9kICJyZWdpc3Rlcl9vcHRpb25fc2V0KHVpbnQxNltdLHBheSl1aW50NjQiLCBtZXRob2QgInBsYWNlX2JldCh1aW50NjQsdWludDY0LHBheSkodWludDY0LHVpbnQ2NFtdLHVpbnQ2NFtdLHVpbnQ2NCkiLCBtZXRob2QgInBsYWNlX2JldHModWludDY0W10sdWludDY0W10sdWludDY0W10scGF5KXZvaWQiLCBtZXRob2QgInNldHRsZV9tYXJrZXQodWludDY0LHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAic2V0dGxlX3NjYWxhcl9tYXJrZXQodWludDY0LHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAic2V0dGxlX21hcmtldHModWludDY0W10sdWludDY0W10pdm9pZCIsIG1ldGhvZCAiY2xhaW1fd2lubmluZ3ModWludDY0KSh1aW50NjQsdWludDY0LGJvb2wpIiwgbWV0aG9kICJjbGFpbV9hbGwodWludDY0W10pdWludDY0IiwgbWV0aG9kICJkaXN0cmlidXRlKHVpbnQ2NCx1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYXJjaGl2ZV9tYXJrZXQodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiY2xvc2VfcG9zaXRpb25zKHVpbnQ2NCxhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJnZXRfbWFya2V0X2luZm8odWludDY0KShzdHJpbmcsc3RyaW5nW10sdWludDE2W10sdWludDY0W10sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2J1Y2tldF9ib3VuZGFyaWVzKHVpbnQ2NCl1aW50NjRbXSIsIG1ldGhvZCAiZ2V0X21hcmtldF9zdW1tYXJ5KHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjRbXSkiLCBtZXRob2QgImdldF91c2VyX3Bvc2l0aW9uKHVpbnQ2NCxhZGRyZXNzKSh1aW50NjRbXSx1aW50NjQsYm9vbCkiLCBtZXRob2QgImdldF91c2VyX3BvcnRmb2xpbyhhZGRyZXNzLHVpbnQ2NCx1aW50NjQpKHVpbnQ2NCx1aW50OCx1aW50OCxib29sLHVpbnQ2NCx1aW50NjQpW10iLCBtZXRob2QgImdldF9tYXJrZXRzX3BhZ2UodWludDY0LHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDgsdWludDgsdWludDgsdWludDMyLHVpbnQzMix1aW50NjQpW10iLCBtZXRob2QgImdldF9tYXJrZXRfY291bnQoKXVpbnQ2NCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX21hcmtldF9yb3V0ZUA1IG1haW5fY3JlYXRlX21hcmtldF93aXRoX2lkc19yb3V0ZUA2IG1haW5fY3JlYXRlX21hcmtldF9mcm9tX3RlbXBsYXRlX3JvdXRlQDcgbWFpbl9jcmVhdGVfc2NhbGFyX21hcmtldF9yb3V0ZUA4IG1haW5fcmVnaXN0ZXJfc3RyaW5nX3JvdXRlQDkgbWFpbl9yZWdpc3Rlcl9vcHRpb25fc2V0X3JvdXRlQDEwIG1haW5fcGxhY2VfYmV0X3JvdXRlQDExIG1haW5fcGxhY2VfYmV0c19yb3V0ZUAxMiBtYWluX3NldHRsZV9tYXJrZXRfcm91dGVAMTMgbWFpbl9zZXR0bGVfc2NhbGFyX21hcmtldF9yb3V0ZUAxNCBtYWluX3NldHRsZV9tYXJrZXRzX3JvdXRlQDE1IG1haW5fY2xhaW1fd2lubmluZ3Nfcm91dGVAMTYgbWFpbl9jbGFpbV9hbGxfcm91dGVAMTcgbWFpbl9kaXN0cmlidXRlX3JvdXRlQDE4IG1haW5fYXJjaGl2ZV9tYXJrZXRfcm91dGVAMTkgbWFpbl9jbG9zZV9wb3NpdGlvbnNfcm91dGVAMjAgbWFpbl9nZXRfbWFya2V0X2luZm9fcm91dGVAMjEgbWFpbl9nZXRfYnVja2V0X2JvdW5kYXJpZXNfcm91dGVAMjIgbWFpbl9nZXRfbWFya2V0X3N1bW1hcnlfcm91dGVAMjMgbWFpbl9nZXRfdXNlcl9wb3NpdGlvbl9yb3V0ZUAyNCBtYWluX2dldF91c2VyX3BvcnRmb2xpb19yb3V0ZUAyNSBtYWluX2dldF9tYXJrZXRzX3BhZ2Vfcm91dGVAMjYgbWFpbl9nZXRfbWFya2V0X2NvdW50X3JvdXRlQDI3CgptYWluX2FmdGVyX2lmX2Vsc2VAMzA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9tYXJrZXRfY291bnRfcm91dGVAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X21hcmtldF9jb3VudAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbWFya2V0c19wYWdlX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAyOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9tYXJrZXRzX3BhZ2UKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3VzZXJfcG9ydGZvbGlvX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk4MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5ODIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdXNlcl9wb3J0Zm9saW8KICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3VzZXJfcG9zaXRpb25fcm91dGVAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTYyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk2MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF91c2VyX3Bvc2l0aW9uCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9tYXJrZXRfc3VtbWFyeV9yb3V0ZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X21hcmtldF9zdW1tYXJ5CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9idWNrZXRfYm91bmRhcmllc19yb3V0ZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MzIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTMyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2J1Y2tldF9ib3VuZGFyaWVzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9tYXJrZXRfaW5mb19yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTAxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X21hcmtldF9pbmZvCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2Nsb3NlX3Bvc2l0aW9uc19yb3V0ZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NjUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODY1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY2xvc2VfcG9zaXRpb25zCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FyY2hpdmVfbWFya2V0X3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgxNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhcmNoaXZlX21hcmtldAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kaXN0cmlidXRlX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc2MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBkaXN0cmlidXRlCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX2FsbF9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3NDIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzQyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY2xhaW1fYWxsCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3dpbm5pbmdzX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcyMgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MjIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjbGFpbV93aW5uaW5ncwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXR0bGVfbWFya2V0c19yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0dGxlX21hcmtldHMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0dGxlX3NjYWxhcl9tYXJrZXRfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjgzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY4MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldHRsZV9zY2FsYXJfbWFya2V0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldHRsZV9tYXJrZXRfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjcwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY3MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldHRsZV9tYXJrZXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcGxhY2VfYmV0c19yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwbGFjZV9iZXRzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3BsYWNlX2JldF9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwbGFjZV9iZXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVnaXN0ZXJfb3B0aW9uX3NldF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1ODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1ODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZWdpc3Rlcl9vcHRpb25fc2V0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlZ2lzdGVyX3N0cmluZ19yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU1OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHJlZ2lzdGVyX3N0cmluZwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfc2NhbGFyX21hcmtldF9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjUxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjUxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZV9zY2FsYXJfbWFya2V0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9tYXJrZXRfZnJvbV90ZW1wbGF0ZV9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjgKICAgIC8vIGNsYXNzIFByZWRpY3Rpb25NYXJrZXQoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGNyZWF0ZV9tYXJrZXRfZnJvbV90ZW1wbGF0ZQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbWFya2V0X3dpdGhfaWRzX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDczCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDczCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlX21hcmtldF93aXRoX2lkcwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbWFya2V0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY2xhc3MgUHJlZGljdGlvbk1hcmtldChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDQ5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlX21hcmtldAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMjg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDI4CiAgICAvLyBjbGFzcyBQcmVkaWN0aW9uTWFya2V0KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDMwCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi51dGlsLmVuc3VyZV9idWRnZXQocmVxdWlyZWRfYnVkZ2V0OiB1aW50NjQsIGZlZV9zb3VyY2U6IHVpbnQ2NCkgLT4gdm9pZDoKZW5zdXJlX2J1ZGdldDoKICAgIHByb3RvIDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICArCgplbnN1cmVfYnVkZ2V0X3doaWxlX3RvcEAxOgogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IGVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANwogICAgaXR4bl9iZWdpbgogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGJ5dGVjIDE0IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbQogICAgYnl0ZWMgMTQgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANjoKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDEKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDYKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzOgogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2CgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDc6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuYm94X2FwcGVuZChrZXk6IGJ5dGVzLCB2YWx1ZTogYnl0ZXMpIC0+IHZvaWQ6CmJveF9hcHBlbmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzE5LTMyMAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBib3hfYXBwZW5kKGtleTogQnl0ZXMsIHZhbHVlOiBCeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMyMgogICAgLy8gbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGtleSkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2xlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMyMwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogYm94X2FwcGVuZF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMyNAogICAgLy8gb3AuQm94LnJlc2l6ZShrZXksIGxlbmd0aCArIHZhbHVlLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3Jlc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMyNQogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCBsZW5ndGgsIHZhbHVlKQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCmJveF9hcHBlbmRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzI3CiAgICAvLyBvcC5Cb3gucHV0KGtleSwgdmFsdWUpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LnBvc2l0aW9uX3BheW91dChwb3NpdGlvbjogYnl0ZXMsIHdpbm5pbmdfb3B0aW9uOiB1aW50NjQsIHdpbm5pbmdfcG9vbDogdWludDY0LCBwYXlvdXRfcmF0aW86IHVpbnQ2NCkgLT4gdWludDY0Ogpwb3NpdGlvbl9wYXlvdXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzU2LTM1NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBwb3NpdGlvbl9wYXlvdXQocG9zaXRpb246IEJ5dGVzLCB3aW5uaW5nX29wdGlvbjogVUludDY0LCB3aW5uaW5nX3Bvb2w6IFVJbnQ2NCwgcGF5b3V0X3JhdGlvOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM2MwogICAgLy8gaWYgd2lubmluZ19wb29sOgogICAgZnJhbWVfZGlnIC0yCiAgICBieiBwb3NpdGlvbl9wYXlvdXRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzY0CiAgICAvLyBzdGFrZV9vZmZzZXQgPSBVSW50NjQoUE9TSVRJT05fU1RBS0VTX09GRlNFVCkgKyB3aW5uaW5nX29wdGlvbiAqIFVJbnQ2NChQT09MX1NMT1RfU0laRSkKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNjUKICAgIC8vIHN0YWtlID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChwb3NpdGlvbiwgc3Rha2Vfb2Zmc2V0LCBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKSkKICAgIGZyYW1lX2RpZyAtNAogICAgc3dhcAogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDE3CiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KGEsIGIpCiAgICBmcmFtZV9kaWcgLTEKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNjYKICAgIC8vIHJldHVybiBtdWxfZGl2KHN0YWtlLCBwYXlvdXRfcmF0aW8sIFVJbnQ2NChQQVlPVVRfU0NBTEUpKQogICAgaW50YyA3IC8vIDEwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MTgKICAgIC8vIHJldHVybiBvcC5kaXZ3KGhpZ2gsIGxvdywgYykKICAgIGRpdncKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNjYKICAgIC8vIHJldHVybiBtdWxfZGl2KHN0YWtlLCBwYXlvdXRfcmF0aW8sIFVJbnQ2NChQQVlPVVRfU0NBTEUpKQogICAgcmV0c3ViCgpwb3NpdGlvbl9wYXlvdXRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM2NwogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3QocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9UT1RBTF9PRkZTRVQpLCBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKSkKICAgIGZyYW1lX2RpZyAtNAogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LmRlbGV0ZV9ib3goa2V5OiBieXRlcykgLT4gdWludDY0OgpkZWxldGVfYm94OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM4NC0zODUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZGVsZXRlX2JveChrZXk6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozODcKICAgIC8vIHNpemUsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgoa2V5KQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfbGVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Mzg4CiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGRlbGV0ZV9ib3hfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Mzg5CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCgpkZWxldGVfYm94X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozOTAKICAgIC8vIGFzc2VydCBvcC5Cb3guZGVsZXRlKGtleSkKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2RlbAogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzgxCiAgICAvLyByZXR1cm4gVUludDY0KEJPWF9GTEFUX01JTl9CQUxBTkNFKSArIFVJbnQ2NChCT1hfQllURV9NSU5fQkFMQU5DRSkgKiAoa2V5Lmxlbmd0aCArIHNpemUpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGludGMgNCAvLyA0MDAKICAgICoKICAgIGludGMgNSAvLyAyNTAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzkxCiAgICAvLyByZXR1cm4gYm94X21pbl9iYWxhbmNlKGtleSwgc2l6ZSkKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5wYWNrZWRfdWludDY0X2FycmF5KHBhY2tlZDogYnl0ZXMpIC0+IGJ5dGVzOgpwYWNrZWRfdWludDY0X2FycmF5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQyMS00MjIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcGFja2VkX3VpbnQ2NF9hcnJheShwYWNrZWQ6IEJ5dGVzKSAtPiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF06CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjQKICAgIC8vIGxlbmd0aCA9IG9wLmV4dHJhY3Qob3AuaXRvYihwYWNrZWQubGVuZ3RoIC8vIFBPT0xfU0xPVF9TSVpFKSwgNiwgMikKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MjUKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0uZnJvbV9ieXRlcyhsZW5ndGggKyBwYWNrZWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuY3JlYXRlX21hcmtldCh0aXRsZTogYnl0ZXMsIG9wdGlvbnM6IGJ5dGVzLCBvZGRzOiBieXRlcywgZHVyYXRpb25faG91cnM6IGJ5dGVzLCBwYXltZW50X3R4bjogdWludDY0KSAtPiBieXRlczoKY3JlYXRlX21hcmtldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0NDktNDU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjcmVhdGVfbWFya2V0KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdGl0bGU6IGFyYzQuU3RyaW5nLAogICAgLy8gICAgIG9wdGlvbnM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSwKICAgIC8vICAgICBvZGRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0sCiAgICAvLyAgICAgZHVyYXRpb25faG91cnM6IGFyYzQuVUludDY0LAogICAgLy8gICAgIHBheW1lbnRfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDUgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gYXNzZXJ0IG9wdGlvbnMubGVuZ3RoID09IG9kZHMubGVuZ3RoLCAiT3B0aW9ucyBhbmQgb2RkcyBtdXN0IGhhdmUgc2FtZSBsZW5ndGgiCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgID09CiAgICBhc3NlcnQgLy8gT3B0aW9ucyBhbmQgb2RkcyBtdXN0IGhhdmUgc2FtZSBsZW5ndGgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0NjYKICAgIC8vIG1pbl9iYWxhbmNlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDY4CiAgICAvLyB0aXRsZSwgb3B0aW9ucy5jb3B5KCksIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0NjctNDY5CiAgICAvLyBtYXJrZXRfaWQgPSBzZWxmLl9jcmVhdGVfbWFya2V0KAogICAgLy8gICAgIHRpdGxlLCBvcHRpb25zLmNvcHkoKSwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdKCksIG9kZHMuY29weSgpLCBkdXJhdGlvbl9ob3Vycy5uYXRpdmUKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDY4CiAgICAvLyB0aXRsZSwgb3B0aW9ucy5jb3B5KCksIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICBieXRlYyA2IC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ2Ny00NjkKICAgIC8vIG1hcmtldF9pZCA9IHNlbGYuX2NyZWF0ZV9tYXJrZXQoCiAgICAvLyAgICAgdGl0bGUsIG9wdGlvbnMuY29weSgpLCBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0oKSwgb2Rkcy5jb3B5KCksIGR1cmF0aW9uX2hvdXJzLm5hdGl2ZQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDQKICAgIGNhbGxzdWIgX2NyZWF0ZV9tYXJrZXQKICAgIHBvcG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gc2VsZi5fY2hlY2tfZGVwb3NpdChwYXltZW50X3R4biwgbWluX2JhbGFuY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfY2hlY2tfZGVwb3NpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ3MQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KG1hcmtldF9pZCkKICAgIGl0b2IKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmNyZWF0ZV9tYXJrZXRfd2l0aF9pZHModGl0bGU6IGJ5dGVzLCBvcHRpb25faWRzOiBieXRlcywgb2RkczogYnl0ZXMsIGR1cmF0aW9uX2hvdXJzOiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CmNyZWF0ZV9tYXJrZXRfd2l0aF9pZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDczLTQ4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX21hcmtldF93aXRoX2lkcygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHRpdGxlOiBhcmM0LlN0cmluZywKICAgIC8vICAgICBvcHRpb25faWRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0sCiAgICAvLyAgICAgb2RkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdLAogICAgLy8gICAgIGR1cmF0aW9uX2hvdXJzOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byA1IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0ODYKICAgIC8vIGFzc2VydCBvcHRpb25faWRzLmxlbmd0aCA9PSBvZGRzLmxlbmd0aCwgIk9wdGlvbnMgYW5kIG9kZHMgbXVzdCBoYXZlIHNhbWUgbGVuZ3RoIgogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBPcHRpb25zIGFuZCBvZGRzIG11c3QgaGF2ZSBzYW1lIGxlbmd0aAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ4NwogICAgLy8gYXNzZXJ0IG9wdGlvbl9pZHMubGVuZ3RoIDw9IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1BWF9PUFRJT05TIiksICJUb28gbWFueSBvcHRpb25zIgogICAgaW50YyA2IC8vIFRNUExfTUFYX09QVElPTlMKICAgIDw9CiAgICBhc3NlcnQgLy8gVG9vIG1hbnkgb3B0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gc2VsZi5fY2hlY2tfc3RyaW5nX2lkcyhvcHRpb25faWRzLmJ5dGVzKQogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIF9jaGVja19zdHJpbmdfaWRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDg5CiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gdGl0bGUsIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpLCBvcHRpb25faWRzLmNvcHkoKSwgb2Rkcy5jb3B5KCksIGR1cmF0aW9uX2hvdXJzLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDkwLTQ5MgogICAgLy8gbWFya2V0X2lkID0gc2VsZi5fY3JlYXRlX21hcmtldCgKICAgIC8vICAgICB0aXRsZSwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksIG9wdGlvbl9pZHMuY29weSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0OTEKICAgIC8vIHRpdGxlLCBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKSwgb3B0aW9uX2lkcy5jb3B5KCksIG9kZHMuY29weSgpLCBkdXJhdGlvbl9ob3Vycy5uYXRpdmUKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDkwLTQ5MgogICAgLy8gbWFya2V0X2lkID0gc2VsZi5fY3JlYXRlX21hcmtldCgKICAgIC8vICAgICB0aXRsZSwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksIG9wdGlvbl9pZHMuY29weSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgdW5jb3ZlciA0CiAgICBjYWxsc3ViIF9jcmVhdGVfbWFya2V0CiAgICBwb3BuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0OTMKICAgIC8vIHNlbGYuX2NoZWNrX2RlcG9zaXQocGF5bWVudF90eG4sIG1pbl9iYWxhbmNlKQogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NoZWNrX2RlcG9zaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0OTQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChtYXJrZXRfaWQpCiAgICBpdG9iCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5jcmVhdGVfbWFya2V0X2Zyb21fdGVtcGxhdGUodGl0bGU6IGJ5dGVzLCBvcHRpb25fc2V0X2lkOiBieXRlcywgb2RkczogYnl0ZXMsIGR1cmF0aW9uX2hvdXJzOiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CmNyZWF0ZV9tYXJrZXRfZnJvbV90ZW1wbGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0OTYtNTA0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjcmVhdGVfbWFya2V0X2Zyb21fdGVtcGxhdGUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB0aXRsZTogYXJjNC5TdHJpbmcsCiAgICAvLyAgICAgb3B0aW9uX3NldF9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgb2RkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdLAogICAgLy8gICAgIGR1cmF0aW9uX2hvdXJzOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byA1IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MDkKICAgIC8vIGFzc2VydCBvcHRpb25fc2V0X2lkLm5hdGl2ZSBpbiBzZWxmLm9wdGlvbl9zZXRzLCAiT3B0aW9uIHNldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtNAogICAgYnRvaQogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4NzQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPcHRpb24gc2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTEwCiAgICAvLyBvcHRpb25faWRzID0gc2VsZi5vcHRpb25fc2V0c1tvcHRpb25fc2V0X2lkLm5hdGl2ZV0uY29weSgpCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fc2V0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MTEKICAgIC8vIGFzc2VydCBvcHRpb25faWRzLmxlbmd0aCA9PSBvZGRzLmxlbmd0aCwgIk9wdGlvbnMgYW5kIG9kZHMgbXVzdCBoYXZlIHNhbWUgbGVuZ3RoIgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICA9PQogICAgYXNzZXJ0IC8vIE9wdGlvbnMgYW5kIG9kZHMgbXVzdCBoYXZlIHNhbWUgbGVuZ3RoCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTEyCiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjUxNAogICAgLy8gdGl0bGUsIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpLCBvcHRpb25faWRzLmNvcHkoKSwgb2Rkcy5jb3B5KCksIGR1cmF0aW9uX2hvdXJzLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTEzLTUxNQogICAgLy8gbWFya2V0X2lkID0gc2VsZi5fY3JlYXRlX21hcmtldCgKICAgIC8vICAgICB0aXRsZSwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksIG9wdGlvbl9pZHMuY29weSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MTQKICAgIC8vIHRpdGxlLCBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKSwgb3B0aW9uX2lkcy5jb3B5KCksIG9kZHMuY29weSgpLCBkdXJhdGlvbl9ob3Vycy5uYXRpdmUKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTEzLTUxNQogICAgLy8gbWFya2V0X2lkID0gc2VsZi5fY3JlYXRlX21hcmtldCgKICAgIC8vICAgICB0aXRsZSwgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksIG9wdGlvbl9pZHMuY29weSgpLCBvZGRzLmNvcHkoKSwgZHVyYXRpb25faG91cnMubmF0aXZlCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIGZyYW1lX2RpZyAtMwogICAgdW5jb3ZlciA0CiAgICBjYWxsc3ViIF9jcmVhdGVfbWFya2V0CiAgICBwb3BuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MTYKICAgIC8vIHNlbGYuX2NoZWNrX2RlcG9zaXQocGF5bWVudF90eG4sIG1pbl9iYWxhbmNlKQogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX2NoZWNrX2RlcG9zaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1MTcKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChtYXJrZXRfaWQpCiAgICBpdG9iCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5jcmVhdGVfc2NhbGFyX21hcmtldCh0aXRsZTogYnl0ZXMsIGJvdW5kYXJpZXM6IGJ5dGVzLCBvZGRzOiBieXRlcywgZHVyYXRpb25faG91cnM6IGJ5dGVzLCBwYXltZW50X3R4bjogdWludDY0KSAtPiBieXRlczoKY3JlYXRlX3NjYWxhcl9tYXJrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTE5LTUyNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX3NjYWxhcl9tYXJrZXQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB0aXRsZTogYXJjNC5TdHJpbmcsCiAgICAvLyAgICAgYm91bmRhcmllczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gICAgIG9kZHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSwKICAgIC8vICAgICBkdXJhdGlvbl9ob3VyczogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgcGF5bWVudF90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uCiAgICAvLyApIC0+IGFyYzQuVUludDY0OgogICAgcHJvdG8gNSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTM3CiAgICAvLyBhc3NlcnQgYm91bmRhcmllcy5sZW5ndGggKyAxID09IG9kZHMubGVuZ3RoLCAiRXZlcnkgYnVja2V0IG5lZWRzIG9kZHMiCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfZGlnIC0zCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEV2ZXJ5IGJ1Y2tldCBuZWVkcyBvZGRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTM4CiAgICAvLyBhc3NlcnQgb2Rkcy5sZW5ndGggPD0gVGVtcGxhdGVWYXJbVUludDY0XSgiTUFYX09QVElPTlMiKSwgIlRvbyBtYW55IG9wdGlvbnMiCiAgICBpbnRjIDYgLy8gVE1QTF9NQVhfT1BUSU9OUwogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBvcHRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTM5CiAgICAvLyBlbnN1cmVfYnVkZ2V0KGJvdW5kYXJpZXMubGVuZ3RoICogVUludDY0KEJPVU5EQVJZX09QQ09ERV9CVURHRVQpLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCAyNSAvLyAyNQogICAgKgogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0MQogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMiArIFBPT0xfU0xPVF9TSVpFLCBib3VuZGFyeV9ieXRlcy5sZW5ndGgsIFBPT0xfU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyAtNAogICAgbGVuCiAgICBwdXNoaW50IDEwIC8vIDEwCgpjcmVhdGVfc2NhbGFyX21hcmtldF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTQxCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyICsgUE9PTF9TTE9UX1NJWkUsIGJvdW5kYXJ5X2J5dGVzLmxlbmd0aCwgUE9PTF9TTE9UX1NJWkUpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBjcmVhdGVfc2NhbGFyX21hcmtldF9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0MgogICAgLy8gYXNzZXJ0IG9wLmV4dHJhY3RfdWludDY0KGJvdW5kYXJ5X2J5dGVzLCBvZmZzZXQgLSBQT09MX1NMT1RfU0laRSkgPCBvcC5leHRyYWN0X3VpbnQ2NCgKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAtCiAgICBmcmFtZV9kaWcgLTQKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTQyLTU0NAogICAgLy8gYXNzZXJ0IG9wLmV4dHJhY3RfdWludDY0KGJvdW5kYXJ5X2J5dGVzLCBvZmZzZXQgLSBQT09MX1NMT1RfU0laRSkgPCBvcC5leHRyYWN0X3VpbnQ2NCgKICAgIC8vICAgICBib3VuZGFyeV9ieXRlcywgb2Zmc2V0CiAgICAvLyApLCAiQm91bmRhcmllcyBtdXN0IGJlIHN0cmljdGx5IGluY3JlYXNpbmciCiAgICBmcmFtZV9kaWcgLTQKICAgIGRpZyAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgPAogICAgYXNzZXJ0IC8vIEJvdW5kYXJpZXMgbXVzdCBiZSBzdHJpY3RseSBpbmNyZWFzaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTQxCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyICsgUE9PTF9TTE9UX1NJWkUsIGJvdW5kYXJ5X2J5dGVzLmxlbmd0aCwgUE9PTF9TTE9UX1NJWkUpOgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBjcmVhdGVfc2NhbGFyX21hcmtldF9mb3JfaGVhZGVyQDEKCmNyZWF0ZV9zY2FsYXJfbWFya2V0X2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0NgogICAgLy8gbWluX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NTIKICAgIC8vIGR1cmF0aW9uX2hvdXJzLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0Ny01NTMKICAgIC8vIG1hcmtldF9pZCA9IHNlbGYuX2NyZWF0ZV9tYXJrZXQoCiAgICAvLyAgICAgdGl0bGUsCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdKCksCiAgICAvLyAgICAgb2Rkcy5jb3B5KCksCiAgICAvLyAgICAgZHVyYXRpb25faG91cnMubmF0aXZlLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC01CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTQ5CiAgICAvLyBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKSwKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTUwCiAgICAvLyBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQxNl0oKSwKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU0Ny01NTMKICAgIC8vIG1hcmtldF9pZCA9IHNlbGYuX2NyZWF0ZV9tYXJrZXQoCiAgICAvLyAgICAgdGl0bGUsCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCksCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdKCksCiAgICAvLyAgICAgb2Rkcy5jb3B5KCksCiAgICAvLyAgICAgZHVyYXRpb25faG91cnMubmF0aXZlLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDQKICAgIGNhbGxzdWIgX2NyZWF0ZV9tYXJrZXQKICAgIHBvcG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI5OAogICAgLy8gcmV0dXJuIGIiYiIgKyBvcC5pdG9iKG1hcmtldF9pZCkKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NjIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NTQKICAgIC8vIG9wLkJveC5wdXQoYm91bmRhcmllc19rZXkobWFya2V0X2lkKSwgYm91bmRhcnlfYnl0ZXNbMjpdKQogICAgcHVzaGludCAyIC8vIDIKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID49CiAgICBwdXNoaW50IDIgLy8gMgogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgLTQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU1NQogICAgLy8gc2VsZi5fY2hlY2tfZGVwb3NpdChwYXltZW50X3R4biwgbWluX2JhbGFuY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfY2hlY2tfZGVwb3NpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU1NgogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KG1hcmtldF9pZCkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQucmVnaXN0ZXJfc3RyaW5nKHZhbHVlOiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlZ2lzdGVyX3N0cmluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NTgtNTU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiByZWdpc3Rlcl9zdHJpbmcoc2VsZiwgdmFsdWU6IGFyYzQuU3RyaW5nLCBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IGFyYzQuVUludDE2OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTY4CiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU2OQogICAgLy8gZGlnZXN0ID0gb3Auc2hhMjU2KHZhbHVlLm5hdGl2ZS5ieXRlcykKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU3MAogICAgLy8gaWYgZGlnZXN0IG5vdCBpbiBzZWxmLnN0cmluZ19pZHM6CiAgICBwdXNoYnl0ZXMgMHg2OAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IHJlZ2lzdGVyX3N0cmluZ19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NzEKICAgIC8vIGFzc2VydCBzZWxmLnN0cmluZ19jb3VudGVyIDwgTUFYX1NUUklOR19JRCwgIlN0cmluZyByZWdpc3RyeSBpcyBmdWxsIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInN0cmluZ19jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0cmluZ19jb3VudGVyIGV4aXN0cwogICAgZHVwCiAgICBwdXNoaW50IDY1NTM1IC8vIDY1NTM1CiAgICA8CiAgICBhc3NlcnQgLy8gU3RyaW5nIHJlZ2lzdHJ5IGlzIGZ1bGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NzIKICAgIC8vIHNlbGYuc3RyaW5nX2NvdW50ZXIgKz0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAic3RyaW5nX2NvdW50ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NzMKICAgIC8vIHNlbGYuc3RyaW5nc1tzZWxmLnN0cmluZ19jb3VudGVyXSA9IHZhbHVlCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg3MwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU3NAogICAgLy8gc2VsZi5zdHJpbmdfaWRzW2RpZ2VzdF0gPSBzZWxmLnN0cmluZ19jb3VudGVyCiAgICBmcmFtZV9kaWcgMQogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NzUKICAgIC8vIGFyYzQuZW1pdChTdHJpbmdSZWdpc3RlcmVkKHN0cmluZ19pZD1hcmM0LlVJbnQxNihzZWxmLnN0cmluZ19jb3VudGVyKSwgdmFsdWU9dmFsdWUpKQogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICBwdXNoYnl0ZXMgMHgwMDA0CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwOTRlMTRlZCAvLyBtZXRob2QgIlN0cmluZ1JlZ2lzdGVyZWQodWludDE2LHN0cmluZykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwoKcmVnaXN0ZXJfc3RyaW5nX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1NzcKICAgIC8vIHNlbGYuX2NoZWNrX2RlcG9zaXQocGF5bWVudF90eG4sIG1pbl9iYWxhbmNlKQogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBfY2hlY2tfZGVwb3NpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU3OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDE2KHNlbGYuc3RyaW5nX2lkc1tkaWdlc3RdKQogICAgZnJhbWVfZGlnIDEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0cmluZ19pZHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQucmVnaXN0ZXJfb3B0aW9uX3NldChzdHJpbmdfaWRzOiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlZ2lzdGVyX29wdGlvbl9zZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTgwLTU4NQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcmVnaXN0ZXJfb3B0aW9uX3NldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHN0cmluZ19pZHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSwKICAgIC8vICAgICBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1OTEKICAgIC8vIGFzc2VydCBzdHJpbmdfaWRzLmxlbmd0aCA+PSAyLCAiT3B0aW9uIHNldCBtdXN0IGhhdmUgYXQgbGVhc3QgMiBvcHRpb25zIgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgcHVzaGludCAyIC8vIDIKICAgID49CiAgICBhc3NlcnQgLy8gT3B0aW9uIHNldCBtdXN0IGhhdmUgYXQgbGVhc3QgMiBvcHRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTkyCiAgICAvLyBhc3NlcnQgc3RyaW5nX2lkcy5sZW5ndGggPD0gVGVtcGxhdGVWYXJbVUludDY0XSgiTUFYX09QVElPTlMiKSwgIlRvbyBtYW55IG9wdGlvbnMiCiAgICBpbnRjIDYgLy8gVE1QTF9NQVhfT1BUSU9OUwogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBvcHRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTkzCiAgICAvLyBzZWxmLl9jaGVja19zdHJpbmdfaWRzKHN0cmluZ19pZHMuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX2NoZWNrX3N0cmluZ19pZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo1OTUKICAgIC8vIG1pbl9iYWxhbmNlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NTk2CiAgICAvLyBzZWxmLm9wdGlvbl9zZXRfY291bnRlciArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJvcHRpb25fc2V0X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYub3B0aW9uX3NldF9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDkgLy8gIm9wdGlvbl9zZXRfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU5NwogICAgLy8gc2VsZi5vcHRpb25fc2V0c1tzZWxmLm9wdGlvbl9zZXRfY291bnRlcl0gPSBzdHJpbmdfaWRzLmNvcHkoKQogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4NzQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjU5OAogICAgLy8gc2VsZi5fY2hlY2tfZGVwb3NpdChwYXltZW50X3R4biwgbWluX2JhbGFuY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGNhbGxzdWIgX2NoZWNrX2RlcG9zaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MDEKICAgIC8vIG9wdGlvbl9zZXRfaWQ9YXJjNC5VSW50NjQoc2VsZi5vcHRpb25fc2V0X2NvdW50ZXIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gIm9wdGlvbl9zZXRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcHRpb25fc2V0X2NvdW50ZXIgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjAwLTYwMwogICAgLy8gYXJjNC5lbWl0KE9wdGlvblNldFJlZ2lzdGVyZWQoCiAgICAvLyAgICAgb3B0aW9uX3NldF9pZD1hcmM0LlVJbnQ2NChzZWxmLm9wdGlvbl9zZXRfY291bnRlciksCiAgICAvLyAgICAgc3RyaW5nX2lkcz1zdHJpbmdfaWRzLmNvcHkoKSwKICAgIC8vICkpCiAgICBkdXAKICAgIHB1c2hieXRlcyAweDAwMGEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDljODk2MjMxIC8vIG1ldGhvZCAiT3B0aW9uU2V0UmVnaXN0ZXJlZCh1aW50NjQsdWludDE2W10pIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MDQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLm9wdGlvbl9zZXRfY291bnRlcikKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LnBsYWNlX2JldChtYXJrZXRfaWQ6IGJ5dGVzLCBvcHRpb25faW5kZXg6IGJ5dGVzLCBwYXltZW50X3R4bjogdWludDY0KSAtPiBieXRlczoKcGxhY2VfYmV0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjYwNi02MTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBsYWNlX2JldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG1hcmtldF9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgb3B0aW9uX2luZGV4OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gQmV0UmVzdWx0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjIyCiAgICAvLyBzZWxmLl9jaGVja19wYXltZW50KHBheW1lbnRfdHhuKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9jaGVja19wYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjIzCiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjYyNAogICAgLy8gbmV3X2JldHRvciA9IHNlbGYuX29wZW5fcG9zaXRpb24obWFya2V0X2lkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgZHVwCiAgICBjYWxsc3ViIF9vcGVuX3Bvc2l0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjI1CiAgICAvLyBkZXBvc2l0ID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIHVuY292ZXIgMwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjYyNgogICAgLy8gc2VsZi5fcmVjb3JkX2JldChtYXJrZXRfaWQubmF0aXZlLCBvcHRpb25faW5kZXgubmF0aXZlLCBwYXltZW50X3R4bi5hbW91bnQgLSBkZXBvc2l0LCBuZXdfYmV0dG9yKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgdW5jb3ZlciAyCiAgICAtCiAgICBkaWcgMwogICAgY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIF9yZWNvcmRfYmV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjkyCiAgICAvLyByZXR1cm4gYiJwIiArIG9wLml0b2IobWFya2V0X2lkKQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjI4CiAgICAvLyBvcHRpb25fcG9vbHMsIF9wb29sc19leGlzdCA9IG9wLkJveC5nZXQocG9vbHNfa2V5KG1hcmtldF9pZC5uYXRpdmUpKQogICAgYm94X2dldAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjI5CiAgICAvLyBwb3NpdGlvbiwgX3Bvc2l0aW9uX2V4aXN0cyA9IG9wLkJveC5nZXQocG9zaXRpb25fa2V5KG1hcmtldF9pZC5uYXRpdmUsIFR4bi5zZW5kZXIpKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjI5CiAgICAvLyBwb3NpdGlvbiwgX3Bvc2l0aW9uX2V4aXN0cyA9IG9wLkJveC5nZXQocG9zaXRpb25fa2V5KG1hcmtldF9pZC5uYXRpdmUsIFR4bi5zZW5kZXIpKQogICAgYm94X2dldAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjMxCiAgICAvLyB0b3RhbF9wb29sPXNlbGYubWFya2V0c1ttYXJrZXRfaWQubmF0aXZlXS50b3RhbF9wb29sLAogICAgYnl0ZWNfMSAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDY0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjMyCiAgICAvLyBvcHRpb25fcG9vbHM9cGFja2VkX3VpbnQ2NF9hcnJheShvcHRpb25fcG9vbHMpLAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHBhY2tlZF91aW50NjRfYXJyYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MzMKICAgIC8vIHBvc2l0aW9uX3N0YWtlcz1wYWNrZWRfdWludDY0X2FycmF5KHBvc2l0aW9uW1BPU0lUSU9OX1NUQUtFU19PRkZTRVQ6XSksCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICBkaWcgMQogICAgPj0KICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY2FsbHN1YiBwYWNrZWRfdWludDY0X2FycmF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjM0CiAgICAvLyBwb3NpdGlvbl90b3RhbD1hcmM0LlVJbnQ2NChvcC5leHRyYWN0X3VpbnQ2NChwb3NpdGlvbiwgUE9TSVRJT05fVE9UQUxfT0ZGU0VUKSksCiAgICB1bmNvdmVyIDMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjYzMC02MzUKICAgIC8vIHJldHVybiBCZXRSZXN1bHQoCiAgICAvLyAgICAgdG90YWxfcG9vbD1zZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0udG90YWxfcG9vbCwKICAgIC8vICAgICBvcHRpb25fcG9vbHM9cGFja2VkX3VpbnQ2NF9hcnJheShvcHRpb25fcG9vbHMpLAogICAgLy8gICAgIHBvc2l0aW9uX3N0YWtlcz1wYWNrZWRfdWludDY0X2FycmF5KHBvc2l0aW9uW1BPU0lUSU9OX1NUQUtFU19PRkZTRVQ6XSksCiAgICAvLyAgICAgcG9zaXRpb25fdG90YWw9YXJjNC5VSW50NjQob3AuZXh0cmFjdF91aW50NjQocG9zaXRpb24sIFBPU0lUSU9OX1RPVEFMX09GRlNFVCkpLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBwdXNoYnl0ZXMgMHgwMDE0CiAgICBjb25jYXQKICAgIGRpZyAzCiAgICBsZW4KICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQucGxhY2VfYmV0cyhtYXJrZXRfaWRzOiBieXRlcywgb3B0aW9uX2luZGV4ZXM6IGJ5dGVzLCBhbW91bnRzOiBieXRlcywgcGF5bWVudF90eG46IHVpbnQ2NCkgLT4gdm9pZDoKcGxhY2VfYmV0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2MzctNjQ0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwbGFjZV9iZXRzKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbWFya2V0X2lkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gICAgIG9wdGlvbl9pbmRleGVzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0sCiAgICAvLyAgICAgYW1vdW50czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gICAgIHBheW1lbnRfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjUzCiAgICAvLyBhc3NlcnQgbWFya2V0X2lkcy5sZW5ndGggPiAwLCAiQXQgbGVhc3Qgb25lIGJldCBpcyByZXF1aXJlZCIKICAgIGZyYW1lX2RpZyAtNAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIGFzc2VydCAvLyBBdCBsZWFzdCBvbmUgYmV0IGlzIHJlcXVpcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjU0CiAgICAvLyBhc3NlcnQgbWFya2V0X2lkcy5sZW5ndGggPT0gb3B0aW9uX2luZGV4ZXMubGVuZ3RoLCAiRXZlcnkgYmV0IG5lZWRzIGEgbWFya2V0IGlkIGFuZCBhbiBvcHRpb24gaW5kZXgiCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gRXZlcnkgYmV0IG5lZWRzIGEgbWFya2V0IGlkIGFuZCBhbiBvcHRpb24gaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NTUKICAgIC8vIGFzc2VydCBtYXJrZXRfaWRzLmxlbmd0aCA9PSBhbW91bnRzLmxlbmd0aCwgIkV2ZXJ5IGJldCBuZWVkcyBhIG1hcmtldCBpZCBhbmQgYW4gYW1vdW50IgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIEV2ZXJ5IGJldCBuZWVkcyBhIG1hcmtldCBpZCBhbmQgYW4gYW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjU2CiAgICAvLyBzZWxmLl9jaGVja19wYXltZW50KHBheW1lbnRfdHhuKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9jaGVja19wYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjU4LTY1OQogICAgLy8gIyBQb29sIG9wY29kZSBidWRnZXQgdXAgZnJvbnQgc28gbG9uZyBzbGlwcyBmaXQgaW4gb25lIGdyb3VwCiAgICAvLyBlbnN1cmVfYnVkZ2V0KG1hcmtldF9pZHMubGVuZ3RoICogVUludDY0KEJFVF9PUENPREVfQlVER0VUKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIHB1c2hpbnQgMzIwIC8vIDMyMAogICAgKgogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY2MQogICAgLy8gbWluX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NjIKICAgIC8vIHRvdGFsID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY2MwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG1hcmtldF9pZHMubGVuZ3RoKToKICAgIGR1cAoKcGxhY2VfYmV0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjYzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWFya2V0X2lkcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBwbGFjZV9iZXRzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjY0CiAgICAvLyBuZXdfYmV0dG9yID0gc2VsZi5fb3Blbl9wb3NpdGlvbihtYXJrZXRfaWRzW2ldLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBzd2FwCiAgICBkaWcgMQogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgY2FsbHN1YiBfb3Blbl9wb3NpdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY2NQogICAgLy8gc2VsZi5fcmVjb3JkX2JldChtYXJrZXRfaWRzW2ldLm5hdGl2ZSwgb3B0aW9uX2luZGV4ZXNbaV0ubmF0aXZlLCBhbW91bnRzW2ldLm5hdGl2ZSwgbmV3X2JldHRvcikKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAzCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgdW5jb3ZlciA0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDQKICAgIGNhbGxzdWIgX3JlY29yZF9iZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NjYKICAgIC8vIHRvdGFsICs9IGFtb3VudHNbaV0ubmF0aXZlCiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjYzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWFya2V0X2lkcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBwbGFjZV9iZXRzX2Zvcl9oZWFkZXJAMQoKcGxhY2VfYmV0c19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NjcKICAgIC8vIGRlcG9zaXQgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgZnJhbWVfZGlnIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NjgKICAgIC8vIGFzc2VydCBwYXltZW50X3R4bi5hbW91bnQgPT0gdG90YWwgKyBkZXBvc2l0LCAiUGF5bWVudCBtdXN0IGVxdWFsIHRoZSBzdW0gb2YgYWxsIGJldHMgcGx1cyB0aGUgYm94IGRlcG9zaXQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIDIKICAgIHVuY292ZXIgMgogICAgKwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgZXF1YWwgdGhlIHN1bSBvZiBhbGwgYmV0cyBwbHVzIHRoZSBib3ggZGVwb3NpdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuc2V0dGxlX21hcmtldChtYXJrZXRfaWQ6IGJ5dGVzLCB3aW5uaW5nX29wdGlvbjogYnl0ZXMpIC0+IGJ5dGVzOgpzZXR0bGVfbWFya2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY3MC02NzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldHRsZV9tYXJrZXQoc2VsZiwgbWFya2V0X2lkOiBhcmM0LlVJbnQ2NCwgd2lubmluZ19vcHRpb246IGFyYzQuVUludDY0KSAtPiBTZXR0bGVtZW50UmVzdWx0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjczCiAgICAvLyBzZWxmLl9zZXR0bGUobWFya2V0X2lkLm5hdGl2ZSwgd2lubmluZ19vcHRpb24ubmF0aXZlKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGRpZyAxCiAgICBzd2FwCiAgICBjYWxsc3ViIF9zZXR0bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NzUKICAgIC8vIG1hcmtldCA9IHNlbGYubWFya2V0c1ttYXJrZXRfaWQubmF0aXZlXS5jb3B5KCkKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY3NwogICAgLy8gc3RhdHVzPW1hcmtldC5zdGF0dXMsCiAgICBkdXAKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2NzgKICAgIC8vIHdpbm5pbmdfb3B0aW9uPW1hcmtldC53aW5uaW5nX29wdGlvbiwKICAgIGRpZyAxCiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Njc5CiAgICAvLyB3aW5uaW5nX3Bvb2w9bWFya2V0Lndpbm5pbmdfcG9vbCwKICAgIGRpZyAyCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjgwCiAgICAvLyBwYXlvdXRfcmF0aW89bWFya2V0LnBheW91dF9yYXRpbywKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdCA4MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY3Ni02ODEKICAgIC8vIHJldHVybiBTZXR0bGVtZW50UmVzdWx0KAogICAgLy8gICAgIHN0YXR1cz1tYXJrZXQuc3RhdHVzLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPW1hcmtldC53aW5uaW5nX29wdGlvbiwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9bWFya2V0Lndpbm5pbmdfcG9vbCwKICAgIC8vICAgICBwYXlvdXRfcmF0aW89bWFya2V0LnBheW91dF9yYXRpbywKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LnNldHRsZV9zY2FsYXJfbWFya2V0KG1hcmtldF9pZDogYnl0ZXMsIHJlc3VsdDogYnl0ZXMpIC0+IGJ5dGVzOgpzZXR0bGVfc2NhbGFyX21hcmtldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2ODMtNjg0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXR0bGVfc2NhbGFyX21hcmtldChzZWxmLCBtYXJrZXRfaWQ6IGFyYzQuVUludDY0LCByZXN1bHQ6IGFyYzQuVUludDY0KSAtPiBTZXR0bGVtZW50UmVzdWx0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjkwCiAgICAvLyBrZXkgPSBib3VuZGFyaWVzX2tleShtYXJrZXRfaWQubmF0aXZlKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToyOTgKICAgIC8vIHJldHVybiBiImIiICsgb3AuaXRvYihtYXJrZXRfaWQpCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjIDEwIC8vIDB4NjIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NjkxCiAgICAvLyBzaXplLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGtleSkKICAgIGJveF9sZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2OTIKICAgIC8vIGFzc2VydCBleGlzdHMsICJOb3QgYSBzY2FsYXIgbWFya2V0IgogICAgYXNzZXJ0IC8vIE5vdCBhIHNjYWxhciBtYXJrZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2OTMKICAgIC8vIHNlbGYuX3NldHRsZShtYXJrZXRfaWQubmF0aXZlLCBidWNrZXRfaW5kZXgoa2V5LCBzaXplIC8vIFBPT0xfU0xPVF9TSVpFLCByZXN1bHQubmF0aXZlKSkKICAgIGludGNfMiAvLyA4CiAgICAvCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MDIKICAgIC8vIGxvdyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKCnNldHRsZV9zY2FsYXJfbWFya2V0X3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQwNAogICAgLy8gd2hpbGUgbG93IDwgaGlnaDoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgYnogc2V0dGxlX3NjYWxhcl9tYXJrZXRfYWZ0ZXJfd2hpbGVANwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQwNQogICAgLy8gbWlkZGxlID0gKGxvdyArIGhpZ2gpIC8vIDIKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNQogICAgKwogICAgcHVzaGludCAyIC8vIDIKICAgIC8KICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQwNgogICAgLy8gYm91bmRhcnkgPSBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgbWlkZGxlICogVUludDY0KFBPT0xfU0xPVF9TSVpFKSwgVUludDY0KFBPT0xfU0xPVF9TSVpFKSkpCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQwNwogICAgLy8gaWYgYm91bmRhcnkgPD0gdmFsdWU6CiAgICBmcmFtZV9kaWcgMwogICAgPD0KICAgIGJ6IHNldHRsZV9zY2FsYXJfbWFya2V0X2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDA4CiAgICAvLyBsb3cgPSBtaWRkbGUgKyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIHNldHRsZV9zY2FsYXJfbWFya2V0X3doaWxlX3RvcEAyCgpzZXR0bGVfc2NhbGFyX21hcmtldF9lbHNlX2JvZHlANToKICAgIGZyYW1lX2J1cnkgNQogICAgYiBzZXR0bGVfc2NhbGFyX21hcmtldF93aGlsZV90b3BAMgoKc2V0dGxlX3NjYWxhcl9tYXJrZXRfYWZ0ZXJfd2hpbGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2OTMKICAgIC8vIHNlbGYuX3NldHRsZShtYXJrZXRfaWQubmF0aXZlLCBidWNrZXRfaW5kZXgoa2V5LCBzaXplIC8vIFBPT0xfU0xPVF9TSVpFLCByZXN1bHQubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNAogICAgY2FsbHN1YiBfc2V0dGxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Njk1CiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0uY29weSgpCiAgICBieXRlY18xIC8vIDB4NmQKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Njk3CiAgICAvLyBzdGF0dXM9bWFya2V0LnN0YXR1cywKICAgIGR1cAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjY5OAogICAgLy8gd2lubmluZ19vcHRpb249bWFya2V0Lndpbm5pbmdfb3B0aW9uLAogICAgZGlnIDEKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo2OTkKICAgIC8vIHdpbm5pbmdfcG9vbD1tYXJrZXQud2lubmluZ19wb29sLAogICAgZGlnIDIKICAgIGV4dHJhY3QgNzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MDAKICAgIC8vIHBheW91dF9yYXRpbz1tYXJrZXQucGF5b3V0X3JhdGlvLAogICAgdW5jb3ZlciAzCiAgICBleHRyYWN0IDgwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Njk2LTcwMQogICAgLy8gcmV0dXJuIFNldHRsZW1lbnRSZXN1bHQoCiAgICAvLyAgICAgc3RhdHVzPW1hcmtldC5zdGF0dXMsCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249bWFya2V0Lndpbm5pbmdfb3B0aW9uLAogICAgLy8gICAgIHdpbm5pbmdfcG9vbD1tYXJrZXQud2lubmluZ19wb29sLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1tYXJrZXQucGF5b3V0X3JhdGlvLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5zZXR0bGVfbWFya2V0cyhtYXJrZXRfaWRzOiBieXRlcywgd2lubmluZ19vcHRpb25zOiBieXRlcykgLT4gdm9pZDoKc2V0dGxlX21hcmtldHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzAzLTcwOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0dGxlX21hcmtldHMoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBtYXJrZXRfaWRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0sCiAgICAvLyAgICAgd2lubmluZ19vcHRpb25zOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcxNgogICAgLy8gYXNzZXJ0IG1hcmtldF9pZHMubGVuZ3RoID09IHdpbm5pbmdfb3B0aW9ucy5sZW5ndGgsICJFdmVyeSBtYXJrZXQgbmVlZHMgYSB3aW5uaW5nIG9wdGlvbiIKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBFdmVyeSBtYXJrZXQgbmVlZHMgYSB3aW5uaW5nIG9wdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcxNwogICAgLy8gZW5zdXJlX2J1ZGdldChtYXJrZXRfaWRzLmxlbmd0aCAqIFVJbnQ2NChTRVRUTEVfT1BDT0RFX0JVREdFVCksIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBwdXNoaW50IDE1MCAvLyAxNTAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MTkKICAgIC8vIGZvciBpIGluIHVyYW5nZShtYXJrZXRfaWRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAoKc2V0dGxlX21hcmtldHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcxOQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG1hcmtldF9pZHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogc2V0dGxlX21hcmtldHNfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MjAKICAgIC8vIHNlbGYuX3NldHRsZShtYXJrZXRfaWRzW2ldLm5hdGl2ZSwgd2lubmluZ19vcHRpb25zW2ldLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBzd2FwCiAgICBkaWcgMQogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX3NldHRsZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcxOQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG1hcmtldF9pZHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgc2V0dGxlX21hcmtldHNfZm9yX2hlYWRlckAxCgpzZXR0bGVfbWFya2V0c19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmNsYWltX3dpbm5pbmdzKG1hcmtldF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpjbGFpbV93aW5uaW5nczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MjItNzIzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjbGFpbV93aW5uaW5ncyhzZWxmLCBtYXJrZXRfaWQ6IGFyYzQuVUludDY0KSAtPiBDbGFpbVJlc3VsdDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjcyOQogICAgLy8gcGF5b3V0ID0gc2VsZi5fY2xhaW0obWFya2V0X2lkLm5hdGl2ZSwgVHhuLnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIF9jbGFpbQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzMwCiAgICAvLyBpZiBwYXlvdXQ6CiAgICBieiBjbGFpbV93aW5uaW5nc19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MzEKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cGF5b3V0LCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKY2xhaW1fd2lubmluZ3NfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjczNAogICAgLy8gcG9zaXRpb25fa2V5KG1hcmtldF9pZC5uYXRpdmUsIFR4bi5zZW5kZXIpLCBVSW50NjQoUE9TSVRJT05fQ0xBSU1FRF9PRkZTRVQpLCBVSW50NjQoMSkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozMTAKICAgIC8vIHJldHVybiBiInUiICsgb3AuaXRvYihtYXJrZXRfaWQpICsgYmV0dG9yLmJ5dGVzCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgYnl0ZWNfMyAvLyAweDc1CiAgICBkaWcgMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjczNAogICAgLy8gcG9zaXRpb25fa2V5KG1hcmtldF9pZC5uYXRpdmUsIFR4bi5zZW5kZXIpLCBVSW50NjQoUE9TSVRJT05fQ0xBSU1FRF9PRkZTRVQpLCBVSW50NjQoMSkKICAgIGludGNfMiAvLyA4CiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjczMy03MzUKICAgIC8vIGNsYWltZWQgPSBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBwb3NpdGlvbl9rZXkobWFya2V0X2lkLm5hdGl2ZSwgVHhuLnNlbmRlciksIFVJbnQ2NChQT1NJVElPTl9DTEFJTUVEX09GRlNFVCksIFVJbnQ2NCgxKQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MzcKICAgIC8vIHBheW91dD1hcmM0LlVJbnQ2NChwYXlvdXQpLAogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MzgKICAgIC8vIHN0YXR1cz1zZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0uc3RhdHVzLAogICAgYnl0ZWNfMSAvLyAweDZkCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0cyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3MzkKICAgIC8vIGNsYWltZWQ9YXJjNC5Cb29sKG9wLmJ0b2koY2xhaW1lZCkgIT0gMCksCiAgICB1bmNvdmVyIDIKICAgIGJ0b2kKICAgIGJ5dGVjIDEyIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjczNi03NDAKICAgIC8vIHJldHVybiBDbGFpbVJlc3VsdCgKICAgIC8vICAgICBwYXlvdXQ9YXJjNC5VSW50NjQocGF5b3V0KSwKICAgIC8vICAgICBzdGF0dXM9c2VsZi5tYXJrZXRzW21hcmtldF9pZC5uYXRpdmVdLnN0YXR1cywKICAgIC8vICAgICBjbGFpbWVkPWFyYzQuQm9vbChvcC5idG9pKGNsYWltZWQpICE9IDApLAogICAgLy8gKQogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuY2xhaW1fYWxsKG1hcmtldF9pZHM6IGJ5dGVzKSAtPiBieXRlczoKY2xhaW1fYWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc0Mi03NDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNsYWltX2FsbChzZWxmLCBtYXJrZXRfaWRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IGFyYzQuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzUwCiAgICAvLyBlbnN1cmVfYnVkZ2V0KG1hcmtldF9pZHMubGVuZ3RoICogVUludDY0KENMQUlNX09QQ09ERV9CVURHRVQpLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgcHVzaGludCAxNTAgLy8gMTUwCiAgICAqCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzUyCiAgICAvLyBwYXlvdXQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzUzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWFya2V0X2lkcy5sZW5ndGgpOgogICAgZHVwCgpjbGFpbV9hbGxfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc1MwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKG1hcmtldF9pZHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogY2xhaW1fYWxsX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzU0CiAgICAvLyBwYXlvdXQgKz0gc2VsZi5fY2xhaW0obWFya2V0X2lkc1tpXS5uYXRpdmUsIFR4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZXh0cmFjdF91aW50NjQKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgX2NsYWltCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzUzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWFya2V0X2lkcy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBjbGFpbV9hbGxfZm9yX2hlYWRlckAxCgpjbGFpbV9hbGxfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzU1CiAgICAvLyBpZiBwYXlvdXQ6CiAgICBmcmFtZV9kaWcgMQogICAgYnogY2xhaW1fYWxsX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc1NgogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXlvdXQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CgpjbGFpbV9hbGxfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc1OAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHBheW91dCkKICAgIGZyYW1lX2RpZyAxCiAgICBpdG9iCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmRpc3RyaWJ1dGUobWFya2V0X2lkOiBieXRlcywgY3Vyc29yOiBieXRlcywgbWF4X2JldHRvcnM6IGJ5dGVzKSAtPiBieXRlczoKZGlzdHJpYnV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3NjAtNzY2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBkaXN0cmlidXRlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbWFya2V0X2lkOiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBjdXJzb3I6IGFyYzQuVUludDY0LAogICAgLy8gICAgIG1heF9iZXR0b3JzOiBhcmM0LlVJbnQ2NAogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3ODMKICAgIC8vIGFzc2VydCBtYXJrZXRfaWQubmF0aXZlIGluIHNlbGYubWFya2V0cywgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMwogICAgYnRvaQogICAgZHVwCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1hcmtldCBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc4NAogICAgLy8gbWFya2V0ID0gc2VsZi5tYXJrZXRzW21hcmtldF9pZC5uYXRpdmVdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzg1CiAgICAvLyBhc3NlcnQgbWFya2V0LnN0YXR1cyA9PSBTVEFUVVNfU0VUVExFRCwgIk1hcmtldCBpcyBub3Qgc2V0dGxlZCIKICAgIGR1cAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNyAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIGI9PQogICAgYXNzZXJ0IC8vIE1hcmtldCBpcyBub3Qgc2V0dGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc4NgogICAgLy8gYXNzZXJ0IGN1cnNvciA9PSBtYXJrZXQuZGlzdHJpYnV0aW9uX2N1cnNvciwgIkN1cnNvciBkb2VzIG5vdCBtYXRjaCB0aGUgc3RvcmVkIGN1cnNvciIKICAgIGV4dHJhY3QgMTI4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgIGI9PQogICAgYXNzZXJ0IC8vIEN1cnNvciBkb2VzIG5vdCBtYXRjaCB0aGUgc3RvcmVkIGN1cnNvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojc4OAogICAgLy8gYmF0Y2ggPSBtYXhfYmV0dG9ycy5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzg5CiAgICAvLyBpZiBiYXRjaCA+IE1BWF9ESVNUUklCVVRFX0JBVENIOgogICAgcHVzaGludCAxMCAvLyAxMAogICAgPgogICAgYnogZGlzdHJpYnV0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3OTAKICAgIC8vIGJhdGNoID0gVUludDY0KE1BWF9ESVNUUklCVVRFX0JBVENIKQogICAgcHVzaGludCAxMCAvLyAxMAogICAgZnJhbWVfYnVyeSAxMQoKZGlzdHJpYnV0ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzkxCiAgICAvLyBzdG9wID0gY3Vyc29yLm5hdGl2ZSArIGJhdGNoCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgMTEKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NzkyCiAgICAvLyBpZiBzdG9wID4gbWFya2V0LmJldHRvcl9jb3VudC5uYXRpdmU6CiAgICBmcmFtZV9kaWcgMTAKICAgIHB1c2hpbnQgMTEyIC8vIDExMgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICA+CiAgICBieiBkaXN0cmlidXRlX2FmdGVyX2lmX2Vsc2VANAogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2J1cnkgNAoKZGlzdHJpYnV0ZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzk0CiAgICAvLyBlbnN1cmVfYnVkZ2V0KChzdG9wIC0gY3Vyc29yLm5hdGl2ZSkgKiBVSW50NjQoRElTVFJJQlVURV9PUENPREVfQlVER0VUKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCkKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgLQogICAgcHVzaGludCAxOTAgLy8gMTkwCiAgICAqCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CgpkaXN0cmlidXRlX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3OTYKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoY3Vyc29yLm5hdGl2ZSwgc3RvcCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDQKICAgIDwKICAgIGJ6IGRpc3RyaWJ1dGVfYWZ0ZXJfZm9yQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzk3CiAgICAvLyBwYWdlID0gYmV0dG9yc19rZXkobWFya2V0X2lkLm5hdGl2ZSwgaW5kZXggLy8gQkVUVE9SX1BBR0VfU0laRSkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGludGNfMyAvLyAzMgogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMwNAogICAgLy8gcmV0dXJuIGIiciIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBvcC5pdG9iKHBhZ2UpCiAgICBieXRlYyAxMSAvLyAweDcyCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBjb3ZlciA0CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo3OTkKICAgIC8vIG9wLkJveC5leHRyYWN0KHBhZ2UsIChpbmRleCAlIEJFVFRPUl9QQUdFX1NJWkUpICogVUludDY0KEFERFJFU1NfU0laRSksIFVJbnQ2NChBRERSRVNTX1NJWkUpKQogICAgc3dhcAogICAgaW50Y18zIC8vIDMyCiAgICAlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzk4LTgwMAogICAgLy8gYmV0dG9yID0gQWNjb3VudC5mcm9tX2J5dGVzKAogICAgLy8gICAgIG9wLkJveC5leHRyYWN0KHBhZ2UsIChpbmRleCAlIEJFVFRPUl9QQUdFX1NJWkUpICogVUludDY0KEFERFJFU1NfU0laRSksIFVJbnQ2NChBRERSRVNTX1NJWkUpKQogICAgLy8gKQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozMTAKICAgIC8vIHJldHVybiBiInUiICsgb3AuaXRvYihtYXJrZXRfaWQpICsgYmV0dG9yLmJ5dGVzCiAgICBieXRlY18zIC8vIDB4NzUKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MDIKICAgIC8vIGlmIG9wLmJ0b2kob3AuQm94LmV4dHJhY3QocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9DTEFJTUVEX09GRlNFVCksIFVJbnQ2NCgxKSkpID09IDA6CiAgICBpbnRjXzIgLy8gOAogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBibnogZGlzdHJpYnV0ZV9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODAzCiAgICAvLyBwYXlvdXQgPSBzZWxmLl9jbGFpbShtYXJrZXRfaWQubmF0aXZlLCBiZXR0b3IpCiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgX2NsYWltCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgwNAogICAgLy8gaWYgcGF5b3V0OgogICAgYnogZGlzdHJpYnV0ZV9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODA1CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9YmV0dG9yLCBhbW91bnQ9cGF5b3V0LCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAzCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCmRpc3RyaWJ1dGVfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MDctODA4CiAgICAvLyAjIEJldHMgYXJlIGNsb3NlZCBvbmNlIGEgbWFya2V0IGlzIHNldHRsZWQsIHNvIHRoZSBpbmRleCBpcyBmaW5hbAogICAgLy8gaWYgaW5kZXggJSBCRVRUT1JfUEFHRV9TSVpFID09IEJFVFRPUl9QQUdFX1NJWkUgLSAxIG9yIGluZGV4ICsgMSA9PSBtYXJrZXQuYmV0dG9yX2NvdW50Lm5hdGl2ZToKICAgIGZyYW1lX2RpZyA2CiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICA9PQogICAgYm56IGRpc3RyaWJ1dGVfaWZfYm9keUAxMwogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9kaWcgNQogICAgPT0KICAgIGJ6IGRpc3RyaWJ1dGVfYWZ0ZXJfaWZfZWxzZUAxNAoKZGlzdHJpYnV0ZV9pZl9ib2R5QDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgwOQogICAgLy8gX3JlbGVhc2VkID0gZGVsZXRlX2JveChwYWdlKQogICAgZnJhbWVfZGlnIDEKICAgIGNhbGxzdWIgZGVsZXRlX2JveAogICAgcG9wCgpkaXN0cmlidXRlX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Nzk2CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKGN1cnNvci5uYXRpdmUsIHN0b3ApOgogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZGlzdHJpYnV0ZV9mb3JfaGVhZGVyQDUKCmRpc3RyaWJ1dGVfYWZ0ZXJfZm9yQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgxMQogICAgLy8gc2VsZi5tYXJrZXRzW21hcmtldF9pZC5uYXRpdmVdLmRpc3RyaWJ1dGlvbl9jdXJzb3IgPSBhcmM0LlVJbnQ2NChzdG9wKQogICAgZnJhbWVfZGlnIDQKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICBkaWcgMQogICAgcmVwbGFjZTIgMTI4CiAgICBkaWcgMgogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MTIKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzdG9wKQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5hcmNoaXZlX21hcmtldChtYXJrZXRfaWQ6IGJ5dGVzKSAtPiBieXRlczoKYXJjaGl2ZV9tYXJrZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODE0LTgxNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYXJjaGl2ZV9tYXJrZXQoc2VsZiwgbWFya2V0X2lkOiBhcmM0LlVJbnQ2NCkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgzMQogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgaW4gc2VsZi5tYXJrZXRzLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MzIKICAgIC8vIG1hcmtldCA9IHNlbGYubWFya2V0c1ttYXJrZXRfaWQubmF0aXZlXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciA0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjgzMwogICAgLy8gYXNzZXJ0IG1hcmtldC5zdGF0dXMgPT0gU1RBVFVTX1NFVFRMRUQsICJNYXJrZXQgaXMgbm90IHNldHRsZWQiCiAgICBkdXAKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjIDcgLy8gMHgwMDAwMDAwMDAwMDAwMDAyCiAgICBiPT0KICAgIGFzc2VydCAvLyBNYXJrZXQgaXMgbm90IHNldHRsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MzUKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID49IG1hcmtldC5lbmRfdGltZS5uYXRpdmUgKyBVSW50NjQoQ0xBSU1fUEVSSU9EX1NFQ09ORFMpCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgcHVzaGludCA3Nzc2MDAwIC8vIDc3NzYwMDAKICAgICsKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODM0LTgzNgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA+PSBtYXJrZXQuZW5kX3RpbWUubmF0aXZlICsgVUludDY0KENMQUlNX1BFUklPRF9TRUNPTkRTKQogICAgLy8gKSwgIkNsYWltIHBlcmlvZCBoYXMgbm90IGVuZGVkIgogICAgYXNzZXJ0IC8vIENsYWltIHBlcmlvZCBoYXMgbm90IGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODM4CiAgICAvLyByZWxlYXNlZCA9IGJveF9taW5fYmFsYW5jZShiIm0iICsgb3AuaXRvYihtYXJrZXRfaWQubmF0aXZlKSwgc2VsZi5tYXJrZXRzLmxlbmd0aChtYXJrZXRfaWQubmF0aXZlKSkKICAgIGRpZyAxCiAgICBib3hfbGVuCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM4MQogICAgLy8gcmV0dXJuIFVJbnQ2NChCT1hfRkxBVF9NSU5fQkFMQU5DRSkgKyBVSW50NjQoQk9YX0JZVEVfTUlOX0JBTEFOQ0UpICogKGtleS5sZW5ndGggKyBzaXplKQogICAgZGlnIDIKICAgIGxlbgogICAgKwogICAgaW50YyA0IC8vIDQwMAogICAgKgogICAgaW50YyA1IC8vIDI1MDAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4MzkKICAgIC8vIGRlbCBzZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0KICAgIHVuY292ZXIgMgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjkyCiAgICAvLyByZXR1cm4gYiJwIiArIG9wLml0b2IobWFya2V0X2lkKQogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBkaWcgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODQwCiAgICAvLyByZWxlYXNlZCArPSBkZWxldGVfYm94KHBvb2xzX2tleShtYXJrZXRfaWQubmF0aXZlKSkKICAgIGNhbGxzdWIgZGVsZXRlX2JveAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI5OAogICAgLy8gcmV0dXJuIGIiYiIgKyBvcC5pdG9iKG1hcmtldF9pZCkKICAgIGJ5dGVjIDEwIC8vIDB4NjIKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODQxCiAgICAvLyByZWxlYXNlZCArPSBkZWxldGVfYm94KGJvdW5kYXJpZXNfa2V5KG1hcmtldF9pZC5uYXRpdmUpKQogICAgY2FsbHN1YiBkZWxldGVfYm94CiAgICArCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODQyCiAgICAvLyBwYWdlX2NvdW50ID0gKG1hcmtldC5iZXR0b3JfY291bnQubmF0aXZlICsgQkVUVE9SX1BBR0VfU0laRSAtIDEpIC8vIEJFVFRPUl9QQUdFX1NJWkUKICAgIGR1cAogICAgcHVzaGludCAxMTIgLy8gMTEyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18zIC8vIDMyCiAgICArCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaW50Y18zIC8vIDMyCiAgICAvCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg0MwogICAgLy8gZmlyc3RfcGFnZSA9IG1hcmtldC5kaXN0cmlidXRpb25fY3Vyc29yLm5hdGl2ZSAvLyBCRVRUT1JfUEFHRV9TSVpFCiAgICBwdXNoaW50IDEyOCAvLyAxMjgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzMgLy8gMzIKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NDUKICAgIC8vIFVJbnQ2NChBUkNISVZFX09QQ09ERV9CVURHRVQpICsgKHBhZ2VfY291bnQgLSBmaXJzdF9wYWdlKSAqIFVJbnQ2NChBUkNISVZFX1BBR0VfT1BDT0RFX0JVREdFVCksCiAgICBzd2FwCiAgICBkaWcgMQogICAgLQogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCAxMDAgLy8gMTAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODQ2CiAgICAvLyBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NDQtODQ3CiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIFVJbnQ2NChBUkNISVZFX09QQ09ERV9CVURHRVQpICsgKHBhZ2VfY291bnQgLSBmaXJzdF9wYWdlKSAqIFVJbnQ2NChBUkNISVZFX1BBR0VfT1BDT0RFX0JVREdFVCksCiAgICAvLyAgICAgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAoKYXJjaGl2ZV9tYXJrZXRfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg0OAogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKGZpcnN0X3BhZ2UsIHBhZ2VfY291bnQpOgogICAgZnJhbWVfZGlnIDcKICAgIGZyYW1lX2RpZyA2CiAgICA8CiAgICBieiBhcmNoaXZlX21hcmtldF9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMwNAogICAgLy8gcmV0dXJuIGIiciIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBvcC5pdG9iKHBhZ2UpCiAgICBieXRlYyAxMSAvLyAweDcyCiAgICBmcmFtZV9kaWcgMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NDkKICAgIC8vIF9yZWxlYXNlZCA9IGRlbGV0ZV9ib3goYmV0dG9yc19rZXkobWFya2V0X2lkLm5hdGl2ZSwgcGFnZSkpCiAgICBjYWxsc3ViIGRlbGV0ZV9ib3gKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg0OAogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKGZpcnN0X3BhZ2UsIHBhZ2VfY291bnQpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNwogICAgYiBhcmNoaXZlX21hcmtldF9mb3JfaGVhZGVyQDEKCmFyY2hpdmVfbWFya2V0X2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg1MQogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPW1hcmtldC5jcmVhdG9yLm5hdGl2ZSwgYW1vdW50PXJlbGVhc2VkLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyA1CiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg1MgogICAgLy8gc3dlcHQgPSBtYXJrZXQudG90YWxfcG9vbC5uYXRpdmUgLSBtYXJrZXQucGFpZF9vdXQubmF0aXZlCiAgICBkdXAKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2J1cnkgMAogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgIGV4dHJhY3QgODggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2J1cnkgMQogICAgc3dhcAogICAgcHVzaGludCA4OCAvLyA4OAogICAgZXh0cmFjdF91aW50NjQKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODUzCiAgICAvLyBpZiBzd2VwdDoKICAgIGJ6IGFyY2hpdmVfbWFya2V0X2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg1NAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsIGFtb3VudD1zd2VwdCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGZyYW1lX2RpZyAyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKYXJjaGl2ZV9tYXJrZXRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg1OAogICAgLy8gd2lubmluZ19vcHRpb249bWFya2V0Lndpbm5pbmdfb3B0aW9uLAogICAgZnJhbWVfZGlnIDQKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NjEKICAgIC8vIHN3ZXB0PWFyYzQuVUludDY0KHN3ZXB0KSwKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODU2LTg2MgogICAgLy8gYXJjNC5lbWl0KE1hcmtldEFyY2hpdmVkKAogICAgLy8gICAgIG1hcmtldF9pZD1tYXJrZXRfaWQsCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249bWFya2V0Lndpbm5pbmdfb3B0aW9uLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9bWFya2V0LnRvdGFsX3Bvb2wsCiAgICAvLyAgICAgcGFpZF9vdXQ9bWFya2V0LnBhaWRfb3V0LAogICAgLy8gICAgIHN3ZXB0PWFyYzQuVUludDY0KHN3ZXB0KSwKICAgIC8vICkpCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg1YTYzN2RiMyAvLyBtZXRob2QgIk1hcmtldEFyY2hpdmVkKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4NjMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzd2VwdCkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuY2xvc2VfcG9zaXRpb25zKG1hcmtldF9pZDogYnl0ZXMsIGJldHRvcnM6IGJ5dGVzKSAtPiBieXRlczoKY2xvc2VfcG9zaXRpb25zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg2NS04NzAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNsb3NlX3Bvc2l0aW9ucygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIG1hcmtldF9pZDogYXJjNC5VSW50NjQsCiAgICAvLyAgICAgYmV0dG9yczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXQogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMgogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4ODEKICAgIC8vIGFzc2VydCBtYXJrZXRfaWQubmF0aXZlID4gMCwgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZHVwbiAyCiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODgyCiAgICAvLyBhc3NlcnQgbWFya2V0X2lkLm5hdGl2ZSA8PSBzZWxmLm1hcmtldF9jb3VudGVyLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODgzCiAgICAvLyBhc3NlcnQgbWFya2V0X2lkLm5hdGl2ZSBub3QgaW4gc2VsZi5tYXJrZXRzLCAiTWFya2V0IGlzIG5vdCBhcmNoaXZlZCIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWNfMSAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIE1hcmtldCBpcyBub3QgYXJjaGl2ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4ODQKICAgIC8vIGVuc3VyZV9idWRnZXQoYmV0dG9ycy5sZW5ndGggKiBVSW50NjQoQ0xPU0VfT1BDT0RFX0JVREdFVCksIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBwdXNoaW50IDIwMCAvLyAyMDAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4ODYKICAgIC8vIHJlZnVuZGVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg4NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGJldHRvcnMubGVuZ3RoKToKICAgIGR1cAoKY2xvc2VfcG9zaXRpb25zX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4ODcKICAgIC8vIGZvciBpIGluIHVyYW5nZShiZXR0b3JzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMTMKICAgIGZyYW1lX2RpZyAxMQogICAgPAogICAgYnogY2xvc2VfcG9zaXRpb25zX2FmdGVyX2ZvckA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODg4CiAgICAvLyBiZXR0b3IgPSBiZXR0b3JzW2ldLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEzCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgZnJhbWVfZGlnIDEwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4OTAKICAgIC8vIF9zaXplLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKHBvc2l0aW9uKQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBmcmFtZV9kaWcgMTIKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5MQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5MgogICAgLy8gcmVmdW5kID0gVUludDY0KEFERFJFU1NfU0laRSAqIEJPWF9CWVRFX01JTl9CQUxBTkNFKQogICAgcHVzaGludCAxMjgwMCAvLyAxMjgwMAogICAgZnJhbWVfYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODkzCiAgICAvLyBpZiBvcC5idG9pKG9wLkJveC5leHRyYWN0KHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fUEFHRV9PRkZTRVQpLCBVSW50NjQoMSkpKToKICAgIGZyYW1lX2RpZyAyCiAgICBwdXNoaW50IDkgLy8gOQogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBieiBjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzA0CiAgICAvLyByZXR1cm4gYiJyIiArIG9wLml0b2IobWFya2V0X2lkKSArIG9wLml0b2IocGFnZSkKICAgIGJ5dGVjIDExIC8vIDB4NzIKICAgIGZyYW1lX2RpZyAxMAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODk0CiAgICAvLyByZWZ1bmQgKz0gYm94X21pbl9iYWxhbmNlKGJldHRvcnNfa2V5KG1hcmtldF9pZC5uYXRpdmUsIFVJbnQ2NCgwKSksIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzA0CiAgICAvLyByZXR1cm4gYiJyIiArIG9wLml0b2IobWFya2V0X2lkKSArIG9wLml0b2IocGFnZSkKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM4MQogICAgLy8gcmV0dXJuIFVJbnQ2NChCT1hfRkxBVF9NSU5fQkFMQU5DRSkgKyBVSW50NjQoQk9YX0JZVEVfTUlOX0JBTEFOQ0UpICogKGtleS5sZW5ndGggKyBzaXplKQogICAgbGVuCiAgICBpbnRjIDQgLy8gNDAwCiAgICAqCiAgICBpbnRjIDUgLy8gMjUwMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5MgogICAgLy8gcmVmdW5kID0gVUludDY0KEFERFJFU1NfU0laRSAqIEJPWF9CWVRFX01JTl9CQUxBTkNFKQogICAgcHVzaGludCAxMjgwMCAvLyAxMjgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5NAogICAgLy8gcmVmdW5kICs9IGJveF9taW5fYmFsYW5jZShiZXR0b3JzX2tleShtYXJrZXRfaWQubmF0aXZlLCBVSW50NjQoMCkpLCBVSW50NjQoMCkpCiAgICArCiAgICBmcmFtZV9idXJ5IDYKCmNsb3NlX3Bvc2l0aW9uc19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODk1CiAgICAvLyByZWZ1bmQgKz0gZGVsZXRlX2JveChwb3NpdGlvbikgKyBwb3J0Zm9saW9fcmVtb3ZlKGJldHRvciwgbWFya2V0X2lkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAyCiAgICBjYWxsc3ViIGRlbGV0ZV9ib3gKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxNgogICAgLy8gcmV0dXJuIGIiaSIgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjIDEzIC8vIDB4NjkKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzM5CiAgICAvLyBsZW5ndGgsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgoa2V5KQogICAgYm94X2xlbgogICAgc3dhcAogICAgZnJhbWVfYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzQwCiAgICAvLyBpZiBub3QgZXhpc3RzOgogICAgYm56IGNsb3NlX3Bvc2l0aW9uc19hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzQxCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAoKY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LnBvcnRmb2xpb19yZW1vdmVAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODk1CiAgICAvLyByZWZ1bmQgKz0gZGVsZXRlX2JveChwb3NpdGlvbikgKyBwb3J0Zm9saW9fcmVtb3ZlKGJldHRvciwgbWFya2V0X2lkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyA4CiAgICArCiAgICBmcmFtZV9kaWcgNgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5NgogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPWJldHRvciwgYW1vdW50PXJlZnVuZCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5NwogICAgLy8gcmVmdW5kZWQgKz0gcmVmdW5kCiAgICBmcmFtZV9kaWcgMTIKICAgICsKICAgIGZyYW1lX2J1cnkgNwoKY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lmX2Vsc2VANzoKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9idXJ5IDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6ODg3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYmV0dG9ycy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxMwogICAgYiBjbG9zZV9wb3NpdGlvbnNfZm9yX2hlYWRlckAxCgpjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNDIKICAgIC8vIGVuc3VyZV9idWRnZXQoKGxlbmd0aCAvLyBQT09MX1NMT1RfU0laRSkgKiBVSW50NjQoUE9SVEZPTElPX0VOVFJZX09QQ09ERV9CVURHRVQpLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIHB1c2hpbnQgMjAgLy8gMjAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNDQKICAgIC8vIGxhc3QgPSBsZW5ndGggLSBQT09MX1NMT1RfU0laRQogICAgaW50Y18yIC8vIDgKICAgIC0KICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM0NQogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMCwgbGVuZ3RoLCBQT09MX1NMT1RfU0laRSk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1CgpjbG9zZV9wb3NpdGlvbnNfZm9yX2hlYWRlckAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNDUKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKDAsIGxlbmd0aCwgUE9PTF9TTE9UX1NJWkUpOgogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyA0CiAgICA8CiAgICBieiBjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfZm9yQDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzQ2CiAgICAvLyBpZiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKSkgPT0gbWFya2V0X2lkOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyA5CiAgICA9PQogICAgYnogY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lmX2Vsc2VAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNDcKICAgIC8vIGlmIGxhc3QgPT0gMDoKICAgIGZyYW1lX2RpZyAzCiAgICBibnogY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNDgKICAgIC8vIGFzc2VydCBvcC5Cb3guZGVsZXRlKGtleSkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGJveF9kZWwKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM4MQogICAgLy8gcmV0dXJuIFVJbnQ2NChCT1hfRkxBVF9NSU5fQkFMQU5DRSkgKyBVSW50NjQoQk9YX0JZVEVfTUlOX0JBTEFOQ0UpICogKGtleS5sZW5ndGggKyBzaXplKQogICAgbGVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzQ5CiAgICAvLyByZXR1cm4gYm94X21pbl9iYWxhbmNlKGtleSwgVUludDY0KFBPT0xfU0xPVF9TSVpFKSkKICAgIGludGNfMiAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzgxCiAgICAvLyByZXR1cm4gVUludDY0KEJPWF9GTEFUX01JTl9CQUxBTkNFKSArIFVJbnQ2NChCT1hfQllURV9NSU5fQkFMQU5DRSkgKiAoa2V5Lmxlbmd0aCArIHNpemUpCiAgICArCiAgICBpbnRjIDQgLy8gNDAwCiAgICAqCiAgICBpbnRjIDUgLy8gMjUwMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5NQogICAgLy8gcmVmdW5kICs9IGRlbGV0ZV9ib3gocG9zaXRpb24pICsgcG9ydGZvbGlvX3JlbW92ZShiZXR0b3IsIG1hcmtldF9pZC5uYXRpdmUpCiAgICBiIGNsb3NlX3Bvc2l0aW9uc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5wb3J0Zm9saW9fcmVtb3ZlQDIwCgpjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfaWZfZWxzZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNTAKICAgIC8vIG9wLkJveC5yZXBsYWNlKGtleSwgb2Zmc2V0LCBvcC5Cb3guZXh0cmFjdChrZXksIGxhc3QsIFVJbnQ2NChQT09MX1NMT1RfU0laRSkpKQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBkaWcgMQogICAgZnJhbWVfZGlnIDUKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNTEKICAgIC8vIG9wLkJveC5yZXNpemUoa2V5LCBsYXN0KQogICAgc3dhcAogICAgYm94X3Jlc2l6ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM1MgogICAgLy8gcmV0dXJuIFVJbnQ2NChQT09MX1NMT1RfU0laRSAqIEJPWF9CWVRFX01JTl9CQUxBTkNFKQogICAgcHVzaGludCAzMjAwIC8vIDMyMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4OTUKICAgIC8vIHJlZnVuZCArPSBkZWxldGVfYm94KHBvc2l0aW9uKSArIHBvcnRmb2xpb19yZW1vdmUoYmV0dG9yLCBtYXJrZXRfaWQubmF0aXZlKQogICAgYiBjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QucG9ydGZvbGlvX3JlbW92ZUAyMAoKY2xvc2VfcG9zaXRpb25zX2FmdGVyX2lmX2Vsc2VAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzQ1CiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgwLCBsZW5ndGgsIFBPT0xfU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzIgLy8gOAogICAgKwogICAgZnJhbWVfYnVyeSA1CiAgICBiIGNsb3NlX3Bvc2l0aW9uc19mb3JfaGVhZGVyQDEzCgpjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfZm9yQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM1MwogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo4OTUKICAgIC8vIHJlZnVuZCArPSBkZWxldGVfYm94KHBvc2l0aW9uKSArIHBvcnRmb2xpb19yZW1vdmUoYmV0dG9yLCBtYXJrZXRfaWQubmF0aXZlKQogICAgYiBjbG9zZV9wb3NpdGlvbnNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QucG9ydGZvbGlvX3JlbW92ZUAyMAoKY2xvc2VfcG9zaXRpb25zX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojg5OQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHJlZnVuZGVkKQogICAgZnJhbWVfZGlnIDEyCiAgICBpdG9iCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmdldF9tYXJrZXRfaW5mbyhtYXJrZXRfaWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X21hcmtldF9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkwMS05MTEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9tYXJrZXRfaW5mbyhzZWxmLCBtYXJrZXRfaWQ6IGFyYzQuVUludDY0KSAtPiBhcmM0LlR1cGxlWwogICAgLy8gICAgIGFyYzQuU3RyaW5nLCAgIyB0aXRsZQogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSwgICMgb3B0aW9ucwogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSwgICMgb2RkcwogICAgLy8gICAgIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSwgICMgb3B0aW9uX3Bvb2xzCiAgICAvLyAgICAgYXJjNC5VSW50NjQsICAjIHRvdGFsX3Bvb2wKICAgIC8vICAgICBhcmM0LlVJbnQ2NCwgICMgZW5kX3RpbWUKICAgIC8vICAgICBhcmM0LlVJbnQ2NCwgICMgc3RhdHVzCiAgICAvLyAgICAgYXJjNC5VSW50NjQgICAjIHdpbm5pbmdfb3B0aW9uCiAgICAvLyBdOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkxNwogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgaW4gc2VsZi5tYXJrZXRzLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTE4CiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjkyCiAgICAvLyByZXR1cm4gYiJwIiArIG9wLml0b2IobWFya2V0X2lkKQogICAgYnl0ZWMgNSAvLyAweDcwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkxOQogICAgLy8gb3B0aW9uX3Bvb2xzLCBfZXhpc3RzID0gb3AuQm94LmdldChwb29sc19rZXkobWFya2V0X2lkLm5hdGl2ZSkpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MjIKICAgIC8vIG1hcmtldC50aXRsZSwKICAgIGR1cAogICAgcHVzaGludCAxMzYgLy8gMTM2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIHB1c2hpbnQgMTM4IC8vIDEzOAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMwogICAgZGlnIDIKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTU1CiAgICAvLyBpZiBtYXJrZXQub3B0aW9uX2lkcy5sZW5ndGggPT0gMDoKICAgIGR1cAogICAgcHVzaGludCAxNDAgLy8gMTQwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgcHVzaGludCAxNDIgLy8gMTQyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBibnogZ2V0X21hcmtldF9pbmZvX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNTYKICAgIC8vIHJldHVybiBtYXJrZXQub3B0aW9ucy5jb3B5KCkKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIDkKICAgIHN1YnN0cmluZzMKCmdldF9tYXJrZXRfaW5mb19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9tYXJrZXRfb3B0aW9uc0A4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkyNAogICAgLy8gbWFya2V0Lm9kZHMuY29weSgpLAogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgbGVuCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIDEwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MjUKICAgIC8vIHBhY2tlZF91aW50NjRfYXJyYXkob3B0aW9uX3Bvb2xzKSwKICAgIGZyYW1lX2RpZyA2CiAgICBjYWxsc3ViIHBhY2tlZF91aW50NjRfYXJyYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MjYKICAgIC8vIG1hcmtldC50b3RhbF9wb29sLAogICAgZGlnIDIKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MjcKICAgIC8vIG1hcmtldC5lbmRfdGltZSwKICAgIGRpZyAzCiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTI4CiAgICAvLyBtYXJrZXQuc3RhdHVzLAogICAgZGlnIDQKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MjkKICAgIC8vIG1hcmtldC53aW5uaW5nX29wdGlvbgogICAgdW5jb3ZlciA1CiAgICBleHRyYWN0IDQ4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTIxLTkzMAogICAgLy8gcmV0dXJuIGFyYzQuVHVwbGUoKAogICAgLy8gICAgIG1hcmtldC50aXRsZSwKICAgIC8vICAgICBzZWxmLl9tYXJrZXRfb3B0aW9ucyhtYXJrZXQuY29weSgpKSwKICAgIC8vICAgICBtYXJrZXQub2Rkcy5jb3B5KCksCiAgICAvLyAgICAgcGFja2VkX3VpbnQ2NF9hcnJheShvcHRpb25fcG9vbHMpLAogICAgLy8gICAgIG1hcmtldC50b3RhbF9wb29sLAogICAgLy8gICAgIG1hcmtldC5lbmRfdGltZSwKICAgIC8vICAgICBtYXJrZXQuc3RhdHVzLAogICAgLy8gICAgIG1hcmtldC53aW5uaW5nX29wdGlvbgogICAgLy8gKSkKICAgIGZyYW1lX2RpZyA4CiAgICBkdXAKICAgIGNvdmVyIDYKICAgIGxlbgogICAgcHVzaGludCA0MCAvLyA0MAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAyOAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGR1cAogICAgY292ZXIgNAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgOQogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmdldF9tYXJrZXRfaW5mb19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE1OQogICAgLy8gaGVhZCA9IG9wLmV4dHJhY3QoaWRzLCAwLCAyKSAgIyBvcHRpb24gY291bnQKICAgIGZyYW1lX2RpZyAxMQogICAgZHVwCiAgICBleHRyYWN0IDAgMgogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE2MAogICAgLy8gdGFpbCA9IEJ5dGVzKCkKICAgIHB1c2hieXRlcyAweAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE2MQogICAgLy8gaGVhZF9zaXplID0gbWFya2V0Lm9wdGlvbl9pZHMubGVuZ3RoICogVUludDY0KDIpCiAgICBmcmFtZV9kaWcgMTIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAqCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTYyCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyLCBpZHMubGVuZ3RoLCBTVFJJTkdfSURfU0laRSk6CiAgICBsZW4KICAgIGZyYW1lX2J1cnkgNAogICAgcHVzaGludCAyIC8vIDIKICAgIGZyYW1lX2J1cnkgMwoKZ2V0X21hcmtldF9pbmZvX2Zvcl9oZWFkZXJANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTYyCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyLCBpZHMubGVuZ3RoLCBTVFJJTkdfSURfU0laRSk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDQKICAgIDwKICAgIGJ6IGdldF9tYXJrZXRfaW5mb19hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNjMKICAgIC8vIGhlYWQgKz0gb3AuZXh0cmFjdChvcC5pdG9iKGhlYWRfc2l6ZSArIHRhaWwubGVuZ3RoKSwgNiwgMikKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGxlbgogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTY0CiAgICAvLyB0YWlsICs9IHNlbGYuc3RyaW5nc1tvcC5leHRyYWN0X3VpbnQxNihpZHMsIG9mZnNldCldLmJ5dGVzCiAgICBmcmFtZV9kaWcgMTEKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg3MwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdHJpbmdzIGVudHJ5IGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNjIKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKDIsIGlkcy5sZW5ndGgsIFNUUklOR19JRF9TSVpFKToKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgZ2V0X21hcmtldF9pbmZvX2Zvcl9oZWFkZXJANAoKZ2V0X21hcmtldF9pbmZvX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNjUKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10uZnJvbV9ieXRlcyhoZWFkICsgdGFpbCkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTIzCiAgICAvLyBzZWxmLl9tYXJrZXRfb3B0aW9ucyhtYXJrZXQuY29weSgpKSwKICAgIGIgZ2V0X21hcmtldF9pbmZvX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuX21hcmtldF9vcHRpb25zQDgKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5nZXRfYnVja2V0X2JvdW5kYXJpZXMobWFya2V0X2lkOiBieXRlcykgLT4gYnl0ZXM6CmdldF9idWNrZXRfYm91bmRhcmllczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5MzItOTMzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYnVja2V0X2JvdW5kYXJpZXMoc2VsZiwgbWFya2V0X2lkOiBhcmM0LlVJbnQ2NCkgLT4gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTM1CiAgICAvLyBhc3NlcnQgbWFya2V0X2lkLm5hdGl2ZSBpbiBzZWxmLm1hcmtldHMsICJNYXJrZXQgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6Mjk4CiAgICAvLyByZXR1cm4gYiJiIiArIG9wLml0b2IobWFya2V0X2lkKQogICAgYnl0ZWMgMTAgLy8gMHg2MgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTM2CiAgICAvLyBib3VuZGFyaWVzLCBfZXhpc3RzID0gb3AuQm94LmdldChib3VuZGFyaWVzX2tleShtYXJrZXRfaWQubmF0aXZlKSkKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjkzNwogICAgLy8gcmV0dXJuIHBhY2tlZF91aW50NjRfYXJyYXkoYm91bmRhcmllcykKICAgIGNhbGxzdWIgcGFja2VkX3VpbnQ2NF9hcnJheQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuZ2V0X21hcmtldF9zdW1tYXJ5KG1hcmtldF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfbWFya2V0X3N1bW1hcnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTM5LTk0MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X21hcmtldF9zdW1tYXJ5KHNlbGYsIG1hcmtldF9pZDogYXJjNC5VSW50NjQpIC0+IE1hcmtldFRpY2tlcjoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk0NgogICAgLy8gYXNzZXJ0IG1hcmtldF9pZC5uYXRpdmUgaW4gc2VsZi5tYXJrZXRzLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTQ3CiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0uY29weSgpCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI5MgogICAgLy8gcmV0dXJuIGIicCIgKyBvcC5pdG9iKG1hcmtldF9pZCkKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NDgKICAgIC8vIG9wdGlvbl9wb29scywgX2V4aXN0cyA9IG9wLkJveC5nZXQocG9vbHNfa2V5KG1hcmtldF9pZC5uYXRpdmUpKQogICAgYm94X2dldAogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTUxCiAgICAvLyB2ZXJzaW9uPW1hcmtldC52ZXJzaW9uLAogICAgZHVwCiAgICBleHRyYWN0IDk2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTUyCiAgICAvLyBzdGF0dXM9bWFya2V0LnN0YXR1cywKICAgIGRpZyAxCiAgICBleHRyYWN0IDQwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTUzCiAgICAvLyBlbmRfdGltZT1tYXJrZXQuZW5kX3RpbWUsCiAgICBkaWcgMgogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk1NAogICAgLy8gd2lubmluZ19vcHRpb249bWFya2V0Lndpbm5pbmdfb3B0aW9uLAogICAgZGlnIDMKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NTUKICAgIC8vIHRvdGFsX3Bvb2w9bWFya2V0LnRvdGFsX3Bvb2wsCiAgICBkaWcgNAogICAgZXh0cmFjdCA2NCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk1NgogICAgLy8gYmV0X2NvdW50PW1hcmtldC5iZXRfY291bnQsCiAgICBkaWcgNQogICAgZXh0cmFjdCAxMDQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NTcKICAgIC8vIGJldHRvcl9jb3VudD1tYXJrZXQuYmV0dG9yX2NvdW50LAogICAgZGlnIDYKICAgIGV4dHJhY3QgMTEyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTU4CiAgICAvLyBtYXhfYmV0PW1hcmtldC5tYXhfYmV0LAogICAgdW5jb3ZlciA3CiAgICBleHRyYWN0IDEyMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk1OQogICAgLy8gb3B0aW9uX3Bvb2xzPXBhY2tlZF91aW50NjRfYXJyYXkob3B0aW9uX3Bvb2xzKSwKICAgIHVuY292ZXIgOAogICAgY2FsbHN1YiBwYWNrZWRfdWludDY0X2FycmF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTUwLTk2MAogICAgLy8gcmV0dXJuIE1hcmtldFRpY2tlcigKICAgIC8vICAgICB2ZXJzaW9uPW1hcmtldC52ZXJzaW9uLAogICAgLy8gICAgIHN0YXR1cz1tYXJrZXQuc3RhdHVzLAogICAgLy8gICAgIGVuZF90aW1lPW1hcmtldC5lbmRfdGltZSwKICAgIC8vICAgICB3aW5uaW5nX29wdGlvbj1tYXJrZXQud2lubmluZ19vcHRpb24sCiAgICAvLyAgICAgdG90YWxfcG9vbD1tYXJrZXQudG90YWxfcG9vbCwKICAgIC8vICAgICBiZXRfY291bnQ9bWFya2V0LmJldF9jb3VudCwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9bWFya2V0LmJldHRvcl9jb3VudCwKICAgIC8vICAgICBtYXhfYmV0PW1hcmtldC5tYXhfYmV0LAogICAgLy8gICAgIG9wdGlvbl9wb29scz1wYWNrZWRfdWludDY0X2FycmF5KG9wdGlvbl9wb29scyksCiAgICAvLyApCiAgICB1bmNvdmVyIDgKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDQyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuZ2V0X3VzZXJfcG9zaXRpb24obWFya2V0X2lkOiBieXRlcywgdXNlcjogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfdXNlcl9wb3NpdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NjItOTY3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfdXNlcl9wb3NpdGlvbihzZWxmLCBtYXJrZXRfaWQ6IGFyYzQuVUludDY0LCB1c2VyOiBhcmM0LkFkZHJlc3MpIC0+IGFyYzQuVHVwbGVbCiAgICAvLyAgICAgYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLCAgIyB1c2VyX2JldHMgcGVyIG9wdGlvbgogICAgLy8gICAgIGFyYzQuVUludDY0LCAgIyB0b3RhbF9iZXRfYW1vdW50CiAgICAvLyAgICAgYXJjNC5Cb29sICAgICAjIGlzX2NsYWltZWQKICAgIC8vIF06CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NjkKICAgIC8vIGFzc2VydCBtYXJrZXRfaWQubmF0aXZlIGluIHNlbGYubWFya2V0cywgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDZkCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1hcmtldCBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk3MQogICAgLy8gcG9zaXRpb24sIGV4aXN0cyA9IG9wLkJveC5nZXQocG9zaXRpb25fa2V5KG1hcmtldF9pZC5uYXRpdmUsIHVzZXIubmF0aXZlKSkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NzIKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogZ2V0X3VzZXJfcG9zaXRpb25fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTczCiAgICAvLyBvcHRpb25fY291bnQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkLm5hdGl2ZV0ub3B0aW9uX2NvdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk3NAogICAgLy8gcG9zaXRpb24gPSBvcC5iemVybyhVSW50NjQoUE9TSVRJT05fU1RBS0VTX09GRlNFVCkgKyBvcHRpb25fY291bnQgKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgICsKICAgIGJ6ZXJvCiAgICBmcmFtZV9idXJ5IDEKCmdldF91c2VyX3Bvc2l0aW9uX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5NzcKICAgIC8vIHBhY2tlZF91aW50NjRfYXJyYXkocG9zaXRpb25bUE9TSVRJT05fU1RBS0VTX09GRlNFVDpdKSwKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAxMCAvLyAxMAogICAgZGlnIDEKICAgID49CiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAyCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGNhbGxzdWIgcGFja2VkX3VpbnQ2NF9hcnJheQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk3OAogICAgLy8gYXJjNC5VSW50NjQob3AuZXh0cmFjdF91aW50NjQocG9zaXRpb24sIFBPU0lUSU9OX1RPVEFMX09GRlNFVCkpLCAgIyB0b3RhbF9iZXRfYW1vdW50CiAgICBkaWcgMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTc5CiAgICAvLyBhcmM0LkJvb2wob3AuZ2V0Ynl0ZShwb3NpdGlvbiwgUE9TSVRJT05fQ0xBSU1FRF9PRkZTRVQpICE9IDApICAgICAjIGlzX2NsYWltZWQKICAgIHVuY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgIGdldGJ5dGUKICAgIGJ5dGVjIDEyIC8vIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk3Ni05ODAKICAgIC8vIHJldHVybiBhcmM0LlR1cGxlKCgKICAgIC8vICAgICBwYWNrZWRfdWludDY0X2FycmF5KHBvc2l0aW9uW1BPU0lUSU9OX1NUQUtFU19PRkZTRVQ6XSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQob3AuZXh0cmFjdF91aW50NjQocG9zaXRpb24sIFBPU0lUSU9OX1RPVEFMX09GRlNFVCkpLCAgIyB0b3RhbF9iZXRfYW1vdW50CiAgICAvLyAgICAgYXJjNC5Cb29sKG9wLmdldGJ5dGUocG9zaXRpb24sIFBPU0lUSU9OX0NMQUlNRURfT0ZGU0VUKSAhPSAwKSAgICAgIyBpc19jbGFpbWVkCiAgICAvLyApKQogICAgcHVzaGJ5dGVzIDB4MDAwYgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0LmdldF91c2VyX3BvcnRmb2xpbyh1c2VyOiBieXRlcywgc3RhcnQ6IGJ5dGVzLCBjb3VudDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfdXNlcl9wb3J0Zm9saW86CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTgyLTk4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3VzZXJfcG9ydGZvbGlvKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdXNlcjogYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIHN0YXJ0OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBjb3VudDogYXJjNC5VSW50NjQKICAgIC8vICkgLT4gYXJjNC5EeW5hbWljQXJyYXlbUG9ydGZvbGlvRW50cnldOgogICAgcHJvdG8gMyAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA1CiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gNgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxNgogICAgLy8gcmV0dXJuIGIiaSIgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjIDEzIC8vIDB4NjkKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6OTk1CiAgICAvLyBpbmRleCwgX2V4aXN0cyA9IG9wLkJveC5nZXQocG9ydGZvbGlvX2tleSh1c2VyLm5hdGl2ZSkpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5OTYKICAgIC8vIHBhZ2Vfc2l6ZSA9IGNvdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5OTcKICAgIC8vIGlmIHBhZ2Vfc2l6ZSA+IE1BWF9QT1JURk9MSU9fUEFHRV9TSVpFOgogICAgcHVzaGludCAzNyAvLyAzNwogICAgPgogICAgYnogZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5Ojk5OAogICAgLy8gcGFnZV9zaXplID0gVUludDY0KE1BWF9QT1JURk9MSU9fUEFHRV9TSVpFKQogICAgcHVzaGludCAzNyAvLyAzNwogICAgZnJhbWVfYnVyeSAxNAoKZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo5OTkKICAgIC8vIHN0b3AgPSAoc3RhcnQubmF0aXZlICsgcGFnZV9zaXplKSAqIFVJbnQ2NChQT09MX1NMT1RfU0laRSkKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZHVwCiAgICBmcmFtZV9idXJ5IDExCiAgICBmcmFtZV9kaWcgMTQKICAgICsKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMDAKICAgIC8vIGlmIHN0b3AgPiBpbmRleC5sZW5ndGg6CiAgICBmcmFtZV9kaWcgMTMKICAgIGxlbgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEwCiAgICA+CiAgICBieiBnZXRfdXNlcl9wb3J0Zm9saW9fYWZ0ZXJfaWZfZWxzZUA0CiAgICBmcmFtZV9kaWcgMTAKICAgIGZyYW1lX2J1cnkgOQoKZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDAzCiAgICAvLyBwb3J0Zm9saW8gPSBhcmM0LkR5bmFtaWNBcnJheVtQb3J0Zm9saW9FbnRyeV0oKQogICAgYnl0ZWMgNiAvLyAweDAwMDAKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMDQKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKHN0YXJ0Lm5hdGl2ZSAqIFVJbnQ2NChQT09MX1NMT1RfU0laRSksIHN0b3AsIFBPT0xfU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyAxMQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGZyYW1lX2J1cnkgOAoKZ2V0X3VzZXJfcG9ydGZvbGlvX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDA0CiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZShzdGFydC5uYXRpdmUgKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpLCBzdG9wLCBQT09MX1NMT1RfU0laRSk6CiAgICBmcmFtZV9kaWcgOAogICAgZnJhbWVfZGlnIDkKICAgIDwKICAgIGJ6IGdldF91c2VyX3BvcnRmb2xpb19hZnRlcl9mb3JAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDA1CiAgICAvLyBtYXJrZXRfaWQgPSBvcC5leHRyYWN0X3VpbnQ2NChpbmRleCwgb2Zmc2V0KQogICAgZnJhbWVfZGlnIDEzCiAgICBmcmFtZV9kaWcgOAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDA2CiAgICAvLyBpZiBtYXJrZXRfaWQgaW4gc2VsZi5tYXJrZXRzOgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSA0CiAgICBieiBnZXRfdXNlcl9wb3J0Zm9saW9fYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMDcKICAgIC8vIG1hcmtldCA9IHNlbGYubWFya2V0c1ttYXJrZXRfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAwOQogICAgLy8gY2xhaW1lZCA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9DTEFJTUVEX09GRlNFVCksIFVJbnQ2NCgxKSkpICE9IDAKICAgIGludGNfMiAvLyA4CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDEwCiAgICAvLyBjbGFpbWFibGUgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMTEKICAgIC8vIGlmIG1hcmtldC5zdGF0dXMgPT0gU1RBVFVTX1NFVFRMRUQgYW5kIG5vdCBjbGFpbWVkOgogICAgc3dhcAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNyAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIGI9PQogICAgc3dhcAogICAgZnJhbWVfYnVyeSA3CiAgICBieiBnZXRfdXNlcl9wb3J0Zm9saW9fYWZ0ZXJfaWZfZWxzZUAxMAogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2J1cnkgNwogICAgZnJhbWVfZGlnIDEyCiAgICBibnogZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDEzCiAgICAvLyBwb3NpdGlvbiwgbWFya2V0Lndpbm5pbmdfb3B0aW9uLm5hdGl2ZSwgbWFya2V0Lndpbm5pbmdfcG9vbC5uYXRpdmUsIG1hcmtldC5wYXlvdXRfcmF0aW8ubmF0aXZlCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgIGV4dHJhY3RfdWludDY0CiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgODAgLy8gODAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAxMi0xMDE0CiAgICAvLyBjbGFpbWFibGUgPSBwb3NpdGlvbl9wYXlvdXQoCiAgICAvLyAgICAgcG9zaXRpb24sIG1hcmtldC53aW5uaW5nX29wdGlvbi5uYXRpdmUsIG1hcmtldC53aW5uaW5nX3Bvb2wubmF0aXZlLCBtYXJrZXQucGF5b3V0X3JhdGlvLm5hdGl2ZQogICAgLy8gKQogICAgZnJhbWVfZGlnIDUKICAgIGNvdmVyIDMKICAgIGNhbGxzdWIgcG9zaXRpb25fcGF5b3V0CiAgICBmcmFtZV9idXJ5IDcKCmdldF91c2VyX3BvcnRmb2xpb19hZnRlcl9pZl9lbHNlQDEwOgogICAgZnJhbWVfZGlnIDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDE1LTEwMjQKICAgIC8vIHBvcnRmb2xpby5hcHBlbmQoUG9ydGZvbGlvRW50cnkoCiAgICAvLyAgICAgbWFya2V0X2lkPWFyYzQuVUludDY0KG1hcmtldF9pZCksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDgobWFya2V0LnN0YXR1cy5uYXRpdmUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDgobWFya2V0Lndpbm5pbmdfb3B0aW9uLm5hdGl2ZSksCiAgICAvLyAgICAgY2xhaW1lZD1hcmM0LkJvb2woY2xhaW1lZCksCiAgICAvLyAgICAgdG90YWxfc3Rha2U9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIG9wLmJ0b2kob3AuQm94LmV4dHJhY3QocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9UT1RBTF9PRkZTRVQpLCBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKSkKICAgIC8vICAgICApLAogICAgLy8gICAgIGNsYWltYWJsZT1hcmM0LlVJbnQ2NChjbGFpbWFibGUpLAogICAgLy8gKSkKICAgIGZyYW1lX2RpZyAzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMTcKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ4KG1hcmtldC5zdGF0dXMubmF0aXZlKSwKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAxOAogICAgLy8gd2lubmluZ19vcHRpb249YXJjNC5VSW50OChtYXJrZXQud2lubmluZ19vcHRpb24ubmF0aXZlKSwKICAgIHN3YXAKICAgIHB1c2hpbnQgNDggLy8gNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAxOQogICAgLy8gY2xhaW1lZD1hcmM0LkJvb2woY2xhaW1lZCksCiAgICBieXRlYyAxMiAvLyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfZGlnIDEyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDIxCiAgICAvLyBvcC5idG9pKG9wLkJveC5leHRyYWN0KHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fVE9UQUxfT0ZGU0VUKSwgVUludDY0KFBPT0xfU0xPVF9TSVpFKSkpCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18wIC8vIDAKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMjAtMTAyMgogICAgLy8gdG90YWxfc3Rha2U9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChwb3NpdGlvbiwgVUludDY0KFBPU0lUSU9OX1RPVEFMX09GRlNFVCksIFVJbnQ2NChQT09MX1NMT1RfU0laRSkpKQogICAgLy8gKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDIzCiAgICAvLyBjbGFpbWFibGU9YXJjNC5VSW50NjQoY2xhaW1hYmxlKSwKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMTUtMTAyNAogICAgLy8gcG9ydGZvbGlvLmFwcGVuZChQb3J0Zm9saW9FbnRyeSgKICAgIC8vICAgICBtYXJrZXRfaWQ9YXJjNC5VSW50NjQobWFya2V0X2lkKSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChtYXJrZXQuc3RhdHVzLm5hdGl2ZSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50OChtYXJrZXQud2lubmluZ19vcHRpb24ubmF0aXZlKSwKICAgIC8vICAgICBjbGFpbWVkPWFyYzQuQm9vbChjbGFpbWVkKSwKICAgIC8vICAgICB0b3RhbF9zdGFrZT1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChwb3NpdGlvbiwgVUludDY0KFBPU0lUSU9OX1RPVEFMX09GRlNFVCksIFVJbnQ2NChQT09MX1NMT1RfU0laRSkpKQogICAgLy8gICAgICksCiAgICAvLyAgICAgY2xhaW1hYmxlPWFyYzQuVUludDY0KGNsYWltYWJsZSksCiAgICAvLyApKQogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMjcgLy8gMjcKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgNAoKZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAwNAogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2Uoc3RhcnQubmF0aXZlICogVUludDY0KFBPT0xfU0xPVF9TSVpFKSwgc3RvcCwgUE9PTF9TTE9UX1NJWkUpOgogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMiAvLyA4CiAgICArCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgZ2V0X3VzZXJfcG9ydGZvbGlvX2Zvcl9oZWFkZXJANQoKZ2V0X3VzZXJfcG9ydGZvbGlvX2FmdGVyX2ZvckAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDI2CiAgICAvLyByZXR1cm4gcG9ydGZvbGlvCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5nZXRfbWFya2V0c19wYWdlKHN0YXJ0OiBieXRlcywgY291bnQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X21hcmtldHNfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDI4LTEwMjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9tYXJrZXRzX3BhZ2Uoc2VsZiwgc3RhcnQ6IGFyYzQuVUludDY0LCBjb3VudDogYXJjNC5VSW50NjQpIC0+IGFyYzQuRHluYW1pY0FycmF5W01hcmtldFN1bW1hcnldOgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAzCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwMzYKICAgIC8vIHBhZ2Vfc2l6ZSA9IGNvdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDM3CiAgICAvLyBpZiBwYWdlX3NpemUgPiBNQVhfUEFHRV9TSVpFOgogICAgcHVzaGludCAyMyAvLyAyMwogICAgPgogICAgYnogZ2V0X21hcmtldHNfcGFnZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDM4CiAgICAvLyBwYWdlX3NpemUgPSBVSW50NjQoTUFYX1BBR0VfU0laRSkKICAgIHB1c2hpbnQgMjMgLy8gMjMKICAgIGZyYW1lX2J1cnkgNgoKZ2V0X21hcmtldHNfcGFnZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTAzOQogICAgLy8gc3RvcCA9IHN0YXJ0Lm5hdGl2ZSArIHBhZ2Vfc2l6ZQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfZGlnIDYKICAgICsKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0MAogICAgLy8gaWYgc3RvcCA+IHNlbGYubWFya2V0X2NvdW50ZXIgKyAxOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgID4KICAgIGJ6IGdldF9tYXJrZXRzX3BhZ2VfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0MQogICAgLy8gc3RvcCA9IHNlbGYubWFya2V0X2NvdW50ZXIgKyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAibWFya2V0X2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0X2NvdW50ZXIgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA1CgpnZXRfbWFya2V0c19wYWdlX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDQzCiAgICAvLyBwYWdlID0gYXJjNC5EeW5hbWljQXJyYXlbTWFya2V0U3VtbWFyeV0oKQogICAgYnl0ZWMgNiAvLyAweDAwMDAKICAgIGZyYW1lX2J1cnkgMgoKZ2V0X21hcmtldHNfcGFnZV9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0NAogICAgLy8gZm9yIG1hcmtldF9pZCBpbiB1cmFuZ2Uoc3RhcnQubmF0aXZlLCBzdG9wKToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgYnogZ2V0X21hcmtldHNfcGFnZV9hZnRlcl9mb3JAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDQ1CiAgICAvLyBpZiBtYXJrZXRfaWQgaW4gc2VsZi5tYXJrZXRzOgogICAgZnJhbWVfZGlnIDQKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBieXRlY18xIC8vIDB4NmQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMwogICAgYnogZ2V0X21hcmtldHNfcGFnZV9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDQ2CiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwNDctMTA1NwogICAgLy8gcGFnZS5hcHBlbmQoTWFya2V0U3VtbWFyeSgKICAgIC8vICAgICBtYXJrZXRfaWQ9YXJjNC5VSW50NjQobWFya2V0X2lkKSwKICAgIC8vICAgICBlbmRfdGltZT1tYXJrZXQuZW5kX3RpbWUsCiAgICAvLyAgICAgdG90YWxfcG9vbD1tYXJrZXQudG90YWxfcG9vbCwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChtYXJrZXQuc3RhdHVzLm5hdGl2ZSksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDgobWFya2V0Lm9wdGlvbl9jb3VudC5uYXRpdmUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDgobWFya2V0Lndpbm5pbmdfb3B0aW9uLm5hdGl2ZSksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDMyKG1hcmtldC5iZXRfY291bnQubmF0aXZlKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50MzIobWFya2V0LmJldHRvcl9jb3VudC5uYXRpdmUpLAogICAgLy8gICAgIG1heF9iZXQ9bWFya2V0Lm1heF9iZXQsCiAgICAvLyApKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0OQogICAgLy8gZW5kX3RpbWU9bWFya2V0LmVuZF90aW1lLAogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDUwCiAgICAvLyB0b3RhbF9wb29sPW1hcmtldC50b3RhbF9wb29sLAogICAgZGlnIDIKICAgIGV4dHJhY3QgNjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDUxCiAgICAvLyBzdGF0dXM9YXJjNC5VSW50OChtYXJrZXQuc3RhdHVzLm5hdGl2ZSksCiAgICBkaWcgMwogICAgcHVzaGludCA0MCAvLyA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDUyCiAgICAvLyBvcHRpb25fY291bnQ9YXJjNC5VSW50OChtYXJrZXQub3B0aW9uX2NvdW50Lm5hdGl2ZSksCiAgICBkaWcgNAogICAgcHVzaGludCA1NiAvLyA1NgogICAgZXh0cmFjdF91aW50NjQKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzIgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDUzCiAgICAvLyB3aW5uaW5nX29wdGlvbj1hcmM0LlVJbnQ4KG1hcmtldC53aW5uaW5nX29wdGlvbi5uYXRpdmUpLAogICAgZGlnIDUKICAgIHB1c2hpbnQgNDggLy8gNDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA1NAogICAgLy8gYmV0X2NvdW50PWFyYzQuVUludDMyKG1hcmtldC5iZXRfY291bnQubmF0aXZlKSwKICAgIGRpZyA2CiAgICBwdXNoaW50IDEwNCAvLyAxMDQKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwNTUKICAgIC8vIGJldHRvcl9jb3VudD1hcmM0LlVJbnQzMihtYXJrZXQuYmV0dG9yX2NvdW50Lm5hdGl2ZSksCiAgICBkaWcgNwogICAgcHVzaGludCAxMTIgLy8gMTEyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDU2CiAgICAvLyBtYXhfYmV0PW1hcmtldC5tYXhfYmV0LAogICAgdW5jb3ZlciA4CiAgICBleHRyYWN0IDEyMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwNDctMTA1NwogICAgLy8gcGFnZS5hcHBlbmQoTWFya2V0U3VtbWFyeSgKICAgIC8vICAgICBtYXJrZXRfaWQ9YXJjNC5VSW50NjQobWFya2V0X2lkKSwKICAgIC8vICAgICBlbmRfdGltZT1tYXJrZXQuZW5kX3RpbWUsCiAgICAvLyAgICAgdG90YWxfcG9vbD1tYXJrZXQudG90YWxfcG9vbCwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChtYXJrZXQuc3RhdHVzLm5hdGl2ZSksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDgobWFya2V0Lm9wdGlvbl9jb3VudC5uYXRpdmUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDgobWFya2V0Lndpbm5pbmdfb3B0aW9uLm5hdGl2ZSksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDMyKG1hcmtldC5iZXRfY291bnQubmF0aXZlKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50MzIobWFya2V0LmJldHRvcl9jb3VudC5uYXRpdmUpLAogICAgLy8gICAgIG1heF9iZXQ9bWFya2V0Lm1heF9iZXQsCiAgICAvLyApKQogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgNDMgLy8gNDMKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMwoKZ2V0X21hcmtldHNfcGFnZV9hZnRlcl9pZl9lbHNlQDg6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA0NAogICAgLy8gZm9yIG1hcmtldF9pZCBpbiB1cmFuZ2Uoc3RhcnQubmF0aXZlLCBzdG9wKToKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGdldF9tYXJrZXRzX3BhZ2VfZm9yX2hlYWRlckA1CgpnZXRfbWFya2V0c19wYWdlX2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDU5CiAgICAvLyByZXR1cm4gcGFnZQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuZ2V0X21hcmtldF9jb3VudCgpIC0+IGJ5dGVzOgpnZXRfbWFya2V0X2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwNjQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLm1hcmtldF9jb3VudGVyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hcmtldF9jb3VudGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldF9jb3VudGVyIGV4aXN0cwogICAgaXRvYgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuX2NyZWF0ZV9tYXJrZXQodGl0bGU6IGJ5dGVzLCBvcHRpb25zOiBieXRlcywgb3B0aW9uX2lkczogYnl0ZXMsIG9kZHM6IGJ5dGVzLCBkdXJhdGlvbl9ob3VyczogdWludDY0KSAtPiB1aW50NjQsIGJ5dGVzLCBieXRlcywgYnl0ZXM6Cl9jcmVhdGVfbWFya2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwNjYtMTA3NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY3JlYXRlX21hcmtldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHRpdGxlOiBhcmM0LlN0cmluZywKICAgIC8vICAgICBvcHRpb25zOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10sCiAgICAvLyAgICAgb3B0aW9uX2lkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50MTZdLAogICAgLy8gICAgIG9kZHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDE2XSwKICAgIC8vICAgICBkdXJhdGlvbl9ob3VyczogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDUgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwODAtMTA4MQogICAgLy8gIyBCYXNpYyB2YWxpZGF0aW9uOyBjYWxsZXJzIGNoZWNrIHRoYXQgdGhlIG9wdGlvbiBuYW1lcyAoaWYgYW55KSBtYXRjaCB0aGUgb2RkcwogICAgLy8gb3B0aW9uX2NvdW50ID0gb2Rkcy5sZW5ndGgKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDgyCiAgICAvLyBhc3NlcnQgb3B0aW9uX2NvdW50ID49IDIsICJNYXJrZXQgbXVzdCBoYXZlIGF0IGxlYXN0IDIgb3B0aW9ucyIKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIE1hcmtldCBtdXN0IGhhdmUgYXQgbGVhc3QgMiBvcHRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA4MwogICAgLy8gYXNzZXJ0IG9wdGlvbl9jb3VudCA8PSBUZW1wbGF0ZVZhcltVSW50NjRdKCJNQVhfT1BUSU9OUyIpLCAiVG9vIG1hbnkgb3B0aW9ucyIKICAgIGR1cAogICAgaW50YyA2IC8vIFRNUExfTUFYX09QVElPTlMKICAgIDw9CiAgICBhc3NlcnQgLy8gVG9vIG1hbnkgb3B0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEwODUKICAgIC8vIFVJbnQ2NChDUkVBVEVfT1BDT0RFX0JVREdFVCkgKyBvcHRpb25fY291bnQgKiBVSW50NjQoQ1JFQVRFX09QVElPTl9PUENPREVfQlVER0VUKSwKICAgIHB1c2hpbnQgMzAgLy8gMzAKICAgICoKICAgIGludGMgNCAvLyA0MDAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDg2CiAgICAvLyBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDg0LTEwODcKICAgIC8vIGVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgVUludDY0KENSRUFURV9PUENPREVfQlVER0VUKSArIG9wdGlvbl9jb3VudCAqIFVJbnQ2NChDUkVBVEVfT1BUSU9OX09QQ09ERV9CVURHRVQpLAogICAgLy8gICAgIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDkyCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyLCBvZGRzX2J5dGVzLmxlbmd0aCwgT0REU19TTE9UX1NJWkUpOgogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIHB1c2hpbnQgMiAvLyAyCgpfY3JlYXRlX21hcmtldF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA5MgogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMiwgb2Rkc19ieXRlcy5sZW5ndGgsIE9ERFNfU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogX2NyZWF0ZV9tYXJrZXRfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDkzCiAgICAvLyBvZGQgPSBvcC5leHRyYWN0X3VpbnQxNihvZGRzX2J5dGVzLCBvZmZzZXQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA5NAogICAgLy8gYXNzZXJ0IG9kZCA+PSBNSU5fT0REUywgIk9kZHMgbXVzdCBiZSBhdCBsZWFzdCAxLjAxICgxMDEpIgogICAgZHVwCiAgICBwdXNoaW50IDEwMSAvLyAxMDEKICAgID49CiAgICBhc3NlcnQgLy8gT2RkcyBtdXN0IGJlIGF0IGxlYXN0IDEuMDEgKDEwMSkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDk1CiAgICAvLyBhc3NlcnQgb2RkIDw9IE1BWF9PRERTLCAiT2RkcyBtdXN0IGJlIGF0IG1vc3QgMTAwLjAwICgxMDAwMCkiCiAgICBwdXNoaW50IDEwMDAwIC8vIDEwMDAwCiAgICA8PQogICAgYXNzZXJ0IC8vIE9kZHMgbXVzdCBiZSBhdCBtb3N0IDEwMC4wMCAoMTAwMDApCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTA5MgogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMiwgb2Rkc19ieXRlcy5sZW5ndGgsIE9ERFNfU0xPVF9TSVpFKToKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgX2NyZWF0ZV9tYXJrZXRfZm9yX2hlYWRlckAxCgpfY3JlYXRlX21hcmtldF9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMDk3LTExMDEKICAgIC8vICMgSW5jcmVtZW50IG1hcmtldCBjb3VudGVyIGFuZCBzdG9yZSB0aGUgbWFya2V0IGluIGl0cyBvd24gYm94LiBJbmxpbmUKICAgIC8vICMgb3B0aW9ucyBrZWVwIHRoZWlyIEFSQy00IHN0cmluZ1tdIGVuY29kaW5nLCB3aGljaCBpcyBhbHJlYWR5IG9uZSBibG9iIGJlaGluZAogICAgLy8gIyBhIHVpbnQxNiBvZmZzZXQgdGFibGUsIHNvIHRoZXkgYXJlIHN0b3JlZCB2ZXJiYXRpbSB3aXRob3V0IGEKICAgIC8vICMgcGVyLW9wdGlvbiByZS1lbmNvZGluZyBsb29wLgogICAgLy8gc2VsZi5tYXJrZXRfY291bnRlciArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJtYXJrZXRfY291bnRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXJrZXRfY291bnRlciBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJtYXJrZXRfY291bnRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMDIKICAgIC8vIGVuZF90aW1lID0gYXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBkdXJhdGlvbl9ob3VycyAqIFVJbnQ2NCgzNjAwKSkKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAzNjAwIC8vIDM2MDAKICAgICoKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTA0CiAgICAvLyBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTA4CiAgICAvLyBvcHRpb25fY291bnQ9YXJjNC5VSW50NjQob3B0aW9uX2NvdW50KSwKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzLTExMjIKICAgIC8vIHNlbGYubWFya2V0c1tzZWxmLm1hcmtldF9jb3VudGVyXSA9IE1hcmtldCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBlbmRfdGltZT1lbmRfdGltZSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDY0KG9wdGlvbl9jb3VudCksCiAgICAvLyAgICAgdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGF5b3V0X3JhdGlvPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHZlcnNpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBtYXhfYmV0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jdXJzb3I9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgb3B0aW9ucz1vcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25faWRzPW9wdGlvbl9pZHMuY29weSgpLAogICAgLy8gICAgIG9kZHM9b2Rkcy5jb3B5KCksCiAgICAvLyApCiAgICBzd2FwCiAgICBkaWcgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwNgogICAgLy8gc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzLTExMjIKICAgIC8vIHNlbGYubWFya2V0c1tzZWxmLm1hcmtldF9jb3VudGVyXSA9IE1hcmtldCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBlbmRfdGltZT1lbmRfdGltZSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDY0KG9wdGlvbl9jb3VudCksCiAgICAvLyAgICAgdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGF5b3V0X3JhdGlvPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHZlcnNpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBtYXhfYmV0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jdXJzb3I9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgb3B0aW9ucz1vcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25faWRzPW9wdGlvbl9pZHMuY29weSgpLAogICAgLy8gICAgIG9kZHM9b2Rkcy5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTA3CiAgICAvLyB3aW5uaW5nX29wdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwOQogICAgLy8gdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTExMAogICAgLy8gd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzLTExMjIKICAgIC8vIHNlbGYubWFya2V0c1tzZWxmLm1hcmtldF9jb3VudGVyXSA9IE1hcmtldCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBlbmRfdGltZT1lbmRfdGltZSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDY0KG9wdGlvbl9jb3VudCksCiAgICAvLyAgICAgdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGF5b3V0X3JhdGlvPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHZlcnNpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBtYXhfYmV0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jdXJzb3I9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgb3B0aW9ucz1vcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25faWRzPW9wdGlvbl9pZHMuY29weSgpLAogICAgLy8gICAgIG9kZHM9b2Rkcy5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTExCiAgICAvLyBwYXlvdXRfcmF0aW89YXJjNC5VSW50NjQoMCksCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMDMtMTEyMgogICAgLy8gc2VsZi5tYXJrZXRzW3NlbGYubWFya2V0X2NvdW50ZXJdID0gTWFya2V0KAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGVuZF90aW1lPWVuZF90aW1lLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChTVEFUVVNfQUNUSVZFKSwKICAgIC8vICAgICB3aW5uaW5nX29wdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBvcHRpb25fY291bnQ9YXJjNC5VSW50NjQob3B0aW9uX2NvdW50KSwKICAgIC8vICAgICB0b3RhbF9wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHdpbm5pbmdfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYXlvdXRfcmF0aW89YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9vdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdmVyc2lvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0dG9yX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG1heF9iZXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2N1cnNvcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBvcHRpb25zPW9wdGlvbnMuY29weSgpLAogICAgLy8gICAgIG9wdGlvbl9pZHM9b3B0aW9uX2lkcy5jb3B5KCksCiAgICAvLyAgICAgb2Rkcz1vZGRzLmNvcHkoKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMTIKICAgIC8vIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzLTExMjIKICAgIC8vIHNlbGYubWFya2V0c1tzZWxmLm1hcmtldF9jb3VudGVyXSA9IE1hcmtldCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBlbmRfdGltZT1lbmRfdGltZSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDY0KG9wdGlvbl9jb3VudCksCiAgICAvLyAgICAgdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGF5b3V0X3JhdGlvPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHZlcnNpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBtYXhfYmV0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jdXJzb3I9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgb3B0aW9ucz1vcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25faWRzPW9wdGlvbl9pZHMuY29weSgpLAogICAgLy8gICAgIG9kZHM9b2Rkcy5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTEzCiAgICAvLyB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzLTExMjIKICAgIC8vIHNlbGYubWFya2V0c1tzZWxmLm1hcmtldF9jb3VudGVyXSA9IE1hcmtldCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBlbmRfdGltZT1lbmRfdGltZSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgb3B0aW9uX2NvdW50PWFyYzQuVUludDY0KG9wdGlvbl9jb3VudCksCiAgICAvLyAgICAgdG90YWxfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGF5b3V0X3JhdGlvPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfb3V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHZlcnNpb249YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0X2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBtYXhfYmV0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGRpc3RyaWJ1dGlvbl9jdXJzb3I9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyAgICAgb3B0aW9ucz1vcHRpb25zLmNvcHkoKSwKICAgIC8vICAgICBvcHRpb25faWRzPW9wdGlvbl9pZHMuY29weSgpLAogICAgLy8gICAgIG9kZHM9b2Rkcy5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTE0CiAgICAvLyBiZXRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMDMtMTEyMgogICAgLy8gc2VsZi5tYXJrZXRzW3NlbGYubWFya2V0X2NvdW50ZXJdID0gTWFya2V0KAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGVuZF90aW1lPWVuZF90aW1lLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChTVEFUVVNfQUNUSVZFKSwKICAgIC8vICAgICB3aW5uaW5nX29wdGlvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBvcHRpb25fY291bnQ9YXJjNC5VSW50NjQob3B0aW9uX2NvdW50KSwKICAgIC8vICAgICB0b3RhbF9wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHdpbm5pbmdfcG9vbD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYXlvdXRfcmF0aW89YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9vdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgdmVyc2lvbj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXRfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYmV0dG9yX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG1heF9iZXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgZGlzdHJpYnV0aW9uX2N1cnNvcj1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICAgICBvcHRpb25zPW9wdGlvbnMuY29weSgpLAogICAgLy8gICAgIG9wdGlvbl9pZHM9b3B0aW9uX2lkcy5jb3B5KCksCiAgICAvLyAgICAgb2Rkcz1vZGRzLmNvcHkoKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMTUKICAgIC8vIGJldHRvcl9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTExNgogICAgLy8gbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTExNwogICAgLy8gZGlzdHJpYnV0aW9uX2N1cnNvcj1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDkwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgbGVuCiAgICBwdXNoaW50IDE0NCAvLyAxNDQKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC01CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTAzCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICBkaWcgMwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDZkCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEwMy0xMTIyCiAgICAvLyBzZWxmLm1hcmtldHNbc2VsZi5tYXJrZXRfY291bnRlcl0gPSBNYXJrZXQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZW5kX3RpbWU9ZW5kX3RpbWUsCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KFNUQVRVU19BQ1RJVkUpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIHRvdGFsX3Bvb2w9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgd2lubmluZ19wb29sPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHBheW91dF9yYXRpbz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX291dD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB2ZXJzaW9uPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGJldF9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBiZXR0b3JfY291bnQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbWF4X2JldD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBkaXN0cmlidXRpb25fY3Vyc29yPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gICAgIG9wdGlvbnM9b3B0aW9ucy5jb3B5KCksCiAgICAvLyAgICAgb3B0aW9uX2lkcz1vcHRpb25faWRzLmNvcHkoKSwKICAgIC8vICAgICBvZGRzPW9kZHMuY29weSgpLAogICAgLy8gKQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI5MgogICAgLy8gcmV0dXJuIGIicCIgKyBvcC5pdG9iKG1hcmtldF9pZCkKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMjQtMTEyNQogICAgLy8gIyBPcHRpb24gcG9vbHMgc3RhcnQgemVyby1maWxsZWQsIG9uZSBmaXhlZC13aWR0aCBzbG90IHBlciBvcHRpb24KICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKHBvb2xzX2tleShzZWxmLm1hcmtldF9jb3VudGVyKSwgb3B0aW9uX2NvdW50ICogVUludDY0KFBPT0xfU0xPVF9TSVpFKSkKICAgIHVuY292ZXIgNQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMjkKICAgIC8vIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExMjctMTEzMgogICAgLy8gYXJjNC5lbWl0KE1hcmtldENyZWF0ZWQoCiAgICAvLyAgICAgbWFya2V0X2lkPWFyYzQuVUludDY0KHNlbGYubWFya2V0X2NvdW50ZXIpLAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIG9wdGlvbl9jb3VudD1hcmM0LlVJbnQ2NChvcHRpb25fY291bnQpLAogICAgLy8gICAgIGVuZF90aW1lPWVuZF90aW1lLAogICAgLy8gKSkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGI3YWI0MWFjIC8vIG1ldGhvZCAiTWFya2V0Q3JlYXRlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEzNAogICAgLy8gcmV0dXJuIHNlbGYubWFya2V0X2NvdW50ZXIKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDYKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9jaGVja19zdHJpbmdfaWRzKHBhY2tlZF9pZHM6IGJ5dGVzKSAtPiB2b2lkOgpfY2hlY2tfc3RyaW5nX2lkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTM2LTExMzcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NoZWNrX3N0cmluZ19pZHMoc2VsZiwgcGFja2VkX2lkczogQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTQwCiAgICAvLyAocGFja2VkX2lkcy5sZW5ndGggLy8gU1RSSU5HX0lEX1NJWkUpICogVUludDY0KFNUUklOR19JRF9PUENPREVfQlVER0VUKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBkdXAKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAvCiAgICBwdXNoaW50IDI1IC8vIDI1CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE0MQogICAgLy8gT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTEzOS0xMTQyCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIChwYWNrZWRfaWRzLmxlbmd0aCAvLyBTVFJJTkdfSURfU0laRSkgKiBVSW50NjQoU1RSSU5HX0lEX09QQ09ERV9CVURHRVQpLAogICAgLy8gICAgIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTQzCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyLCBwYWNrZWRfaWRzLmxlbmd0aCwgU1RSSU5HX0lEX1NJWkUpOgogICAgcHVzaGludCAyIC8vIDIKCl9jaGVja19zdHJpbmdfaWRzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTQzCiAgICAvLyBmb3Igb2Zmc2V0IGluIHVyYW5nZSgyLCBwYWNrZWRfaWRzLmxlbmd0aCwgU1RSSU5HX0lEX1NJWkUpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBfY2hlY2tfc3RyaW5nX2lkc19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNDQKICAgIC8vIHN0cmluZ19pZCA9IG9wLmV4dHJhY3RfdWludDE2KHBhY2tlZF9pZHMsIG9mZnNldCkKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTQ1CiAgICAvLyBhc3NlcnQgc3RyaW5nX2lkID49IDEsICJVbmtub3duIHN0cmluZyBpZCIKICAgIGR1cAogICAgYXNzZXJ0IC8vIFVua25vd24gc3RyaW5nIGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE0NgogICAgLy8gYXNzZXJ0IHN0cmluZ19pZCA8PSBzZWxmLnN0cmluZ19jb3VudGVyLCAiVW5rbm93biBzdHJpbmcgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAic3RyaW5nX2NvdW50ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RyaW5nX2NvdW50ZXIgZXhpc3RzCiAgICA8PQogICAgYXNzZXJ0IC8vIFVua25vd24gc3RyaW5nIGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE0MwogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMiwgcGFja2VkX2lkcy5sZW5ndGgsIFNUUklOR19JRF9TSVpFKToKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgX2NoZWNrX3N0cmluZ19pZHNfZm9yX2hlYWRlckAxCgpfY2hlY2tfc3RyaW5nX2lkc19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9jaGVja19wYXltZW50KHBheW1lbnRfdHhuOiB1aW50NjQpIC0+IHZvaWQ6Cl9jaGVja19wYXltZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNjctMTE2OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY2hlY2tfcGF5bWVudChzZWxmLCBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTcwCiAgICAvLyBhc3NlcnQgcGF5bWVudF90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlBheW1lbnQgbXVzdCBiZSB0byBhcHBsaWNhdGlvbiIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSB0byBhcHBsaWNhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNzEKICAgIC8vIGFzc2VydCBwYXltZW50X3R4bi5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgc2VuZGVyIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBzZW5kZXIgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9jaGVja19kZXBvc2l0KHBheW1lbnRfdHhuOiB1aW50NjQsIG1pbl9iYWxhbmNlOiB1aW50NjQpIC0+IHZvaWQ6Cl9jaGVja19kZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNzMtMTE3NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY2hlY2tfZGVwb3NpdChzZWxmLCBwYXltZW50X3R4bjogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sIG1pbl9iYWxhbmNlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTc2CiAgICAvLyBzZWxmLl9jaGVja19wYXltZW50KHBheW1lbnRfdHhuKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIF9jaGVja19wYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE3OAogICAgLy8gcGF5bWVudF90eG4uYW1vdW50ID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgLSBtaW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExNzctMTE3OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50X3R4bi5hbW91bnQgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICAvLyApLCAiUGF5bWVudCBtdXN0IGVxdWFsIHRoZSBtaW5pbXVtIGJhbGFuY2Ugb2YgdGhlIG5ldyBib3hlcyIKICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgZXF1YWwgdGhlIG1pbmltdW0gYmFsYW5jZSBvZiB0aGUgbmV3IGJveGVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMucHJlZGljdGlvbl9tYXJrZXQuY29udHJhY3QuUHJlZGljdGlvbk1hcmtldC5fb3Blbl9wb3NpdGlvbihtYXJrZXRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0Ogpfb3Blbl9wb3NpdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTgxLTExODIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX29wZW5fcG9zaXRpb24oc2VsZiwgbWFya2V0X2lkOiBVSW50NjQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTg5CiAgICAvLyBhc3NlcnQgbWFya2V0X2lkIGluIHNlbGYubWFya2V0cywgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBieXRlY18xIC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTWFya2V0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE5MAogICAgLy8gbWFya2V0ID0gc2VsZi5tYXJrZXRzW21hcmtldF9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE5MQogICAgLy8gcG9zaXRpb24gPSBwb3NpdGlvbl9rZXkobWFya2V0X2lkLCBUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTkzCiAgICAvLyBwb3NpdGlvbiwgVUludDY0KFBPU0lUSU9OX1NUQUtFU19PRkZTRVQpICsgbWFya2V0Lm9wdGlvbl9jb3VudC5uYXRpdmUgKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTkyLTExOTQKICAgIC8vIGlmIG5vdCBvcC5Cb3guY3JlYXRlKAogICAgLy8gICAgIHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fU1RBS0VTX09GRlNFVCkgKyBtYXJrZXQub3B0aW9uX2NvdW50Lm5hdGl2ZSAqIFVJbnQ2NChQT09MX1NMT1RfU0laRSkKICAgIC8vICk6CiAgICBib3hfY3JlYXRlCiAgICBibnogX29wZW5fcG9zaXRpb25fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE5NQogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9vcGVuX3Bvc2l0aW9uX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozMTYKICAgIC8vIHJldHVybiBiImkiICsgYmV0dG9yLmJ5dGVzCiAgICBieXRlYyAxMyAvLyAweDY5CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE5NwogICAgLy8gYm94X2FwcGVuZChwb3J0Zm9saW9fa2V5KFR4bi5zZW5kZXIpLCBvcC5pdG9iKG1hcmtldF9pZCkpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzE2CiAgICAvLyByZXR1cm4gYiJpIiArIGJldHRvci5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTE5NwogICAgLy8gYm94X2FwcGVuZChwb3J0Zm9saW9fa2V5KFR4bi5zZW5kZXIpLCBvcC5pdG9iKG1hcmtldF9pZCkpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIGJveF9hcHBlbmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMTk4CiAgICAvLyBib3hfYXBwZW5kKGJldHRvcnNfa2V5KG1hcmtldF9pZCwgbWFya2V0LmJldHRvcl9jb3VudC5uYXRpdmUgLy8gQkVUVE9SX1BBR0VfU0laRSksIFR4bi5zZW5kZXIuYnl0ZXMpCiAgICBmcmFtZV9kaWcgMQogICAgcHVzaGludCAxMTIgLy8gMTEyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBpbnRjXzMgLy8gMzIKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozMDQKICAgIC8vIHJldHVybiBiInIiICsgb3AuaXRvYihtYXJrZXRfaWQpICsgb3AuaXRvYihwYWdlKQogICAgYnl0ZWMgMTEgLy8gMHg3MgogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExOTgKICAgIC8vIGJveF9hcHBlbmQoYmV0dG9yc19rZXkobWFya2V0X2lkLCBtYXJrZXQuYmV0dG9yX2NvdW50Lm5hdGl2ZSAvLyBCRVRUT1JfUEFHRV9TSVpFKSwgVHhuLnNlbmRlci5ieXRlcykKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgYm94X2FwcGVuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjExOTkKICAgIC8vIGlmIG1hcmtldC5iZXR0b3JfY291bnQubmF0aXZlICUgQkVUVE9SX1BBR0VfU0laRSA9PSAwOgogICAgaW50Y18zIC8vIDMyCiAgICAlCiAgICBibnogX29wZW5fcG9zaXRpb25fYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIwMAogICAgLy8gb3AuQm94LnJlcGxhY2UocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9QQUdFX09GRlNFVCksIEJ5dGVzKGIiXHgwMSIpKQogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgOSAvLyA5CiAgICBwdXNoYnl0ZXMgMHgwMQogICAgYm94X3JlcGxhY2UKCl9vcGVuX3Bvc2l0aW9uX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjAxCiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnByZWRpY3Rpb25fbWFya2V0LmNvbnRyYWN0LlByZWRpY3Rpb25NYXJrZXQuX3JlY29yZF9iZXQobWFya2V0X2lkOiB1aW50NjQsIG9wdGlvbl9pbmRleDogdWludDY0LCBhbW91bnQ6IHVpbnQ2NCwgbmV3X2JldHRvcjogdWludDY0KSAtPiB2b2lkOgpfcmVjb3JkX2JldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjAzLTEyMDQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlY29yZF9iZXQoc2VsZiwgbWFya2V0X2lkOiBVSW50NjQsIG9wdGlvbl9pbmRleDogVUludDY0LCBhbW91bnQ6IFVJbnQ2NCwgbmV3X2JldHRvcjogYm9vbCkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMDYKICAgIC8vIGFzc2VydCBtYXJrZXRfaWQgaW4gc2VsZi5tYXJrZXRzLCAiTWFya2V0IGRvZXMgbm90IGV4aXN0IgogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE1hcmtldCBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMDcKICAgIC8vIG1hcmtldCA9IHNlbGYubWFya2V0c1ttYXJrZXRfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjA4CiAgICAvLyBhc3NlcnQgbWFya2V0LnN0YXR1cyA9PSBTVEFUVVNfQUNUSVZFLCAiTWFya2V0IGlzIG5vdCBhY3RpdmUiCiAgICBkdXAKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGFzc2VydCAvLyBNYXJrZXQgaXMgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMDkKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8IG1hcmtldC5lbmRfdGltZS5uYXRpdmUsICJNYXJrZXQgaGFzIGNsb3NlZCIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICA8CiAgICBhc3NlcnQgLy8gTWFya2V0IGhhcyBjbG9zZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjEwCiAgICAvLyBhc3NlcnQgb3B0aW9uX2luZGV4IDwgbWFya2V0Lm9wdGlvbl9jb3VudC5uYXRpdmUsICJJbnZhbGlkIG9wdGlvbiBpbmRleCIKICAgIGR1cAogICAgcHVzaGludCA1NiAvLyA1NgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMwogICAgPgogICAgYXNzZXJ0IC8vIEludmFsaWQgb3B0aW9uIGluZGV4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIxMQogICAgLy8gYXNzZXJ0IGFtb3VudCA+PSBUZW1wbGF0ZVZhcltVSW50NjRdKCJNSU5fQkVUIiksICJCZXQgaXMgYmVsb3cgdGhlIG1pbmltdW0iCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgOCAvLyBUTVBMX01JTl9CRVQKICAgID49CiAgICBhc3NlcnQgLy8gQmV0IGlzIGJlbG93IHRoZSBtaW5pbXVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIxMy0xMjE1CiAgICAvLyAjIFVwZGF0ZSB0aGUgY2hvc2VuIG9wdGlvbidzIDgtYnl0ZSBwb29sIHNsb3QgaW4gcGxhY2UsIHNvIHRoZSBjb3N0IG9mIGEKICAgIC8vICMgYmV0IGRvZXMgbm90IGRlcGVuZCBvbiBob3cgbWFueSBvcHRpb25zIHRoZSBtYXJrZXQgaGFzCiAgICAvLyBvZmZzZXQgPSBvcHRpb25faW5kZXggKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MjkyCiAgICAvLyByZXR1cm4gYiJwIiArIG9wLml0b2IobWFya2V0X2lkKQogICAgYnl0ZWMgNSAvLyAweDcwCiAgICBkaWcgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzczCiAgICAvLyB2YWx1ZSA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoa2V5LCBvZmZzZXQsIFVJbnQ2NChQT09MX1NMT1RfU0laRSkpKSArIGFtb3VudAogICAgZHVwCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNzQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGtleSwgb2Zmc2V0LCBvcC5pdG9iKHZhbHVlKSkKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgNQogICAgZGlnIDIKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIxOC0xMjE5CiAgICAvLyAjIFJlY29yZCB0aGUgc3Rha2UgaW4gdGhlIGJldHRvcidzIHBvc2l0aW9uCiAgICAvLyBwb3NpdGlvbiA9IHBvc2l0aW9uX2tleShtYXJrZXRfaWQsIFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzEwCiAgICAvLyByZXR1cm4gYiJ1IiArIG9wLml0b2IobWFya2V0X2lkKSArIGJldHRvci5ieXRlcwogICAgYnl0ZWNfMyAvLyAweDc1CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyMAogICAgLy8gX3N0YWtlID0gYWRkX3RvX3Nsb3QocG9zaXRpb24sIFVJbnQ2NChQT1NJVElPTl9TVEFLRVNfT0ZGU0VUKSArIG9mZnNldCwgYW1vdW50KQogICAgcHVzaGludCAxMCAvLyAxMAogICAgdW5jb3ZlciAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MzczCiAgICAvLyB2YWx1ZSA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoa2V5LCBvZmZzZXQsIFVJbnQ2NChQT09MX1NMT1RfU0laRSkpKSArIGFtb3VudAogICAgZHVwMgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNzQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGtleSwgb2Zmc2V0LCBvcC5pdG9iKHZhbHVlKSkKICAgIGl0b2IKICAgIGRpZyAyCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM3MwogICAgLy8gdmFsdWUgPSBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCBVSW50NjQoUE9PTF9TTE9UX1NJWkUpKSkgKyBhbW91bnQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMjEKICAgIC8vIF90b3RhbCA9IGFkZF90b19zbG90KHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fVE9UQUxfT0ZGU0VUKSwgYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNzMKICAgIC8vIHZhbHVlID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgVUludDY0KFBPT0xfU0xPVF9TSVpFKSkpICsgYW1vdW50CiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjM3NAogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMjEKICAgIC8vIF90b3RhbCA9IGFkZF90b19zbG90KHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fVE9UQUxfT0ZGU0VUKSwgYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTozNzQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGtleSwgb2Zmc2V0LCBvcC5pdG9iKHZhbHVlKSkKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyMwogICAgLy8gbWFya2V0LnRvdGFsX3Bvb2wgPSBhcmM0LlVJbnQ2NChtYXJrZXQudG90YWxfcG9vbC5uYXRpdmUgKyBhbW91bnQpCiAgICBkdXAKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyNAogICAgLy8gbWFya2V0LnZlcnNpb24gPSBhcmM0LlVJbnQ2NChtYXJrZXQudmVyc2lvbi5uYXRpdmUgKyAxKQogICAgZHVwCiAgICBwdXNoaW50IDk2IC8vIDk2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDk2CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyNi0xMjI3CiAgICAvLyAjIE9wZXJhdGlvbmFsIHN0YXRpc3RpY3MsIGtlcHQgaW5jcmVtZW50YWxseSBzbyByZWFkcyBhcmUgTygxKQogICAgLy8gbWFya2V0LmJldF9jb3VudCA9IGFyYzQuVUludDY0KG1hcmtldC5iZXRfY291bnQubmF0aXZlICsgMSkKICAgIGR1cAogICAgcHVzaGludCAxMDQgLy8gMTA0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDEwNAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyOAogICAgLy8gaWYgbmV3X2JldHRvcjoKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX3JlY29yZF9iZXRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIyOQogICAgLy8gbWFya2V0LmJldHRvcl9jb3VudCA9IGFyYzQuVUludDY0KG1hcmtldC5iZXR0b3JfY291bnQubmF0aXZlICsgMSkKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIHB1c2hpbnQgMTEyIC8vIDExMgogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAxMTIKICAgIGZyYW1lX2J1cnkgNAoKX3JlY29yZF9iZXRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIzMAogICAgLy8gaWYgYW1vdW50ID4gbWFya2V0Lm1heF9iZXQubmF0aXZlOgogICAgZHVwCiAgICBwdXNoaW50IDEyMCAvLyAxMjAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgIDwKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgNAogICAgYnogX3JlY29yZF9iZXRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTIzMQogICAgLy8gbWFya2V0Lm1heF9iZXQgPSBhcmM0LlVJbnQ2NChhbW91bnQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAzCiAgICBzd2FwCiAgICByZXBsYWNlMiAxMjAKICAgIGZyYW1lX2J1cnkgNAoKX3JlY29yZF9iZXRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgZnJhbWVfZGlnIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjMzLTEyMzQKICAgIC8vICMgV3JpdGUgdGhlIHJlY29yZCBiYWNrIG9uY2UsIHJhdGhlciB0aGFuIHJld3JpdGluZyB0aGUgYm94IHBlciBmaWVsZAogICAgLy8gc2VsZi5tYXJrZXRzW21hcmtldF9pZF0gPSBtYXJrZXQuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjM4CiAgICAvLyBvcHRpb249YXJjNC5VSW50NjQob3B0aW9uX2luZGV4KSwKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyMzkKICAgIC8vIGJldHRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI0MAogICAgLy8gYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjM2LTEyNDIKICAgIC8vIGFyYzQuZW1pdChCZXRQbGFjZWQoCiAgICAvLyAgICAgbWFya2V0X2lkPWFyYzQuVUludDY0KG1hcmtldF9pZCksCiAgICAvLyAgICAgb3B0aW9uPWFyYzQuVUludDY0KG9wdGlvbl9pbmRleCksCiAgICAvLyAgICAgYmV0dG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICBuZXdfb3B0aW9uX3Bvb2w9YXJjNC5VSW50NjQob3B0aW9uX3Bvb2wpLAogICAgLy8gKSkKICAgIGZyYW1lX2RpZyAwCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4YjQ0YzZkYzcgLy8gbWV0aG9kICJCZXRQbGFjZWQodWludDY0LHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9jbGFpbShtYXJrZXRfaWQ6IHVpbnQ2NCwgY2xhaW1hbnQ6IGJ5dGVzKSAtPiB1aW50NjQ6Cl9jbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjQ0LTEyNDUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NsYWltKHNlbGYsIG1hcmtldF9pZDogVUludDY0LCBjbGFpbWFudDogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI1MQogICAgLy8gYXNzZXJ0IG1hcmtldF9pZCBpbiBzZWxmLm1hcmtldHMsICJNYXJrZXQgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHg2ZAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjUyCiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjUzCiAgICAvLyBhc3NlcnQgbWFya2V0LnN0YXR1cyA9PSBTVEFUVVNfU0VUVExFRCwgIk1hcmtldCBpcyBub3Qgc2V0dGxlZCIKICAgIGR1cAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNyAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIGI9PQogICAgYXNzZXJ0IC8vIE1hcmtldCBpcyBub3Qgc2V0dGxlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjMxMAogICAgLy8gcmV0dXJuIGIidSIgKyBvcC5pdG9iKG1hcmtldF9pZCkgKyBiZXR0b3IuYnl0ZXMKICAgIGJ5dGVjXzMgLy8gMHg3NQogICAgZGlnIDMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjU2CiAgICAvLyBfbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKHBvc2l0aW9uKQogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjU3CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiTm8gcG9zaXRpb24gaW4gdGhpcyBtYXJrZXQiCiAgICBhc3NlcnQgLy8gTm8gcG9zaXRpb24gaW4gdGhpcyBtYXJrZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjU4CiAgICAvLyBhc3NlcnQgb3AuYnRvaShvcC5Cb3guZXh0cmFjdChwb3NpdGlvbiwgVUludDY0KFBPU0lUSU9OX0NMQUlNRURfT0ZGU0VUKSwgVUludDY0KDEpKSkgPT0gMCwgIldpbm5pbmdzIGFscmVhZHkgY2xhaW1lZCIKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgIQogICAgYXNzZXJ0IC8vIFdpbm5pbmdzIGFscmVhZHkgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyNTkKICAgIC8vIG9wLkJveC5yZXBsYWNlKHBvc2l0aW9uLCBVSW50NjQoUE9TSVRJT05fQ0xBSU1FRF9PRkZTRVQpLCBCeXRlcyhiIlx4MDEiKSkKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIHB1c2hieXRlcyAweDAxCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyNjIKICAgIC8vIHBvc2l0aW9uLCBtYXJrZXQud2lubmluZ19vcHRpb24ubmF0aXZlLCBtYXJrZXQud2lubmluZ19wb29sLm5hdGl2ZSwgbWFya2V0LnBheW91dF9yYXRpby5uYXRpdmUKICAgIGRpZyAxCiAgICBwdXNoaW50IDQ4IC8vIDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDIKICAgIHB1c2hpbnQgNzIgLy8gNzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMwogICAgcHVzaGludCA4MCAvLyA4MAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjYxLTEyNjMKICAgIC8vIHBheW91dCA9IHBvc2l0aW9uX3BheW91dCgKICAgIC8vICAgICBwb3NpdGlvbiwgbWFya2V0Lndpbm5pbmdfb3B0aW9uLm5hdGl2ZSwgbWFya2V0Lndpbm5pbmdfcG9vbC5uYXRpdmUsIG1hcmtldC5wYXlvdXRfcmF0aW8ubmF0aXZlCiAgICAvLyApCiAgICBjYWxsc3ViIHBvc2l0aW9uX3BheW91dAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyNjUKICAgIC8vIHNlbGYubWFya2V0c1ttYXJrZXRfaWRdLnBhaWRfb3V0ID0gYXJjNC5VSW50NjQobWFya2V0LnBhaWRfb3V0Lm5hdGl2ZSArIHBheW91dCkKICAgIHN3YXAKICAgIHB1c2hpbnQgODggLy8gODgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgKwogICAgaXRvYgogICAgZGlnIDIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1hcmtldHMgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiA4OAogICAgZGlnIDIKICAgIGJveF9kZWwKICAgIHBvcAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI3MAogICAgLy8gcGF5b3V0PWFyYzQuVUludDY0KHBheW91dCksCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjY3LTEyNzEKICAgIC8vIGFyYzQuZW1pdChXaW5uaW5nc0NsYWltZWQoCiAgICAvLyAgICAgbWFya2V0X2lkPWFyYzQuVUludDY0KG1hcmtldF9pZCksCiAgICAvLyAgICAgY2xhaW1hbnQ9YXJjNC5BZGRyZXNzKGNsYWltYW50KSwKICAgIC8vICAgICBwYXlvdXQ9YXJjNC5VSW50NjQocGF5b3V0KSwKICAgIC8vICkpCiAgICB1bmNvdmVyIDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDViMTkyYmU4IC8vIG1ldGhvZCAiV2lubmluZ3NDbGFpbWVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyNzIKICAgIC8vIHJldHVybiBwYXlvdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5wcmVkaWN0aW9uX21hcmtldC5jb250cmFjdC5QcmVkaWN0aW9uTWFya2V0Ll9zZXR0bGUobWFya2V0X2lkOiB1aW50NjQsIHdpbm5pbmdfb3B0aW9uOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXR0bGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI3NC0xMjc1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zZXR0bGUoc2VsZiwgbWFya2V0X2lkOiBVSW50NjQsIHdpbm5pbmdfb3B0aW9uOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjc3CiAgICAvLyBhc3NlcnQgbWFya2V0X2lkIGluIHNlbGYubWFya2V0cywgIk1hcmtldCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBieXRlY18xIC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBNYXJrZXQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjc4CiAgICAvLyBtYXJrZXQgPSBzZWxmLm1hcmtldHNbbWFya2V0X2lkXS5jb3B5KCkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFya2V0cyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjgwLTEyODEKICAgIC8vICMgT25seSB0aGUgbWFya2V0J3MgY3JlYXRvciBjYW4gc2V0dGxlCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBtYXJrZXQuY3JlYXRvci5uYXRpdmUsICJPbmx5IG1hcmtldCBjcmVhdG9yIGNhbiBzZXR0bGUiCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IG1hcmtldCBjcmVhdG9yIGNhbiBzZXR0bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjgyCiAgICAvLyBhc3NlcnQgbWFya2V0LnN0YXR1cyA9PSBTVEFUVVNfQUNUSVZFLCAiTWFya2V0IGFscmVhZHkgc2V0dGxlZCIKICAgIGR1cAogICAgZXh0cmFjdCA0MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWNfMiAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgYXNzZXJ0IC8vIE1hcmtldCBhbHJlYWR5IHNldHRsZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjgzCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPj0gbWFya2V0LmVuZF90aW1lLm5hdGl2ZSwgIk1hcmtldCBoYXMgbm90IGVuZGVkIgogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZGlnIDEKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdF91aW50NjQKICAgID49CiAgICBhc3NlcnQgLy8gTWFya2V0IGhhcyBub3QgZW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjg0CiAgICAvLyBhc3NlcnQgd2lubmluZ19vcHRpb24gPCBtYXJrZXQub3B0aW9uX2NvdW50Lm5hdGl2ZSwgIkludmFsaWQgd2lubmluZyBvcHRpb24iCiAgICBwdXNoaW50IDU2IC8vIDU2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBhc3NlcnQgLy8gSW52YWxpZCB3aW5uaW5nIG9wdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjI5MgogICAgLy8gcmV0dXJuIGIicCIgKyBvcC5pdG9iKG1hcmtldF9pZCkKICAgIGJ5dGVjIDUgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI5MgogICAgLy8gd2lubmluZ19vcHRpb24gKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyOTMKICAgIC8vIFVJbnQ2NChQT09MX1NMT1RfU0laRSksCiAgICBpbnRjXzIgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyOTAtMTI5NAogICAgLy8gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgcG9vbHNfa2V5KG1hcmtldF9pZCksCiAgICAvLyAgICAgd2lubmluZ19vcHRpb24gKiBVSW50NjQoUE9PTF9TTE9UX1NJWkUpLAogICAgLy8gICAgIFVJbnQ2NChQT09MX1NMT1RfU0laRSksCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyODYtMTI5NQogICAgLy8gIyBGaXggdGhlIHBheW91dCByYXRpbyBvbmNlLCBzbyBldmVyeSBjbGFpbSBpcyBhIHNpbmdsZSBtdWx0aXBseS4gVGhlCiAgICAvLyAjIHJhdGlvIGFuZCBlYWNoIHBheW91dCByb3VuZCBkb3duOyB0aGUgZHVzdCB0aGlzIGxlYXZlcyBiZWhpbmQgc3RheXMKICAgIC8vICMgaW4gdGhlIGFwcGxpY2F0aW9uIGFjY291bnQgYWxvbmcgd2l0aCB0aGUgcmFrZS4KICAgIC8vIHdpbm5pbmdfcG9vbCA9IG9wLmJ0b2koCiAgICAvLyAgICAgb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgICAgIHBvb2xzX2tleShtYXJrZXRfaWQpLAogICAgLy8gICAgICAgICB3aW5uaW5nX29wdGlvbiAqIFVJbnQ2NChQT09MX1NMT1RfU0laRSksCiAgICAvLyAgICAgICAgIFVJbnQ2NChQT09MX1NMT1RfU0laRSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnRvaQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI5NgogICAgLy8gcGF5b3V0X3JhdGlvID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyOTcKICAgIC8vIGlmIHdpbm5pbmdfcG9vbDoKICAgIGJ6IF9zZXR0bGVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTI5OAogICAgLy8gdG90YWxfcG9vbCA9IG1hcmtldC50b3RhbF9wb29sLm5hdGl2ZQogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDE3CiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KGEsIGIpCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjk5CiAgICAvLyBuZXRfcG9vbCA9IHRvdGFsX3Bvb2wgLSBtdWxfZGl2KHRvdGFsX3Bvb2wsIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlJBS0VfQlBTIiksIFVJbnQ2NChCUFNfREVOT01JTkFUT1IpKQogICAgaW50YyA5IC8vIFRNUExfUkFLRV9CUFMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weTo0MTcKICAgIC8vIGhpZ2gsIGxvdyA9IG9wLm11bHcoYSwgYikKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMjk5CiAgICAvLyBuZXRfcG9vbCA9IHRvdGFsX3Bvb2wgLSBtdWxfZGl2KHRvdGFsX3Bvb2wsIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlJBS0VfQlBTIiksIFVJbnQ2NChCUFNfREVOT01JTkFUT1IpKQogICAgcHVzaGludCAxMDAwMCAvLyAxMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjQxOAogICAgLy8gcmV0dXJuIG9wLmRpdncoaGlnaCwgbG93LCBjKQogICAgZGl2dwogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEyOTkKICAgIC8vIG5ldF9wb29sID0gdG90YWxfcG9vbCAtIG11bF9kaXYodG90YWxfcG9vbCwgVGVtcGxhdGVWYXJbVUludDY0XSgiUkFLRV9CUFMiKSwgVUludDY0KEJQU19ERU5PTUlOQVRPUikpCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTMwMAogICAgLy8gcGF5b3V0X3JhdGlvID0gbXVsX2RpdihuZXRfcG9vbCwgVUludDY0KFBBWU9VVF9TQ0FMRSksIHdpbm5pbmdfcG9vbCkKICAgIGludGMgNyAvLyAxMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDE3CiAgICAvLyBoaWdoLCBsb3cgPSBvcC5tdWx3KGEsIGIpCiAgICBtdWx3CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6NDE4CiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaWdoLCBsb3csIGMpCiAgICBmcmFtZV9kaWcgMwogICAgZGl2dwogICAgZnJhbWVfYnVyeSA0Cgpfc2V0dGxlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzAyCiAgICAvLyBtYXJrZXQuc3RhdHVzID0gYXJjNC5VSW50NjQoU1RBVFVTX1NFVFRMRUQpCiAgICBmcmFtZV9kaWcgMgogICAgYnl0ZWMgNyAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIHJlcGxhY2UyIDQwCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTMwMwogICAgLy8gbWFya2V0Lndpbm5pbmdfb3B0aW9uID0gYXJjNC5VSW50NjQod2lubmluZ19vcHRpb24pCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIHJlcGxhY2UyIDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTMwNAogICAgLy8gbWFya2V0Lndpbm5pbmdfcG9vbCA9IGFyYzQuVUludDY0KHdpbm5pbmdfcG9vbCkKICAgIGZyYW1lX2RpZyAzCiAgICBpdG9iCiAgICByZXBsYWNlMiA3MgogICAgLy8gc21hcnRfY29udHJhY3RzL3ByZWRpY3Rpb25fbWFya2V0L2NvbnRyYWN0LnB5OjEzMDUKICAgIC8vIG1hcmtldC5wYXlvdXRfcmF0aW8gPSBhcmM0LlVJbnQ2NChwYXlvdXRfcmF0aW8pCiAgICBmcmFtZV9kaWcgNAogICAgaXRvYgogICAgcmVwbGFjZTIgODAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzA2CiAgICAvLyBtYXJrZXQudmVyc2lvbiA9IGFyYzQuVUludDY0KG1hcmtldC52ZXJzaW9uLm5hdGl2ZSArIDEpCiAgICBkdXAKICAgIHB1c2hpbnQgOTYgLy8gOTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgOTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzA3CiAgICAvLyBzZWxmLm1hcmtldHNbbWFya2V0X2lkXSA9IG1hcmtldC5jb3B5KCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzExCiAgICAvLyB3aW5uaW5nX29wdGlvbj1tYXJrZXQud2lubmluZ19vcHRpb24sCiAgICBkdXAKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzEyCiAgICAvLyB3aW5uaW5nX3Bvb2w9bWFya2V0Lndpbm5pbmdfcG9vbCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvcHJlZGljdGlvbl9tYXJrZXQvY29udHJhY3QucHk6MTMxMwogICAgLy8gcGF5b3V0X3JhdGlvPW1hcmtldC5wYXlvdXRfcmF0aW8sCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QgODAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9wcmVkaWN0aW9uX21hcmtldC9jb250cmFjdC5weToxMzA5LTEzMTQKICAgIC8vIGFyYzQuZW1pdChNYXJrZXRTZXR0bGVkKAogICAgLy8gICAgIG1hcmtldF9pZD1hcmM0LlVJbnQ2NChtYXJrZXRfaWQpLAogICAgLy8gICAgIHdpbm5pbmdfb3B0aW9uPW1hcmtldC53aW5uaW5nX29wdGlvbiwKICAgIC8vICAgICB3aW5uaW5nX3Bvb2w9bWFya2V0Lndpbm5pbmdfcG9vbCwKICAgIC8vICAgICBwYXlvdXRfcmF0aW89bWFya2V0LnBheW91dF9yYXRpbywKICAgIC8vICkpCiAgICBmcmFtZV9kaWcgMAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDE1YTk2ODU4IC8vIG1ldGhvZCAiTWFya2V0U2V0dGxlZCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1702], "errorMessage": "At least one bet is required"}, {"pc": [4525], "errorMessage": "Bet is below the minimum"}, {"pc": [1295], "errorMessage": "Boundaries must be strictly increasing"}, {"pc": [2507], "errorMessage": "Claim period has not ended"}, {"pc": [2260], "errorMessage": "Cursor does not match the stored cursor"}, {"pc": [1718], "errorMessage": "Every bet needs a market id and an amount"}, {"pc": [1710], "errorMessage": "Every bet needs a market id and an option index"}, {"pc": [1255], "errorMessage": "Every bucket needs odds"}, {"pc": [2004], "errorMessage": "Every market needs a winning option"}, {"pc": [1630, 1848, 1853, 1858, 1863, 1958, 1963, 1968, 1973, 2113, 2247, 2254, 2487, 2613, 2630, 2641, 2675, 2775, 3112, 3117, 3122, 3127, 3344, 3349, 3354, 3359, 3364, 3369, 3374, 3379, 3648, 3893, 3898, 3973, 4498, 4724, 4847, 4853, 4952, 4957, 4962], "errorMessage": "Index access is out of bounds"}, {"pc": [4519], "errorMessage": "Invalid option index"}, {"pc": [4873], "errorMessage": "Invalid winning option"}, {"pc": [4858], "errorMessage": "Market already settled"}, {"pc": [2239, 2476, 2722, 2731, 3023, 3306, 3332, 3435, 4389, 4494, 4719, 4834], "errorMessage": "Market does not exist"}, {"pc": [4511], "errorMessage": "Market has closed"}, {"pc": [4866], "errorMessage": "Market has not ended"}, {"pc": [4503], "errorMessage": "Market is not active"}, {"pc": [2741], "errorMessage": "Market is not archived"}, {"pc": [2253, 2493, 4730], "errorMessage": "Market is not settled"}, {"pc": [4052], "errorMessage": "Market must have at least 2 options"}, {"pc": [4742], "errorMessage": "No position in this market"}, {"pc": [1892], "errorMessage": "Not a scalar market"}, {"pc": [4093], "errorMessage": "Odds must be at least 1.01 (101)"}, {"pc": [4098], "errorMessage": "Odds must be at most 100.00 (10000)"}, {"pc": [312, 328, 350, 375, 397, 416, 435, 454, 476, 495, 520, 539, 558, 576, 598, 620, 651, 683, 712, 741, 779, 817, 855], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [4851], "errorMessage": "Only market creator can settle"}, {"pc": [1193], "errorMessage": "Option set does not exist"}, {"pc": [1488], "errorMessage": "Option set must have at least 2 options"}, {"pc": [1088, 1135, 1204], "errorMessage": "Options and odds must have same length"}, {"pc": [4341], "errorMessage": "Payment must be to application"}, {"pc": [4372], "errorMessage": "Payment must equal the minimum balance of the new boxes"}, {"pc": [1824], "errorMessage": "Payment must equal the sum of all bets plus the box deposit"}, {"pc": [4349], "errorMessage": "Payment sender must match transaction sender"}, {"pc": [1400], "errorMessage": "String registry is full"}, {"pc": [1139, 1259, 1492, 4057], "errorMessage": "Too many options"}, {"pc": [4314, 4321], "errorMessage": "Unknown string id"}, {"pc": [4749], "errorMessage": "Winnings already claimed"}, {"pc": [1093, 1149, 1209, 1307, 1370, 1502, 1570, 1582, 1736, 1810, 4367], "errorMessage": "account funded"}, {"pc": [898], "errorMessage": "can only call when creating"}, {"pc": [315, 331, 353, 378, 400, 419, 438, 457, 479, 498, 523, 542, 561, 579, 601, 623, 654, 686, 715, 744, 782, 820, 858], "errorMessage": "can only call when not creating"}, {"pc": [2727, 3832, 3843, 4037, 4111], "errorMessage": "check self.market_counter exists"}, {"pc": [1629, 1846, 1956, 2112, 2245, 2440, 2485, 2511, 3031, 3334, 3449, 3626, 3885, 4397, 4496, 4722, 4785, 4842], "errorMessage": "check self.markets entry exists"}, {"pc": [1507, 1537], "errorMessage": "check self.option_set_counter exists"}, {"pc": [1195], "errorMessage": "check self.option_sets entry exists"}, {"pc": [1393, 4319], "errorMessage": "check self.string_counter exists"}, {"pc": [1462], "errorMessage": "check self.string_ids entry exists"}, {"pc": [3269], "errorMessage": "check self.strings entry exists"}, {"pc": [1431, 1470, 3712, 3725, 3911, 3925, 3939, 3953, 3967], "errorMessage": "overflow"}, {"pc": [642, 670, 699, 728, 766, 804, 842, 880], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"MAX_OPTIONS": {"type": "AVMUint64", "value": "AAAAAAAAADI="}, "MIN_BET": {"type": "AVMUint64", "value": "AAAAAAAPQkA="}, "RAKE_BPS": {"type": "AVMUint64", "value": "AAAAAAAAAfQ="}}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,65 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class BetResult:
+    """Struct for BetResult"""
+    total_pool: int
+    option_pools: list[int]
+    position_stakes: list[int]
+    position_total: int
+
+@dataclasses.dataclass(frozen=True)
+class ClaimResult:
+    """Struct for ClaimResult"""
+    payout: int
+    status: int
+    claimed: bool
+
+@dataclasses.dataclass(frozen=True)
+class Market:
+    """Struct for Market"""
+    creator: str
+    end_time: int
+    status: int
+    winning_option: int
+    option_count: int
+    total_pool: int
+    winning_pool: int
+    payout_ratio: int
+    paid_out: int
+    version: int
+    bet_count: int
+    bettor_count: int
+    max_bet: int
+    distribution_cursor: int
+    title: str
+    options: list[str]
+    option_ids: list[int]
+    odds: list[int]
+
+@dataclasses.dataclass(frozen=True)
+class MarketTicker:
+    """Struct for MarketTicker"""
+    version: int
+    status: int
+    end_time: int
+    winning_option: int
+    total_pool: int
+    bet_count: int
+    bettor_count: int
+    max_bet: int
+    option_pools: list[int]
+
+@dataclasses.dataclass(frozen=True)
+class SettlementResult:
+    """Struct for SettlementResult"""
+    status: int
+    winning_option: int
+    winning_pool: int
+    payout_ratio: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateMarketArgs:
     """Dataclass for create_market arguments"""
@@ -71,10 +130,70 @@ class CreateMarketArgs:
     options: list[str]
     odds: list[int]
     duration_hours: int
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_market(string,string[],uint16[],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateMarketWithIdsArgs:
+    """Dataclass for create_market_with_ids arguments"""
+    title: str
+    option_ids: list[int]
+    odds: list[int]
+    duration_hours: int
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateMarketFromTemplateArgs:
+    """Dataclass for create_market_from_template arguments"""
+    title: str
+    option_set_id: int
+    odds: list[int]
+    duration_hours: int
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateScalarMarketArgs:
+    """Dataclass for create_scalar_market arguments"""
+    title: str
+    boundaries: list[int]
+    odds: list[int]
+    duration_hours: int
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RegisterStringArgs:
+    """Dataclass for register_string arguments"""
+    value: str
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "register_string(string,pay)uint16"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RegisterOptionSetArgs:
+    """Dataclass for register_option_set arguments"""
+    string_ids: list[int]
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_market(string,string[],uint64[],uint64)uint64"
+        return "register_option_set(uint16[],pay)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PlaceBetArgs:
@@ -85,7 +204,19 @@ class PlaceBetArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "place_bet(uint64,uint64,pay)void"
+        return "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PlaceBetsArgs:
+    """Dataclass for place_bets arguments"""
+    market_ids: list[int]
+    option_indexes: list[int]
+    amounts: list[int]
+    payment_txn: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "place_bets(uint64[],uint64[],uint64[],pay)void"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class SettleMarketArgs:
@@ -95,7 +226,27 @@ class SettleMarketArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "settle_market(uint64,uint64)void"
+        return "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SettleScalarMarketArgs:
+    """Dataclass for settle_scalar_market arguments"""
+    market_id: int
+    result: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SettleMarketsArgs:
+    """Dataclass for settle_markets arguments"""
+    market_ids: list[int]
+    winning_options: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "settle_markets(uint64[],uint64[])void"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class ClaimWinningsArgs:
@@ -104,7 +255,46 @@ class ClaimWinningsArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "claim_winnings(uint64)uint64"
+        return "claim_winnings(uint64)(uint64,uint64,bool)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimAllArgs:
+    """Dataclass for claim_all arguments"""
+    market_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_all(uint64[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DistributeArgs:
+    """Dataclass for distribute arguments"""
+    market_id: int
+    cursor: int
+    max_bettors: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "distribute(uint64,uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ArchiveMarketArgs:
+    """Dataclass for archive_market arguments"""
+    market_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "archive_market(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClosePositionsArgs:
+    """Dataclass for close_positions arguments"""
+    market_id: int
+    bettors: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_positions(uint64,address[])uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetMarketInfoArgs:
@@ -113,7 +303,25 @@ class GetMarketInfoArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)"
+        return "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBucketBoundariesArgs:
+    """Dataclass for get_bucket_boundaries arguments"""
+    market_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_bucket_boundaries(uint64)uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetMarketSummaryArgs:
+    """Dataclass for get_market_summary arguments"""
+    market_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetUserPositionArgs:
@@ -125,6 +333,27 @@ class GetUserPositionArgs:
     def abi_method_signature(self) -> str:
         return "get_user_position(uint64,address)(uint64[],uint64,bool)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetUserPortfolioArgs:
+    """Dataclass for get_user_portfolio arguments"""
+    user: str
+    start: int
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetMarketsPageArgs:
+    """Dataclass for get_markets_page arguments"""
+    start: int
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]"
+
 
 class PredictionMarketParams:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -132,144 +361,144 @@ class PredictionMarketParams:
 
     def create_market(
         self,
-        args: tuple[str, list[str], list[int], int] | CreateMarketArgs,
+        args: tuple[str, list[str], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_market(string,string[],uint64[],uint64)uint64",
+            "method": "create_market(string,string[],uint16[],uint64,pay)uint64",
             "args": method_args,
         }))
 
-    def place_bet(
+    def create_market_with_ids(
         self,
-        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketWithIdsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "place_bet(uint64,uint64,pay)void",
+            "method": "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64",
             "args": method_args,
         }))
 
-    def settle_market(
+    def create_market_from_template(
         self,
-        args: tuple[int, int] | SettleMarketArgs,
+        args: tuple[str, int, list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketFromTemplateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "settle_market(uint64,uint64)void",
+            "method": "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64",
             "args": method_args,
         }))
 
-    def claim_winnings(
+    def create_scalar_market(
         self,
-        args: tuple[int] | ClaimWinningsArgs,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateScalarMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_winnings(uint64)uint64",
+            "method": "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64",
             "args": method_args,
         }))
 
-    def get_market_info(
+    def register_string(
         self,
-        args: tuple[int] | GetMarketInfoArgs,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | RegisterStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)",
+            "method": "register_string(string,pay)uint16",
             "args": method_args,
         }))
 
-    def get_user_position(
+    def register_option_set(
         self,
-        args: tuple[int, str] | GetUserPositionArgs,
+        args: tuple[list[int], algokit_utils.AppMethodCallTransactionArgument] | RegisterOptionSetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
+            "method": "register_option_set(uint16[],pay)uint64",
             "args": method_args,
         }))
 
-    def get_market_count(
+    def place_bet(
         self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_market_count()uint64",
+            "method": "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)",
+            "args": method_args,
         }))
 
-    def clear_state(
+    def place_bets(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.clear_state(
-            params,
-            
-        )
-
-
-class PredictionMarketCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+        args: tuple[list[int], list[int], list[int], algokit_utils.AppMethodCallTransactionArgument] | PlaceBetsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "place_bets(uint64[],uint64[],uint64[],pay)void",
+            "args": method_args,
+        }))
 
-    def create_market(
+    def settle_market(
         self,
-        args: tuple[str, list[str], list[int], int] | CreateMarketArgs,
+        args: tuple[int, int] | SettleMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_market(string,string[],uint64[],uint64)uint64",
+            "method": "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
             "args": method_args,
         }))
 
-    def place_bet(
+    def settle_scalar_market(
         self,
-        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        args: tuple[int, int] | SettleScalarMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "place_bet(uint64,uint64,pay)void",
+            "method": "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
             "args": method_args,
         }))
 
-    def settle_market(
+    def settle_markets(
         self,
-        args: tuple[int, int] | SettleMarketArgs,
+        args: tuple[list[int], list[int]] | SettleMarketsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "settle_market(uint64,uint64)void",
+            "method": "settle_markets(uint64[],uint64[])void",
             "args": method_args,
         }))
 
@@ -277,110 +506,654 @@ class PredictionMarketCreateTransactionParams:
         self,
         args: tuple[int] | ClaimWinningsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_winnings(uint64)uint64",
+            "method": "claim_winnings(uint64)(uint64,uint64,bool)",
             "args": method_args,
         }))
 
-    def get_market_info(
+    def claim_all(
         self,
-        args: tuple[int] | GetMarketInfoArgs,
+        args: tuple[list[int]] | ClaimAllArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)",
+            "method": "claim_all(uint64[])uint64",
             "args": method_args,
         }))
 
-    def get_user_position(
+    def distribute(
         self,
-        args: tuple[int, str] | GetUserPositionArgs,
+        args: tuple[int, int, int] | DistributeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
+            "method": "distribute(uint64,uint64,uint64)uint64",
             "args": method_args,
         }))
 
-    def get_market_count(
+    def archive_market(
         self,
+        args: tuple[int] | ArchiveMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_market_count()uint64",
+            "method": "archive_market(uint64)uint64",
+            "args": method_args,
         }))
 
-    def clear_state(
+    def close_positions(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
-
-
-class PredictionMarketSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+        args: tuple[int, list[str]] | ClosePositionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_positions(uint64,address[])uint64",
+            "args": method_args,
+        }))
 
-    def create_market(
+    def get_market_info(
         self,
-        args: tuple[str, list[str], list[int], int] | CreateMarketArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
+        args: tuple[int] | GetMarketInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_market(string,string[],uint64[],uint64)uint64",
+            "method": "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+        }))
 
-    def place_bet(
+    def get_bucket_boundaries(
         self,
-        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
-        params: algokit_utils.CommonAppCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[None]:
+        args: tuple[int] | GetBucketBoundariesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "place_bet(uint64,uint64,pay)void",
+            "method": "get_bucket_boundaries(uint64)uint64[]",
             "args": method_args,
-        }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+        }))
+
+    def get_market_summary(
+        self,
+        args: tuple[int] | GetMarketSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_user_position(
+        self,
+        args: tuple[int, str] | GetUserPositionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
+            "args": method_args,
+        }))
+
+    def get_user_portfolio(
+        self,
+        args: tuple[str, int, int] | GetUserPortfolioArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
+    def get_markets_page(
+        self,
+        args: tuple[int, int] | GetMarketsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]",
+            "args": method_args,
+        }))
+
+    def get_market_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class PredictionMarketCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_market(
+        self,
+        args: tuple[str, list[str], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market(string,string[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def create_market_with_ids(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketWithIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def create_market_from_template(
+        self,
+        args: tuple[str, int, list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketFromTemplateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def create_scalar_market(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def register_string(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | RegisterStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_string(string,pay)uint16",
+            "args": method_args,
+        }))
+
+    def register_option_set(
+        self,
+        args: tuple[list[int], algokit_utils.AppMethodCallTransactionArgument] | RegisterOptionSetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_option_set(uint16[],pay)uint64",
+            "args": method_args,
+        }))
+
+    def place_bet(
+        self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)",
+            "args": method_args,
+        }))
+
+    def place_bets(
+        self,
+        args: tuple[list[int], list[int], list[int], algokit_utils.AppMethodCallTransactionArgument] | PlaceBetsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "place_bets(uint64[],uint64[],uint64[],pay)void",
+            "args": method_args,
+        }))
+
+    def settle_market(
+        self,
+        args: tuple[int, int] | SettleMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def settle_scalar_market(
+        self,
+        args: tuple[int, int] | SettleScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def settle_markets(
+        self,
+        args: tuple[list[int], list[int]] | SettleMarketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_markets(uint64[],uint64[])void",
+            "args": method_args,
+        }))
+
+    def claim_winnings(
+        self,
+        args: tuple[int] | ClaimWinningsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_winnings(uint64)(uint64,uint64,bool)",
+            "args": method_args,
+        }))
+
+    def claim_all(
+        self,
+        args: tuple[list[int]] | ClaimAllArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_all(uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def distribute(
+        self,
+        args: tuple[int, int, int] | DistributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute(uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def archive_market(
+        self,
+        args: tuple[int] | ArchiveMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "archive_market(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def close_positions(
+        self,
+        args: tuple[int, list[str]] | ClosePositionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_positions(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
+    def get_market_info(
+        self,
+        args: tuple[int] | GetMarketInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_bucket_boundaries(
+        self,
+        args: tuple[int] | GetBucketBoundariesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bucket_boundaries(uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def get_market_summary(
+        self,
+        args: tuple[int] | GetMarketSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_user_position(
+        self,
+        args: tuple[int, str] | GetUserPositionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
+            "args": method_args,
+        }))
+
+    def get_user_portfolio(
+        self,
+        args: tuple[str, int, int] | GetUserPortfolioArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]",
+            "args": method_args,
+        }))
+
+    def get_markets_page(
+        self,
+        args: tuple[int, int] | GetMarketsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]",
+            "args": method_args,
+        }))
+
+    def get_market_count(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_count()uint64",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class PredictionMarketSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_market(
+        self,
+        args: tuple[str, list[str], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market(string,string[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_market_with_ids(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketWithIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_market_from_template(
+        self,
+        args: tuple[str, int, list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketFromTemplateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_scalar_market(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def register_string(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | RegisterStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_string(string,pay)uint16",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def register_option_set(
+        self,
+        args: tuple[list[int], algokit_utils.AppMethodCallTransactionArgument] | RegisterOptionSetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_option_set(uint16[],pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def place_bet(
+        self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[BetResult]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(BetResult, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[BetResult], parsed_response)
+
+    def place_bets(
+        self,
+        args: tuple[list[int], list[int], list[int], algokit_utils.AppMethodCallTransactionArgument] | PlaceBetsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "place_bets(uint64[],uint64[],uint64[],pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
     def settle_market(
         self,
         args: tuple[int, int] | SettleMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[SettlementResult]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SettlementResult, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SettlementResult], parsed_response)
+
+    def settle_scalar_market(
+        self,
+        args: tuple[int, int] | SettleScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[SettlementResult]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SettlementResult, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[SettlementResult], parsed_response)
+
+    def settle_markets(
+        self,
+        args: tuple[list[int], list[int]] | SettleMarketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "settle_market(uint64,uint64)void",
+            "method": "settle_markets(uint64[],uint64[])void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -391,12 +1164,76 @@ class PredictionMarketSend:
         args: tuple[int] | ClaimWinningsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ClaimResult]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_winnings(uint64)(uint64,uint64,bool)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ClaimResult, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ClaimResult], parsed_response)
+
+    def claim_all(
+        self,
+        args: tuple[list[int]] | ClaimAllArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_all(uint64[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def distribute(
+        self,
+        args: tuple[int, int, int] | DistributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute(uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def archive_market(
+        self,
+        args: tuple[int] | ArchiveMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "archive_market(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def close_positions(
+        self,
+        args: tuple[int, list[str]] | ClosePositionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_winnings(uint64)uint64",
+            "method": "close_positions(uint64,address[])uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -412,12 +1249,44 @@ class PredictionMarketSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)",
+            "method": "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, list[str], list[int], list[int], int, int, int, int]], parsed_response)
 
+    def get_bucket_boundaries(
+        self,
+        args: tuple[int] | GetBucketBoundariesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bucket_boundaries(uint64)uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def get_market_summary(
+        self,
+        args: tuple[int] | GetMarketSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[MarketTicker]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MarketTicker, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[MarketTicker], parsed_response)
+
     def get_user_position(
         self,
         args: tuple[int, str] | GetUserPositionArgs,
@@ -434,6 +1303,38 @@ class PredictionMarketSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[list[int], int, bool]], parsed_response)
 
+    def get_user_portfolio(
+        self,
+        args: tuple[str, int, int] | GetUserPortfolioArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, bool, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, bool, int, int]]], parsed_response)
+
+    def get_markets_page(
+        self,
+        args: tuple[int, int] | GetMarketsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, int, int, int, int, int, int]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, int, int, int, int, int, int, int]]], parsed_response)
+
     def get_market_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -462,9 +1363,8 @@ class PredictionMarketSend:
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     market_counter: int
-    market_title: str
-    total_pool: int
-    creator: str
+    string_counter: int
+    option_set_counter: int
 
 class PredictionMarketState:
     """Methods to access state for the current PredictionMarket app"""
@@ -479,6 +1379,13 @@ class PredictionMarketState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -511,28 +1418,116 @@ class _GlobalState:
         return typing.cast(int, value)
 
     @property
-    def market_title(self) -> str:
-        """Get the current value of the market_title key in global_state state"""
-        value = self.app_client.state.global_state.get_value("market_title")
-        if isinstance(value, dict) and "AVMString" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["AVMString"], value)  # type: ignore
-        return typing.cast(str, value)
+    def string_counter(self) -> int:
+        """Get the current value of the string_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("string_counter")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
 
     @property
-    def total_pool(self) -> int:
-        """Get the current value of the total_pool key in global_state state"""
-        value = self.app_client.state.global_state.get_value("total_pool")
+    def option_set_counter(self) -> int:
+        """Get the current value of the option_set_counter key in global_state state"""
+        value = self.app_client.state.global_state.get_value("option_set_counter")
         if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "Market": Market
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def markets(self) -> "_MapState[int, Market]":
+        """Get values from the markets map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "markets",
+            self._struct_classes.get("Market")
+        )
+
+    @property
+    def strings(self) -> "_MapState[int, str]":
+        """Get values from the strings map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "strings",
+            None
+        )
+
+    @property
+    def string_ids(self) -> "_MapState[bytes, int]":
+        """Get values from the string_ids map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "string_ids",
+            None
+        )
+
     @property
-    def creator(self) -> str:
-        """Get the current value of the creator key in global_state state"""
-        value = self.app_client.state.global_state.get_value("creator")
-        if isinstance(value, dict) and "address" in self._struct_classes:
-            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
-        return typing.cast(str, value)
+    def option_sets(self) -> "_MapState[int, list[int]]":
+        """Get values from the option_sets map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "option_sets",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
 
 class PredictionMarketClient:
     """Client for interacting with PredictionMarket smart contract"""
@@ -680,40 +1675,136 @@ class PredictionMarketClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_market(string,string[],uint64[],uint64)uint64"],
+        method: typing.Literal["create_market(string,string[],uint16[],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_market_from_template(string,uint64,uint16[],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["register_string(string,pay)uint16"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["register_option_set(uint16[],pay)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["place_bet(uint64,uint64,pay)void"],
+        method: typing.Literal["place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> BetResult | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["place_bets(uint64[],uint64[],uint64[],pay)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["settle_market(uint64,uint64)void"],
+        method: typing.Literal["settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SettlementResult | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> SettlementResult | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["settle_markets(uint64[],uint64[])void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["claim_winnings(uint64)uint64"],
+        method: typing.Literal["claim_winnings(uint64)(uint64,uint64,bool)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ClaimResult | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_all(uint64[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["distribute(uint64,uint64,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["archive_market(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_positions(uint64,address[])uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)"],
+        method: typing.Literal["get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[str, list[str], list[int], list[int], int, int, int, int] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_bucket_boundaries(uint64)uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> MarketTicker | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_user_position(uint64,address)(uint64[],uint64,bool)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[list[int], int, bool] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, int, int, bool, int, int]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, int, int, int, int, int, int, int, int]] | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_market_count()uint64"],
@@ -730,7 +1821,7 @@ class PredictionMarketClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | tuple[list[int], int, bool] | tuple[str, list[str], list[int], list[int], int, int, int, int]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | BetResult | ClaimResult | MarketTicker | None | SettlementResult | int | list[int] | list[tuple[int, int, int, bool, int, int]] | list[tuple[int, int, int, int, int, int, int, int, int]] | tuple[list[int], int, bool] | tuple[str, list[str], list[int], list[int], int, int, int, int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -897,124 +1988,444 @@ class PredictionMarketFactoryCreateParams:
     ) -> algokit_utils.AppCreateParams:
         """Creates an instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_market(
+        self,
+        args: tuple[str, list[str], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_market(string,string[],uint16[],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_market(string,string[],uint16[],uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_market_with_ids(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketWithIdsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_market_from_template(
+        self,
+        args: tuple[str, int, list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketFromTemplateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_market_from_template(string,uint64,uint16[],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_scalar_market(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateScalarMarketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def register_string(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | RegisterStringArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the register_string(string,pay)uint16 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "register_string(string,pay)uint16",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def register_option_set(
+        self,
+        args: tuple[list[int], algokit_utils.AppMethodCallTransactionArgument] | RegisterOptionSetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the register_option_set(uint16[],pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "register_option_set(uint16[],pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def place_bet(
+        self,
+        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def place_bets(
+        self,
+        args: tuple[list[int], list[int], list[int], algokit_utils.AppMethodCallTransactionArgument] | PlaceBetsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the place_bets(uint64[],uint64[],uint64[],pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "place_bets(uint64[],uint64[],uint64[],pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def settle_market(
+        self,
+        args: tuple[int, int] | SettleMarketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the settle_market(uint64,uint64)(uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def settle_scalar_market(
+        self,
+        args: tuple[int, int] | SettleScalarMarketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def settle_markets(
+        self,
+        args: tuple[list[int], list[int]] | SettleMarketsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the settle_markets(uint64[],uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "settle_markets(uint64[],uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_winnings(
+        self,
+        args: tuple[int] | ClaimWinningsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_winnings(uint64)(uint64,uint64,bool) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_winnings(uint64)(uint64,uint64,bool)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_all(
+        self,
+        args: tuple[list[int]] | ClaimAllArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_all(uint64[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_all(uint64[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def distribute(
+        self,
+        args: tuple[int, int, int] | DistributeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the distribute(uint64,uint64,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "distribute(uint64,uint64,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def archive_market(
+        self,
+        args: tuple[int] | ArchiveMarketArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the archive_market(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "archive_market(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_positions(
+        self,
+        args: tuple[int, list[str]] | ClosePositionsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_positions(uint64,address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_positions(uint64,address[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def create_market(
+    def get_market_info(
         self,
-        args: tuple[str, list[str], list[int], int] | CreateMarketArgs,
+        args: tuple[int] | GetMarketInfoArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_market(string,string[],uint64[],uint64)uint64 ABI method"""
+        """Creates a new instance using the get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_market(string,string[],uint64[],uint64)uint64",
+                "method": "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def place_bet(
+    def get_bucket_boundaries(
         self,
-        args: tuple[int, int, algokit_utils.AppMethodCallTransactionArgument] | PlaceBetArgs,
+        args: tuple[int] | GetBucketBoundariesArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the place_bet(uint64,uint64,pay)void ABI method"""
+        """Creates a new instance using the get_bucket_boundaries(uint64)uint64[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "place_bet(uint64,uint64,pay)void",
+                "method": "get_bucket_boundaries(uint64)uint64[]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def settle_market(
+    def get_market_summary(
         self,
-        args: tuple[int, int] | SettleMarketArgs,
+        args: tuple[int] | GetMarketSummaryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the settle_market(uint64,uint64)void ABI method"""
+        """Creates a new instance using the get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "settle_market(uint64,uint64)void",
+                "method": "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def claim_winnings(
+    def get_user_position(
         self,
-        args: tuple[int] | ClaimWinningsArgs,
+        args: tuple[int, str] | GetUserPositionArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the claim_winnings(uint64)uint64 ABI method"""
+        """Creates a new instance using the get_user_position(uint64,address)(uint64[],uint64,bool) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "claim_winnings(uint64)uint64",
+                "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_market_info(
+    def get_user_portfolio(
         self,
-        args: tuple[int] | GetMarketInfoArgs,
+        args: tuple[str, int, int] | GetUserPortfolioArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64) ABI method"""
+        """Creates a new instance using the get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)",
+                "method": "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_user_position(
+    def get_markets_page(
         self,
-        args: tuple[int, str] | GetUserPositionArgs,
+        args: tuple[int, int] | GetMarketsPageArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_user_position(uint64,address)(uint64[],uint64,bool) ABI method"""
+        """Creates a new instance using the get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[] ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_user_position(uint64,address)(uint64[],uint64,bool)",
+                "method": "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1143,7 +2554,7 @@ class PredictionMarketComposer:
 
     def create_market(
         self,
-        args: tuple[str, list[str], list[int], int] | CreateMarketArgs,
+        args: tuple[str, list[str], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "PredictionMarketComposer":
         self._composer.add_app_call_method_call(
@@ -1154,7 +2565,97 @@ class PredictionMarketComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_market(string,string[],uint64[],uint64)uint64", v
+                "create_market(string,string[],uint16[],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def create_market_with_ids(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketWithIdsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_market_with_ids(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_market_with_ids(string,uint16[],uint16[],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def create_market_from_template(
+        self,
+        args: tuple[str, int, list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateMarketFromTemplateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_market_from_template(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_market_from_template(string,uint64,uint16[],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def create_scalar_market(
+        self,
+        args: tuple[str, list[int], list[int], int, algokit_utils.AppMethodCallTransactionArgument] | CreateScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_scalar_market(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_scalar_market(string,uint64[],uint16[],uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def register_string(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | RegisterStringArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.register_string(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "register_string(string,pay)uint16", v
+            )
+        )
+        return self
+
+    def register_option_set(
+        self,
+        args: tuple[list[int], algokit_utils.AppMethodCallTransactionArgument] | RegisterOptionSetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.register_option_set(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "register_option_set(uint16[],pay)uint64", v
             )
         )
         return self
@@ -1172,7 +2673,25 @@ class PredictionMarketComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "place_bet(uint64,uint64,pay)void", v
+                "place_bet(uint64,uint64,pay)(uint64,uint64[],uint64[],uint64)", v
+            )
+        )
+        return self
+
+    def place_bets(
+        self,
+        args: tuple[list[int], list[int], list[int], algokit_utils.AppMethodCallTransactionArgument] | PlaceBetsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.place_bets(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "place_bets(uint64[],uint64[],uint64[],pay)void", v
             )
         )
         return self
@@ -1190,7 +2709,43 @@ class PredictionMarketComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "settle_market(uint64,uint64)void", v
+                "settle_market(uint64,uint64)(uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def settle_scalar_market(
+        self,
+        args: tuple[int, int] | SettleScalarMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.settle_scalar_market(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "settle_scalar_market(uint64,uint64)(uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def settle_markets(
+        self,
+        args: tuple[list[int], list[int]] | SettleMarketsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.settle_markets(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "settle_markets(uint64[],uint64[])void", v
             )
         )
         return self
@@ -1208,7 +2763,79 @@ class PredictionMarketComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "claim_winnings(uint64)uint64", v
+                "claim_winnings(uint64)(uint64,uint64,bool)", v
+            )
+        )
+        return self
+
+    def claim_all(
+        self,
+        args: tuple[list[int]] | ClaimAllArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_all(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_all(uint64[])uint64", v
+            )
+        )
+        return self
+
+    def distribute(
+        self,
+        args: tuple[int, int, int] | DistributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.distribute(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "distribute(uint64,uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def archive_market(
+        self,
+        args: tuple[int] | ArchiveMarketArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.archive_market(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "archive_market(uint64)uint64", v
+            )
+        )
+        return self
+
+    def close_positions(
+        self,
+        args: tuple[int, list[str]] | ClosePositionsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_positions(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_positions(uint64,address[])uint64", v
             )
         )
         return self
@@ -1226,7 +2853,43 @@ class PredictionMarketComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_market_info(uint64)(string,string[],uint64[],uint64[],uint64,uint64,uint64,uint64)", v
+                "get_market_info(uint64)(string,string[],uint16[],uint64[],uint64,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_bucket_boundaries(
+        self,
+        args: tuple[int] | GetBucketBoundariesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_bucket_boundaries(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_bucket_boundaries(uint64)uint64[]", v
+            )
+        )
+        return self
+
+    def get_market_summary(
+        self,
+        args: tuple[int] | GetMarketSummaryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_market_summary(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_market_summary(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64[])", v
             )
         )
         return self
@@ -1249,6 +2912,42 @@ class PredictionMarketComposer:
         )
         return self
 
+    def get_user_portfolio(
+        self,
+        args: tuple[str, int, int] | GetUserPortfolioArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_user_portfolio(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_user_portfolio(address,uint64,uint64)(uint64,uint8,uint8,bool,uint64,uint64)[]", v
+            )
+        )
+        return self
+
+    def get_markets_page(
+        self,
+        args: tuple[int, int] | GetMarketsPageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "PredictionMarketComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_markets_page(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_markets_page(uint64,uint64)(uint64,uint64,uint64,uint8,uint8,uint8,uint32,uint32,uint64)[]", v
+            )
+        )
+        return self
+
     def get_market_count(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
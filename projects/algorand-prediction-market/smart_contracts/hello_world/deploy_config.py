@@ -1,12 +1,12 @@
 import logging
 
-import algokit_utils
-
 logger = logging.getLogger(__name__)
 
 
 # define deployment behaviour based on supplied app spec
 def deploy() -> None:
+    import algokit_utils
+
     from smart_contracts.artifacts.hello_world.hello_world_client import (
         HelloArgs,
         HelloWorldFactory,
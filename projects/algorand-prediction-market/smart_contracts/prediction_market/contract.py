@@ -1,123 +1,964 @@
-from algopy import ARC4Contract, arc4, UInt64, String, Txn, Global, gtxn, urange
+from algopy import (
+    ARC4Contract,
+    Account,
+    BoxMap,
+    Bytes,
+    Global,
+    OpUpFeeSource,
+    TemplateVar,
+    Txn,
+    UInt64,
+    arc4,
+    ensure_budget,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
+)
+
+# Market status values
+STATUS_ACTIVE = 0
+STATUS_SETTLED = 2
+
+# Time after a market's end during which winnings can be claimed, before the
+# market may be archived (90 days)
+CLAIM_PERIOD_SECONDS = 7_776_000
+
+# Box minimum balance: a flat amount plus a per-byte amount for key and value
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+# Width in bytes of one packed uint64 pool slot
+POOL_SLOT_SIZE = 8
+
+# Bettor index pages hold up to 32 addresses (1024 bytes), so one box
+# reference covers a whole page
+BETTOR_PAGE_SIZE = 32
+ADDRESS_SIZE = 32
+
+# Registered strings are referenced by packed uint16 ids, starting at 1
+STRING_ID_SIZE = 2
+MAX_STRING_ID = 65_535
+
+# Odds are packed uint16s scaled by 100 (101 = 1.01x, 10000 = 100.00x)
+ODDS_SLOT_SIZE = 2
+MIN_ODDS = 101
+MAX_ODDS = 10_000
+
+# Position record layout: total (uint64) | claimed flag (byte) | page flag
+# (byte, set if the bettor's first bet opened a page of the bettor index) |
+# per-option stakes
+POSITION_TOTAL_OFFSET = 0
+POSITION_CLAIMED_OFFSET = 8
+POSITION_PAGE_OFFSET = 9
+POSITION_STAKES_OFFSET = 10
+
+# The minimum bet (TMPL_MIN_BET, microALGO), the most options a market may
+# have (TMPL_MAX_OPTIONS) and the house rake taken from the pool at settlement
+# (TMPL_RAKE_BPS, basis points) are template variables substituted when the
+# program is built and deployed, so each network can tune them without a
+# global state read on every call. Defaults live in deploy_config.
+BPS_DENOMINATOR = 10_000
+
+# Fixed-point scale of the payout ratio (payout per unit staked on the winner)
+PAYOUT_SCALE = 1_000_000_000
+
+# Opcode budget reserved for create_market: a fixed part for storing the market
+# plus a part per option for odds validation and copying the options
+CREATE_OPCODE_BUDGET = 400
+CREATE_OPTION_OPCODE_BUDGET = 30
+
+# Opcode budget reserved per registered string id checked (~21 ops each)
+STRING_ID_OPCODE_BUDGET = 25
+
+# Opcode budget reserved per boundary of a scalar market, for the strictly
+# increasing check (~21 ops each)
+BOUNDARY_OPCODE_BUDGET = 25
+
+# Opcode budget reserved per bet leg in place_bets. The costliest leg, a first
+# bet in a market (new position, portfolio entry and bettor index page),
+# measures ~290 ops
+BET_OPCODE_BUDGET = 320
+
+# Most market summaries returned by one get_markets_page call; keeps the ABI
+# return value (4-byte prefix + 2-byte length + 43 bytes per summary) inside
+# the 1024-byte log limit
+MAX_PAGE_SIZE = 23
+
+# Most portfolio entries returned by one get_user_portfolio call; keeps the ABI
+# return value (4-byte prefix + 2-byte length + 27 bytes per entry) inside the
+# 1024-byte log limit
+MAX_PORTFOLIO_PAGE_SIZE = 37
+
+# Most references (accounts, apps, assets and boxes) one transaction carries;
+# at most 4 of them may be accounts. References are shared across a group
+MAX_TXN_REFERENCES = 8
+
+# Transactions a distribute call spans: the call itself and two app calls
+# grouped with it that carry the rest of its references
+DISTRIBUTE_CALL_TXNS = 3
+
+# Most bettors one distribute call visits. Besides the market record and the
+# (at most two) bettor index pages a batch touches, each bettor takes two
+# references: their position box and their account, which receives the inner
+# payment. Three transactions carry 24 references, so a batch holds 10 bettors,
+# whose 10 accounts are within the 12 account references
+MAX_DISTRIBUTE_BATCH = (DISTRIBUTE_CALL_TXNS * MAX_TXN_REFERENCES - 3) // 2
+
+# Opcode budget reserved per bettor visited by distribute. Paying a winner
+# measures ~165 ops, ~185 when it also deletes a finished index page
+DISTRIBUTE_OPCODE_BUDGET = 190
+
+# Opcode budget reserved per market in claim_all and settle_markets
+CLAIM_OPCODE_BUDGET = 150
+SETTLE_OPCODE_BUDGET = 150
+
+# Opcode budget reserved per position closed by close_positions, and per entry
+# of the bettor's portfolio index it scans (one slot read and compare, ~17 ops)
+CLOSE_OPCODE_BUDGET = 200
+PORTFOLIO_ENTRY_OPCODE_BUDGET = 20
+
+# Opcode budget reserved by archive_market for its payouts and event, and per
+# bettor index page it deletes (~35 ops each)
+ARCHIVE_OPCODE_BUDGET = 100
+ARCHIVE_PAGE_OPCODE_BUDGET = 40
+
+
+class Market(arc4.Struct):
+    """Market record, stored in its own box keyed by market id.
+
+    Option names are either stored inline in options, or as ids of registered
+    strings in option_ids; the other array is left empty.
+    """
+
+    creator: arc4.Address
+    end_time: arc4.UInt64
+    status: arc4.UInt64
+    winning_option: arc4.UInt64
+    option_count: arc4.UInt64
+    total_pool: arc4.UInt64
+    winning_pool: arc4.UInt64
+    payout_ratio: arc4.UInt64
+    paid_out: arc4.UInt64
+    version: arc4.UInt64
+    bet_count: arc4.UInt64
+    bettor_count: arc4.UInt64
+    max_bet: arc4.UInt64
+    distribution_cursor: arc4.UInt64
+    title: arc4.String
+    options: arc4.DynamicArray[arc4.String]
+    option_ids: arc4.DynamicArray[arc4.UInt16]
+    odds: arc4.DynamicArray[arc4.UInt16]
+
+
+class MarketSummary(arc4.Struct):
+    """Compact fixed-width market summary returned by get_markets_page."""
+
+    market_id: arc4.UInt64
+    end_time: arc4.UInt64
+    total_pool: arc4.UInt64
+    status: arc4.UInt8
+    option_count: arc4.UInt8
+    winning_option: arc4.UInt8
+    bet_count: arc4.UInt32
+    bettor_count: arc4.UInt32
+    max_bet: arc4.UInt64
+
+
+class PortfolioEntry(arc4.Struct):
+    """A bettor's position in one market, returned by get_user_portfolio.
+
+    claimable is what claim_winnings would pay now: zero until the market is
+    settled and after the position is claimed.
+    """
+
+    market_id: arc4.UInt64
+    status: arc4.UInt8
+    winning_option: arc4.UInt8
+    claimed: arc4.Bool
+    total_stake: arc4.UInt64
+    claimable: arc4.UInt64
+
+
+class MarketTicker(arc4.Struct):
+    """Fixed-width market state returned by get_market_summary.
+
+    Encoded as eight big-endian uint64s, a 2-byte offset, then the pools as a
+    2-byte count followed by one uint64 per option, so the pools always start
+    at byte 68.
+    """
+
+    version: arc4.UInt64
+    status: arc4.UInt64
+    end_time: arc4.UInt64
+    winning_option: arc4.UInt64
+    total_pool: arc4.UInt64
+    bet_count: arc4.UInt64
+    bettor_count: arc4.UInt64
+    max_bet: arc4.UInt64
+    option_pools: arc4.DynamicArray[arc4.UInt64]
+
+
+class BetResult(arc4.Struct):
+    """Market and bettor state after a bet, returned by place_bet."""
+
+    total_pool: arc4.UInt64
+    option_pools: arc4.DynamicArray[arc4.UInt64]
+    position_stakes: arc4.DynamicArray[arc4.UInt64]
+    position_total: arc4.UInt64
+
+
+class SettlementResult(arc4.Struct):
+    """Market state after settlement, returned by settle_market."""
+
+    status: arc4.UInt64
+    winning_option: arc4.UInt64
+    winning_pool: arc4.UInt64
+    payout_ratio: arc4.UInt64
+
+
+class ClaimResult(arc4.Struct):
+    """Claimant's payout and position state after a claim, returned by claim_winnings."""
+
+    payout: arc4.UInt64
+    status: arc4.UInt64
+    claimed: arc4.Bool
+
+
+class StringRegistered(arc4.Struct):
+    """ARC-28 event emitted when a string is added to the registry."""
+
+    string_id: arc4.UInt16
+    value: arc4.String
+
+
+class OptionSetRegistered(arc4.Struct):
+    """ARC-28 event emitted when an option-set template is registered."""
+
+    option_set_id: arc4.UInt64
+    string_ids: arc4.DynamicArray[arc4.UInt16]
+
+
+class MarketCreated(arc4.Struct):
+    """ARC-28 event emitted by create_market."""
+
+    market_id: arc4.UInt64
+    creator: arc4.Address
+    option_count: arc4.UInt64
+    end_time: arc4.UInt64
+
+
+class BetPlaced(arc4.Struct):
+    """ARC-28 event emitted for every bet, with the option pool after the bet."""
+
+    market_id: arc4.UInt64
+    option: arc4.UInt64
+    bettor: arc4.Address
+    amount: arc4.UInt64
+    new_option_pool: arc4.UInt64
+
+
+class MarketSettled(arc4.Struct):
+    """ARC-28 event emitted when a market is settled."""
+
+    market_id: arc4.UInt64
+    winning_option: arc4.UInt64
+    winning_pool: arc4.UInt64
+    payout_ratio: arc4.UInt64
+
+
+class WinningsClaimed(arc4.Struct):
+    """ARC-28 event emitted for every claimed position."""
+
+    market_id: arc4.UInt64
+    claimant: arc4.Address
+    payout: arc4.UInt64
+
+
+class MarketArchived(arc4.Struct):
+    """ARC-28 event emitted when a market is archived: its final compact record."""
+
+    market_id: arc4.UInt64
+    winning_option: arc4.UInt64
+    total_pool: arc4.UInt64
+    paid_out: arc4.UInt64
+    swept: arc4.UInt64
+
+
+@subroutine
+def pools_key(market_id: UInt64) -> Bytes:
+    """Key of the box holding a market's packed uint64 option pools."""
+    return b"p" + op.itob(market_id)
+
+
+@subroutine
+def boundaries_key(market_id: UInt64) -> Bytes:
+    """Key of the box holding a scalar market's sorted uint64 bucket boundaries."""
+    return b"b" + op.itob(market_id)
+
+
+@subroutine
+def bettors_key(market_id: UInt64, page: UInt64) -> Bytes:
+    """Key of one page of a market's bettor index, which lists bettors' addresses in order of first bet."""
+    return b"r" + op.itob(market_id) + op.itob(page)
+
+
+@subroutine
+def position_key(market_id: UInt64, bettor: Account) -> Bytes:
+    """Key of the box holding a bettor's position record in a market."""
+    return b"u" + op.itob(market_id) + bettor.bytes
+
+
+@subroutine
+def portfolio_key(bettor: Account) -> Bytes:
+    """Key of the box listing, as packed uint64s, the markets a bettor has positions in."""
+    return b"i" + bettor.bytes
+
+
+@subroutine
+def box_append(key: Bytes, value: Bytes) -> None:
+    """Append value to the end of a box, creating the box on first use."""
+    length, exists = op.Box.length(key)
+    if exists:
+        op.Box.resize(key, length + value.length)
+        op.Box.replace(key, length, value)
+    else:
+        op.Box.put(key, value)
+
+
+@subroutine
+def portfolio_remove(bettor: Account, market_id: UInt64) -> UInt64:
+    """Remove a market id from a bettor's portfolio index and return the minimum balance released.
+
+    The last entry is moved into the removed slot, and the index box is
+    deleted once it is empty. The scan is linear in the number of entries, so
+    budget for all of them is pooled up front.
+    """
+    key = portfolio_key(bettor)
+    length, exists = op.Box.length(key)
+    if not exists:
+        return UInt64(0)
+    ensure_budget((length // POOL_SLOT_SIZE) * UInt64(PORTFOLIO_ENTRY_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+    last = length - POOL_SLOT_SIZE
+    for offset in urange(0, length, POOL_SLOT_SIZE):
+        if op.btoi(op.Box.extract(key, offset, UInt64(POOL_SLOT_SIZE))) == market_id:
+            if last == 0:
+                assert op.Box.delete(key)
+                return box_min_balance(key, UInt64(POOL_SLOT_SIZE))
+            op.Box.replace(key, offset, op.Box.extract(key, last, UInt64(POOL_SLOT_SIZE)))
+            op.Box.resize(key, last)
+            return UInt64(POOL_SLOT_SIZE * BOX_BYTE_MIN_BALANCE)
+    return UInt64(0)
+
+
+@subroutine
+def position_payout(position: Bytes, winning_option: UInt64, winning_pool: UInt64, payout_ratio: UInt64) -> UInt64:
+    """Payout of a position box in a settled market, ignoring whether it was claimed.
+
+    Winners receive their winning stake times the market's payout ratio. If
+    nobody backed the winning option, every bettor is refunded their total stake.
+    """
+    if winning_pool:
+        stake_offset = UInt64(POSITION_STAKES_OFFSET) + winning_option * UInt64(POOL_SLOT_SIZE)
+        stake = op.btoi(op.Box.extract(position, stake_offset, UInt64(POOL_SLOT_SIZE)))
+        return mul_div(stake, payout_ratio, UInt64(PAYOUT_SCALE))
+    return op.btoi(op.Box.extract(position, UInt64(POSITION_TOTAL_OFFSET), UInt64(POOL_SLOT_SIZE)))
+
+
+@subroutine
+def add_to_slot(key: Bytes, offset: UInt64, amount: UInt64) -> UInt64:
+    """Add amount to the uint64 stored at offset in a box, in place, and return the new value."""
+    value = op.btoi(op.Box.extract(key, offset, UInt64(POOL_SLOT_SIZE))) + amount
+    op.Box.replace(key, offset, op.itob(value))
+    return value
+
+
+@subroutine
+def box_min_balance(key: Bytes, size: UInt64) -> UInt64:
+    """Minimum balance a box with this key and value size locks in the app account."""
+    return UInt64(BOX_FLAT_MIN_BALANCE) + UInt64(BOX_BYTE_MIN_BALANCE) * (key.length + size)
+
+
+@subroutine
+def delete_box(key: Bytes) -> UInt64:
+    """Delete a box if it exists and return the minimum balance this released."""
+    size, exists = op.Box.length(key)
+    if not exists:
+        return UInt64(0)
+    assert op.Box.delete(key)
+    return box_min_balance(key, size)
+
+
+@subroutine
+def bucket_index(key: Bytes, boundary_count: UInt64, value: UInt64) -> UInt64:
+    """Binary search a box of sorted packed uint64 boundaries for the bucket holding value.
+
+    Returns how many boundaries are less than or equal to value: bucket 0 is
+    below the first boundary and bucket i covers [boundary i-1, boundary i).
+    Reads log2(boundary_count) slots of the box.
+    """
+    low = UInt64(0)
+    high = boundary_count
+    while low < high:
+        middle = (low + high) // 2
+        boundary = op.btoi(op.Box.extract(key, middle * UInt64(POOL_SLOT_SIZE), UInt64(POOL_SLOT_SIZE)))
+        if boundary <= value:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+@subroutine
+def mul_div(a: UInt64, b: UInt64, c: UInt64) -> UInt64:
+    """Compute a * b // c using a 128-bit intermediate product."""
+    high, low = op.mulw(a, b)
+    return op.divw(high, low, c)
+
+
+@subroutine
+def packed_uint64_array(packed: Bytes) -> arc4.DynamicArray[arc4.UInt64]:
+    """View packed big-endian uint64 slots as an ARC-4 uint64[] (length prefix + slots)."""
+    length = op.extract(op.itob(packed.length // POOL_SLOT_SIZE), 6, 2)
+    return arc4.DynamicArray[arc4.UInt64].from_bytes(length + packed)
 
 
 class PredictionMarket(ARC4Contract):
     """A comprehensive prediction market smart contract for sports betting."""
-    
+
     def __init__(self) -> None:
         # Global state
         self.market_counter = UInt64(0)
-        self.market_title = String("")
-        self.total_pool = UInt64(0)
-        self.creator = Txn.sender
-        
+        self.string_counter = UInt64(0)
+        self.option_set_counter = UInt64(0)
+
+        # Box storage: one box per market, one box of packed option pools
+        # (8 bytes per option, see pools_key) and one fixed-size position
+        # record per bettor per market (see position_key)
+        self.markets = BoxMap(UInt64, Market, key_prefix=b"m")
+
+        # String registry: one box per interned string, an index from the
+        # sha256 of each string to its id, and option-set templates holding
+        # packed string ids
+        self.strings = BoxMap(UInt64, arc4.String, key_prefix=b"s")
+        self.string_ids = BoxMap(Bytes, UInt64, key_prefix=b"h")
+        self.option_sets = BoxMap(UInt64, arc4.DynamicArray[arc4.UInt16], key_prefix=b"t")
+
     @arc4.abimethod
     def create_market(
-        self, 
+        self,
         title: arc4.String,
         options: arc4.DynamicArray[arc4.String],
-        odds: arc4.DynamicArray[arc4.UInt64],
-        duration_hours: arc4.UInt64
+        odds: arc4.DynamicArray[arc4.UInt16],
+        duration_hours: arc4.UInt64,
+        payment_txn: gtxn.PaymentTransaction
     ) -> arc4.UInt64:
-        """Create a new prediction market."""
-        # Basic validation
-        assert options.length >= 2, "Market must have at least 2 options"
+        """Create a new prediction market.
+
+        payment_txn must pay exactly the minimum balance of the market's boxes,
+        which archive_market returns to the creator. Markets with many options
+        pool extra opcode budget through OpUp inner app calls, paid for by the
+        caller's fee surplus.
+        """
         assert options.length == odds.length, "Options and odds must have same length"
-        
-        # Validate odds (minimum 101 = 1.01x)
-        for i in urange(options.length):
-            assert odds[i] >= 101, "Odds must be at least 1.01 (101)"
-        
-        # Increment market counter and store basic market info
-        self.market_counter += UInt64(1)
-        self.market_title = title.native
-        self.total_pool = UInt64(0)
-        self.creator = Txn.sender
-        
-        return arc4.UInt64(self.market_counter)
-    
+        min_balance = Global.current_application_address.min_balance
+        market_id = self._create_market(
+            title, options.copy(), arc4.DynamicArray[arc4.UInt16](), odds.copy(), duration_hours.native
+        )
+        self._check_deposit(payment_txn, min_balance)
+        return arc4.UInt64(market_id)
+
+    @arc4.abimethod
+    def create_market_with_ids(
+        self,
+        title: arc4.String,
+        option_ids: arc4.DynamicArray[arc4.UInt16],
+        odds: arc4.DynamicArray[arc4.UInt16],
+        duration_hours: arc4.UInt64,
+        payment_txn: gtxn.PaymentTransaction
+    ) -> arc4.UInt64:
+        """Create a market whose option names are registered strings, stored as 2-byte ids.
+
+        payment_txn pays the box deposit, as for create_market.
+        """
+        assert option_ids.length == odds.length, "Options and odds must have same length"
+        assert option_ids.length <= TemplateVar[UInt64]("MAX_OPTIONS"), "Too many options"
+        self._check_string_ids(option_ids.bytes)
+        min_balance = Global.current_application_address.min_balance
+        market_id = self._create_market(
+            title, arc4.DynamicArray[arc4.String](), option_ids.copy(), odds.copy(), duration_hours.native
+        )
+        self._check_deposit(payment_txn, min_balance)
+        return arc4.UInt64(market_id)
+
+    @arc4.abimethod
+    def create_market_from_template(
+        self,
+        title: arc4.String,
+        option_set_id: arc4.UInt64,
+        odds: arc4.DynamicArray[arc4.UInt16],
+        duration_hours: arc4.UInt64,
+        payment_txn: gtxn.PaymentTransaction
+    ) -> arc4.UInt64:
+        """Create a market with the options of a registered option-set template.
+
+        payment_txn pays the box deposit, as for create_market.
+        """
+        assert option_set_id.native in self.option_sets, "Option set does not exist"
+        option_ids = self.option_sets[option_set_id.native].copy()
+        assert option_ids.length == odds.length, "Options and odds must have same length"
+        min_balance = Global.current_application_address.min_balance
+        market_id = self._create_market(
+            title, arc4.DynamicArray[arc4.String](), option_ids.copy(), odds.copy(), duration_hours.native
+        )
+        self._check_deposit(payment_txn, min_balance)
+        return arc4.UInt64(market_id)
+
+    @arc4.abimethod
+    def create_scalar_market(
+        self,
+        title: arc4.String,
+        boundaries: arc4.DynamicArray[arc4.UInt64],
+        odds: arc4.DynamicArray[arc4.UInt16],
+        duration_hours: arc4.UInt64,
+        payment_txn: gtxn.PaymentTransaction
+    ) -> arc4.UInt64:
+        """Create a market on a numeric result, such as total goals, split into buckets.
+
+        boundaries must be strictly increasing; n boundaries make n + 1 buckets,
+        which are the market's options: bucket 0 is below the first boundary and
+        bucket i covers [boundary i-1, boundary i). The boundaries are packed in
+        a b"b" box and settle_scalar_market maps the result to its bucket.
+        payment_txn pays the box deposit, boundaries box included, as for
+        create_market.
+        """
+        assert boundaries.length + 1 == odds.length, "Every bucket needs odds"
+        assert odds.length <= TemplateVar[UInt64]("MAX_OPTIONS"), "Too many options"
+        ensure_budget(boundaries.length * UInt64(BOUNDARY_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+        boundary_bytes = boundaries.bytes
+        for offset in urange(2 + POOL_SLOT_SIZE, boundary_bytes.length, POOL_SLOT_SIZE):
+            assert op.extract_uint64(boundary_bytes, offset - POOL_SLOT_SIZE) < op.extract_uint64(
+                boundary_bytes, offset
+            ), "Boundaries must be strictly increasing"
+
+        min_balance = Global.current_application_address.min_balance
+        market_id = self._create_market(
+            title,
+            arc4.DynamicArray[arc4.String](),
+            arc4.DynamicArray[arc4.UInt16](),
+            odds.copy(),
+            duration_hours.native,
+        )
+        op.Box.put(boundaries_key(market_id), boundary_bytes[2:])
+        self._check_deposit(payment_txn, min_balance)
+        return arc4.UInt64(market_id)
+
+    @arc4.abimethod
+    def register_string(self, value: arc4.String, payment_txn: gtxn.PaymentTransaction) -> arc4.UInt16:
+        """Intern a string, such as a team name, and return its id.
+
+        Registering a string that is already in the registry returns its
+        existing id. Boxes used: b"h" + sha256(value) and b"s" + the new id.
+        payment_txn must pay exactly the minimum balance of the two new boxes,
+        or nothing for a string already registered; registry boxes are
+        permanent, so the deposit is not refunded.
+        """
+        min_balance = Global.current_application_address.min_balance
+        digest = op.sha256(value.native.bytes)
+        if digest not in self.string_ids:
+            assert self.string_counter < MAX_STRING_ID, "String registry is full"
+            self.string_counter += UInt64(1)
+            self.strings[self.string_counter] = value
+            self.string_ids[digest] = self.string_counter
+            arc4.emit(StringRegistered(string_id=arc4.UInt16(self.string_counter), value=value))
+
+        self._check_deposit(payment_txn, min_balance)
+        return arc4.UInt16(self.string_ids[digest])
+
+    @arc4.abimethod
+    def register_option_set(
+        self,
+        string_ids: arc4.DynamicArray[arc4.UInt16],
+        payment_txn: gtxn.PaymentTransaction
+    ) -> arc4.UInt64:
+        """Register a reusable option-set template (e.g. Home/Draw/Away) of string ids and return its id.
+
+        payment_txn must pay exactly the minimum balance of the template's box,
+        which is permanent.
+        """
+        assert string_ids.length >= 2, "Option set must have at least 2 options"
+        assert string_ids.length <= TemplateVar[UInt64]("MAX_OPTIONS"), "Too many options"
+        self._check_string_ids(string_ids.bytes)
+
+        min_balance = Global.current_application_address.min_balance
+        self.option_set_counter += UInt64(1)
+        self.option_sets[self.option_set_counter] = string_ids.copy()
+        self._check_deposit(payment_txn, min_balance)
+
+        arc4.emit(OptionSetRegistered(
+            option_set_id=arc4.UInt64(self.option_set_counter),
+            string_ids=string_ids.copy(),
+        ))
+        return arc4.UInt64(self.option_set_counter)
+
     @arc4.abimethod
     def place_bet(
         self,
         market_id: arc4.UInt64,
         option_index: arc4.UInt64,
         payment_txn: gtxn.PaymentTransaction
+    ) -> BetResult:
+        """Place a bet on a market option and return the resulting pools and caller's position.
+
+        On the caller's first bet in a market the payment also covers the
+        minimum balance of the boxes the bet creates (see _open_position); the
+        rest of the payment is staked. close_positions refunds the deposit.
+
+        The return value (28 + 16 bytes per option) and the BetPlaced event share
+        the 1024-byte log limit, which caps markets bet on this way at 58 options.
+        """
+        self._check_payment(payment_txn)
+        min_balance = Global.current_application_address.min_balance
+        new_bettor = self._open_position(market_id.native)
+        deposit = Global.current_application_address.min_balance - min_balance
+        self._record_bet(market_id.native, option_index.native, payment_txn.amount - deposit, new_bettor)
+
+        option_pools, _pools_exist = op.Box.get(pools_key(market_id.native))
+        position, _position_exists = op.Box.get(position_key(market_id.native, Txn.sender))
+        return BetResult(
+            total_pool=self.markets[market_id.native].total_pool,
+            option_pools=packed_uint64_array(option_pools),
+            position_stakes=packed_uint64_array(position[POSITION_STAKES_OFFSET:]),
+            position_total=arc4.UInt64(op.extract_uint64(position, POSITION_TOTAL_OFFSET)),
+        )
+
+    @arc4.abimethod
+    def place_bets(
+        self,
+        market_ids: arc4.DynamicArray[arc4.UInt64],
+        option_indexes: arc4.DynamicArray[arc4.UInt64],
+        amounts: arc4.DynamicArray[arc4.UInt64],
+        payment_txn: gtxn.PaymentTransaction
     ) -> None:
-        """Place a bet on a market option."""
-        # Basic validation
-        assert market_id.native <= self.market_counter, "Market does not exist"
-        assert option_index.native < 3, "Invalid option index"  # Simplified to 3 options max
-        
-        # Validate payment transaction
-        assert payment_txn.receiver == Global.current_application_address, "Payment must be to application"
-        assert payment_txn.amount >= 1_000_000, "Minimum bet is 1 ALGO"
-        assert payment_txn.sender == Txn.sender, "Payment sender must match transaction sender"
-        
-        # Update total pool
-        self.total_pool += payment_txn.amount
-    
-    @arc4.abimethod
-    def settle_market(self, market_id: arc4.UInt64, winning_option: arc4.UInt64) -> None:
-        """Settle a market by determining the winning option."""
-        # Only creator can settle
-        assert Txn.sender == self.creator, "Only market creator can settle"
-        assert market_id.native <= self.market_counter, "Market does not exist"
-        assert winning_option.native < 3, "Invalid winning option"
-    
+        """Place several bets (legs) in one call, all covered by a single grouped payment.
+
+        The payment must equal the sum of the amounts plus the minimum balance
+        of the boxes opened by legs in markets new to the caller, which
+        close_positions refunds. Each leg emits a BetPlaced event and a
+        transaction may log at most 1024 bytes, so one call takes up to 15 legs;
+        split longer slips across app calls in the same group.
+        """
+        assert market_ids.length > 0, "At least one bet is required"
+        assert market_ids.length == option_indexes.length, "Every bet needs a market id and an option index"
+        assert market_ids.length == amounts.length, "Every bet needs a market id and an amount"
+        self._check_payment(payment_txn)
+
+        # Pool opcode budget up front so long slips fit in one group
+        ensure_budget(market_ids.length * UInt64(BET_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        min_balance = Global.current_application_address.min_balance
+        total = UInt64(0)
+        for i in urange(market_ids.length):
+            new_bettor = self._open_position(market_ids[i].native)
+            self._record_bet(market_ids[i].native, option_indexes[i].native, amounts[i].native, new_bettor)
+            total += amounts[i].native
+        deposit = Global.current_application_address.min_balance - min_balance
+        assert payment_txn.amount == total + deposit, "Payment must equal the sum of all bets plus the box deposit"
+
     @arc4.abimethod
-    def claim_winnings(self, market_id: arc4.UInt64) -> arc4.UInt64:
-        """Claim winnings from a settled market."""
-        assert market_id.native <= self.market_counter, "Market does not exist"
-        
-        # Simplified payout - return 90% of total pool to claimant
-        payout = self.total_pool * UInt64(90) // UInt64(100)
-        
+    def settle_market(self, market_id: arc4.UInt64, winning_option: arc4.UInt64) -> SettlementResult:
+        """Settle a market by determining the winning option and return its payout state."""
+        self._settle(market_id.native, winning_option.native)
+
+        market = self.markets[market_id.native].copy()
+        return SettlementResult(
+            status=market.status,
+            winning_option=market.winning_option,
+            winning_pool=market.winning_pool,
+            payout_ratio=market.payout_ratio,
+        )
+
+    @arc4.abimethod
+    def settle_scalar_market(self, market_id: arc4.UInt64, result: arc4.UInt64) -> SettlementResult:
+        """Settle a scalar market on its numeric result; the bucket holding it wins.
+
+        The bucket is found by binary search over the packed boundaries, so the
+        cost grows with log(buckets).
+        """
+        key = boundaries_key(market_id.native)
+        size, exists = op.Box.length(key)
+        assert exists, "Not a scalar market"
+        self._settle(market_id.native, bucket_index(key, size // POOL_SLOT_SIZE, result.native))
+
+        market = self.markets[market_id.native].copy()
+        return SettlementResult(
+            status=market.status,
+            winning_option=market.winning_option,
+            winning_pool=market.winning_pool,
+            payout_ratio=market.payout_ratio,
+        )
+
+    @arc4.abimethod
+    def settle_markets(
+        self,
+        market_ids: arc4.DynamicArray[arc4.UInt64],
+        winning_options: arc4.DynamicArray[arc4.UInt64]
+    ) -> None:
+        """Settle a batch of markets in one call; the caller must have created each of them.
+
+        Each market emits a MarketSettled event and a transaction may log at most
+        1024 bytes, so one call settles up to 28 markets; split larger batches
+        across app calls in the same group. Large batches pool opcode budget
+        through OpUp inner app calls, paid for by the caller's fee surplus.
+        """
+        assert market_ids.length == winning_options.length, "Every market needs a winning option"
+        ensure_budget(market_ids.length * UInt64(SETTLE_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        for i in urange(market_ids.length):
+            self._settle(market_ids[i].native, winning_options[i].native)
+
+    @arc4.abimethod
+    def claim_winnings(self, market_id: arc4.UInt64) -> ClaimResult:
+        """Claim winnings from a settled market.
+
+        Returns the payout with the market's status and the position's claimed
+        flag as they stand after the claim.
+        """
+        payout = self._claim(market_id.native, Txn.sender)
+        if payout:
+            itxn.Payment(receiver=Txn.sender, amount=payout, fee=0).submit()
+
+        claimed = op.Box.extract(
+            position_key(market_id.native, Txn.sender), UInt64(POSITION_CLAIMED_OFFSET), UInt64(1)
+        )
+        return ClaimResult(
+            payout=arc4.UInt64(payout),
+            status=self.markets[market_id.native].status,
+            claimed=arc4.Bool(op.btoi(claimed) != 0),
+        )
+
+    @arc4.abimethod
+    def claim_all(self, market_ids: arc4.DynamicArray[arc4.UInt64]) -> arc4.UInt64:
+        """Claim winnings from several settled markets with a single inner payment.
+
+        The inner payment's fee is pooled, so the caller's transaction pays it.
+        Each market emits a WinningsClaimed event and a transaction may log at
+        most 1024 bytes, so one call claims up to 19 markets.
+        """
+        ensure_budget(market_ids.length * UInt64(CLAIM_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        payout = UInt64(0)
+        for i in urange(market_ids.length):
+            payout += self._claim(market_ids[i].native, Txn.sender)
+        if payout:
+            itxn.Payment(receiver=Txn.sender, amount=payout, fee=0).submit()
+
         return arc4.UInt64(payout)
-    
+
+    @arc4.abimethod
+    def distribute(
+        self,
+        market_id: arc4.UInt64,
+        cursor: arc4.UInt64,
+        max_bettors: arc4.UInt64
+    ) -> arc4.UInt64:
+        """Push payouts to the next bettors of a settled market and return the new cursor.
+
+        Visits up to max_bettors (at most MAX_DISTRIBUTE_BATCH) entries of the
+        bettor index from cursor, which must equal the market's stored cursor,
+        and settles each unclaimed position as claim_winnings would, paying
+        winners with an inner payment. Index pages are deleted once visited;
+        their minimum balance was paid by the bettors and stays in the app
+        until close_positions refunds it.
+
+        A market with n bettors is distributed in ceil(n / MAX_DISTRIBUTE_BATCH)
+        calls, each spanning DISTRIBUTE_CALL_TXNS transactions to carry its
+        references, so five calls (50 bettors) fit in one 16-transaction group,
+        each given the cursor the previous one returns, with their inner
+        payments covered by fee pooling. A 1,000-bettor market takes 100 calls
+        in 20 groups.
+        """
+        assert market_id.native in self.markets, "Market does not exist"
+        market = self.markets[market_id.native].copy()
+        assert market.status == STATUS_SETTLED, "Market is not settled"
+        assert cursor == market.distribution_cursor, "Cursor does not match the stored cursor"
+
+        batch = max_bettors.native
+        if batch > MAX_DISTRIBUTE_BATCH:
+            batch = UInt64(MAX_DISTRIBUTE_BATCH)
+        stop = cursor.native + batch
+        if stop > market.bettor_count.native:
+            stop = market.bettor_count.native
+        ensure_budget((stop - cursor.native) * UInt64(DISTRIBUTE_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        for index in urange(cursor.native, stop):
+            page = bettors_key(market_id.native, index // BETTOR_PAGE_SIZE)
+            bettor = Account.from_bytes(
+                op.Box.extract(page, (index % BETTOR_PAGE_SIZE) * UInt64(ADDRESS_SIZE), UInt64(ADDRESS_SIZE))
+            )
+            position = position_key(market_id.native, bettor)
+            if op.btoi(op.Box.extract(position, UInt64(POSITION_CLAIMED_OFFSET), UInt64(1))) == 0:
+                payout = self._claim(market_id.native, bettor)
+                if payout:
+                    itxn.Payment(receiver=bettor, amount=payout, fee=0).submit()
+
+            # Bets are closed once a market is settled, so the index is final
+            if index % BETTOR_PAGE_SIZE == BETTOR_PAGE_SIZE - 1 or index + 1 == market.bettor_count.native:
+                _released = delete_box(page)
+
+        self.markets[market_id.native].distribution_cursor = arc4.UInt64(stop)
+        return arc4.UInt64(stop)
+
+    @arc4.abimethod
+    def archive_market(self, market_id: arc4.UInt64) -> arc4.UInt64:
+        """Archive a settled market once its claim period is over and return the amount swept.
+
+        Deletes the market's record, pools, remaining bettor index pages and
+        (for scalar markets) boundaries boxes. The market creator gets back the
+        deposit they paid for the record, pools and boundaries, and the app
+        creator is swept the unclaimed remainder of the pool (rake, rounding
+        dust and unclaimed winnings). The bettor index was paid for by the
+        bettors, so its minimum balance stays in the app for close_positions,
+        which removes their position boxes afterwards and refunds their
+        deposits.
+
+        Index pages already visited by distribute are gone, so only the rest
+        need box references. A market with many pages pools opcode budget
+        through OpUp inner app calls, paid for by the caller's fee surplus.
+        """
+        assert market_id.native in self.markets, "Market does not exist"
+        market = self.markets[market_id.native].copy()
+        assert market.status == STATUS_SETTLED, "Market is not settled"
+        assert (
+            Global.latest_timestamp >= market.end_time.native + UInt64(CLAIM_PERIOD_SECONDS)
+        ), "Claim period has not ended"
+
+        released = box_min_balance(b"m" + op.itob(market_id.native), self.markets.length(market_id.native))
+        del self.markets[market_id.native]
+        released += delete_box(pools_key(market_id.native))
+        released += delete_box(boundaries_key(market_id.native))
+        page_count = (market.bettor_count.native + BETTOR_PAGE_SIZE - 1) // BETTOR_PAGE_SIZE
+        first_page = market.distribution_cursor.native // BETTOR_PAGE_SIZE
+        ensure_budget(
+            UInt64(ARCHIVE_OPCODE_BUDGET) + (page_count - first_page) * UInt64(ARCHIVE_PAGE_OPCODE_BUDGET),
+            OpUpFeeSource.GroupCredit,
+        )
+        for page in urange(first_page, page_count):
+            _released = delete_box(bettors_key(market_id.native, page))
+
+        itxn.Payment(receiver=market.creator.native, amount=released, fee=0).submit()
+        swept = market.total_pool.native - market.paid_out.native
+        if swept:
+            itxn.Payment(receiver=Global.creator_address, amount=swept, fee=0).submit()
+
+        arc4.emit(MarketArchived(
+            market_id=market_id,
+            winning_option=market.winning_option,
+            total_pool=market.total_pool,
+            paid_out=market.paid_out,
+            swept=arc4.UInt64(swept),
+        ))
+        return arc4.UInt64(swept)
+
+    @arc4.abimethod
+    def close_positions(
+        self,
+        market_id: arc4.UInt64,
+        bettors: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.UInt64:
+        """Delete bettors' position boxes in an archived market, refund their deposits and return the total refunded.
+
+        Each closed position is also removed from its bettor's portfolio index.
+        A bettor is refunded the minimum balance of their position box, their
+        portfolio index entry and their slot in the market's bettor index (the
+        whole page if they opened it) with one inner payment each, so a call
+        closes at most 16 positions, fewer when it pools opcode budget through
+        OpUp inner app calls (paid for by the caller's fee surplus) for many
+        positions or long portfolio indexes.
+        """
+        assert market_id.native > 0, "Market does not exist"
+        assert market_id.native <= self.market_counter, "Market does not exist"
+        assert market_id.native not in self.markets, "Market is not archived"
+        ensure_budget(bettors.length * UInt64(CLOSE_OPCODE_BUDGET), OpUpFeeSource.GroupCredit)
+
+        refunded = UInt64(0)
+        for i in urange(bettors.length):
+            bettor = bettors[i].native
+            position = position_key(market_id.native, bettor)
+            _size, exists = op.Box.length(position)
+            if exists:
+                refund = UInt64(ADDRESS_SIZE * BOX_BYTE_MIN_BALANCE)
+                if op.btoi(op.Box.extract(position, UInt64(POSITION_PAGE_OFFSET), UInt64(1))):
+                    refund += box_min_balance(bettors_key(market_id.native, UInt64(0)), UInt64(0))
+                refund += delete_box(position) + portfolio_remove(bettor, market_id.native)
+                itxn.Payment(receiver=bettor, amount=refund, fee=0).submit()
+                refunded += refund
+
+        return arc4.UInt64(refunded)
+
     @arc4.abimethod(readonly=True)
     def get_market_info(self, market_id: arc4.UInt64) -> arc4.Tuple[
         arc4.String,  # title
         arc4.DynamicArray[arc4.String],  # options
-        arc4.DynamicArray[arc4.UInt64],  # odds
+        arc4.DynamicArray[arc4.UInt16],  # odds
         arc4.DynamicArray[arc4.UInt64],  # option_pools
         arc4.UInt64,  # total_pool
         arc4.UInt64,  # end_time
         arc4.UInt64,  # status
         arc4.UInt64   # winning_option
     ]:
-        """Get comprehensive market information."""
-        assert market_id.native <= self.market_counter, "Market does not exist"
-        
-        # Return simplified market info
-        options = arc4.DynamicArray[arc4.String](
-            arc4.String("Option 1"),
-            arc4.String("Option 2"), 
-            arc4.String("Option 3")
-        )
-        
-        odds = arc4.DynamicArray[arc4.UInt64](
-            arc4.UInt64(200),
-            arc4.UInt64(300),
-            arc4.UInt64(150)
-        )
-        
-        option_pools = arc4.DynamicArray[arc4.UInt64](
-            arc4.UInt64(0),
-            arc4.UInt64(0),
-            arc4.UInt64(0)
-        )
-        
+        """Get comprehensive market information.
+
+        Options stored as registered string ids are returned resolved, which
+        reads the b"s" box of each id.
+        """
+        assert market_id.native in self.markets, "Market does not exist"
+        market = self.markets[market_id.native].copy()
+        option_pools, _exists = op.Box.get(pools_key(market_id.native))
+
         return arc4.Tuple((
-            arc4.String(self.market_title),
-            options.copy(),
-            odds.copy(),
-            option_pools.copy(),
-            arc4.UInt64(self.total_pool),
-            arc4.UInt64(Global.latest_timestamp + UInt64(86400)),  # end_time: 24 hours from now
-            arc4.UInt64(0),  # status: active
-            arc4.UInt64(0)   # winning_option: not set
+            market.title,
+            self._market_options(market.copy()),
+            market.odds.copy(),
+            packed_uint64_array(option_pools),
+            market.total_pool,
+            market.end_time,
+            market.status,
+            market.winning_option
         ))
-    
+
+    @arc4.abimethod(readonly=True)
+    def get_bucket_boundaries(self, market_id: arc4.UInt64) -> arc4.DynamicArray[arc4.UInt64]:
+        """Get a scalar market's bucket boundaries (empty for other markets)."""
+        assert market_id.native in self.markets, "Market does not exist"
+        boundaries, _exists = op.Box.get(boundaries_key(market_id.native))
+        return packed_uint64_array(boundaries)
+
+    @arc4.abimethod(readonly=True)
+    def get_market_summary(self, market_id: arc4.UInt64) -> MarketTicker:
+        """Get a market's pools, status, timing, winner, version and bet statistics, without text.
+
+        version increases with every bet and settlement, so pollers can skip
+        unchanged markets.
+        """
+        assert market_id.native in self.markets, "Market does not exist"
+        market = self.markets[market_id.native].copy()
+        option_pools, _exists = op.Box.get(pools_key(market_id.native))
+
+        return MarketTicker(
+            version=market.version,
+            status=market.status,
+            end_time=market.end_time,
+            winning_option=market.winning_option,
+            total_pool=market.total_pool,
+            bet_count=market.bet_count,
+            bettor_count=market.bettor_count,
+            max_bet=market.max_bet,
+            option_pools=packed_uint64_array(option_pools),
+        )
+
     @arc4.abimethod(readonly=True)
     def get_user_position(self, market_id: arc4.UInt64, user: arc4.Address) -> arc4.Tuple[
         arc4.DynamicArray[arc4.UInt64],  # user_bets per option
@@ -125,22 +966,349 @@ class PredictionMarket(ARC4Contract):
         arc4.Bool     # is_claimed
     ]:
         """Get user's betting position for a market."""
-        assert market_id.native <= self.market_counter, "Market does not exist"
-        
-        # Return simplified user position
-        user_bets = arc4.DynamicArray[arc4.UInt64](
-            arc4.UInt64(0),
-            arc4.UInt64(0),
-            arc4.UInt64(0)
-        )
-        
+        assert market_id.native in self.markets, "Market does not exist"
+
+        position, exists = op.Box.get(position_key(market_id.native, user.native))
+        if not exists:
+            option_count = self.markets[market_id.native].option_count.native
+            position = op.bzero(UInt64(POSITION_STAKES_OFFSET) + option_count * UInt64(POOL_SLOT_SIZE))
+
         return arc4.Tuple((
-            user_bets.copy(),
-            arc4.UInt64(0),     # total_bet_amount
-            arc4.Bool(False)    # is_claimed
+            packed_uint64_array(position[POSITION_STAKES_OFFSET:]),
+            arc4.UInt64(op.extract_uint64(position, POSITION_TOTAL_OFFSET)),  # total_bet_amount
+            arc4.Bool(op.getbyte(position, POSITION_CLAIMED_OFFSET) != 0)     # is_claimed
         ))
-    
+
+    @arc4.abimethod(readonly=True)
+    def get_user_portfolio(
+        self,
+        user: arc4.Address,
+        start: arc4.UInt64,
+        count: arc4.UInt64
+    ) -> arc4.DynamicArray[PortfolioEntry]:
+        """Get a bettor's positions from their portfolio index, starting at index entry start.
+
+        Markets that have been archived are skipped. At most
+        MAX_PORTFOLIO_PAGE_SIZE entries are read per call; group several calls
+        into one simulate request to load a whole portfolio at once.
+        """
+        index, _exists = op.Box.get(portfolio_key(user.native))
+        page_size = count.native
+        if page_size > MAX_PORTFOLIO_PAGE_SIZE:
+            page_size = UInt64(MAX_PORTFOLIO_PAGE_SIZE)
+        stop = (start.native + page_size) * UInt64(POOL_SLOT_SIZE)
+        if stop > index.length:
+            stop = index.length
+
+        portfolio = arc4.DynamicArray[PortfolioEntry]()
+        for offset in urange(start.native * UInt64(POOL_SLOT_SIZE), stop, POOL_SLOT_SIZE):
+            market_id = op.extract_uint64(index, offset)
+            if market_id in self.markets:
+                market = self.markets[market_id].copy()
+                position = position_key(market_id, user.native)
+                claimed = op.btoi(op.Box.extract(position, UInt64(POSITION_CLAIMED_OFFSET), UInt64(1))) != 0
+                claimable = UInt64(0)
+                if market.status == STATUS_SETTLED and not claimed:
+                    claimable = position_payout(
+                        position, market.winning_option.native, market.winning_pool.native, market.payout_ratio.native
+                    )
+                portfolio.append(PortfolioEntry(
+                    market_id=arc4.UInt64(market_id),
+                    status=arc4.UInt8(market.status.native),
+                    winning_option=arc4.UInt8(market.winning_option.native),
+                    claimed=arc4.Bool(claimed),
+                    total_stake=arc4.UInt64(
+                        op.btoi(op.Box.extract(position, UInt64(POSITION_TOTAL_OFFSET), UInt64(POOL_SLOT_SIZE)))
+                    ),
+                    claimable=arc4.UInt64(claimable),
+                ))
+
+        return portfolio
+
+    @arc4.abimethod(readonly=True)
+    def get_markets_page(self, start: arc4.UInt64, count: arc4.UInt64) -> arc4.DynamicArray[MarketSummary]:
+        """Get summaries of the markets with ids from start onwards, skipping ids without a market.
+
+        At most MAX_PAGE_SIZE markets are returned per call. To list more in one
+        request, group several page calls into a single simulate call and raise
+        its extra opcode budget.
+        """
+        page_size = count.native
+        if page_size > MAX_PAGE_SIZE:
+            page_size = UInt64(MAX_PAGE_SIZE)
+        stop = start.native + page_size
+        if stop > self.market_counter + 1:
+            stop = self.market_counter + 1
+
+        page = arc4.DynamicArray[MarketSummary]()
+        for market_id in urange(start.native, stop):
+            if market_id in self.markets:
+                market = self.markets[market_id].copy()
+                page.append(MarketSummary(
+                    market_id=arc4.UInt64(market_id),
+                    end_time=market.end_time,
+                    total_pool=market.total_pool,
+                    status=arc4.UInt8(market.status.native),
+                    option_count=arc4.UInt8(market.option_count.native),
+                    winning_option=arc4.UInt8(market.winning_option.native),
+                    bet_count=arc4.UInt32(market.bet_count.native),
+                    bettor_count=arc4.UInt32(market.bettor_count.native),
+                    max_bet=market.max_bet,
+                ))
+
+        return page
+
     @arc4.abimethod(readonly=True)
     def get_market_count(self) -> arc4.UInt64:
         """Get total market count."""
-        return arc4.UInt64(self.market_counter)
\ No newline at end of file
+        return arc4.UInt64(self.market_counter)
+
+    @subroutine
+    def _create_market(
+        self,
+        title: arc4.String,
+        options: arc4.DynamicArray[arc4.String],
+        option_ids: arc4.DynamicArray[arc4.UInt16],
+        odds: arc4.DynamicArray[arc4.UInt16],
+        duration_hours: UInt64
+    ) -> UInt64:
+        """Validate and store a new market with one option per odds entry and return its id.
+
+        Option names are given inline in options, as registered ids in
+        option_ids, or not at all for scalar markets; unused arrays are empty.
+        """
+        # Basic validation; callers check that the option names (if any) match the odds
+        option_count = odds.length
+        assert option_count >= 2, "Market must have at least 2 options"
+        assert option_count <= TemplateVar[UInt64]("MAX_OPTIONS"), "Too many options"
+        ensure_budget(
+            UInt64(CREATE_OPCODE_BUDGET) + option_count * UInt64(CREATE_OPTION_OPCODE_BUDGET),
+            OpUpFeeSource.GroupCredit,
+        )
+
+        # Validate odds (1.01x to 100.00x) with fixed-stride reads over the
+        # packed uint16s, skipping the 2-byte length prefix
+        odds_bytes = odds.bytes
+        for offset in urange(2, odds_bytes.length, ODDS_SLOT_SIZE):
+            odd = op.extract_uint16(odds_bytes, offset)
+            assert odd >= MIN_ODDS, "Odds must be at least 1.01 (101)"
+            assert odd <= MAX_ODDS, "Odds must be at most 100.00 (10000)"
+
+        # Increment market counter and store the market in its own box. Inline
+        # options keep their ARC-4 string[] encoding, which is already one blob behind
+        # a uint16 offset table, so they are stored verbatim without a
+        # per-option re-encoding loop.
+        self.market_counter += UInt64(1)
+        end_time = arc4.UInt64(Global.latest_timestamp + duration_hours * UInt64(3600))
+        self.markets[self.market_counter] = Market(
+            creator=arc4.Address(Txn.sender),
+            end_time=end_time,
+            status=arc4.UInt64(STATUS_ACTIVE),
+            winning_option=arc4.UInt64(0),
+            option_count=arc4.UInt64(option_count),
+            total_pool=arc4.UInt64(0),
+            winning_pool=arc4.UInt64(0),
+            payout_ratio=arc4.UInt64(0),
+            paid_out=arc4.UInt64(0),
+            version=arc4.UInt64(0),
+            bet_count=arc4.UInt64(0),
+            bettor_count=arc4.UInt64(0),
+            max_bet=arc4.UInt64(0),
+            distribution_cursor=arc4.UInt64(0),
+            title=title,
+            options=options.copy(),
+            option_ids=option_ids.copy(),
+            odds=odds.copy(),
+        )
+
+        # Option pools start zero-filled, one fixed-width slot per option
+        assert op.Box.create(pools_key(self.market_counter), option_count * UInt64(POOL_SLOT_SIZE))
+
+        arc4.emit(MarketCreated(
+            market_id=arc4.UInt64(self.market_counter),
+            creator=arc4.Address(Txn.sender),
+            option_count=arc4.UInt64(option_count),
+            end_time=end_time,
+        ))
+
+        return self.market_counter
+
+    @subroutine
+    def _check_string_ids(self, packed_ids: Bytes) -> None:
+        """Check that every id in an ARC-4 uint16[] encoding refers to a registered string."""
+        ensure_budget(
+            (packed_ids.length // STRING_ID_SIZE) * UInt64(STRING_ID_OPCODE_BUDGET),
+            OpUpFeeSource.GroupCredit,
+        )
+        for offset in urange(2, packed_ids.length, STRING_ID_SIZE):
+            string_id = op.extract_uint16(packed_ids, offset)
+            assert string_id >= 1, "Unknown string id"
+            assert string_id <= self.string_counter, "Unknown string id"
+
+    @subroutine
+    def _market_options(self, market: Market) -> arc4.DynamicArray[arc4.String]:
+        """A market's option names, resolving registered string ids in a single pass.
+
+        Builds the ARC-4 string[] encoding directly: a uint16 offset per option
+        followed by each registered string's stored encoding.
+        """
+        if market.option_ids.length == 0:
+            return market.options.copy()
+
+        ids = market.option_ids.bytes
+        head = op.extract(ids, 0, 2)  # option count
+        tail = Bytes()
+        head_size = market.option_ids.length * UInt64(2)
+        for offset in urange(2, ids.length, STRING_ID_SIZE):
+            head += op.extract(op.itob(head_size + tail.length), 6, 2)
+            tail += self.strings[op.extract_uint16(ids, offset)].bytes
+        return arc4.DynamicArray[arc4.String].from_bytes(head + tail)
+
+    @subroutine
+    def _check_payment(self, payment_txn: gtxn.PaymentTransaction) -> None:
+        """Validate that a payment comes from the caller and goes to the application."""
+        assert payment_txn.receiver == Global.current_application_address, "Payment must be to application"
+        assert payment_txn.sender == Txn.sender, "Payment sender must match transaction sender"
+
+    @subroutine
+    def _check_deposit(self, payment_txn: gtxn.PaymentTransaction, min_balance: UInt64) -> None:
+        """Validate that a payment from the caller covers exactly the minimum balance added since min_balance was read."""
+        self._check_payment(payment_txn)
+        assert (
+            payment_txn.amount == Global.current_application_address.min_balance - min_balance
+        ), "Payment must equal the minimum balance of the new boxes"
+
+    @subroutine
+    def _open_position(self, market_id: UInt64) -> bool:
+        """Create the caller's position box on their first bet in a market and return whether it is new.
+
+        A new position is appended to the caller's portfolio index and to the
+        market's bettor index; the caller pays for the minimum balance all of
+        this adds to the app account.
+        """
+        assert market_id in self.markets, "Market does not exist"
+        market = self.markets[market_id].copy()
+        position = position_key(market_id, Txn.sender)
+        if not op.Box.create(
+            position, UInt64(POSITION_STAKES_OFFSET) + market.option_count.native * UInt64(POOL_SLOT_SIZE)
+        ):
+            return False
+
+        box_append(portfolio_key(Txn.sender), op.itob(market_id))
+        box_append(bettors_key(market_id, market.bettor_count.native // BETTOR_PAGE_SIZE), Txn.sender.bytes)
+        if market.bettor_count.native % BETTOR_PAGE_SIZE == 0:
+            op.Box.replace(position, UInt64(POSITION_PAGE_OFFSET), Bytes(b"\x01"))
+        return True
+
+    @subroutine
+    def _record_bet(self, market_id: UInt64, option_index: UInt64, amount: UInt64, new_bettor: bool) -> None:
+        """Validate a single bet by the caller and apply it to the pools and their open position."""
+        assert market_id in self.markets, "Market does not exist"
+        market = self.markets[market_id].copy()
+        assert market.status == STATUS_ACTIVE, "Market is not active"
+        assert Global.latest_timestamp < market.end_time.native, "Market has closed"
+        assert option_index < market.option_count.native, "Invalid option index"
+        assert amount >= TemplateVar[UInt64]("MIN_BET"), "Bet is below the minimum"
+
+        # Update the chosen option's 8-byte pool slot in place, so the cost of a
+        # bet does not depend on how many options the market has
+        offset = option_index * UInt64(POOL_SLOT_SIZE)
+        option_pool = add_to_slot(pools_key(market_id), offset, amount)
+
+        # Record the stake in the bettor's position
+        position = position_key(market_id, Txn.sender)
+        _stake = add_to_slot(position, UInt64(POSITION_STAKES_OFFSET) + offset, amount)
+        _total = add_to_slot(position, UInt64(POSITION_TOTAL_OFFSET), amount)
+
+        market.total_pool = arc4.UInt64(market.total_pool.native + amount)
+        market.version = arc4.UInt64(market.version.native + 1)
+
+        # Operational statistics, kept incrementally so reads are O(1)
+        market.bet_count = arc4.UInt64(market.bet_count.native + 1)
+        if new_bettor:
+            market.bettor_count = arc4.UInt64(market.bettor_count.native + 1)
+        if amount > market.max_bet.native:
+            market.max_bet = arc4.UInt64(amount)
+
+        # Write the record back once, rather than rewriting the box per field
+        self.markets[market_id] = market.copy()
+
+        arc4.emit(BetPlaced(
+            market_id=arc4.UInt64(market_id),
+            option=arc4.UInt64(option_index),
+            bettor=arc4.Address(Txn.sender),
+            amount=arc4.UInt64(amount),
+            new_option_pool=arc4.UInt64(option_pool),
+        ))
+
+    @subroutine
+    def _claim(self, market_id: UInt64, claimant: Account) -> UInt64:
+        """Mark a claimant's position in a settled market as claimed and return its payout.
+
+        Winners receive their winning stake times the market's payout ratio. If
+        nobody backed the winning option, every bettor is refunded their total stake.
+        """
+        assert market_id in self.markets, "Market does not exist"
+        market = self.markets[market_id].copy()
+        assert market.status == STATUS_SETTLED, "Market is not settled"
+
+        position = position_key(market_id, claimant)
+        _length, exists = op.Box.length(position)
+        assert exists, "No position in this market"
+        assert op.btoi(op.Box.extract(position, UInt64(POSITION_CLAIMED_OFFSET), UInt64(1))) == 0, "Winnings already claimed"
+        op.Box.replace(position, UInt64(POSITION_CLAIMED_OFFSET), Bytes(b"\x01"))
+
+        payout = position_payout(
+            position, market.winning_option.native, market.winning_pool.native, market.payout_ratio.native
+        )
+
+        self.markets[market_id].paid_out = arc4.UInt64(market.paid_out.native + payout)
+
+        arc4.emit(WinningsClaimed(
+            market_id=arc4.UInt64(market_id),
+            claimant=arc4.Address(claimant),
+            payout=arc4.UInt64(payout),
+        ))
+        return payout
+
+    @subroutine
+    def _settle(self, market_id: UInt64, winning_option: UInt64) -> None:
+        """Settle one market and fix its payout ratio, if the caller is its creator."""
+        assert market_id in self.markets, "Market does not exist"
+        market = self.markets[market_id].copy()
+
+        # Only the market's creator can settle
+        assert Txn.sender == market.creator.native, "Only market creator can settle"
+        assert market.status == STATUS_ACTIVE, "Market already settled"
+        assert Global.latest_timestamp >= market.end_time.native, "Market has not ended"
+        assert winning_option < market.option_count.native, "Invalid winning option"
+
+        # Fix the payout ratio once, so every claim is a single multiply. The
+        # ratio and each payout round down; the dust this leaves behind stays
+        # in the application account along with the rake.
+        winning_pool = op.btoi(
+            op.Box.extract(
+                pools_key(market_id),
+                winning_option * UInt64(POOL_SLOT_SIZE),
+                UInt64(POOL_SLOT_SIZE),
+            )
+        )
+        payout_ratio = UInt64(0)
+        if winning_pool:
+            total_pool = market.total_pool.native
+            net_pool = total_pool - mul_div(total_pool, TemplateVar[UInt64]("RAKE_BPS"), UInt64(BPS_DENOMINATOR))
+            payout_ratio = mul_div(net_pool, UInt64(PAYOUT_SCALE), winning_pool)
+
+        market.status = arc4.UInt64(STATUS_SETTLED)
+        market.winning_option = arc4.UInt64(winning_option)
+        market.winning_pool = arc4.UInt64(winning_pool)
+        market.payout_ratio = arc4.UInt64(payout_ratio)
+        market.version = arc4.UInt64(market.version.native + 1)
+        self.markets[market_id] = market.copy()
+
+        arc4.emit(MarketSettled(
+            market_id=arc4.UInt64(market_id),
+            winning_option=market.winning_option,
+            winning_pool=market.winning_pool,
+            payout_ratio=market.payout_ratio,
+        ))
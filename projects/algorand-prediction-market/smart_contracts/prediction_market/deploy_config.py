@@ -1,75 +1,161 @@
+import json
 import logging
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import algokit_utils
-from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.indexer import IndexerClient
+# algokit_utils is imported where it is used, so that `python -m smart_contracts build`,
+# which only reads template_params from here, need not load it
+if TYPE_CHECKING:
+    import algokit_utils
 
 logger = logging.getLogger(__name__)
 
+# ARC-56 app spec written by `python -m smart_contracts build`
+APP_SPEC_PATH = Path(__file__).parent.parent / "artifacts" / "prediction_market" / "PredictionMarket.arc56.json"
+
+# Default values of the contract's TMPL_ template variables. Each can be
+# overridden per network with a PREDICTION_MARKET_<NAME> environment variable
+# (e.g. in .env.testnet); the same values are used when building and deploying.
+TEMPLATE_DEFAULTS = {
+    "MIN_BET": 1_000_000,  # microALGO
+    "MAX_OPTIONS": 50,
+    "RAKE_BPS": 500,  # 5%
+}
+
+
+def template_params() -> dict[str, int]:
+    """Template variable values for the current environment."""
+    return {
+        name: int(os.environ.get(f"PREDICTION_MARKET_{name}", default))
+        for name, default in TEMPLATE_DEFAULTS.items()
+    }
+
+
+def legacy_app_spec() -> "algokit_utils.ApplicationSpecification":
+    """The built app spec in the ARC-32 form taken by algokit_utils' legacy ApplicationClient.
+
+    The tests and examples drive the contract through that client, so they
+    deploy exactly the program, methods and schema of the last build.
+    """
+    import algokit_utils
+
+    arc56 = json.loads(APP_SPEC_PATH.read_text())
+    schema = arc56["state"]["schema"]
+    methods = [
+        {
+            "name": method["name"],
+            "args": [{"type": arg["type"], "name": arg["name"]} for arg in method["args"]],
+            "returns": {"type": method["returns"]["type"]},
+        }
+        for method in arc56["methods"]
+    ]
+    signatures = {
+        method["name"]: f"{method['name']}({','.join(arg['type'] for arg in method['args'])}){method['returns']['type']}"
+        for method in methods
+    }
+    return algokit_utils.ApplicationSpecification.from_json(json.dumps({
+        "hints": {
+            signatures[method["name"]]: {"read_only": True}
+            for method in arc56["methods"]
+            if method.get("readonly")
+        },
+        "source": arc56["source"],
+        "state": {
+            scope: {"num_byte_slices": schema[scope]["bytes"], "num_uints": schema[scope]["ints"]}
+            for scope in ("global", "local")
+        },
+        "schema": {scope: {"declared": {}, "reserved": {}} for scope in ("global", "local")},
+        "contract": {"name": arc56["name"], "methods": methods},
+        # ARC-56 names on-completion actions NoOp, OptIn, ...; ARC-32 no_op, opt_in, ...
+        "bare_call_config": {
+            re.sub(r"(?<!^)(?=[A-Z])", "_", action).lower(): "CREATE"
+            for action in arc56["bareActions"]["create"]
+        },
+    }))
+
 
 # define deployment behaviour based on supplied app spec
-def deploy(
-    algod_client: AlgodClient,
-    indexer_client: IndexerClient,
-    app_spec: algokit_utils.ApplicationSpecification,
-    deployer: algokit_utils.Account,
-) -> None:
-
-    app_client = algokit_utils.ApplicationClient(
-        algod_client,
-        app_spec,
-        creator=deployer,
-        indexer_client=indexer_client,
+def deploy() -> None:
+    import algokit_utils
+
+    from smart_contracts.artifacts.prediction_market.prediction_market_client import (
+        CreateMarketArgs,
+        PredictionMarketFactory,
     )
+    from smart_contracts.prediction_market.helpers import market_deposit
 
-    # Deploy the application
-    app_client.deploy(
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+
+    params = template_params()
+    logger.info(f"Deploying with template values {params}")
+
+    factory = algorand.client.get_typed_app_factory(
+        PredictionMarketFactory,
+        default_sender=deployer_.address,
+        compilation_params={"deploy_time_params": params},
+    )
+
+    app_client, result = factory.deploy(
         on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
 
-    # Fund the application account with some ALGOs for operation
-    app_address = app_client.app_address
-    
-    # Fund with 10 ALGOs for contract operations
-    funding_amount = 10_000_000  # 10 ALGOs in microAlgos
-    
-    logger.info(f"Funding application account {app_address} with {funding_amount / 1_000_000} ALGOs")
-    
-    algokit_utils.ensure_funded(
-        algod_client,
-        algokit_utils.EnsureBalanceParameters(
-            account_to_fund=app_address,
-            min_spending_balance_micro_algos=funding_amount,
-            funding_source=deployer,
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # Fund with 10 ALGOs for contract operations; market creators and
+        # bettors pay the minimum balance of the boxes they create
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=10),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
         )
-    )
 
     logger.info("Prediction Market application deployed successfully!")
     logger.info(f"App ID: {app_client.app_id}")
-    logger.info(f"App Address: {app_address}")
-    
+    logger.info(f"App Address: {app_client.app_address}")
+
     # Optionally create a sample market for testing
     if logger.isEnabledFor(logging.INFO):
         try:
-            # Sample market creation
-            sample_title = "Chelsea vs Arsenal"
-            sample_options = ["Chelsea", "Draw", "Arsenal"]
-            sample_odds = [180, 320, 210]  # 1.80, 3.20, 2.10 odds
-            duration_hours = 24  # 24 hours betting window
-            
             logger.info("Creating sample market for testing...")
-            result = app_client.call(
-                "create_market",
-                title=sample_title,
-                options=sample_options,
-                odds=sample_odds,
-                duration_hours=duration_hours,
+            next_market_id = app_client.state.global_state.market_counter + 1
+            title = "Chelsea vs Arsenal"
+            options = ["Chelsea", "Draw", "Arsenal"]
+            odds = [180, 320, 210]  # 1.80, 3.20, 2.10 odds
+
+            # The creator pays the minimum balance of the market's boxes
+            deposit = market_deposit(title, options, odds)
+
+            response = app_client.send.create_market(
+                args=CreateMarketArgs(
+                    title=title,
+                    options=options,
+                    odds=odds,
+                    duration_hours=24,  # 24 hours betting window
+                    payment_txn=algorand.create_transaction.payment(
+                        algokit_utils.PaymentParams(
+                            amount=algokit_utils.AlgoAmount(micro_algo=deposit),
+                            sender=deployer_.address,
+                            receiver=app_client.app_address,
+                        )
+                    ),
+                ),
+                params=algokit_utils.CommonAppCallParams(
+                    box_references=[
+                        prefix + next_market_id.to_bytes(8, "big")
+                        for prefix in (b"m", b"p")
+                    ]
+                ),
             )
-            
-            market_id = result.return_value
-            logger.info(f"Sample market created with ID: {market_id}")
-            
+            logger.info(f"Sample market created with ID: {response.abi_return}")
+
         except Exception as e:
             logger.warning(f"Failed to create sample market: {e}")
 
@@ -79,12 +165,13 @@ def get_deploy_config() -> dict:
     """Get deployment configuration parameters."""
     return {
         "global_schema": {
-            "num_uints": 64,  # Sufficient for all global state variables
-            "num_byte_slices": 32,  # For strings and dynamic arrays
+            "num_uints": 3,  # market, string and option-set counters; records live in boxes
+            "num_byte_slices": 0,
         },
         "local_schema": {
-            "num_uints": 16,  # For user betting data
-            "num_byte_slices": 8,  # For user state arrays
+            "num_uints": 0,  # Positions live in boxes, so bettors never opt in
+            "num_byte_slices": 0,
         },
         "extra_pages": 2,  # Additional program pages for complex logic
+        "template_params": template_params(),
     }
@@ -0,0 +1,197 @@
+"""Client-side helpers shared by the tests and examples.
+
+Box keys mirror the prefixes the contract stores its records under, so they
+are derived in one place and a prefix change cannot drift between callers.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from functools import cache
+
+import algokit_utils
+from algokit_utils import ApplicationClient
+from algosdk.abi import ABIType
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.encoding import decode_address
+from algosdk.transaction import PaymentTxn, SuggestedParams, wait_for_confirmation
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+
+from smart_contracts.prediction_market.deploy_config import APP_SPEC_PATH
+
+# Most inner transactions one group may issue
+MAX_INNER_TXNS = 256
+
+# Minimum balance per box: 2500 microALGO plus 400 per byte of key and value
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+
+# Market record, pools and boundaries keys: a one-byte prefix and the market id
+MARKET_KEY_SIZE = 9
+
+# Bytes per option pool slot and per scalar market boundary
+SLOT_SIZE = 8
+
+
+def market_boxes(market_id: int) -> list[tuple[int, bytes]]:
+    """Box references for the record and packed option pools of ``market_id``."""
+    key = market_id.to_bytes(8, "big")
+    return [(0, b"m" + key), (0, b"p" + key)]
+
+
+def position_box(market_id: int, address: str) -> tuple[int, bytes]:
+    """Box reference for the position record of ``address`` in ``market_id``."""
+    return (0, b"u" + market_id.to_bytes(8, "big") + decode_address(address))
+
+
+def portfolio_box(address: str) -> tuple[int, bytes]:
+    """Box reference for the portfolio index of ``address``."""
+    return (0, b"i" + decode_address(address))
+
+
+def bettor_page_box(market_id: int, page: int = 0) -> tuple[int, bytes]:
+    """Box reference for one page (32 addresses) of the bettor index of ``market_id``."""
+    return (0, b"r" + market_id.to_bytes(8, "big") + page.to_bytes(8, "big"))
+
+
+def bet_boxes(market_id: int, address: str, bettor_page: int = 0) -> list[tuple[int, bytes]]:
+    """Box references touched when ``address`` bets on or claims from ``market_id``.
+
+    A first bet appends to the bettor index page ``bettor_page``, which is the
+    market's bettor count before the bet divided by 32.
+    """
+    return market_boxes(market_id) + [
+        position_box(market_id, address),
+        portfolio_box(address),
+        bettor_page_box(market_id, bettor_page),
+    ]
+
+
+def boundaries_box(market_id: int) -> tuple[int, bytes]:
+    """Box reference for the bucket boundaries of scalar market ``market_id``."""
+    return (0, b"b" + market_id.to_bytes(8, "big"))
+
+
+def string_box(string_id: int) -> tuple[int, bytes]:
+    """Box reference for the registered string with id ``string_id``."""
+    return (0, b"s" + string_id.to_bytes(8, "big"))
+
+
+def string_index_box(value: str) -> tuple[int, bytes]:
+    """Box reference for the hash index entry of the registered string ``value``."""
+    return (0, b"h" + hashlib.sha256(value.encode()).digest())
+
+
+def option_set_box(option_set_id: int) -> tuple[int, bytes]:
+    """Box reference for the option-set template with id ``option_set_id``."""
+    return (0, b"t" + option_set_id.to_bytes(8, "big"))
+
+
+def box_deposit(key_size: int, value_size: int) -> int:
+    """Minimum balance a box with these key and value sizes locks in the app account."""
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (key_size + value_size)
+
+
+@cache
+def _market_fields() -> tuple[tuple[str, str], ...]:
+    """Names and ARC-4 types of the Market struct fields, from the built app spec."""
+    fields = json.loads(APP_SPEC_PATH.read_text())["structs"]["Market"]
+    return tuple((field["name"], field["type"]) for field in fields)
+
+
+def market_record_size(
+    title: str,
+    options: Sequence[str] = (),
+    option_ids: Sequence[int] = (),
+    odds: Sequence[int] = (),
+) -> int:
+    """Size in bytes of the Market record a create call stores for these arguments.
+
+    Encodes the record with the built contract's struct layout, so the size
+    follows any change to its fields. Markets with inline option names leave
+    option_ids empty and the others leave options empty.
+    """
+    dynamic = {"title": title, "options": list(options), "option_ids": list(option_ids), "odds": list(odds)}
+    fields = _market_fields()
+    record_type = ABIType.from_string(f"({','.join(arc4_type for _, arc4_type in fields)})")
+    return len(record_type.encode([
+        dynamic[name] if name in dynamic else bytes(32) if arc4_type == "address" else 0
+        for name, arc4_type in fields
+    ]))
+
+
+def market_deposit(
+    title: str,
+    options: Sequence[str] = (),
+    odds: Sequence[int] = (),
+    option_ids: Sequence[int] = (),
+    boundaries: Sequence[int] = (),
+) -> int:
+    """Box deposit a create call pays: the minimum balance of the market's boxes.
+
+    Covers the record, the packed option pools and, for a scalar market, its
+    boundaries; archive_market returns it to the market's creator.
+    """
+    deposit = box_deposit(MARKET_KEY_SIZE, market_record_size(title, options, option_ids, odds))
+    deposit += box_deposit(MARKET_KEY_SIZE, SLOT_SIZE * len(odds))
+    if boundaries:
+        deposit += box_deposit(MARKET_KEY_SIZE, SLOT_SIZE * len(boundaries))
+    return deposit
+
+
+def count_inner_txns(txn_result: dict) -> int:
+    """Count the inner transactions (at any depth) in a simulated transaction result."""
+    inner_txns = txn_result.get("inner-txns", [])
+    return len(inner_txns) + sum(count_inner_txns(inner) for inner in inner_txns)
+
+
+def padded_fee_params(
+    app_client: ApplicationClient,
+    method: str,
+    transaction_parameters: dict | None = None,
+    **kwargs,
+) -> SuggestedParams:
+    """Suggested params whose flat fee covers ``method`` and every inner transaction it issues.
+
+    Simulates the call once with the largest fee a group can need, counts the
+    inner transactions it issued (payouts and OpUp budget calls) and returns
+    params paying for exactly those, so heavy calls fit in a single group.
+    """
+    sp = app_client.algod_client.suggested_params()
+    sp.flat_fee = True
+    sp.fee = (1 + MAX_INNER_TXNS) * sp.min_fee
+
+    atc = AtomicTransactionComposer()
+    app_client.compose_call(
+        atc,
+        method,
+        transaction_parameters={**(transaction_parameters or {}), "suggested_params": sp},
+        **kwargs,
+    )
+    result = atc.simulate(app_client.algod_client, SimulateRequest(txn_groups=[]))
+    if result.failure_message:
+        raise Exception(f"Simulating {method} failed: {result.failure_message}")
+
+    txn_result = result.simulate_response["txn-groups"][0]["txn-results"][-1]["txn-result"]
+    sp.fee = (1 + count_inner_txns(txn_result)) * sp.min_fee
+    return sp
+
+
+def advance_time(algod_client: AlgodClient, seconds: int) -> None:
+    """Move LocalNet's clock forward by minting one block ``seconds`` after the last."""
+    dispenser = algokit_utils.get_localnet_default_account(algod_client)
+    algod_client.set_timestamp_offset(seconds)
+    try:
+        txn = PaymentTxn(
+            sender=dispenser.address,
+            sp=algod_client.suggested_params(),
+            receiver=dispenser.address,
+            amt=0,
+            note=os.urandom(8),
+        )
+        txid = algod_client.send_transaction(txn.sign(dispenser.private_key))
+        wait_for_confirmation(algod_client, txid)
+    finally:
+        algod_client.set_timestamp_offset(0)
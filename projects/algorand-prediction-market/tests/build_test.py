@@ -0,0 +1,373 @@
+"""Unit tests for the build pipeline in smart_contracts/__main__.py.
+
+The compile and client generation steps are replaced by fakes that write
+placeholder artifacts, so these tests need neither LocalNet nor the compiler.
+"""
+
+import errno
+import importlib
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+build_module = importlib.import_module("smart_contracts.__main__")
+
+CONTRACT_SOURCE = "from .helpers import GREETING\n\nclass Contract:\n    greeting = GREETING\n"
+
+
+class FakeToolchain:
+    """Stands in for the subprocess backend's compile and client generation steps."""
+
+    def __init__(self) -> None:
+        self.compiled: list[Path] = []
+
+    def compile(self, contract_path: Path, output_dir: Path, compile_args: list[str]) -> None:
+        self.compiled.append(contract_path)
+        (output_dir / "Contract.approval.teal").write_text(contract_path.read_text() + json.dumps(compile_args))
+        (output_dir / "Contract.arc56.json").write_text(json.dumps({"name": "Contract"}))
+
+    def generate_client(self, app_spec_path: Path, output_dir: Path) -> None:
+        (output_dir / "contract_client.py").write_text(app_spec_path.read_text())
+
+
+@pytest.fixture
+def toolchain(monkeypatch: pytest.MonkeyPatch) -> FakeToolchain:
+    fake = FakeToolchain()
+    monkeypatch.setattr(build_module, "_compile_with_algokit", fake.compile)
+    monkeypatch.setattr(build_module, "_generate_client_with_algokit", fake.generate_client)
+    return fake
+
+
+def write_contract(tmp_path: Path, name: str) -> Path:
+    """Writes a contract that imports a local module, in its own package directory."""
+    package = tmp_path / "contracts" / name
+    package.mkdir(parents=True)
+    (package / "helpers.py").write_text('GREETING = "hello"\n')
+    path = package / "contract.py"
+    path.write_text(CONTRACT_SOURCE)
+    return path
+
+
+@pytest.fixture
+def contract_path(tmp_path: Path) -> Path:
+    return write_contract(tmp_path, "example")
+
+
+def build(tmp_path: Path, contract_path: Path, template_params: dict[str, int] | None = None) -> Path:
+    return build_module.build(tmp_path / "artifacts" / "example", contract_path, template_params, "subprocess")
+
+
+def test_build_reuses_cached_artifacts(tmp_path: Path, contract_path: Path, toolchain: FakeToolchain):
+    first = build(tmp_path, contract_path)
+    second = build(tmp_path, contract_path)
+
+    assert toolchain.compiled == [contract_path]
+    assert first == second == (tmp_path / "artifacts" / "example" / "Contract.arc56.json").resolve()
+
+
+def test_build_cache_invalidated_by_contract_change(
+    tmp_path: Path, contract_path: Path, toolchain: FakeToolchain
+):
+    build(tmp_path, contract_path)
+    contract_path.write_text(CONTRACT_SOURCE + "\n# changed\n")
+    build(tmp_path, contract_path)
+
+    assert len(toolchain.compiled) == 2
+    assert "# changed" in (tmp_path / "artifacts" / "example" / "Contract.approval.teal").read_text()
+
+
+def test_build_cache_invalidated_by_local_import_change(
+    tmp_path: Path, contract_path: Path, toolchain: FakeToolchain
+):
+    build(tmp_path, contract_path)
+    (contract_path.parent / "helpers.py").write_text('GREETING = "goodbye"\n')
+    build(tmp_path, contract_path)
+
+    assert len(toolchain.compiled) == 2
+
+
+def test_build_cache_invalidated_by_template_params(
+    tmp_path: Path, contract_path: Path, toolchain: FakeToolchain
+):
+    build(tmp_path, contract_path, {"MIN_BET": 1})
+    build(tmp_path, contract_path, {"MIN_BET": 1})
+    build(tmp_path, contract_path, {"MIN_BET": 2})
+
+    assert len(toolchain.compiled) == 2
+
+
+def test_build_cache_misses_when_an_artifact_is_missing(
+    tmp_path: Path, contract_path: Path, toolchain: FakeToolchain
+):
+    build(tmp_path, contract_path)
+    (tmp_path / "artifacts" / "example" / "contract_client.py").unlink()
+    build(tmp_path, contract_path)
+
+    assert len(toolchain.compiled) == 2
+    assert (tmp_path / "artifacts" / "example" / "contract_client.py").is_file()
+
+
+def test_cached_build_ignores_an_unreadable_cache_file(
+    tmp_path: Path, contract_path: Path, toolchain: FakeToolchain
+):
+    build(tmp_path, contract_path)
+    output_dir = tmp_path / "artifacts" / "example"
+    (output_dir / build_module.BUILD_CACHE_FILE).write_text("not json")
+
+    cache_key = build_module.build_cache_key(contract_path, build_module._compile_args(None))
+    assert build_module._cached_build(output_dir, cache_key) is None
+
+
+def test_build_entry_point_does_not_load_the_toolchain():
+    """A build with current artifacts is decided before the compiler or algokit_utils is imported."""
+    project_root = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, smart_contracts.__main__; "
+            "print(sorted({'algokit_utils', 'puyapy'} & set(sys.modules)))",
+        ],
+        cwd=project_root,
+        env={**os.environ, "PYTHONPATH": str(project_root)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+class SerialExecutor:
+    """Stands in for the process pool, running each submitted build as it is submitted."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.submitted: list[Path] = []
+
+    def __enter__(self) -> "SerialExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def submit(self, fn, *args) -> Future:
+        self.submitted.append(args[1])
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, cancel_futures: bool = False) -> None:
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> list[SerialExecutor]:
+    """The executors build_all creates, with enough workers that it always uses one."""
+    executors: list[SerialExecutor] = []
+
+    def executor(max_workers: int) -> SerialExecutor:
+        executors.append(SerialExecutor(max_workers))
+        return executors[-1]
+
+    monkeypatch.setenv("BUILD_WORKERS", "4")
+    monkeypatch.setattr(build_module, "ProcessPoolExecutor", executor)
+    return executors
+
+
+def contracts(tmp_path: Path, names: list[str]) -> list:
+    return [build_module.SmartContract(path=write_contract(tmp_path, name), name=name) for name in names]
+
+
+def test_build_all_keeps_cached_contracts_off_the_pool(
+    tmp_path: Path, toolchain: FakeToolchain, pool: list[SerialExecutor]
+):
+    to_build = contracts(tmp_path, ["first", "second"])
+    for contract in to_build:
+        build_module.build(tmp_path / "artifacts" / contract.name, contract.path, None, "subprocess")
+
+    results = build_module.build_all(tmp_path / "artifacts", to_build)
+
+    assert pool == []
+    assert results == [
+        (tmp_path / "artifacts" / name / "Contract.arc56.json").resolve() for name in ("first", "second")
+    ]
+
+
+def test_build_all_sends_only_stale_contracts_to_the_pool(
+    tmp_path: Path,
+    toolchain: FakeToolchain,
+    pool: list[SerialExecutor],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+):
+    to_build = contracts(tmp_path, ["first", "second", "third"])
+    build_module.build(tmp_path / "artifacts" / "second", to_build[1].path, None, "subprocess")
+    monkeypatch.setenv("BUILD_BACKEND", "subprocess")
+
+    with caplog.at_level("INFO"):
+        results = build_module.build_all(tmp_path / "artifacts", to_build)
+
+    assert [executor.submitted for executor in pool] == [[to_build[0].path, to_build[2].path]]
+    assert results == [
+        (tmp_path / "artifacts" / name / "Contract.arc56.json").resolve() for name in ("first", "second", "third")
+    ]
+    # Each contract's logs are replayed as one block, in contract order
+    building = [message for message in caplog.messages if message.startswith("Building app at")]
+    assert building == [f"Building app at {contract.path}" for contract in to_build]
+
+
+def test_build_all_raises_the_first_failure(
+    tmp_path: Path, toolchain: FakeToolchain, pool: list[SerialExecutor], monkeypatch: pytest.MonkeyPatch
+):
+    to_build = contracts(tmp_path, ["first", "second"])
+    monkeypatch.setenv("BUILD_BACKEND", "subprocess")
+
+    def compile(contract_path: Path, output_dir: Path, compile_args: list[str]) -> None:
+        if contract_path == to_build[1].path:
+            raise Exception("syntax error")
+        toolchain.compile(contract_path, output_dir, compile_args)
+
+    monkeypatch.setattr(build_module, "_compile_with_algokit", compile)
+
+    with pytest.raises(Exception, match="Could not build second: syntax error"):
+        build_module.build_all(tmp_path / "artifacts", to_build)
+    # The failed build left nothing behind, not even its staging directory
+    assert sorted(path.name for path in (tmp_path / "artifacts").iterdir()) == ["first"]
+
+
+def _missing_toolchain() -> str | None:
+    """Why the real compiler cannot be used here, if it cannot."""
+    if shutil.which("algokit") is None:
+        return "the algokit CLI is not installed"
+    for module in ("puyapy", "algokit_client_generator"):
+        if importlib.util.find_spec(module) is None:
+            return f"{module} is not installed"
+    return None
+
+
+@pytest.mark.skipif(_missing_toolchain() is not None, reason=str(_missing_toolchain()))
+def test_backends_build_identical_artifacts(tmp_path: Path):
+    """The in-process backend writes byte for byte what the algokit CLI does."""
+    contract = next(contract for contract in build_module.contracts if contract.name == "prediction_market")
+    template_params = contract.template_params() if contract.template_params else None
+
+    artifacts = {}
+    for backend in build_module.BUILD_BACKENDS:
+        output_dir = tmp_path / backend / contract.name
+        build_module.build(output_dir, contract.path, template_params, backend)
+        artifacts[backend] = {path.name: path.read_bytes() for path in output_dir.iterdir()}
+
+    assert artifacts["inprocess"] == artifacts["subprocess"]
+
+
+def staged_build(tmp_path: Path, name: str, content: str) -> Path:
+    """A completed build in a staging directory next to the artifacts directory."""
+    staging_dir = tmp_path / f".example.build-{name}"
+    staging_dir.mkdir()
+    (staging_dir / "Contract.approval.teal").write_text(content)
+    return staging_dir
+
+
+def assert_published(tmp_path: Path, output_dir: Path, content: str) -> None:
+    """output_dir holds the build with content, and no staging or set-aside directory is left."""
+    assert (output_dir / "Contract.approval.teal").read_text() == content
+    assert [path.name for path in tmp_path.iterdir()] == [output_dir.name]
+
+
+def test_publish_first_build(tmp_path: Path):
+    output_dir = tmp_path / "example"
+    build_module.publish_artifacts(staged_build(tmp_path, "new", "new"), output_dir)
+
+    assert_published(tmp_path, output_dir, "new")
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="renameat2 is Linux only")
+def test_publish_exchanges_directories(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    output_dir = tmp_path / "example"
+    build_module.publish_artifacts(staged_build(tmp_path, "old", "old"), output_dir)
+    exchanged = []
+    exchange = build_module._exchange_directories
+
+    def record_exchange(first: Path, second: Path) -> bool:
+        exchanged.append(exchange(first, second))
+        return exchanged[-1]
+
+    monkeypatch.setattr(build_module, "_exchange_directories", record_exchange)
+    build_module.publish_artifacts(staged_build(tmp_path, "new", "new"), output_dir)
+
+    if exchanged != [True]:
+        pytest.skip("the filesystem does not support RENAME_EXCHANGE")
+    assert_published(tmp_path, output_dir, "new")
+
+
+@pytest.mark.parametrize(
+    "libc",
+    [
+        pytest.param(SimpleNamespace(), id="no renameat2"),
+        pytest.param(SimpleNamespace(renameat2=lambda *args: -1), id="renameat2 fails with ENOSYS"),
+    ],
+)
+def test_publish_falls_back_without_renameat2(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, libc: SimpleNamespace
+):
+    output_dir = tmp_path / "example"
+    build_module.publish_artifacts(staged_build(tmp_path, "old", "old"), output_dir)
+    monkeypatch.setattr(build_module.sys, "platform", "linux")
+    monkeypatch.setattr(build_module.ctypes, "CDLL", lambda *args, **kwargs: libc)
+    monkeypatch.setattr(build_module.ctypes, "get_errno", lambda: errno.ENOSYS)
+
+    build_module.publish_artifacts(staged_build(tmp_path, "new", "new"), output_dir)
+
+    assert_published(tmp_path, output_dir, "new")
+
+
+def test_exchange_directories_raises_other_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(build_module.sys, "platform", "linux")
+    monkeypatch.setattr(build_module.ctypes, "CDLL", lambda *args, **kwargs: SimpleNamespace(renameat2=lambda *args: -1))
+    monkeypatch.setattr(build_module.ctypes, "get_errno", lambda: errno.EACCES)
+
+    with pytest.raises(PermissionError):
+        build_module._exchange_directories(tmp_path / "first", tmp_path / "second")
+
+
+def touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_watch_rebuilds_once_per_burst_of_saves(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    to_watch = contracts(tmp_path, ["first", "second"])
+    first_module = to_watch[0].path.parent / "helpers.py"
+    rebuilds: list[list[str]] = []
+    monkeypatch.setattr(
+        build_module,
+        "_rebuild",
+        lambda artifact_path, to_build, deploy: rebuilds.append([contract.name for contract in to_build]),
+    )
+
+    # Each sleep runs the next step: a quiet poll, a burst of three saves to the first
+    # contract's sources, and then Ctrl+C once the burst has been rebuilt.
+    steps = [
+        lambda: None,
+        lambda: touch(to_watch[0].path, 1_000),
+        lambda: touch(first_module, 2_000),
+        lambda: touch(to_watch[0].path, 3_000),
+        lambda: None,
+        lambda: None,
+    ]
+
+    def sleep(seconds: float) -> None:
+        if not steps:
+            raise KeyboardInterrupt
+        steps.pop(0)()
+
+    monkeypatch.setattr(build_module.time, "sleep", sleep)
+    build_module.watch(tmp_path / "artifacts", to_watch)
+
+    assert rebuilds == [["first", "second"], ["first"]]
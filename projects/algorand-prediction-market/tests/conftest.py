@@ -0,0 +1,16 @@
+import pytest
+import algokit_utils
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+
+@pytest.fixture(scope="session")
+def algod_client() -> AlgodClient:
+    """Algod client for the LocalNet the tests run against."""
+    return algokit_utils.get_algod_client(algokit_utils.get_default_localnet_config("algod"))
+
+
+@pytest.fixture(scope="session")
+def indexer_client() -> IndexerClient:
+    """Indexer client for the LocalNet the tests run against."""
+    return algokit_utils.get_indexer_client(algokit_utils.get_default_localnet_config("indexer"))
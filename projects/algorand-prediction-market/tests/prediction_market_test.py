@@ -1,10 +1,224 @@
+import base64
+import copy
+
 import pytest
 import algokit_utils
 from algokit_utils import ApplicationClient
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from algosdk.account import generate_account
-from algosdk.transaction import PaymentTxn
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.encoding import checksum, decode_address
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.prediction_market.deploy_config import TEMPLATE_DEFAULTS, legacy_app_spec
+from smart_contracts.prediction_market.helpers import (
+    advance_time,
+    bet_boxes,
+    bettor_page_box,
+    boundaries_box,
+    box_deposit,
+    market_boxes,
+    market_deposit,
+    option_set_box,
+    padded_fee_params,
+    portfolio_box,
+    position_box,
+    string_box,
+    string_index_box,
+)
+
+# Most box references one app call can carry
+MAX_BOX_REFERENCES = 8
+
+# Most account references one app call can carry
+MAX_ACCOUNT_REFERENCES = 4
+
+# Most bettors one distribute call visits (MAX_DISTRIBUTE_BATCH in the contract)
+MAX_DISTRIBUTE_BATCH = 10
+
+
+def position_deposit(option_count: int, new_portfolio: bool = True, opens_page: bool = True) -> int:
+    """Box deposit a bettor's first bet in a market pays on top of the stake.
+
+    Covers the position box, the bettor's portfolio index entry (the whole box
+    for their first market) and their slot in the market's bettor index (the
+    whole page for the first bettor on it). close_positions refunds it.
+    """
+    deposit = box_deposit(41, 10 + 8 * option_count)
+    deposit += box_deposit(33, 8) if new_portfolio else 400 * 8
+    deposit += box_deposit(17, 32) if opens_page else 400 * 32
+    return deposit
+
+
+def with_deposit(app_client: ApplicationClient, **market_args) -> dict:
+    """Market creation arguments plus the payment of the market's box deposit.
+
+    Options without names are registered string ids, one per odds entry,
+    unless the market is scalar.
+    """
+    named = "options" in market_args or "boundaries" in market_args
+    deposit = market_deposit(
+        market_args["title"],
+        options=market_args.get("options", []),
+        odds=market_args["odds"],
+        option_ids=[] if named else [0] * len(market_args["odds"]),
+        boundaries=market_args.get("boundaries", []),
+    )
+    return {**market_args, "payment_txn": deposit_payment(app_client, deposit)}
+
+
+def deposit_payment(app_client: ApplicationClient, amount: int) -> PaymentTxn:
+    """Payment of a box deposit from the app client's sender to the app."""
+    return PaymentTxn(
+        sender=app_client.sender,
+        receiver=app_client.app_address,
+        amt=amount,
+        sp=app_client.algod_client.suggested_params(),
+    )
+
+
+def next_market_boxes(app_client: ApplicationClient) -> list[tuple[int, bytes]]:
+    """Box references for the market the next ``create_market`` call will store."""
+    return market_boxes(app_client.get_global_state().get("market_counter", 0) + 1)
+
+
+def call_with_shared_boxes(
+    app_client: ApplicationClient,
+    method: str,
+    boxes: list[tuple[int, bytes]],
+    transaction_parameters: dict | None = None,
+    accounts: list[str] | None = None,
+    **kwargs,
+):
+    """Call ``method`` with more box references than one app call can carry.
+
+    The references beyond the first eight, and any ``accounts`` (such as the
+    receivers of inner payments), ride on get_market_count calls grouped
+    before it; box and account references are shared across a group.
+    """
+    atc = AtomicTransactionComposer()
+    extra_boxes = boxes[MAX_BOX_REFERENCES:]
+    for start in range(0, len(extra_boxes), MAX_BOX_REFERENCES):
+        app_client.compose_call(
+            atc,
+            "get_market_count",
+            transaction_parameters={"boxes": extra_boxes[start:start + MAX_BOX_REFERENCES]},
+        )
+    accounts = accounts or []
+    for start in range(0, len(accounts), MAX_ACCOUNT_REFERENCES):
+        app_client.compose_call(
+            atc,
+            "get_market_count",
+            transaction_parameters={"accounts": accounts[start:start + MAX_ACCOUNT_REFERENCES]},
+        )
+    app_client.compose_call(
+        atc,
+        method,
+        transaction_parameters={**(transaction_parameters or {}), "boxes": boxes[:MAX_BOX_REFERENCES]},
+        **kwargs,
+    )
+    return atc.execute(app_client.algod_client, 4).abi_results[-1]
+
+
+def new_bettors(
+    app_client: ApplicationClient,
+    algod_client: AlgodClient,
+    market_id: int,
+    count: int,
+    option_index: int,
+) -> list[algokit_utils.Account]:
+    """Fund ``count`` new accounts and have each stake 1 ALGO on ``option_index`` of ``market_id``.
+
+    ``market_id`` must have no bettors yet, so the bettors fill its index in order.
+    """
+    bettors = []
+    for index in range(count):
+        private_key, address = generate_account()
+        algokit_utils.ensure_funded(
+            algod_client,
+            algokit_utils.EnsureBalanceParameters(
+                account_to_fund=address,
+                min_spending_balance_micro_algos=2_000_000,
+            ),
+        )
+        bettor = algokit_utils.Account(private_key=private_key, address=address)
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, address, index // 32)},
+            market_id=market_id,
+            option_index=option_index,
+            payment_txn=PaymentTxn(
+                sender=address,
+                receiver=app_client.app_address,
+                amt=1_000_000 + position_deposit(2, opens_page=index % 32 == 0),
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor,
+        )
+        bettors.append(bettor)
+    return bettors
+
+
+def free_params(sp: SuggestedParams) -> SuggestedParams:
+    """A copy of ``sp`` paying no fee, for transactions whose fee another one in the group pools."""
+    free = copy.copy(sp)
+    free.flat_fee = True
+    free.fee = 0
+    return free
+
+
+def compose_distribute(
+    atc: AtomicTransactionComposer,
+    app_client: ApplicationClient,
+    market_id: int,
+    cursor: int,
+    bettors: list[algokit_utils.Account],
+    sp: SuggestedParams,
+) -> None:
+    """Add a distribute call over ``bettors``, the next entries of the index from ``cursor``, to ``atc``.
+
+    The call needs the market record, the index pages the batch spans and
+    each bettor's position box and account. A transaction carries at most 8
+    references, 4 of them accounts, so two get_market_count calls grouped
+    before it carry 4 accounts and 4 boxes each. The first of the three pays
+    ``sp``'s flat fee and the other two none.
+    """
+    pages = sorted({index // 32 for index in range(cursor, cursor + len(bettors))})
+    boxes = market_boxes(market_id)[:1] + [bettor_page_box(market_id, page) for page in pages] + [
+        position_box(market_id, bettor.address) for bettor in bettors
+    ]
+    accounts = [bettor.address for bettor in bettors]
+    free = free_params(sp)
+    for carrier in range(2):
+        refs = slice(carrier * MAX_ACCOUNT_REFERENCES, (carrier + 1) * MAX_ACCOUNT_REFERENCES)
+        app_client.compose_call(
+            atc,
+            "get_market_count",
+            transaction_parameters={
+                "boxes": boxes[refs],
+                "accounts": accounts[refs],
+                "suggested_params": sp if carrier == 0 else free,
+            },
+        )
+    app_client.compose_call(
+        atc,
+        "distribute",
+        transaction_parameters={
+            "boxes": boxes[2 * MAX_ACCOUNT_REFERENCES:],
+            "accounts": accounts[2 * MAX_ACCOUNT_REFERENCES:],
+            "suggested_params": free,
+        },
+        market_id=market_id,
+        cursor=cursor,
+        max_bettors=len(bettors),
+    )
+
+
+def register_string_boxes(app_client: ApplicationClient, value: str) -> list[tuple[int, bytes]]:
+    """Box references for the hash index entry of ``value`` and the string box it may create."""
+    next_string_id = app_client.get_global_state().get("string_counter", 0) + 1
+    return [string_index_box(value), string_box(next_string_id)]
 
 
 class TestPredictionMarket:
@@ -32,48 +246,17 @@ class TestPredictionMarket:
             ),
         )
 
-        # Create application client
-        app_spec = algokit_utils.ApplicationSpecification.from_json({
-            "hints": {},
-            "source": {
-                "approval": "",
-                "clear": ""
-            },
-            "state": {
-                "global": {
-                    "num_byte_slices": 32,
-                    "num_uints": 64
-                },
-                "local": {
-                    "num_byte_slices": 8,
-                    "num_uints": 16
-                }
-            },
-            "schema": {
-                "global": {
-                    "declared": {},
-                    "reserved": {}
-                },
-                "local": {
-                    "declared": {},
-                    "reserved": {}
-                }
-            },
-            "contract": {
-                "name": "PredictionMarket",
-                "methods": []
-            }
-        })
-
+        # Create application client for the built contract
         app_client = ApplicationClient(
             algod_client=algod_client,
-            app_spec=app_spec,
+            app_spec=legacy_app_spec(),
             creator=deployer,
             indexer_client=indexer_client,
         )
 
         # Deploy the application
         app_client.deploy(
+            template_values=TEMPLATE_DEFAULTS,
             on_schema_break=algokit_utils.OnSchemaBreak.ReplaceApp,
             on_update=algokit_utils.OnUpdate.UpdateApp,
         )
@@ -117,10 +300,14 @@ class TestPredictionMarket:
         # Create market
         result = app_client.call(
             "create_market",
-            title=title,
-            options=options,
-            odds=odds,
-            duration_hours=duration_hours,
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title=title,
+                options=options,
+                odds=odds,
+                duration_hours=duration_hours,
+            ),
         )
 
         market_id = result.return_value
@@ -129,6 +316,7 @@ class TestPredictionMarket:
         # Verify market info
         market_info = app_client.call(
             "get_market_info",
+            transaction_parameters={"boxes": market_boxes(market_id)},
             market_id=market_id,
         )
 
@@ -144,30 +332,200 @@ class TestPredictionMarket:
         with pytest.raises(Exception):
             app_client.call(
                 "create_market",
-                title="Invalid Market",
-                options=["Only One"],
-                odds=[200],
-                duration_hours=24,
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Invalid Market",
+                    options=["Only One"],
+                    odds=[200],
+                    duration_hours=24,
+                ),
             )
 
         # Test with mismatched options and odds
         with pytest.raises(Exception):
             app_client.call(
                 "create_market",
-                title="Mismatched Market",
-                options=["Option1", "Option2"],
-                odds=[200],  # Only one odd for two options
-                duration_hours=24,
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Mismatched Market",
+                    options=["Option1", "Option2"],
+                    odds=[200],  # Only one odd for two options
+                    duration_hours=24,
+                ),
             )
 
         # Test with invalid odds (too low)
         with pytest.raises(Exception):
             app_client.call(
                 "create_market",
-                title="Low Odds Market",
-                options=["Option1", "Option2"],
-                odds=[50, 200],  # 0.50 odds too low
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Low Odds Market",
+                    options=["Option1", "Option2"],
+                    odds=[50, 200],  # 0.50 odds too low
+                    duration_hours=24,
+                ),
+            )
+
+        # Test with invalid odds (too high)
+        with pytest.raises(Exception):
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="High Odds Market",
+                    options=["Option1", "Option2"],
+                    odds=[200, 10_001],  # above 100.00 odds
+                    duration_hours=24,
+                ),
+            )
+
+        # Test with a deposit short of the minimum balance of the market's boxes
+        market_args = with_deposit(
+            app_client,
+            title="Underfunded Market",
+            options=["Yes", "No"],
+            odds=[200, 200],
+            duration_hours=24,
+        )
+        market_args["payment_txn"].amt -= 1
+        with pytest.raises(Exception):
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **market_args,
+            )
+
+        # Test with more options than TMPL_MAX_OPTIONS allows
+        option_count = TEMPLATE_DEFAULTS["MAX_OPTIONS"] + 1
+        with pytest.raises(Exception):
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Crowded Market",
+                    options=[f"Option{i}" for i in range(option_count)],
+                    odds=[200] * option_count,
+                    duration_hours=24,
+                ),
+            )
+
+    def test_create_market_max_options(self, app_client: ApplicationClient):
+        """Test creating a market with the most options allowed, padding the fee for OpUp calls."""
+        option_count = TEMPLATE_DEFAULTS["MAX_OPTIONS"]
+        market_args = with_deposit(
+            app_client,
+            title="Crowded Market",
+            options=[f"Option{i}" for i in range(option_count)],
+            odds=[200] * option_count,
+            duration_hours=24,
+        )
+        boxes = next_market_boxes(app_client)
+        sp = padded_fee_params(app_client, "create_market", {"boxes": boxes}, **market_args)
+
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": boxes, "suggested_params": sp},
+            **market_args,
+        ).return_value
+
+        market_data = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+        ).return_value
+        assert len(market_data[1]) == option_count
+        assert market_data[3] == [0] * option_count
+
+    def test_string_registry(self, app_client: ApplicationClient):
+        """Test creating markets from registered strings and option-set templates."""
+
+        def register(value: str, new: bool = True) -> int:
+            # A new string pays for its string box and its hash index entry
+            deposit = box_deposit(9, 2 + len(value.encode())) + box_deposit(33, 8) if new else 0
+            return app_client.call(
+                "register_string",
+                transaction_parameters={"boxes": register_string_boxes(app_client, value)},
+                value=value,
+                payment_txn=deposit_payment(app_client, deposit),
+            ).return_value
+
+        home, draw, away = register("Home"), register("Draw"), register("Away")
+        assert register("Draw", new=False) == draw, "Registering a string again should return its id"
+
+        # Registering a known string takes no deposit
+        with pytest.raises(Exception):
+            app_client.call(
+                "register_string",
+                transaction_parameters={"boxes": register_string_boxes(app_client, "Draw")},
+                value="Draw",
+                payment_txn=deposit_payment(app_client, box_deposit(9, 6) + box_deposit(33, 8)),
+            )
+
+        next_option_set_id = app_client.get_global_state().get("option_set_counter", 0) + 1
+        option_set_id = app_client.call(
+            "register_option_set",
+            transaction_parameters={"boxes": [option_set_box(next_option_set_id)]},
+            string_ids=[home, draw, away],
+            payment_txn=deposit_payment(app_client, box_deposit(9, 2 + 2 * 3)),
+        ).return_value
+
+        template_market_id = app_client.call(
+            "create_market_from_template",
+            transaction_parameters={"boxes": next_market_boxes(app_client) + [option_set_box(option_set_id)]},
+            **with_deposit(
+                app_client,
+                title="Derby",
+                option_set_id=option_set_id,
+                odds=[180, 320, 210],
+                duration_hours=24,
+            ),
+        ).return_value
+
+        city, arsenal = register("Manchester City"), register("Arsenal")
+        ids_market_id = app_client.call(
+            "create_market_with_ids",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Manchester City vs Arsenal",
+                option_ids=[city, draw, arsenal],
+                odds=[180, 320, 220],
                 duration_hours=24,
+            ),
+        ).return_value
+
+        for market_id, string_ids, names in (
+            (template_market_id, [home, draw, away], ["Home", "Draw", "Away"]),
+            (ids_market_id, [city, draw, arsenal], ["Manchester City", "Draw", "Arsenal"]),
+        ):
+            market_data = app_client.call(
+                "get_market_info",
+                transaction_parameters={
+                    "boxes": market_boxes(market_id) + [string_box(string_id) for string_id in string_ids]
+                },
+                market_id=market_id,
+            ).return_value
+            assert market_data[1] == names
+            assert len(market_data[3]) == 3
+
+        # Unregistered string ids are rejected
+        with pytest.raises(Exception):
+            app_client.call(
+                "create_market_with_ids",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Unknown Teams",
+                    option_ids=[city, 65_000],
+                    odds=[200, 200],
+                    duration_hours=24,
+                ),
             )
 
     def test_place_bet(
@@ -185,53 +543,58 @@ class TestPredictionMarket:
 
         create_result = app_client.call(
             "create_market",
-            title=title,
-            options=options,
-            odds=odds,
-            duration_hours=duration_hours,
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title=title,
+                options=options,
+                odds=odds,
+                duration_hours=duration_hours,
+            ),
         )
         market_id = create_result.return_value
 
-        # Opt the bettor into the application
-        app_client.opt_in(signer=bettor_account)
-
         # Place a bet on option 0 (Real Madrid)
         bet_amount = 2_000_000  # 2 ALGOs
         option_index = 0
 
-        # Create payment transaction
+        # Create payment transaction; a first bet also pays for the boxes it creates
         payment_txn = PaymentTxn(
             sender=bettor_account.address,
             receiver=app_client.app_address,
-            amt=bet_amount,
+            amt=bet_amount + position_deposit(len(options)),
             sp=algod_client.suggested_params(),
         )
 
         # Place bet
-        app_client.call(
+        bet_result = app_client.call(
             "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
             market_id=market_id,
             option_index=option_index,
             payment_txn=payment_txn,
             signer=bettor_account,
         )
 
-        # Verify market state updated
-        market_info = app_client.call(
-            "get_market_info",
-            market_id=market_id,
-        )
-        market_data = market_info.return_value
-        assert market_data[4] == bet_amount, "Total pool should equal bet amount"
+        # Verify the returned post-bet state:
+        # (total_pool, option_pools, position_stakes, position_total)
+        bet_data = bet_result.return_value
+        assert bet_data[0] == bet_amount, "Total pool should equal bet amount"
+        assert bet_data[1] == [bet_amount, 0, 0], "Option 0 pool should hold the bet"
+        assert bet_data[2] == [bet_amount, 0, 0], "Stake should be on option 0"
+        assert bet_data[3] == bet_amount, "User total bet should match"
 
         # Verify user position
         user_position = app_client.call(
             "get_user_position",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
             market_id=market_id,
             user=bettor_account.address,
         )
         position_data = user_position.return_value
+        assert position_data[0] == [bet_amount, 0, 0], "Stake should be on option 0"
         assert position_data[1] == bet_amount, "User total bet should match"
+        assert not position_data[2], "Position should not be claimed yet"
 
     def test_multiple_bets(
         self,
@@ -243,10 +606,14 @@ class TestPredictionMarket:
         # Create market
         create_result = app_client.call(
             "create_market",
-            title="Test Multiple Bets",
-            options=["A", "B", "C"],
-            odds=[200, 300, 150],
-            duration_hours=24,
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Test Multiple Bets",
+                options=["A", "B", "C"],
+                odds=[200, 300, 150],
+                duration_hours=24,
+            ),
         )
         market_id = create_result.return_value
 
@@ -266,21 +633,18 @@ class TestPredictionMarket:
             ),
         )
 
-        # Opt both bettors into the application
-        app_client.opt_in(signer=bettor_account)
-        app_client.opt_in(signer=bettor2)
-
         # Bettor 1 bets on option A
         bet1_amount = 3_000_000  # 3 ALGOs
         payment_txn1 = PaymentTxn(
             sender=bettor_account.address,
             receiver=app_client.app_address,
-            amt=bet1_amount,
+            amt=bet1_amount + position_deposit(3),
             sp=algod_client.suggested_params(),
         )
 
         app_client.call(
             "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
             market_id=market_id,
             option_index=0,
             payment_txn=payment_txn1,
@@ -292,12 +656,13 @@ class TestPredictionMarket:
         payment_txn2 = PaymentTxn(
             sender=bettor2_address,
             receiver=app_client.app_address,
-            amt=bet2_amount,
+            amt=bet2_amount + position_deposit(3, opens_page=False),
             sp=algod_client.suggested_params(),
         )
 
         app_client.call(
             "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor2_address)},
             market_id=market_id,
             option_index=1,
             payment_txn=payment_txn2,
@@ -305,19 +670,264 @@ class TestPredictionMarket:
         )
 
         # Verify total pool
-        market_info = app_client.call("get_market_info", market_id=market_id)
+        market_info = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+        )
         total_pool = market_info.return_value[4]
         assert total_pool == bet1_amount + bet2_amount
 
+        # Verify each bet landed in its own option pool
+        option_pools = market_info.return_value[3]
+        assert option_pools == [bet1_amount, bet2_amount, 0]
+
+    def test_bet_placed_event(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test that a bet emits an ARC-28 BetPlaced event with the new option pool."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Event Test",
+                options=["Yes", "No"],
+                odds=[180, 220],
+                duration_hours=24,
+            ),
+        ).return_value
+
+        result = app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            option_index=1,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=2_000_000 + position_deposit(2),
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor_account,
+        )
+
+        selector = checksum(b"BetPlaced(uint64,uint64,address,uint64,uint64)")[:4]
+        event = base64.b64decode(result.tx_info["logs"][0])
+        assert event[:4] == selector
+        assert int.from_bytes(event[4:12], "big") == market_id
+        assert int.from_bytes(event[12:20], "big") == 1
+        assert event[20:52] == decode_address(bettor_account.address)
+        assert int.from_bytes(event[52:60], "big") == 2_000_000
+        assert int.from_bytes(event[60:68], "big") == 2_000_000
+
+    def test_markets_are_independent(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test that creating and betting on one market leaves the others untouched."""
+        first_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Chelsea vs Arsenal",
+                options=["Chelsea", "Draw", "Arsenal"],
+                odds=[180, 320, 210],
+                duration_hours=24,
+            ),
+        ).return_value
+        second_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Everton vs Fulham",
+                options=["Everton", "Fulham"],
+                odds=[190, 190],
+                duration_hours=24,
+            ),
+        ).return_value
+
+        payment_txn = PaymentTxn(
+            sender=bettor_account.address,
+            receiver=app_client.app_address,
+            amt=1_000_000 + position_deposit(2),
+            sp=algod_client.suggested_params(),
+        )
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(second_id, bettor_account.address)},
+            market_id=second_id,
+            option_index=1,
+            payment_txn=payment_txn,
+            signer=bettor_account,
+        )
+
+        first = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(first_id)},
+            market_id=first_id,
+        ).return_value
+        second = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(second_id)},
+            market_id=second_id,
+        ).return_value
+        assert first[0] == "Chelsea vs Arsenal", "Creating a market must not overwrite another"
+        assert first[4] == 0, "Betting on one market must not touch another's pool"
+        assert second[3] == [0, 1_000_000]
+        assert second[4] == 1_000_000
+
+    def test_place_bets(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test placing a multi-leg slip with one grouped payment."""
+        market_ids = [
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=title,
+                    options=["Home", "Draw", "Away"],
+                    odds=[200, 300, 250],
+                    duration_hours=24,
+                ),
+            ).return_value
+            for title in ("Slip Leg 1", "Slip Leg 2")
+        ]
+        boxes = list(dict.fromkeys(
+            bet_boxes(market_ids[0], bettor_account.address) + bet_boxes(market_ids[1], bettor_account.address)
+        ))
+
+        # Payment must cover exactly the sum of the legs plus the deposit for
+        # the boxes of two new positions
+        deposit = position_deposit(3) + position_deposit(3, new_portfolio=False)
+        with pytest.raises(Exception):
+            call_with_shared_boxes(
+                app_client,
+                "place_bets",
+                boxes,
+                {"signer": bettor_account.signer},
+                market_ids=market_ids,
+                option_indexes=[0, 2],
+                amounts=[1_000_000, 2_000_000],
+                payment_txn=PaymentTxn(
+                    sender=bettor_account.address,
+                    receiver=app_client.app_address,
+                    amt=3_000_000,
+                    sp=algod_client.suggested_params(),
+                ),
+            )
+
+        call_with_shared_boxes(
+            app_client,
+            "place_bets",
+            boxes,
+            {"signer": bettor_account.signer},
+            market_ids=market_ids,
+            option_indexes=[0, 2],
+            amounts=[1_000_000, 2_000_000],
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=3_000_000 + deposit,
+                sp=algod_client.suggested_params(),
+            ),
+        )
+
+        first = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(market_ids[0])},
+            market_id=market_ids[0],
+        ).return_value
+        second = app_client.call(
+            "get_market_info",
+            transaction_parameters={"boxes": market_boxes(market_ids[1])},
+            market_id=market_ids[1],
+        ).return_value
+        assert first[3] == [1_000_000, 0, 0]
+        assert second[3] == [0, 0, 2_000_000]
+
+    def test_place_bets_long_slip(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test a 12-leg slip of first bets on fresh markets, padding the fee for OpUp calls."""
+        leg_count = 12
+        market_ids = [
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=f"Slip Leg {leg}",
+                    options=["Home", "Away"],
+                    odds=[200, 200],
+                    duration_hours=24,
+                ),
+            ).return_value
+            for leg in range(leg_count)
+        ]
+        boxes = list(dict.fromkeys(
+            box for market_id in market_ids for box in bet_boxes(market_id, bettor_account.address)
+        ))
+
+        # Every leg opens a position, a portfolio entry and a bettor index page
+        deposit = position_deposit(2) + (leg_count - 1) * position_deposit(2, new_portfolio=False)
+        sp = algod_client.suggested_params()
+        sp.flat_fee = True
+        sp.fee = (1 + leg_count // 2) * sp.min_fee
+        call_with_shared_boxes(
+            app_client,
+            "place_bets",
+            boxes,
+            {"signer": bettor_account.signer, "suggested_params": sp},
+            market_ids=market_ids,
+            option_indexes=[leg % 2 for leg in range(leg_count)],
+            amounts=[TEMPLATE_DEFAULTS["MIN_BET"]] * leg_count,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=leg_count * TEMPLATE_DEFAULTS["MIN_BET"] + deposit,
+                sp=algod_client.suggested_params(),
+            ),
+        )
+
+        for leg, market_id in enumerate(market_ids):
+            pools = app_client.call(
+                "get_market_info",
+                transaction_parameters={"boxes": market_boxes(market_id)},
+                market_id=market_id,
+            ).return_value[3]
+            expected = [0, 0]
+            expected[leg % 2] = TEMPLATE_DEFAULTS["MIN_BET"]
+            assert pools == expected
+
     def test_settle_market(self, app_client: ApplicationClient):
         """Test settling a market."""
         # Create market with short duration for testing
         create_result = app_client.call(
             "create_market",
-            title="Quick Settlement Test",
-            options=["Win", "Lose"],
-            odds=[200, 200],
-            duration_hours=1,  # 1 hour
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Quick Settlement Test",
+                options=["Win", "Lose"],
+                odds=[200, 200],
+                duration_hours=1,  # 1 hour
+            ),
         )
         market_id = create_result.return_value
 
@@ -328,6 +938,7 @@ class TestPredictionMarket:
         with pytest.raises(Exception):
             app_client.call(
                 "settle_market",
+                transaction_parameters={"boxes": market_boxes(market_id)},
                 market_id=market_id,
                 winning_option=0,
             )
@@ -336,10 +947,838 @@ class TestPredictionMarket:
         with pytest.raises(Exception):
             app_client.call(
                 "settle_market",
+                transaction_parameters={"boxes": market_boxes(market_id)},
                 market_id=market_id,
                 winning_option=5,  # Invalid option index
             )
 
+    def test_claim_winnings(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test that settlement fixes the payout ratio and claims pay it out once."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Claim Test",
+                options=["Win", "Lose"],
+                odds=[200, 200],
+                duration_hours=1,
+            ),
+        ).return_value
+
+        # Bettor backs the winner with 3 ALGO, the deployer backs the loser with 1 ALGO
+        for signer, address, option_index, amount, deposit in (
+            (bettor_account, bettor_account.address, 0, 3_000_000, position_deposit(2)),
+            (None, app_client.sender, 1, 1_000_000, position_deposit(2, opens_page=False)),
+        ):
+            app_client.call(
+                "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, address)},
+                market_id=market_id,
+                option_index=option_index,
+                payment_txn=PaymentTxn(
+                    sender=address,
+                    receiver=app_client.app_address,
+                    amt=amount + deposit,
+                    sp=algod_client.suggested_params(),
+                ),
+                signer=signer,
+            )
+
+        # Move LocalNet's clock past the end of the betting window
+        advance_time(algod_client, 2 * 3600)
+        settlement = app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        ).return_value
+
+        # (status, winning_option, winning_pool, payout_ratio)
+        assert settlement[0] == 2, "Market should be settled (status 2)"
+        assert settlement[1] == 0
+        assert settlement[2] == 3_000_000
+        assert settlement[3] == 3_800_000 * 1_000_000_000 // 3_000_000
+
+        sp = algod_client.suggested_params()
+        sp.flat_fee = True
+        sp.fee = 2 * sp.min_fee  # covers the inner payout payment
+        claim_params = {
+            "boxes": bet_boxes(market_id, bettor_account.address),
+            "suggested_params": sp,
+        }
+        payout, status, claimed = app_client.call(
+            "claim_winnings",
+            transaction_parameters=claim_params,
+            market_id=market_id,
+            signer=bettor_account,
+        ).return_value
+
+        # 4 ALGO pool less 5% rake goes to the only winning stake; the ratio and
+        # the payout both round down, leaving 1 microALGO of dust
+        assert payout == 3_799_999
+        assert status == 2, "Market should stay settled"
+        assert claimed, "Claim result should report the position claimed"
+
+        position = app_client.call(
+            "get_user_position",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            user=bettor_account.address,
+        ).return_value
+        assert position[2], "Position should be marked claimed"
+
+        # Claims are one-shot
+        with pytest.raises(Exception):
+            app_client.call(
+                "claim_winnings",
+                transaction_parameters=claim_params,
+                market_id=market_id,
+                signer=bettor_account,
+            )
+
+    def test_claim_all(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test claiming a portfolio of settled markets in one call."""
+        market_ids = []
+        for title in ("Portfolio 1", "Portfolio 2"):
+            market_id = app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=title,
+                    options=["Yes", "No"],
+                    odds=[200, 200],
+                    duration_hours=1,
+                ),
+            ).return_value
+            app_client.call(
+                "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+                market_id=market_id,
+                option_index=0,
+                payment_txn=PaymentTxn(
+                    sender=bettor_account.address,
+                    receiver=app_client.app_address,
+                    amt=2_000_000 + position_deposit(2, new_portfolio=not market_ids),
+                    sp=algod_client.suggested_params(),
+                ),
+                signer=bettor_account,
+            )
+            market_ids.append(market_id)
+
+        advance_time(algod_client, 2 * 3600)
+        for market_id in market_ids:
+            app_client.call(
+                "settle_market",
+                transaction_parameters={"boxes": market_boxes(market_id)},
+                market_id=market_id,
+                winning_option=0,
+            )
+
+        sp = algod_client.suggested_params()
+        sp.flat_fee = True
+        sp.fee = 2 * sp.min_fee  # one inner payment for the whole portfolio
+        payout = app_client.call(
+            "claim_all",
+            transaction_parameters={
+                "boxes": [
+                    box
+                    for market_id in market_ids
+                    for box in market_boxes(market_id) + [position_box(market_id, bettor_account.address)]
+                ],
+                "suggested_params": sp,
+            },
+            market_ids=market_ids,
+            signer=bettor_account,
+        ).return_value
+
+        # Sole bettor on the winner in both markets gets each pool back less 5% rake
+        assert payout == 2 * 1_900_000
+
+    def test_settle_markets(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test settling a batch of markets in one call."""
+        market_ids = [
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=title,
+                    options=["Home", "Draw", "Away"],
+                    odds=[200, 300, 250],
+                    duration_hours=1,
+                ),
+            ).return_value
+            for title in ("Round 1", "Round 2", "Round 3")
+        ]
+        boxes = [box for market_id in market_ids for box in market_boxes(market_id)]
+
+        advance_time(algod_client, 2 * 3600)
+
+        # Only each market's creator may settle it
+        with pytest.raises(Exception):
+            app_client.call(
+                "settle_markets",
+                transaction_parameters={"boxes": boxes},
+                market_ids=market_ids,
+                winning_options=[0, 1, 2],
+                signer=bettor_account,
+            )
+
+        app_client.call(
+            "settle_markets",
+            transaction_parameters={"boxes": boxes},
+            market_ids=market_ids,
+            winning_options=[0, 1, 2],
+        )
+
+        for market_id, winning_option in zip(market_ids, [0, 1, 2]):
+            market_data = app_client.call(
+                "get_market_info",
+                transaction_parameters={"boxes": market_boxes(market_id)},
+                market_id=market_id,
+            ).return_value
+            assert market_data[6] == 2, "Market should be settled (status 2)"
+            assert market_data[7] == winning_option
+
+    def test_scalar_market(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test a total-goals market whose result is mapped to a bucket at settlement."""
+        # Buckets: 0, 1, 2, 3, 4 and 5+ goals
+        boundaries = [1, 2, 3, 4, 5]
+
+        # Boundaries must be strictly increasing
+        with pytest.raises(Exception):
+            app_client.call(
+                "create_scalar_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title="Unsorted Goals",
+                    boundaries=[1, 3, 2],
+                    odds=[200] * 4,
+                    duration_hours=1,
+                ),
+            )
+
+        next_market_id = app_client.get_global_state().get("market_counter", 0) + 1
+        market_id = app_client.call(
+            "create_scalar_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client) + [boundaries_box(next_market_id)]},
+            **with_deposit(
+                app_client,
+                title="Total Goals",
+                boundaries=boundaries,
+                odds=[900, 500, 350, 400, 600, 800],
+                duration_hours=1,
+            ),
+        ).return_value
+
+        assert app_client.call(
+            "get_bucket_boundaries",
+            transaction_parameters={"boxes": market_boxes(market_id) + [boundaries_box(market_id)]},
+            market_id=market_id,
+        ).return_value == boundaries
+
+        # Back exactly three goals
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            option_index=3,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=1_000_000 + position_deposit(6),
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor_account,
+        )
+
+        advance_time(algod_client, 2 * 3600)
+        status, winning_option, winning_pool, _payout_ratio = app_client.call(
+            "settle_scalar_market",
+            transaction_parameters={"boxes": market_boxes(market_id) + [boundaries_box(market_id)]},
+            market_id=market_id,
+            result=3,
+        ).return_value
+
+        assert status == 2
+        assert winning_option == 3, "A result of 3 falls in the [3, 4) bucket"
+        assert winning_pool == 1_000_000
+
+    def test_scalar_market_max_boundaries(self, app_client: ApplicationClient):
+        """Test a scalar market with the most buckets allowed, padding the fee for OpUp calls."""
+        boundaries = list(range(1, TEMPLATE_DEFAULTS["MAX_OPTIONS"]))
+        market_args = with_deposit(
+            app_client,
+            title="Total Points",
+            boundaries=boundaries,
+            odds=[200] * (len(boundaries) + 1),
+            duration_hours=1,
+        )
+        next_market_id = app_client.get_global_state().get("market_counter", 0) + 1
+        boxes = next_market_boxes(app_client) + [boundaries_box(next_market_id)]
+        sp = padded_fee_params(app_client, "create_scalar_market", {"boxes": boxes}, **market_args)
+
+        market_id = app_client.call(
+            "create_scalar_market",
+            transaction_parameters={"boxes": boxes, "suggested_params": sp},
+            **market_args,
+        ).return_value
+
+        assert app_client.call(
+            "get_bucket_boundaries",
+            transaction_parameters={"boxes": market_boxes(market_id) + [boundaries_box(market_id)]},
+            market_id=market_id,
+        ).return_value == boundaries
+
+    def test_distribute(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test pushing payouts to every bettor in paged distribute calls."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Push Payouts",
+                options=["Yes", "No"],
+                odds=[200, 200],
+                duration_hours=1,
+            ),
+        ).return_value
+
+        bettors = [bettor_account]
+        for _ in range(2):
+            private_key, address = generate_account()
+            algokit_utils.ensure_funded(
+                algod_client,
+                algokit_utils.EnsureBalanceParameters(
+                    account_to_fund=address,
+                    min_spending_balance_micro_algos=10_000_000,
+                ),
+            )
+            bettors.append(algokit_utils.Account(private_key=private_key, address=address))
+
+        # Two winners and one loser, in bettor index order
+        for bettor, option_index, amount in (
+            (bettors[0], 0, 1_000_000),
+            (bettors[1], 0, 3_000_000),
+            (bettors[2], 1, 1_000_000),
+        ):
+            app_client.call(
+                "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor.address)},
+                market_id=market_id,
+                option_index=option_index,
+                payment_txn=PaymentTxn(
+                    sender=bettor.address,
+                    receiver=app_client.app_address,
+                    amt=amount + position_deposit(2, opens_page=bettor is bettors[0]),
+                    sp=algod_client.suggested_params(),
+                ),
+                signer=bettor,
+            )
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        )
+
+        def distribute(cursor: int, batch: list[algokit_utils.Account]) -> int:
+            boxes = market_boxes(market_id)[:1] + [bettor_page_box(market_id)] + [
+                position_box(market_id, bettor.address) for bettor in batch
+            ]
+            # Winners are paid with inner payments, so their accounts are referenced
+            references = {"boxes": boxes, "accounts": [bettor.address for bettor in batch]}
+            args = {"market_id": market_id, "cursor": cursor, "max_bettors": len(batch)}
+            sp = padded_fee_params(app_client, "distribute", references, **args)
+            return app_client.call(
+                "distribute",
+                transaction_parameters={**references, "suggested_params": sp},
+                **args,
+            ).return_value
+
+        balances = [algod_client.account_info(bettor.address)["amount"] for bettor in bettors]
+        assert distribute(0, bettors[:2]) == 2
+
+        # The cursor must match the stored one, so a batch cannot be replayed
+        with pytest.raises(Exception):
+            distribute(0, bettors[:2])
+
+        assert distribute(2, bettors[2:]) == 3
+
+        # 5 ALGO pool less 5% rake, shared 1:3 between the winners
+        received = [
+            algod_client.account_info(bettor.address)["amount"] - balance
+            for bettor, balance in zip(bettors, balances)
+        ]
+        assert received == [1_187_500, 3_562_500, 0]
+
+        # Every position is now settled, so nobody can claim again
+        with pytest.raises(Exception):
+            app_client.call(
+                "claim_winnings",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettors[0].address)},
+                market_id=market_id,
+                signer=bettors[0],
+            )
+
+    def test_distribute_many_bettors(self, app_client: ApplicationClient, algod_client: AlgodClient):
+        """Test distributing in full batches of winners across two bettor index pages."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Crowded Payouts",
+                options=["Yes", "No"],
+                odds=[200, 200],
+                duration_hours=1,
+            ),
+        ).return_value
+
+        # 36 winners: the first index page fills up and a second one is opened
+        bettors = new_bettors(app_client, algod_client, market_id, 36, option_index=0)
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        )
+
+        balances = [algod_client.account_info(bettor.address)["amount"] for bettor in bettors]
+        cursor = 0
+        while cursor < len(bettors):
+            batch = bettors[cursor:cursor + MAX_DISTRIBUTE_BATCH]
+            pages = sorted({index // 32 for index in range(cursor, cursor + len(batch))})
+            boxes = market_boxes(market_id)[:1] + [bettor_page_box(market_id, page) for page in pages] + [
+                position_box(market_id, bettor.address) for bettor in batch
+            ]
+            sp = algod_client.suggested_params()
+            sp.flat_fee = True
+            sp.fee = (1 + len(batch)) * sp.min_fee  # one inner payment per winner
+            cursor = call_with_shared_boxes(
+                app_client,
+                "distribute",
+                boxes,
+                {"suggested_params": sp},
+                accounts=[bettor.address for bettor in batch],
+                market_id=market_id,
+                cursor=cursor,
+                max_bettors=len(batch),
+            ).return_value
+
+        # Everyone backed the winner, so each gets their stake less the 5% rake
+        received = [
+            algod_client.account_info(bettor.address)["amount"] - balance
+            for bettor, balance in zip(bettors, balances)
+        ]
+        assert received == [950_000] * len(bettors)
+
+        # The last batch spans both pages: it deleted the full first page at
+        # index 31 and the second one at the last bettor
+        for page in (0, 1):
+            with pytest.raises(Exception):
+                algod_client.application_box_by_name(app_client.app_id, bettor_page_box(market_id, page)[1])
+
+    def test_distribute_full_group(self, app_client: ApplicationClient, algod_client: AlgodClient):
+        """Test distributing 50 winners in one group of five distribute calls."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Group Payouts",
+                options=["Yes", "No"],
+                odds=[200, 200],
+                duration_hours=1,
+            ),
+        ).return_value
+        bettors = new_bettors(app_client, algod_client, market_id, 50, option_index=0)
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        )
+
+        # Each call spans three transactions, so five calls fill 15 of the
+        # group's 16; the first transaction pays every fee, inner payments included
+        sp = algod_client.suggested_params()
+        sp.flat_fee = True
+        sp.fee = (15 + len(bettors)) * sp.min_fee
+        balances = [algod_client.account_info(bettor.address)["amount"] for bettor in bettors]
+        atc = AtomicTransactionComposer()
+        for cursor in range(0, len(bettors), MAX_DISTRIBUTE_BATCH):
+            compose_distribute(
+                atc,
+                app_client,
+                market_id,
+                cursor,
+                bettors[cursor:cursor + MAX_DISTRIBUTE_BATCH],
+                sp if cursor == 0 else free_params(sp),
+            )
+        assert len(atc.txn_list) == 15
+        results = atc.execute(algod_client, 4).abi_results
+
+        # Every call returns the cursor the next one was given
+        cursors = [result.return_value for result in results if result.method.name == "distribute"]
+        assert cursors == [10, 20, 30, 40, 50]
+
+        received = [
+            algod_client.account_info(bettor.address)["amount"] - balance
+            for bettor, balance in zip(bettors, balances)
+        ]
+        assert received == [950_000] * len(bettors)
+        for page in (0, 1):
+            with pytest.raises(Exception):
+                algod_client.application_box_by_name(app_client.app_id, bettor_page_box(market_id, page)[1])
+
+    def test_archive_market(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test archiving a market after its claim period and reclaiming its boxes."""
+        market_args = with_deposit(
+            app_client,
+            title="Archive Test",
+            options=["Yes", "No"],
+            odds=[200, 200],
+            duration_hours=1,
+        )
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **market_args,
+        ).return_value
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            option_index=1,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=1_000_000 + position_deposit(2),
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor_account,
+        )
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        )
+
+        sp = algod_client.suggested_params()
+        sp.flat_fee = True
+        sp.fee = 3 * sp.min_fee  # covers the inner deposit refund and sweep payments
+        archive_params = {
+            "boxes": market_boxes(market_id) + [boundaries_box(market_id), bettor_page_box(market_id)],
+            "suggested_params": sp,
+        }
+
+        # Not before the claim period is over
+        with pytest.raises(Exception):
+            app_client.call("archive_market", transaction_parameters=archive_params, market_id=market_id)
+
+        advance_time(algod_client, 91 * 24 * 3600)
+        balance = algod_client.account_info(app_client.sender)["amount"]
+        swept = app_client.call(
+            "archive_market",
+            transaction_parameters=archive_params,
+            market_id=market_id,
+        ).return_value
+
+        # Nobody backed the winner and nobody claimed a refund, so the whole pool
+        # is swept to the app creator, and the market creator (the same account
+        # here) gets back the deposit for the market's record and pools; the
+        # bettor index page was paid for by the bettor
+        assert swept == 1_000_000
+        deposit = market_args["payment_txn"].amt
+        assert algod_client.account_info(app_client.sender)["amount"] == balance + swept + deposit - sp.fee
+
+        with pytest.raises(Exception):
+            app_client.call(
+                "get_market_info",
+                transaction_parameters={"boxes": market_boxes(market_id)},
+                market_id=market_id,
+            )
+
+        balance = algod_client.account_info(bettor_account.address)["amount"]
+        refunded = app_client.call(
+            "close_positions",
+            transaction_parameters={
+                "boxes": market_boxes(market_id)[:1] + [
+                    position_box(market_id, bettor_account.address),
+                    portfolio_box(bettor_account.address),
+                ],
+                "accounts": [bettor_account.address],
+                "suggested_params": sp,
+            },
+            market_id=market_id,
+            bettors=[bettor_account.address],
+        ).return_value
+        # The bettor gets back the whole deposit of their first bet
+        assert refunded == position_deposit(2)
+        assert algod_client.account_info(bettor_account.address)["amount"] == balance + refunded
+
+    def test_archive_market_many_pages(self, app_client: ApplicationClient, algod_client: AlgodClient):
+        """Test archiving an undistributed market whose bettor index spans two pages."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Crowded Archive",
+                options=["Yes", "No"],
+                odds=[200, 200],
+                duration_hours=1,
+            ),
+        ).return_value
+
+        # 33 bettors: the first index page fills up and a second one is opened
+        new_bettors(app_client, algod_client, market_id, 33, option_index=1)
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+            winning_option=0,
+        )
+        advance_time(algod_client, 91 * 24 * 3600)
+
+        # Nothing was distributed, so archiving deletes both index pages
+        pages = [bettor_page_box(market_id, page) for page in (0, 1)]
+        archive_params = {"boxes": market_boxes(market_id) + [boundaries_box(market_id)] + pages}
+        sp = padded_fee_params(app_client, "archive_market", archive_params, market_id=market_id)
+        swept = app_client.call(
+            "archive_market",
+            transaction_parameters={**archive_params, "suggested_params": sp},
+            market_id=market_id,
+        ).return_value
+
+        # Nobody backed the winner and nobody claimed a refund
+        assert swept == 33_000_000
+        for page in pages:
+            with pytest.raises(Exception):
+                algod_client.application_box_by_name(app_client.app_id, page[1])
+
+    def test_get_user_portfolio(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test reading all of a bettor's positions from their portfolio index."""
+        market_ids = [
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=title,
+                    options=["Yes", "No"],
+                    odds=[200, 200],
+                    duration_hours=1,
+                ),
+            ).return_value
+            for title in ("Portfolio A", "Portfolio B")
+        ]
+
+        # Two bets in the first market and one in the second index two markets
+        for market_id, option_index, deposit in (
+            (market_ids[0], 0, position_deposit(2)),
+            (market_ids[0], 1, 0),
+            (market_ids[1], 0, position_deposit(2, new_portfolio=False)),
+        ):
+            app_client.call(
+                "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+                market_id=market_id,
+                option_index=option_index,
+                payment_txn=PaymentTxn(
+                    sender=bettor_account.address,
+                    receiver=app_client.app_address,
+                    amt=1_000_000 + deposit,
+                    sp=algod_client.suggested_params(),
+                ),
+                signer=bettor_account,
+            )
+
+        advance_time(algod_client, 2 * 3600)
+        app_client.call(
+            "settle_market",
+            transaction_parameters={"boxes": market_boxes(market_ids[1])},
+            market_id=market_ids[1],
+            winning_option=0,
+        )
+
+        portfolio = app_client.call(
+            "get_user_portfolio",
+            transaction_parameters={
+                "boxes": [portfolio_box(bettor_account.address)] + [
+                    box
+                    for market_id in market_ids
+                    for box in (market_boxes(market_id)[0], position_box(market_id, bettor_account.address))
+                ]
+            },
+            user=bettor_account.address,
+            start=0,
+            count=10,
+        ).return_value
+
+        # Each entry is (market_id, status, winning_option, claimed, total_stake, claimable);
+        # the sole bettor in the settled market gets the pool back net of the 5% rake
+        assert portfolio == [
+            [market_ids[0], 0, 0, False, 2_000_000, 0],
+            [market_ids[1], 2, 0, False, 1_000_000, 950_000],
+        ]
+
+    def test_get_markets_page(self, app_client: ApplicationClient):
+        """Test listing a range of markets in one read."""
+        first_id = app_client.get_global_state().get("market_counter", 0) + 1
+        for title in ("Page A", "Page B"):
+            app_client.call(
+                "create_market",
+                transaction_parameters={"boxes": next_market_boxes(app_client)},
+                **with_deposit(
+                    app_client,
+                    title=title,
+                    options=["Yes", "No"],
+                    odds=[180, 220],
+                    duration_hours=24,
+                ),
+            )
+
+        page = app_client.call(
+            "get_markets_page",
+            transaction_parameters={
+                "boxes": market_boxes(first_id)[:1] + market_boxes(first_id + 1)[:1]
+            },
+            start=first_id,
+            count=5,  # runs past the last market
+        ).return_value
+
+        # Each summary is (market_id, end_time, total_pool, status, option_count,
+        # winning_option, bet_count, bettor_count, max_bet)
+        assert [summary[0] for summary in page] == [first_id, first_id + 1]
+        assert all(summary[3] == 0 and summary[4] == 2 for summary in page)
+        assert all(summary[6:] == [0, 0, 0] for summary in page)
+
+    def test_get_market_summary(
+        self,
+        app_client: ApplicationClient,
+        bettor_account: algokit_utils.Account,
+        algod_client: AlgodClient
+    ):
+        """Test the fixed-width summary used for polling."""
+        market_id = app_client.call(
+            "create_market",
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Ticker Test",
+                options=["Home", "Draw", "Away"],
+                odds=[200, 300, 250],
+                duration_hours=24,
+            ),
+        ).return_value
+
+        # (version, status, end_time, winning_option, total_pool,
+        #  bet_count, bettor_count, max_bet, option_pools)
+        summary = app_client.call(
+            "get_market_summary",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+        ).return_value
+        assert summary[0] == 0
+        assert summary[8] == [0, 0, 0]
+
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            option_index=2,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=1_000_000 + position_deposit(3),
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor_account,
+        )
+
+        summary = app_client.call(
+            "get_market_summary",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+        ).return_value
+        assert summary[0] == 1, "A bet should bump the version"
+        assert summary[4] == 1_000_000
+        assert summary[5:8] == [1, 1, 1_000_000]
+        assert summary[8] == [0, 0, 1_000_000]
+
+        # A second, larger bet by the same bettor is not a new bettor
+        app_client.call(
+            "place_bet",
+            transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
+            market_id=market_id,
+            option_index=0,
+            payment_txn=PaymentTxn(
+                sender=bettor_account.address,
+                receiver=app_client.app_address,
+                amt=2_500_000,
+                sp=algod_client.suggested_params(),
+            ),
+            signer=bettor_account,
+        )
+
+        summary = app_client.call(
+            "get_market_summary",
+            transaction_parameters={"boxes": market_boxes(market_id)},
+            market_id=market_id,
+        ).return_value
+        assert summary[5:8] == [2, 1, 2_500_000], "(bet_count, bettor_count, max_bet)"
+
     def test_market_count(self, app_client: ApplicationClient):
         """Test getting market count."""
         initial_count = app_client.call("get_market_count").return_value
@@ -347,10 +1786,14 @@ class TestPredictionMarket:
         # Create a new market
         app_client.call(
             "create_market",
-            title="Count Test Market",
-            options=["Yes", "No"],
-            odds=[180, 220],
-            duration_hours=24,
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Count Test Market",
+                options=["Yes", "No"],
+                odds=[180, 220],
+                duration_hours=24,
+            ),
         )
 
         # Check count increased
@@ -367,15 +1810,17 @@ class TestPredictionMarket:
         # Create market
         create_result = app_client.call(
             "create_market",
-            title="Validation Test",
-            options=["Option1", "Option2"],
-            odds=[200, 200],
-            duration_hours=24,
+            transaction_parameters={"boxes": next_market_boxes(app_client)},
+            **with_deposit(
+                app_client,
+                title="Validation Test",
+                options=["Option1", "Option2"],
+                odds=[200, 200],
+                duration_hours=24,
+            ),
         )
         market_id = create_result.return_value
 
-        app_client.opt_in(signer=bettor_account)
-
         # Test betting on non-existent market
         with pytest.raises(Exception):
             payment_txn = PaymentTxn(
@@ -386,6 +1831,7 @@ class TestPredictionMarket:
             )
             app_client.call(
                 "place_bet",
+                transaction_parameters={"boxes": bet_boxes(999, bettor_account.address)},
                 market_id=999,  # Non-existent market
                 option_index=0,
                 payment_txn=payment_txn,
@@ -402,6 +1848,7 @@ class TestPredictionMarket:
             )
             app_client.call(
                 "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
                 market_id=market_id,
                 option_index=5,  # Invalid option
                 payment_txn=payment_txn,
@@ -413,11 +1860,12 @@ class TestPredictionMarket:
             payment_txn = PaymentTxn(
                 sender=bettor_account.address,
                 receiver=app_client.app_address,
-                amt=500_000,  # Below minimum (1 ALGO)
+                amt=TEMPLATE_DEFAULTS["MIN_BET"] - 1 + position_deposit(2),  # Stake below TMPL_MIN_BET
                 sp=algod_client.suggested_params(),
             )
             app_client.call(
                 "place_bet",
+                transaction_parameters={"boxes": bet_boxes(market_id, bettor_account.address)},
                 market_id=market_id,
                 option_index=0,
                 payment_txn=payment_txn,